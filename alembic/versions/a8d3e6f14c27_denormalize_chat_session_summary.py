@@ -0,0 +1,78 @@
+"""Denormalize chat session summary columns
+
+Revision ID: a8d3e6f14c27
+Revises: f2b7c41d9e03
+Create Date: 2026-10-16 19:05:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d3e6f14c27'
+down_revision = 'f2b7c41d9e03'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    채팅 세션 요약 컬럼 추가 + 기존 데이터 백필 + 복합 인덱스 생성
+
+    - message_count / first_user_message / last_message: 세션 목록 조회 시 메시지 테이블 미조회
+    - (conversation_id, created_at): 최근 N개 조회 및 created_at 키셋 페이지네이션
+    - (user_id, last_message_at): 사용자별 최근 활동 순 세션 목록
+    """
+    op.add_column(
+        'chat_sessions',
+        sa.Column('message_count', sa.Integer(), server_default='0', nullable=False),
+    )
+    op.add_column('chat_sessions', sa.Column('first_user_message', sa.Text(), nullable=True))
+    op.add_column('chat_sessions', sa.Column('last_message', sa.Text(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE chat_sessions AS s
+        SET message_count = (
+                SELECT COUNT(*) FROM chat_messages AS m
+                WHERE m.conversation_id = s.conversation_id
+            ),
+            first_user_message = (
+                SELECT LEFT(m.content, 500) FROM chat_messages AS m
+                WHERE m.conversation_id = s.conversation_id AND m.role = 'user' AND m.content <> ''
+                ORDER BY m.created_at ASC
+                LIMIT 1
+            ),
+            last_message = (
+                SELECT LEFT(m.content, 500) FROM chat_messages AS m
+                WHERE m.conversation_id = s.conversation_id
+                ORDER BY m.created_at DESC
+                LIMIT 1
+            )
+        """
+    )
+
+    op.create_index(
+        'ix_chat_messages_conversation_id_created_at',
+        'chat_messages',
+        ['conversation_id', 'created_at'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_chat_sessions_user_id_last_message_at',
+        'chat_sessions',
+        ['user_id', 'last_message_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """
+    요약 컬럼 및 인덱스 삭제
+    """
+    op.drop_index('ix_chat_sessions_user_id_last_message_at', table_name='chat_sessions')
+    op.drop_index('ix_chat_messages_conversation_id_created_at', table_name='chat_messages')
+    op.drop_column('chat_sessions', 'last_message')
+    op.drop_column('chat_sessions', 'first_user_message')
+    op.drop_column('chat_sessions', 'message_count')
@@ -0,0 +1,41 @@
+"""Add stream_state column to stock_indicators
+
+Revision ID: c7e2f4a91b3d
+Revises: a5a9b52dd593
+Create Date: 2026-10-16 10:12:31.418205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7e2f4a91b3d'
+down_revision = 'a5a9b52dd593'
+branch_labels = None
+depends_on = None
+
+
+def _has_stock_indicators() -> bool:
+    # stock_indicators는 init_db(create_all)로 생성되므로 없는 환경이 있을 수 있음
+    return sa.inspect(op.get_bind()).has_table('stock_indicators')
+
+
+def upgrade() -> None:
+    """
+    증분 지표 계산 상태 컬럼 추가
+
+    IndicatorStream 상태를 저장해 새 일봉이 들어올 때 전체 구간을 재계산하지 않습니다.
+    """
+    if not _has_stock_indicators():
+        return
+    op.add_column('stock_indicators', sa.Column('stream_state', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """
+    stream_state 컬럼 제거
+    """
+    if not _has_stock_indicators():
+        return
+    op.drop_column('stock_indicators', 'stream_state')
@@ -0,0 +1,46 @@
+"""Add llm_response_cache table
+
+Revision ID: d3a8b61f5e20
+Revises: c7e2f4a91b3d
+Create Date: 2026-10-16 14:05:12.503118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3a8b61f5e20'
+down_revision = 'c7e2f4a91b3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    LLM 응답 캐시 테이블 생성
+
+    temperature=0 등 결정적 LLM 호출 결과를 프롬프트 해시 기준으로 저장합니다.
+    """
+    op.create_table(
+        'llm_response_cache',
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('node', sa.String(length=100), nullable=False),
+        sa.Column('model', sa.String(length=200), nullable=True),
+        sa.Column('generations', sa.Text(), nullable=False),
+        sa.Column('total_tokens', sa.Integer(), nullable=True),
+        sa.Column('latency_ms', sa.Float(), nullable=True),
+        sa.Column('hit_count', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('expires_at', sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint('cache_key')
+    )
+    op.create_index('ix_llm_response_cache_expires_at', 'llm_response_cache', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """
+    llm_response_cache 테이블 삭제
+    """
+    op.drop_index('ix_llm_response_cache_expires_at', table_name='llm_response_cache')
+    op.drop_table('llm_response_cache')
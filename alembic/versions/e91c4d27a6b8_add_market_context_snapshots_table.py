@@ -0,0 +1,40 @@
+"""Add market_context_snapshots table
+
+Revision ID: e91c4d27a6b8
+Revises: d3a8b61f5e20
+Create Date: 2026-10-16 15:21:47.220914
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e91c4d27a6b8'
+down_revision = 'd3a8b61f5e20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    공유 시장 컨텍스트 테이블 생성
+
+    거시 지표 기준일/지수 종가 조합(version)마다 한 번 생성한 시장 사이클·자산 배분 판단을 저장합니다.
+    """
+    op.create_table(
+        'market_context_snapshots',
+        sa.Column('version', sa.String(length=200), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('version')
+    )
+    op.create_index('ix_market_context_snapshots_created_at', 'market_context_snapshots', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """
+    market_context_snapshots 테이블 삭제
+    """
+    op.drop_index('ix_market_context_snapshots_created_at', table_name='market_context_snapshots')
+    op.drop_table('market_context_snapshots')
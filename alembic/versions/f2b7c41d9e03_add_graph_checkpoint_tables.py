@@ -0,0 +1,71 @@
+"""Add graph checkpoint tables
+
+Revision ID: f2b7c41d9e03
+Revises: e91c4d27a6b8
+Create Date: 2026-10-16 17:42:09.118305
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2b7c41d9e03'
+down_revision = 'e91c4d27a6b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    LangGraph 체크포인트 테이블 생성
+
+    대화 상태와 HITL 중단 지점을 재시작 후에도 이어갈 수 있도록 저장하고,
+    스레드별 만료 시각(expires_at) 기준으로 정리합니다.
+    """
+    op.create_table(
+        'graph_checkpoint_threads',
+        sa.Column('thread_id', sa.String(length=255), nullable=False),
+        sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('expires_at', sa.TIMESTAMP(), nullable=False),
+        sa.PrimaryKeyConstraint('thread_id')
+    )
+    op.create_index(
+        'ix_graph_checkpoint_threads_expires_at', 'graph_checkpoint_threads', ['expires_at'], unique=False
+    )
+    op.create_table(
+        'graph_checkpoints',
+        sa.Column('thread_id', sa.String(length=255), nullable=False),
+        sa.Column('checkpoint_ns', sa.String(length=255), nullable=False),
+        sa.Column('checkpoint_id', sa.String(length=64), nullable=False),
+        sa.Column('parent_checkpoint_id', sa.String(length=64), nullable=True),
+        sa.Column('type', sa.String(length=32), nullable=False),
+        sa.Column('checkpoint', sa.LargeBinary(), nullable=False),
+        sa.Column('metadata_type', sa.String(length=32), nullable=False),
+        sa.Column('checkpoint_metadata', sa.LargeBinary(), nullable=False),
+        sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id')
+    )
+    op.create_table(
+        'graph_checkpoint_writes',
+        sa.Column('thread_id', sa.String(length=255), nullable=False),
+        sa.Column('checkpoint_ns', sa.String(length=255), nullable=False),
+        sa.Column('checkpoint_id', sa.String(length=64), nullable=False),
+        sa.Column('task_id', sa.String(length=255), nullable=False),
+        sa.Column('idx', sa.Integer(), nullable=False),
+        sa.Column('channel', sa.String(length=255), nullable=False),
+        sa.Column('type', sa.String(length=32), nullable=False),
+        sa.Column('value', sa.LargeBinary(), nullable=False),
+        sa.Column('task_path', sa.String(length=500), nullable=False),
+        sa.PrimaryKeyConstraint('thread_id', 'checkpoint_ns', 'checkpoint_id', 'task_id', 'idx')
+    )
+
+
+def downgrade() -> None:
+    """
+    체크포인트 테이블 삭제
+    """
+    op.drop_table('graph_checkpoint_writes')
+    op.drop_table('graph_checkpoints')
+    op.drop_index('ix_graph_checkpoint_threads_expires_at', table_name='graph_checkpoint_threads')
+    op.drop_table('graph_checkpoint_threads')
@@ -0,0 +1,671 @@
+"""
+LangGraph 체크포인터
+
+MemorySaver는 모든 대화의 전체 상태 이력을 프로세스가 끝날 때까지 보관하고
+재시작하면 HITL 중단 지점까지 잃어버리므로, 크기/기간이 제한된 체크포인터를
+GRAPH_CHECKPOINT_BACKEND로 선택해 사용합니다.
+
+- memory: 최근 사용한 대화 LANGGRAPH_CHECKPOINT_MAX_THREADS개만 유지 (LRU)
+- postgres: 애플리케이션 DB(graph_checkpoint_* 테이블)에 저장
+- sqlite: GRAPH_CHECKPOINT_SQLITE_PATH 파일에 저장 (단일 서버/개발용)
+
+공통:
+- 대화(네임스페이스)별 최신 체크포인트 LANGGRAPH_CHECKPOINT_MAX_HISTORY개만 보관
+- 마지막 사용 후 LANGGRAPH_CHECKPOINT_TTL_MINUTES가 지난 대화는 정리
+  (LANGGRAPH_CHECKPOINT_REFRESH_ON_READ=True면 조회도 사용으로 간주)
+- serde(msgpack) 직렬화 결과가 LANGGRAPH_CHECKPOINT_COMPRESS_BYTES 이상이면 zlib 압축
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_COMPRESSED_SUFFIX = "+zlib"
+_TOUCH_INTERVAL_SECONDS = 60.0  # 조회 시 DB 만료 연장 최소 간격 (스레드별)
+
+Typed = Tuple[str, bytes]
+# (task_id, idx, channel, 직렬화 값, task_path)
+WriteRecord = Tuple[str, int, str, Typed, str]
+
+
+class _CompactCheckpointSaver(BaseCheckpointSaver[int], ABC):
+    """압축 직렬화/설정 해석 공통 로직 (저장소별로 sweep 구현)"""
+
+    def __init__(
+        self,
+        *,
+        max_history: Optional[int] = None,
+        ttl_minutes: Optional[int] = None,
+        refresh_on_read: Optional[bool] = None,
+        compress_bytes: Optional[int] = None,
+        sweep_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        serde: Optional[SerializerProtocol] = None,
+    ) -> None:
+        super().__init__(serde=serde)
+        self._clock = clock
+        self.sweep_seconds = settings.LANGGRAPH_CHECKPOINT_SWEEP_SECONDS if sweep_seconds is None else sweep_seconds
+        self._last_sweep = clock()
+        self.max_history = settings.LANGGRAPH_CHECKPOINT_MAX_HISTORY if max_history is None else max_history
+        ttl_minutes = settings.langgraph_default_ttl if ttl_minutes is None else ttl_minutes
+        self.ttl_seconds = ttl_minutes * 60
+        self.refresh_on_read = (
+            settings.LANGGRAPH_CHECKPOINT_REFRESH_ON_READ if refresh_on_read is None else refresh_on_read
+        )
+        self.compress_bytes = (
+            settings.LANGGRAPH_CHECKPOINT_COMPRESS_BYTES if compress_bytes is None else compress_bytes
+        )
+
+    @abstractmethod
+    def sweep(self) -> int:
+        """만료된 대화 정리 (정리한 대화 수)"""
+
+    def _sweep_due(self) -> bool:
+        return self.sweep_seconds > 0 and self._clock() - self._last_sweep >= self.sweep_seconds
+
+    # ------------------------------------------------------------------
+    # 직렬화
+    # ------------------------------------------------------------------
+    def _dumps(self, value: Any) -> Typed:
+        type_, data = self.serde.dumps_typed(value)
+        if self.compress_bytes > 0 and len(data) >= self.compress_bytes:
+            return type_ + _COMPRESSED_SUFFIX, zlib.compress(data, 1)
+        return type_, data
+
+    def _loads(self, typed: Typed) -> Any:
+        type_, data = typed
+        if type_.endswith(_COMPRESSED_SUFFIX):
+            type_, data = type_[: -len(_COMPRESSED_SUFFIX)], zlib.decompress(data)
+        return self.serde.loads_typed((type_, data))
+
+    def _dump_checkpoint(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+    ) -> Tuple[str, str, str, Optional[str], Typed, Typed]:
+        configurable = config["configurable"]
+        return (
+            configurable["thread_id"],
+            configurable.get("checkpoint_ns", ""),
+            checkpoint["id"],
+            configurable.get("checkpoint_id"),  # parent
+            self._dumps(checkpoint),
+            self._dumps(get_checkpoint_metadata(config, metadata)),
+        )
+
+    def _dump_writes(self, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str) -> List[WriteRecord]:
+        return [
+            (task_id, WRITES_IDX_MAP.get(channel, idx), channel, self._dumps(value), task_path)
+            for idx, (channel, value) in enumerate(writes)
+        ]
+
+    def _tuple(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        checkpoint: Typed,
+        metadata: Typed,
+        parent_checkpoint_id: Optional[str],
+        writes: Sequence[WriteRecord],
+    ) -> CheckpointTuple:
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self._loads(checkpoint),
+            metadata=self._loads(metadata),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[(task_id, channel, self._loads(value)) for task_id, _, channel, value, _ in writes],
+        )
+
+    @staticmethod
+    def _target(config: RunnableConfig) -> Tuple[str, str, Optional[str]]:
+        configurable = config["configurable"]
+        return configurable["thread_id"], configurable.get("checkpoint_ns", ""), get_checkpoint_id(config)
+
+    @staticmethod
+    def _next_config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> RunnableConfig:
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint_id,
+            }
+        }
+
+    @staticmethod
+    def _matches(metadata: Dict[str, Any], filter: Optional[Dict[str, Any]]) -> bool:
+        return not filter or all(metadata.get(key) == value for key, value in filter.items())
+
+    # ------------------------------------------------------------------
+    # 비동기 인터페이스 (하위 클래스가 필요 시 재정의)
+    # ------------------------------------------------------------------
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self.get_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        self.delete_thread(thread_id)
+
+
+@dataclass
+class _MemoryThread:
+    expires_at: float
+    # checkpoint_ns -> checkpoint_id -> (checkpoint, metadata, parent_checkpoint_id)
+    checkpoints: Dict[str, Dict[str, Tuple[Typed, Typed, Optional[str]]]] = field(default_factory=dict)
+    # (checkpoint_ns, checkpoint_id) -> (task_id, idx) -> WriteRecord
+    writes: Dict[Tuple[str, str], Dict[Tuple[str, int], WriteRecord]] = field(default_factory=dict)
+
+
+class BoundedMemorySaver(_CompactCheckpointSaver):
+    """
+    크기/기간이 제한된 인메모리 체크포인터
+
+    대화 수(LRU), 대화별 체크포인트 수, 마지막 사용 후 TTL로 메모리 사용량을
+    대화 수와 무관하게 일정하게 유지합니다.
+    """
+
+    def __init__(self, *, max_threads: Optional[int] = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.max_threads = settings.LANGGRAPH_CHECKPOINT_MAX_THREADS if max_threads is None else max_threads
+        self._threads: "OrderedDict[str, _MemoryThread]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._evicted = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            checkpoints = sum(
+                len(saved) for entry in self._threads.values() for saved in entry.checkpoints.values()
+            )
+            return {
+                "backend": "memory",
+                "threads": len(self._threads),
+                "checkpoints": checkpoints,
+                "max_threads": self.max_threads,
+                "evicted": self._evicted,
+            }
+
+    # ------------------------------------------------------------------
+    # BaseCheckpointSaver
+    # ------------------------------------------------------------------
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id, checkpoint_ns, checkpoint_id = self._target(config)
+        with self._lock:
+            entry = self._entry(thread_id, touch=self.refresh_on_read)
+            saved_by_id = entry.checkpoints.get(checkpoint_ns) if entry else None
+            if not saved_by_id:
+                return None
+            if checkpoint_id is None:
+                checkpoint_id = max(saved_by_id)
+            saved = saved_by_id.get(checkpoint_id)
+            if saved is None:
+                return None
+            writes = list(entry.writes.get((checkpoint_ns, checkpoint_id), {}).values())
+        checkpoint, metadata, parent_id = saved
+        return self._tuple(thread_id, checkpoint_ns, checkpoint_id, checkpoint, metadata, parent_id, writes)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        config_ns = config["configurable"].get("checkpoint_ns") if config else None
+        config_id = get_checkpoint_id(config) if config else None
+        before_id = get_checkpoint_id(before) if before else None
+
+        with self._lock:
+            if config:
+                entry = self._entry(config["configurable"]["thread_id"], touch=self.refresh_on_read)
+                threads = [(config["configurable"]["thread_id"], entry)] if entry else []
+            else:
+                threads = list(self._threads.items())
+            candidates = []
+            for thread_id, entry in threads:
+                for checkpoint_ns, saved_by_id in entry.checkpoints.items():
+                    if config_ns is not None and checkpoint_ns != config_ns:
+                        continue
+                    for checkpoint_id, saved in saved_by_id.items():
+                        if config_id and checkpoint_id != config_id:
+                            continue
+                        if before_id and checkpoint_id >= before_id:
+                            continue
+                        writes = list(entry.writes.get((checkpoint_ns, checkpoint_id), {}).values())
+                        candidates.append((thread_id, checkpoint_ns, checkpoint_id, saved, writes))
+
+        candidates.sort(key=lambda item: item[2], reverse=True)
+        for thread_id, checkpoint_ns, checkpoint_id, (checkpoint, metadata, parent_id), writes in candidates:
+            if limit is not None and limit <= 0:
+                break
+            if filter and not self._matches(self._loads(metadata), filter):
+                continue
+            if limit is not None:
+                limit -= 1
+            yield self._tuple(thread_id, checkpoint_ns, checkpoint_id, checkpoint, metadata, parent_id, writes)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, dumped, dumped_metadata = self._dump_checkpoint(
+            config, checkpoint, metadata
+        )
+        with self._lock:
+            entry = self._entry(thread_id, create=True, touch=True)
+            saved_by_id = entry.checkpoints.setdefault(checkpoint_ns, {})
+            saved_by_id[checkpoint_id] = (dumped, dumped_metadata, parent_id)
+            self._prune_history(entry, checkpoint_ns)
+            self._enforce_limits()
+        if self._sweep_due():
+            self.sweep()
+        return self._next_config(thread_id, checkpoint_ns, checkpoint_id)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id, checkpoint_ns, checkpoint_id = self._target(config)
+        records = self._dump_writes(writes, task_id, task_path)
+        with self._lock:
+            entry = self._entry(thread_id, create=True, touch=True)
+            stored = entry.writes.setdefault((checkpoint_ns, checkpoint_id), {})
+            for record in records:
+                key = (record[0], record[1])
+                if key[1] >= 0 and key in stored:
+                    continue
+                stored[key] = record
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            self._threads.pop(thread_id, None)
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+    def sweep(self) -> int:
+        now = self._last_sweep = self._clock()
+        with self._lock:
+            expired = [thread_id for thread_id, entry in self._threads.items() if entry.expires_at <= now]
+            for thread_id in expired:
+                del self._threads[thread_id]
+        if expired:
+            logger.info("🧹 [Checkpoint] 만료된 대화 %d개 정리", len(expired))
+        return len(expired)
+
+    def _entry(self, thread_id: str, create: bool = False, touch: bool = False) -> Optional[_MemoryThread]:
+        now = self._clock()
+        entry = self._threads.get(thread_id)
+        if entry is not None and entry.expires_at <= now:
+            del self._threads[thread_id]
+            entry = None
+        if entry is None:
+            if not create:
+                return None
+            entry = self._threads[thread_id] = _MemoryThread(expires_at=now + self.ttl_seconds)
+        elif touch:
+            entry.expires_at = now + self.ttl_seconds
+        self._threads.move_to_end(thread_id)
+        return entry
+
+    def _prune_history(self, entry: _MemoryThread, checkpoint_ns: str) -> None:
+        saved_by_id = entry.checkpoints[checkpoint_ns]
+        if not self.max_history or len(saved_by_id) <= self.max_history:
+            return
+        for checkpoint_id in sorted(saved_by_id)[: len(saved_by_id) - self.max_history]:
+            del saved_by_id[checkpoint_id]
+            entry.writes.pop((checkpoint_ns, checkpoint_id), None)
+
+    def _enforce_limits(self) -> None:
+        # 가장 오래 사용하지 않은 대화부터 제거 (맨 앞 = 가장 오래됨)
+        now = self._clock()
+        while self._threads:
+            thread_id, entry = next(iter(self._threads.items()))
+            if entry.expires_at > now and len(self._threads) <= self.max_threads:
+                break
+            del self._threads[thread_id]
+            self._evicted += 1
+
+
+class DatabaseCheckpointSaver(_CompactCheckpointSaver):
+    """
+    DB 체크포인터 (PostgreSQL/SQLite)
+
+    재시작 후에도, 다른 워커에서도 같은 대화/HITL 중단 지점을 이어갈 수 있도록
+    모든 읽기/쓰기를 DB에서 처리합니다. 동기 DB 접근은 비동기 경로에서
+    asyncio.to_thread로 실행합니다.
+    """
+
+    def __init__(self, repository=None, *, serialize: bool = False, **kwargs: Any) -> None:
+        """
+        Args:
+            repository: GraphCheckpointRepository (None이면 애플리케이션 DB)
+            serialize: DB 접근을 한 번에 하나씩 실행 (SQLite처럼 동시 쓰기를 못 하는 경우)
+        """
+        super().__init__(**kwargs)
+        if repository is None:
+            from src.repositories.graph_checkpoint_repository import graph_checkpoint_repository
+
+            repository = graph_checkpoint_repository
+        self.repository = repository
+        self._db_lock: Optional[threading.Lock] = threading.Lock() if serialize else None
+        # 스레드별 마지막 만료 연장 시각 (조회마다 UPDATE하지 않도록, 크기 제한)
+        self._touched: "OrderedDict[str, float]" = OrderedDict()
+        self._touched_limit = settings.LANGGRAPH_CHECKPOINT_MAX_THREADS
+        self._lock = threading.Lock()
+        self._tasks: set[asyncio.Task] = set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "database", "sweep_seconds": self.sweep_seconds}
+
+    def _expires_at(self) -> datetime:
+        return datetime.now() + timedelta(seconds=self.ttl_seconds)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id, checkpoint_ns, checkpoint_id = self._target(config)
+        row = self._call("get", thread_id, checkpoint_ns, checkpoint_id)
+        if row is None:
+            return None
+        if self._should_touch(thread_id):
+            self._call("touch", thread_id, self._expires_at())
+        return self._row_tuple(row)
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id, checkpoint_ns, checkpoint_id = self._target(config)
+        row = await self._acall("get", thread_id, checkpoint_ns, checkpoint_id)
+        if row is None:
+            return None
+        if self._should_touch(thread_id):
+            await self._acall("touch", thread_id, self._expires_at())
+        return self._row_tuple(row)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        rows = self._call("list", **self._list_args(config, before, None if filter else limit))
+        yield from self._filter_rows(rows, filter, limit)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        rows = await self._acall("list", **self._list_args(config, before, None if filter else limit))
+        for item in self._filter_rows(rows, filter, limit):
+            yield item
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        record = self._dump_checkpoint(config, checkpoint, metadata)
+        self._call("put", *record, self._expires_at(), self.max_history)
+        self._mark_touched(record[0])
+        if self._sweep_due():
+            self.sweep()
+        return self._next_config(*record[:3])
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        record = self._dump_checkpoint(config, checkpoint, metadata)
+        await self._acall("put", *record, self._expires_at(), self.max_history)
+        self._mark_touched(record[0])
+        if self._sweep_due():
+            task = asyncio.create_task(asyncio.to_thread(self.sweep))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return self._next_config(*record[:3])
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id, checkpoint_ns, checkpoint_id = self._target(config)
+        self._call("put_writes", thread_id, checkpoint_ns, checkpoint_id, self._write_rows(writes, task_id, task_path))
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id, checkpoint_ns, checkpoint_id = self._target(config)
+        rows = self._write_rows(writes, task_id, task_path)
+        await self._acall("put_writes", thread_id, checkpoint_ns, checkpoint_id, rows)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._call("delete_thread", thread_id)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self._acall("delete_thread", thread_id)
+
+    # ------------------------------------------------------------------
+    # 정리
+    # ------------------------------------------------------------------
+    def sweep(self) -> int:
+        self._last_sweep = self._clock()
+        try:
+            purged = self._call("purge_expired")
+        except Exception as exc:
+            logger.warning("⚠️ [Checkpoint] 만료 체크포인트 정리 실패: %s", exc)
+            return 0
+        if purged:
+            logger.info("🧹 [Checkpoint] 만료된 대화 %d개 정리", purged)
+        return purged
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        if self._db_lock is None:
+            return getattr(self.repository, method)(*args, **kwargs)
+        with self._db_lock:
+            return getattr(self.repository, method)(*args, **kwargs)
+
+    async def _acall(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        return await asyncio.to_thread(self._call, method, *args, **kwargs)
+
+    def _should_touch(self, thread_id: str) -> bool:
+        if not self.refresh_on_read:
+            return False
+        with self._lock:
+            touched_at = self._touched.get(thread_id)
+            if touched_at is not None and self._clock() - touched_at < _TOUCH_INTERVAL_SECONDS:
+                return False
+        self._mark_touched(thread_id)
+        return True
+
+    def _mark_touched(self, thread_id: str) -> None:
+        with self._lock:
+            self._touched[thread_id] = self._clock()
+            self._touched.move_to_end(thread_id)
+            while len(self._touched) > self._touched_limit:
+                self._touched.popitem(last=False)
+
+    def _write_rows(self, writes: Sequence[Tuple[str, Any]], task_id: str, task_path: str):
+        return [
+            (task_id, idx, channel, type_, value, path)
+            for task_id, idx, channel, (type_, value), path in self._dump_writes(writes, task_id, task_path)
+        ]
+
+    def _row_tuple(self, row: Dict[str, Any]) -> CheckpointTuple:
+        writes = [
+            (task_id, idx, channel, (type_, value), task_path)
+            for task_id, idx, channel, type_, value, task_path in row["writes"]
+        ]
+        return self._tuple(
+            row["thread_id"],
+            row["checkpoint_ns"],
+            row["checkpoint_id"],
+            row["checkpoint"],
+            row["metadata"],
+            row["parent_checkpoint_id"],
+            writes,
+        )
+
+    @staticmethod
+    def _list_args(
+        config: Optional[RunnableConfig],
+        before: Optional[RunnableConfig],
+        limit: Optional[int],
+    ) -> Dict[str, Any]:
+        return {
+            "thread_id": config["configurable"]["thread_id"] if config else None,
+            "checkpoint_ns": config["configurable"].get("checkpoint_ns") if config else None,
+            "checkpoint_id": get_checkpoint_id(config) if config else None,
+            "before": get_checkpoint_id(before) if before else None,
+            "limit": limit,
+        }
+
+    def _filter_rows(
+        self,
+        rows: List[Dict[str, Any]],
+        filter: Optional[Dict[str, Any]],
+        limit: Optional[int],
+    ) -> Iterator[CheckpointTuple]:
+        for row in rows:
+            if limit is not None and limit <= 0:
+                break
+            if filter and not self._matches(self._loads(row["metadata"]), filter):
+                continue
+            if limit is not None:
+                limit -= 1
+            yield self._row_tuple(row)
+
+
+def _sqlite_repository():
+    """GRAPH_CHECKPOINT_SQLITE_PATH 파일을 쓰는 체크포인트 저장소"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from src.models.graph_checkpoint import GraphCheckpoint, GraphCheckpointThread, GraphCheckpointWrite
+    from src.repositories.graph_checkpoint_repository import GraphCheckpointRepository
+
+    path = Path(settings.GRAPH_CHECKPOINT_SQLITE_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    for model in (GraphCheckpointThread, GraphCheckpoint, GraphCheckpointWrite):
+        model.__table__.create(bind=engine, checkfirst=True)
+    return GraphCheckpointRepository(sessionmaker(bind=engine, expire_on_commit=False))
+
+
+@lru_cache(maxsize=None)
+def get_checkpointer(backend: str = "memory") -> _CompactCheckpointSaver:
+    """
+    백엔드별 공유 체크포인터
+
+    자동화 레벨/이벤트 루프별로 따로 컴파일되는 그래프가 같은 저장소를 쓰도록
+    백엔드마다 인스턴스 하나만 만듭니다.
+    """
+    key = backend.lower()
+    if key == "postgres":
+        return DatabaseCheckpointSaver()
+    if key == "sqlite":
+        return DatabaseCheckpointSaver(_sqlite_repository(), serialize=True)
+    if key != "memory":
+        logger.warning("Graph checkpoint backend '%s'는 지원되지 않아 메모리 체크포인터로 대체합니다.", backend)
+    return BoundedMemorySaver()
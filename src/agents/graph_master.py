@@ -21,12 +21,9 @@ from typing import Any, Dict, Optional
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph, END
-try:
-    from langgraph.checkpoints.memory import MemorySaver
-except ImportError:  # pragma: no cover - 호환성 유지
-    from langgraph.checkpoint.memory import MemorySaver  # type: ignore
 from langgraph_supervisor import create_supervisor
 
+from src.agents.checkpointer import get_checkpointer
 from src.config.settings import settings
 from src.schemas.graph_state import GraphState
 from src.agents.master.routing_nodes import (
@@ -251,23 +248,17 @@ def build_state_graph(automation_level: int = 2):
 def _resolve_backend_key(backend: Optional[str] = None) -> str:
     if backend:
         return backend.lower()
-    return getattr(settings, "GRAPH_CHECKPOINT_BACKEND", "memory").lower()
+    return settings.GRAPH_CHECKPOINT_BACKEND.lower()
 
 
 def _create_checkpointer(backend_key: str):
     """
-    현재 환경에서는 Redis/Postgres 체크포인터를 사용하지 않고
-    항상 인메모리 Saver를 반환한다.
-    """
-    key = backend_key.lower()
-
-    if key != "memory":
-        logger.warning(
-            "Graph checkpoint backend '%s'는 지원되지 않아 MemorySaver로 대체합니다.",
-            backend_key,
-        )
+    GRAPH_CHECKPOINT_BACKEND(memory/postgres/sqlite)에 맞는 공유 체크포인터를 반환한다.
 
-    return MemorySaver()
+    자동화 레벨/이벤트 루프별로 컴파일된 그래프가 같은 인스턴스를 쓰므로
+    대화 상태는 백엔드별로 한 곳에만 쌓인다.
+    """
+    return get_checkpointer(backend_key.lower())
 
 
 def _loop_token() -> str:
@@ -0,0 +1,263 @@
+"""
+규칙 기반 사전 라우터 (LLM 라우터 앞단)
+
+"삼성전자 현재가", "코스피 지수", "PER이 뭐야?", "삼성전자 10주 매수" 같은
+확실한 요청은 미리 컴파일한 패턴과 로컬 종목 사전(stock_name_resolver)만으로
+한 번에 분류해 route_query/종목명 추출 LLM 호출 없이 바로 보냅니다.
+
+- 시세/지수 조회 → worker_dispatch (stock_price / index_price)
+- 용어 질문 → direct_answer (constants.glossary)
+- 매매 명령 → supervisor (agents_to_call=["trading"], 정식 종목명/코드로 지정한 경우만)
+
+엔티티(종목/지수/용어)를 지운 나머지가 허용 어휘로만 이루어진 경우에만 확정하고,
+조금이라도 애매하면 None을 반환해 기존 LLM 라우터로 넘깁니다.
+경로별 처리 건수/지연 시간은 `pre_router_stats()`로 `/health`에 노출합니다.
+"""
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config.settings import settings
+from src.constants.glossary import GLOSSARY, GLOSSARY_ALIASES
+from src.services.stock_name_resolver import stock_name_resolver
+from src.utils.hangul import normalize_name
+
+LLM_PATH = "llm"
+
+_STOCK_CODE_RE = re.compile(r"(?<![\d,])(\d{6})(?![\d,]|\s*원|\s*주(?!가))")
+_INDEX_RE = re.compile(r"코스피\s*200|kospi\s*200|코스피|코스닥|kospi|kosdaq")
+
+# 엔티티를 지운 뒤 남아도 되는 어휘 (조사/어미 포함)
+_ENDINGS = r"알려\s*줘|알려\s*주세요|알려\s*줄래|보여\s*줘|보여\s*주세요|조회|확인|좀|요|야|이야|에요|예요|인가요|이에요|는|은|이|가|의|를|을|[?!.,~]|\s"
+_PRICE_KEYWORD_RE = re.compile(r"현재\s*가|주가|시세|가격|얼마|몇\s*원")
+_PRICE_FILLER_RE = re.compile(rf"(?:현재\s*가|현재|지금|오늘|실시간|주가|시세|가격|얼마|몇\s*원|{_ENDINGS})+")
+_INDEX_KEYWORD_RE = re.compile(r"지수|얼마|현재|지금|오늘|시세|몇|포인트")
+_INDEX_FILLER_RE = re.compile(rf"(?:지수|현재\s*가|현재|지금|오늘|실시간|시세|얼마|몇|포인트|{_ENDINGS})+")
+_GLOSSARY_QUESTION_RE = re.compile(r"뭐야|뭔가요|뭐예요|뭐에요|뭐지|무엇|뜻|의미|이란|란\s*\?|설명해\s*줘")
+_GLOSSARY_FILLER_RE = re.compile(
+    rf"(?:뭐야|뭔가요|뭐예요|뭐에요|뭐지|무엇인가요|무엇|뜻|의미|이란|란|설명해\s*줘|설명해\s*주세요|에\s*대해|"
+    rf"대해|가요|이에요|예요|{_ENDINGS})+"
+)
+_TRADE_VERB_RE = re.compile(r"매수|매도|사\s*줘|사\s*주세요|팔아\s*줘|팔아\s*주세요")
+_TRADE_FILLER_RE = re.compile(
+    r"(?:\d[\d,]*\s*주|\d[\d,]*\s*원에?|시장가로?|지정가로?|매수|매도|주문|진행|넣어\s*줘|해\s*줘|해\s*주세요|"
+    r"사\s*줘|사\s*주세요|팔아\s*줘|팔아\s*주세요|좀|요|는|은|이|가|를|을|[!.,~]|\s)+"
+)
+_ASCII_TERM_RE = re.compile(r"^[a-z0-9]+$")
+
+
+@dataclass(frozen=True)
+class PreRoute:
+    """사전 라우터 판정 결과 (path: 통계 라벨, update: routing_node 상태 업데이트)"""
+
+    path: str
+    update: Dict[str, Any]
+
+
+def _residual_is_filler(text: str, spans: List[Tuple[int, int]], filler: re.Pattern) -> bool:
+    """엔티티 구간을 지운 나머지가 허용 어휘로만 이루어졌는지"""
+    remaining = []
+    cursor = 0
+    for start, end in sorted(spans):
+        remaining.append(text[cursor:start])
+        cursor = max(cursor, end)
+    remaining.append(text[cursor:])
+    return filler.sub("", " ".join(remaining)) == ""
+
+
+def _glossary_terms(lowered: str) -> List[Tuple[str, Tuple[int, int]]]:
+    found: Dict[str, Tuple[int, int]] = {}
+    for term in (*GLOSSARY, *GLOSSARY_ALIASES):
+        key = GLOSSARY_ALIASES.get(term, term)
+        if _ASCII_TERM_RE.match(term):
+            match = re.search(rf"(?<![a-z]){term}(?![a-z])", lowered)
+        else:
+            match = re.search(r"\s*".join(map(re.escape, term)), lowered)
+        if match:
+            span = match.span()
+            previous = found.get(key)
+            # 같은 용어의 여러 표기는 가장 긴 구간으로 ("손절매" vs "손절")
+            if previous is None or span[1] - span[0] > previous[1] - previous[0]:
+                found[key] = span
+    return list(found.items())
+
+
+def _stock_entities(query: str) -> List[Tuple[str, str, Tuple[int, int], bool]]:
+    """
+    (종목 코드, 종목명, 구간, 정확 지정 여부) 목록 - 로컬 사전 + 6자리 코드
+
+    정확 지정은 정식 종목명을 그대로 썼거나 6자리 코드를 쓴 경우이며,
+    별칭("삼성", "삼전")/영문 독음으로 찾은 경우는 False입니다.
+    """
+    entities = [
+        (m.code, m.name, (m.start, m.end), normalize_name(m.matched) == normalize_name(m.name))
+        for m in stock_name_resolver.find_in_text(query)
+    ]
+    for match in _STOCK_CODE_RE.finditer(query):
+        entry = stock_name_resolver.get(match.group(1))
+        entities.append((match.group(1), entry.name if entry else None, match.span(), True))
+    return entities
+
+
+def _update(
+    query: str,
+    intent: str,
+    reasoning: str,
+    *,
+    agents: Tuple[str, ...] = (),
+    worker_action: Optional[str] = None,
+    worker_params: Optional[Dict[str, Any]] = None,
+    direct_answer: Optional[str] = None,
+    stock_code: Optional[str] = None,
+    stock_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    decision = {
+        "query_complexity": "simple",
+        "user_intent": intent,
+        "stock_names": [stock_name] if stock_name else None,
+        "agents_to_call": list(agents),
+        "depth_level": "brief",
+        "personalization": {},
+        "reasoning": reasoning,
+        "worker_action": worker_action,
+        "worker_params": worker_params,
+        "direct_answer": direct_answer,
+        "pre_routed": True,
+    }
+    update: Dict[str, Any] = {
+        "routing_decision": {key: value for key, value in decision.items() if value is not None},
+        "query": query,
+        "depth_level": "brief",
+        "personalization": None,
+        "agents_to_call": list(agents),
+        "worker_action": worker_action,
+        "worker_params": worker_params,
+        "direct_answer": direct_answer,
+        "supervisor_reasoning": reasoning,
+        "stock_name": stock_name,
+        "clarification_needed": False,
+        "clarification_message": None,
+    }
+    if stock_code:
+        update["stock_code"] = stock_code
+    return update
+
+
+async def pre_route(query: str) -> Optional[PreRoute]:
+    """확실한 요청이면 PreRoute, 애매하면 None (LLM 라우터로 진행)"""
+    if not query or len(query) > settings.PRE_ROUTER_MAX_QUERY_LENGTH:
+        return None
+
+    await stock_name_resolver.ensure_loaded()
+    lowered = query.lower()
+    stocks = _stock_entities(query)
+    codes = {code for code, _, _, _ in stocks}
+    terms = _glossary_terms(lowered)
+
+    # 1) 매매 명령: 종목 1개 + 매수/매도 동사, 의문형/조건절 없음
+    #    실제 주문으로 이어지므로 정식 종목명/6자리 코드로 지정한 경우만 확정 (별칭은 LLM 라우터로)
+    if _TRADE_VERB_RE.search(query) and "?" not in query:
+        if len(codes) == 1 and not terms and all(exact for _, _, _, exact in stocks):
+            code, name, _, _ = stocks[0]
+            if _residual_is_filler(query, [span for _, _, span, _ in stocks], _TRADE_FILLER_RE):
+                action = "매도" if re.search(r"매도|팔아", query) else "매수"
+                update = _update(
+                    query,
+                    "trading",
+                    f"사전 라우터: {name or code} {action} 명령",
+                    agents=("trading",),
+                    stock_code=code,
+                    stock_name=name,
+                )
+                return PreRoute("trade", update)
+        return None
+
+    # 2) 용어 질문: 용어 1개 + 질문 표현, 종목 언급 없음
+    if len(terms) == 1 and not stocks and _GLOSSARY_QUESTION_RE.search(lowered):
+        key, span = terms[0]
+        if _residual_is_filler(lowered, [span], _GLOSSARY_FILLER_RE):
+            update = _update(query, "definition", f"사전 라우터: 용어 '{key}' 설명", direct_answer=GLOSSARY[key])
+            return PreRoute("glossary", update)
+        return None
+
+    # 3) 지수 조회
+    index_match = _INDEX_RE.search(lowered)
+    if index_match and not stocks and _INDEX_KEYWORD_RE.search(lowered):
+        if _residual_is_filler(lowered, [index_match.span()], _INDEX_FILLER_RE):
+            index_name = index_match.group(0).replace(" ", "")
+            update = _update(
+                query,
+                "quick_info",
+                f"사전 라우터: {index_name} 지수 조회",
+                worker_action="index_price",
+                worker_params={"index_name": index_name},
+            )
+            return PreRoute("index_price", update)
+        return None
+
+    # 4) 종목 현재가 조회: 종목 1개 + 시세 키워드, 지표 용어 없음
+    if len(codes) == 1 and not terms and _PRICE_KEYWORD_RE.search(query):
+        code, name, _, _ = stocks[0]
+        if _residual_is_filler(query, [span for _, _, span, _ in stocks], _PRICE_FILLER_RE):
+            params = {"stock_code": code, **({"stock_name": name} if name else {})}
+            update = _update(
+                query,
+                "quick_info",
+                f"사전 라우터: {name or code} 현재가 조회",
+                worker_action="stock_price",
+                worker_params=params,
+                stock_code=code,
+                stock_name=name,
+            )
+            return PreRoute("stock_price", update)
+
+    return None
+
+
+class RoutingStats:
+    """라우팅 경로별 처리 건수/지연 시간 (LLM 우회 비율 측정용)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._paths: Dict[str, Dict[str, float]] = {}
+
+    def record(self, path: str, elapsed_ms: float) -> None:
+        with self._lock:
+            entry = self._paths.setdefault(path, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._paths.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            paths = {
+                path: {
+                    "count": int(entry["count"]),
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 2),
+                    "max_ms": round(entry["max_ms"], 2),
+                }
+                for path, entry in self._paths.items()
+            }
+        total = sum(entry["count"] for entry in paths.values())
+        skipped = total - paths.get(LLM_PATH, {}).get("count", 0)
+        return {
+            "total": total,
+            "llm_skipped": skipped,
+            "skip_rate": round(skipped / total, 4) if total else 0.0,
+            "paths": paths,
+        }
+
+
+routing_stats = RoutingStats()
+
+
+def pre_router_stats() -> Dict[str, Any]:
+    """사전 라우터 통계 (`/health` 노출용)"""
+    return {"enabled": settings.PRE_ROUTER_ENABLED, **routing_stats.stats()}
@@ -8,15 +8,18 @@ from __future__ import annotations
 
 import logging
 import re
+import time
 from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import AIMessage
 from langchain_core.prompts import ChatPromptTemplate
 
+from src.agents.master.pre_router import LLM_PATH, pre_route, routing_stats
 from src.agents.router.router_agent import route_query
 from src.config.settings import settings
 from src.schemas.graph_state import GraphState
 from src.services.stock_data_service import stock_data_service
+from src.services.stock_name_resolver import stock_name_resolver
 from src.utils.llm_factory import get_claude_llm
 from src.utils.stock_name_extractor import extract_stock_names_from_query
 from src.utils.text_utils import ensure_plain_text
@@ -31,6 +34,10 @@ async def _resolve_stock_code_from_names(stock_names: Optional[List[str]]) -> Op
     for stock_name in stock_names:
         if not stock_name:
             continue
+        code = await stock_name_resolver.aresolve(stock_name)
+        if code:
+            logger.info("✅ [Routing] 종목 코드 찾기 성공 (로컬 해석): %s -> %s", stock_name, code)
+            return code
         for market in ("KOSPI", "KOSDAQ", "KONEX"):
             code = await stock_data_service.get_stock_by_name(stock_name, market=market)
             if code:
@@ -66,6 +73,22 @@ async def routing_node(state: GraphState) -> Dict[str, Any]:
             "clarification_needed": False,
         }
 
+    started = time.perf_counter()
+    if settings.PRE_ROUTER_ENABLED:
+        pre_routed = await pre_route(query)
+        if pre_routed is not None:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            routing_stats.record(pre_routed.path, elapsed_ms)
+            logger.info("⚡ [RoutingNode] 사전 라우터 처리: %s (%.1fms)", pre_routed.path, elapsed_ms)
+            return pre_routed.update
+
+    update = await _route_with_llm(state, query)
+    routing_stats.record(LLM_PATH, (time.perf_counter() - started) * 1000)
+    return update
+
+
+async def _route_with_llm(state: GraphState, query: str) -> Dict[str, Any]:
+    """LLM 라우터(route_query) 결과로 상태 업데이트 구성"""
     user_profile = state.get("user_profile") or {}
     conversation_history = state.get("conversation_history") or []
 
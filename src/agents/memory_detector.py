@@ -156,7 +156,7 @@ async def apply_profile_update(
     user_id: str,
     update: ProfileUpdate,
     user_profile_service,
-    db
+    db=None
 ) -> Dict[str, Any]:
     """
     감지된 프로파일 업데이트 적용
@@ -165,7 +165,7 @@ async def apply_profile_update(
         user_id: 사용자 ID
         update: ProfileUpdate 객체
         user_profile_service: UserProfileService 인스턴스
-        db: DB 세션
+        db: DB 세션 (None이면 서비스 전용 세션 사용)
 
     Returns:
         업데이트된 프로파일
@@ -177,7 +177,8 @@ async def apply_profile_update(
     logger.info(f"🔄 [MemoryDetector] 프로파일 업데이트 적용: {update.field} = {update.value}")
 
     try:
-        updated_profile = user_profile_service.update_user_profile(
+        # 커밋은 스레드에서 실행되고, 프로파일 캐시는 서비스에서 갱신됨
+        updated_profile = await user_profile_service.aupdate_user_profile(
             user_id=user_id,
             updates={update.field: update.value},
             db=db
@@ -2,9 +2,10 @@
 Research Agent 서브그래프 (Deep Agent 플로우)
 """
 import logging
-from typing import Literal
+from typing import List, Union
 
 from langgraph.graph import END, StateGraph
+from langgraph.types import Send
 
 from .state import ResearchState
 from .nodes import (
@@ -24,17 +25,31 @@ from .nodes import (
 
 logger = logging.getLogger(__name__)
 
-
-def _route_task(
-    state: ResearchState,
-) -> Literal["data", "macro", "bull", "bear", "insight", "technical", "trading_flow", "information", "done"]:
-    task = state.get("current_task")
-    if not task:
-        return "done"
-    worker = str(task.get("worker", "")).lower()
-    if worker not in {"data", "macro", "bull", "bear", "insight", "technical", "trading_flow", "information"}:
-        return "insight"
-    return worker  # type: ignore[return-value]
+# task.worker → 노드 이름
+WORKER_NODES = {
+    "data": "data_worker",
+    "technical": "technical_analyst",
+    "trading_flow": "trading_flow_analyst",
+    "information": "information_analyst",
+    "macro": "macro_worker",
+    "bull": "bull_worker",
+    "bear": "bear_worker",
+    "insight": "insight_worker",
+}
+
+
+def _dispatch_tasks(state: ResearchState) -> Union[str, List[Send]]:
+    """task_router가 고른 작업을 Send로 동시에 실행 (없으면 synthesis)"""
+    tasks = state.get("ready_tasks") or []
+    if not tasks:
+        return "synthesis"
+
+    sends = []
+    for task in tasks:
+        worker = str(task.get("worker", "")).lower()
+        node = WORKER_NODES.get(worker, "insight_worker")
+        sends.append(Send(node, {**state, "current_task": task, "ready_tasks": []}))
+    return sends
 
 
 def build_research_subgraph():
@@ -42,7 +57,12 @@ def build_research_subgraph():
     Research Agent 서브그래프 생성
 
     Flow:
-    query_intent_classifier → planner → task_router → (worker loop) → synthesis → END
+    query_intent_classifier → planner → task_router ⇄ (병렬 worker) → synthesis → END
+
+    Parallel Execution:
+    - task_router: 선행 worker가 끝난 작업을 분석 깊이별 max_parallel_workers 만큼 선택
+    - 선택된 작업은 Send로 동시에 실행되고, completed_tasks/task_notes는 reducer로 병합
+    - 예) comprehensive: data → (technical, trading_flow, information, macro, bull, bear) → insight
 
     Dynamic Worker Selection:
     - query_intent_classifier: 쿼리 의도 분석 및 분석 깊이 결정 (quick/standard/comprehensive)
@@ -79,34 +99,14 @@ def build_research_subgraph():
     workflow.add_edge("query_intent_classifier", "planner")
     workflow.add_edge("planner", "task_router")
 
-    # 조건부 라우팅
+    # 준비된 작업을 병렬 실행 (fan-out) → 모두 끝나면 task_router에서 다음 묶음 선택 (fan-in)
     workflow.add_conditional_edges(
         "task_router",
-        _route_task,
-        {
-            "data": "data_worker",
-            "technical": "technical_analyst",
-            "trading_flow": "trading_flow_analyst",
-            "information": "information_analyst",
-            "macro": "macro_worker",
-            "bull": "bull_worker",
-            "bear": "bear_worker",
-            "insight": "insight_worker",
-            "done": "synthesis",
-        },
+        _dispatch_tasks,
+        [*WORKER_NODES.values(), "synthesis"],
     )
 
-    # 모든 워커는 완료 후 task_router로 돌아감
-    for worker in (
-        "data_worker",
-        "technical_analyst",
-        "trading_flow_analyst",
-        "information_analyst",
-        "macro_worker",
-        "bull_worker",
-        "bear_worker",
-        "insight_worker",
-    ):
+    for worker in WORKER_NODES.values():
         workflow.add_edge(worker, "task_router")
 
     # 종료
@@ -15,16 +15,20 @@ from langchain_core.messages import AIMessage, HumanMessage
 from src.agents.research.state import ResearchState
 from src.config.settings import settings
 from src.utils.llm_factory import get_research_llm as get_llm
+from src.utils.llm_cache import llm_cache_scope
 from src.utils.json_parser import safe_json_parse
 from src.utils.indicators import calculate_all_indicators
+from src.utils.blob_store import blob_store, resolve_blob
 from src.utils.stock_name_extractor import extract_stock_names_from_query
 from src.services.stock_data_service import stock_data_service
+from src.services.stock_name_resolver import stock_name_resolver
 from src.services.dart_service import dart_service
 from src.constants.analysis_depth import (
     ANALYSIS_DEPTH_LEVELS,
     classify_depth_by_keywords,
     extract_focus_areas,
     get_default_depth,
+    get_depth_config,
 )
 
 from .state import ResearchState
@@ -33,6 +37,26 @@ logger = logging.getLogger(__name__)
 
 ALLOWED_WORKERS = {"data", "bull", "bear", "insight", "macro", "technical", "trading_flow", "information"}
 
+# Worker 선행 관계 (계획에 포함된 선행 worker만 기다림)
+# - 분석 worker는 data_worker 산출물만 사용하므로 data 이후 병렬 실행
+# - insight는 bull/bear/macro 결과를 종합
+WORKER_DEPENDENCIES: Dict[str, set] = {
+    "data": set(),
+    "insight": {"data", "bull", "bear", "macro"},
+}
+DEFAULT_WORKER_DEPENDENCIES = {"data"}
+
+# data_worker 소스별 타임아웃 (초) - 초과 시 해당 소스 없이 부분 결과로 진행
+DATA_SOURCE_TIMEOUTS: Dict[str, float] = {
+    "price": 15.0,
+    "dart": 10.0,
+    "fundamental": 5.0,
+    "market_cap": 5.0,
+    "market_index": 5.0,
+}
+PRICE_HISTORY_DAYS = 30
+RECENT_BARS_IN_PROMPT = 10
+
 
 def _json_default(value: Any) -> Union[float, str, list]:
     """json.dumps에서 직렬화할 수 없는 값을 안전하게 변환한다."""
@@ -105,6 +129,12 @@ async def _extract_stock_code(state: ResearchState) -> str:
             if stock_names:
                 stock_name = stock_names[0]  # 첫 번째 종목 사용
 
+                # 로컬 해석기 (전체 시장 한 번에 조회)
+                code = await stock_name_resolver.aresolve(stock_name)
+                if code:
+                    logger.info(f"✅ [Research] 종목 코드 추출 성공 (로컬 해석): {stock_name} -> {code}")
+                    return code
+
                 # 종목명으로 코드 검색
                 markets = ["KOSPI", "KOSDAQ", "KONEX"]
                 for market in markets:
@@ -173,13 +203,9 @@ def _task_complete(
     summary: str,
     extra: Dict[str, Any],
 ) -> ResearchState:
-    completed = list(state.get("completed_tasks") or [])
-    notes = list(state.get("task_notes") or [])
-
-    if task:
-        completed.append({**task, "status": "done", "summary": summary})
-    if summary:
-        notes.append(summary)
+    # completed_tasks/task_notes는 reducer로 병합되므로 이번 작업분만 반환
+    completed = [{**task, "status": "done", "summary": summary}] if task else []
+    notes = [summary] if summary else []
 
     update: ResearchState = {
         "completed_tasks": completed,
@@ -190,6 +216,11 @@ def _task_complete(
     return update
 
 
+def _skip_on_error() -> ResearchState:
+    # 병렬 worker는 같은 superstep에서 실행되므로 전체 state를 돌려주면 키 충돌/로그 중복이 생김
+    return {"current_task": None}
+
+
 async def query_intent_classifier_node(state: ResearchState) -> ResearchState:
     """
     Query Intent Classifier (쿼리 의도 분석기) - LLM 완전 판단 기반
@@ -229,8 +260,9 @@ async def query_intent_classifier_node(state: ResearchState) -> ResearchState:
             },
         )
 
-        # LLM 호출
-        response = await llm.ainvoke(prompt)
+        # LLM 호출 (같은 쿼리/프로파일 반복 시 응답 캐시 사용)
+        with llm_cache_scope("intent_classifier"):
+            response = await llm.ainvoke(prompt)
 
         # JSON 파싱 (프롬프트 유틸리티 사용)
         from src.prompts import parse_llm_json
@@ -379,7 +411,7 @@ async def planner_node(state: ResearchState) -> ResearchState:
 1. 추천된 worker 중에서 선택하세요 (위 목록 참고)
 2. {analysis_depth} 레벨에 맞는 적절한 worker 수를 선택하세요
 3. 집중 영역({", ".join(focus_areas) if focus_areas else "없음"})이 있다면 우선적으로 포함하세요
-4. worker는 순차적으로 실행됩니다 (data → technical → trading_flow → ... → insight)
+4. data가 먼저 실행되고, 나머지 분석 worker는 병렬로 실행되며 insight는 bull/bear/macro 이후에 실행됩니다
 
 JSON 형식으로만 답변하세요:
 {{
@@ -438,24 +470,166 @@ JSON 형식으로만 답변하세요:
     return {
         "plan": plan,
         "pending_tasks": deepcopy(validated_tasks),
-        "completed_tasks": [],
+        "ready_tasks": [],
+        "completed_tasks": None,  # None = 이전 조사 기록 초기화 (_append_log)
         "current_task": None,
-        "task_notes": [],
+        "task_notes": None,
         "messages": [plan_message],
         "stock_code": stock_code,
     }
 
 
+def _task_dependencies(worker: str) -> set:
+    return WORKER_DEPENDENCIES.get(worker, DEFAULT_WORKER_DEPENDENCIES)
+
+
 def task_router_node(state: ResearchState) -> ResearchState:
+    """
+    실행 가능한 작업 묶음 선택 (DAG 스케줄러)
+
+    계획에 포함된 선행 worker가 모두 끝난 작업을 ready로 보고,
+    분석 깊이별 max_parallel_workers 만큼 한 번에 내보냅니다.
+    계획에 없는 선행 worker는 기다리지 않습니다.
+    """
     pending = list(state.get("pending_tasks") or [])
     if not pending:
-        return {"current_task": None, "pending_tasks": []}
+        return {"current_task": None, "pending_tasks": [], "ready_tasks": []}
+
+    completed_workers = {
+        str(task.get("worker")) for task in (state.get("completed_tasks") or [])
+    }
+    pending_workers = {str(task.get("worker")) for task in pending}
 
-    task = pending.pop(0)
-    logger.info("🧭 [Research/Router] 다음 작업 선택: %s (%s)", task["id"], task["worker"])
+    ready: List[int] = []
+    for idx, task in enumerate(pending):
+        blocking = _task_dependencies(task["worker"]) & (pending_workers - completed_workers)
+        # 같은 worker가 여러 번 계획된 경우 자기 자신은 선행 조건에서 제외
+        blocking.discard(task["worker"])
+        if not blocking:
+            ready.append(idx)
+
+    if not ready:
+        # 순환 등으로 진행할 수 없으면 계획 순서대로 하나씩 실행
+        ready = [0]
+
+    depth_config = get_depth_config(state.get("analysis_depth") or get_default_depth())
+    selected = set(ready[: max(1, depth_config.get("max_parallel_workers", 1))])
+    batch = [task for idx, task in enumerate(pending) if idx in selected]
+    remaining = [task for idx, task in enumerate(pending) if idx not in selected]
+
+    logger.info(
+        "🧭 [Research/Router] 병렬 작업 선택: %s (대기 %d개)",
+        ", ".join(f"{task['id']}({task['worker']})" for task in batch),
+        len(remaining),
+    )
     return {
-        "current_task": task,
-        "pending_tasks": pending,
+        "ready_tasks": batch,
+        "pending_tasks": remaining,
+    }
+
+
+async def _collect_source(
+    name: str,
+    coro: Coroutine[Any, Any, Any],
+    status: Dict[str, str],
+    default: Any = None,
+) -> Any:
+    """소스 하나를 타임아웃 내에 수집 (실패/지연 시 default로 대체)"""
+    timeout = DATA_SOURCE_TIMEOUTS[name]
+    try:
+        result = await asyncio.wait_for(coro, timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning("⏱️ [Research/Data] %s 시간 초과 (%.0fs) - 부분 결과로 진행", name, timeout)
+        status[name] = "timeout"
+        return default
+    except Exception as exc:
+        logger.warning("⚠️ [Research/Data] %s 수집 실패: %s", name, exc)
+        status[name] = "error"
+        return default
+
+    status[name] = "ok" if result is not None else "empty"
+    return result
+
+
+async def _load_price_records(stock_code: str, days: int) -> Optional[List[Dict[str, Any]]]:
+    """price_records blob 재조회 (다른 워커에서 재개/캐시 만료 시)"""
+    price_df = await stock_data_service.get_stock_price(stock_code, days=days)
+    if price_df is None or len(price_df) == 0:
+        return None
+    return price_df.reset_index().to_dict("records")
+
+
+async def _load_dart_statements(corp_code: str, year: str) -> Any:
+    """dart_statements blob 재조회"""
+    return await dart_service.get_financial_statement(corp_code, bsns_year=year) or {}
+
+
+blob_store.register_loader("price_records", _load_price_records)
+blob_store.register_loader("dart_statements", _load_dart_statements)
+
+
+def _format_recent_bars(records: List[Dict[str, Any]], limit: int = RECENT_BARS_IN_PROMPT) -> str:
+    """일별 시세 레코드 중 최근 limit개를 프롬프트용 표로 변환"""
+    lines = []
+    for row in records[-limit:]:
+        day = row.get("Date") or row.get("date") or row.get("index")
+        lines.append(
+            f"- {str(day)[:10]}: 시가 {_coerce_number(row.get('Open'), 0):,.0f} / "
+            f"고가 {_coerce_number(row.get('High'), 0):,.0f} / "
+            f"저가 {_coerce_number(row.get('Low'), 0):,.0f} / "
+            f"종가 {_coerce_number(row.get('Close'), 0):,.0f} / "
+            f"거래량 {_coerce_number(row.get('Volume'), 0):,.0f}"
+        )
+    return "\n".join(lines) or "데이터 없음"
+
+
+async def _fetch_dart_data(stock_code: str) -> Optional[tuple]:
+    """고유번호 조회 후 재무제표/기업개황을 동시에 조회"""
+    corp_code = await dart_service.search_corp_code_by_stock_code(stock_code)
+    if not corp_code:
+        logger.warning("⚠️ [Research/Data] 고유번호 조회 실패: %s", stock_code)
+        return None
+
+    financial_statements, company_info = await asyncio.gather(
+        dart_service.get_financial_statement(corp_code, bsns_year="2023"),
+        dart_service.get_company_info(corp_code),
+    )
+    financial_data = {
+        "stock_code": stock_code,
+        "corp_code": corp_code,
+        "year": "2023",
+        # 재무제표 원본은 상태 밖에 두고 핸들만 유지 (필요한 노드에서 resolve_blob으로 역참조)
+        "statements": blob_store.put(
+            financial_statements or {},
+            kind="dart_statements",
+            ref={"corp_code": corp_code, "year": "2023"},
+        ),
+        "source": "DART",
+    }
+    company_data = {
+        "stock_code": stock_code,
+        "corp_code": corp_code,
+        "info": company_info or {},
+        "source": "DART",
+    }
+    return financial_data, company_data
+
+
+async def _fetch_market_index() -> Dict[str, Any]:
+    market_df = await stock_data_service.get_market_index("KOSPI", days=30)
+    return {
+        "index": "KOSPI",
+        "current": float(market_df.iloc[-1]["Close"])
+        if market_df is not None and len(market_df) > 0
+        else None,
+        "change": float(market_df.iloc[-1]["Close"] - market_df.iloc[-2]["Close"])
+        if market_df is not None and len(market_df) > 1
+        else None,
+        "change_rate": float(
+            (market_df.iloc[-1]["Close"] / market_df.iloc[-2]["Close"] - 1) * 100
+        )
+        if market_df is not None and len(market_df) > 1
+        else None,
     }
 
 
@@ -467,67 +641,61 @@ async def data_worker_node(state: ResearchState) -> ResearchState:
     logger.info("📊 [Research/Data] 데이터 수집 시작: %s", stock_code)
 
     try:
-        price_df = await stock_data_service.get_stock_price(stock_code, days=30)
+        # 서로 독립적인 소스는 동시에 수집하고, 느린 소스는 타임아웃 후 부분 결과로 진행
+        # (펀더멘털/시가총액은 같은 현재가 조회를 공유하므로 KIS 호출은 1회)
+        status: Dict[str, str] = {}
+        price_task = asyncio.ensure_future(
+            asyncio.wait_for(
+                stock_data_service.get_stock_price(stock_code, days=PRICE_HISTORY_DAYS),
+                timeout=DATA_SOURCE_TIMEOUTS["price"],
+            )
+        )
+        optional_sources = asyncio.gather(
+            _collect_source("dart", _fetch_dart_data(stock_code), status),
+            _collect_source("fundamental", stock_data_service.get_fundamental_data(stock_code), status),
+            _collect_source("market_cap", stock_data_service.get_market_cap_data(stock_code), status),
+            _collect_source(
+                "market_index",
+                _fetch_market_index(),
+                status,
+                default={"index": "KOSPI", "current": None, "change": None, "change_rate": None},
+            ),
+        )
+
+        try:
+            price_df = await price_task
+        except asyncio.TimeoutError:
+            optional_sources.cancel()
+            raise RuntimeError(f"주가 데이터 조회 시간 초과: {stock_code}")
+        except Exception:
+            optional_sources.cancel()
+            raise
         if price_df is None or len(price_df) == 0:
+            optional_sources.cancel()
             raise RuntimeError(f"주가 데이터 조회 실패: {stock_code}")
 
         price_data = {
             "stock_code": stock_code,
             "days": len(price_df),
-            "prices": price_df.reset_index().to_dict("records"),
+            # 일별 시세 레코드는 체크포인트/SSE 페이로드에서 빼고 핸들만 유지
+            "prices": blob_store.put(
+                price_df.reset_index().to_dict("records"),
+                kind="price_records",
+                ref={"stock_code": stock_code, "days": PRICE_HISTORY_DAYS},
+            ),
             "latest_close": float(price_df.iloc[-1]["Close"]),
             "latest_volume": int(price_df.iloc[-1]["Volume"]),
             "source": "FinanceDataReader",
         }
-
-        corp_code = await dart_service.search_corp_code_by_stock_code(stock_code)
-        if corp_code:
-            financial_statements = await dart_service.get_financial_statement(
-                corp_code, bsns_year="2023"
-            )
-            company_info = await dart_service.get_company_info(corp_code)
-            financial_data = {
-                "stock_code": stock_code,
-                "corp_code": corp_code,
-                "year": "2023",
-                "statements": financial_statements or {},
-                "source": "DART",
-            }
-            company_data = {
-                "stock_code": stock_code,
-                "corp_code": corp_code,
-                "info": company_info or {},
-                "source": "DART",
-            }
-        else:
-            logger.warning("⚠️ [Research/Data] 고유번호 조회 실패: %s", stock_code)
-            financial_data = None
-            company_data = None
-
         technical_indicators = calculate_all_indicators(price_df)
-        fundamental_data = await stock_data_service.get_fundamental_data(stock_code)
-        market_cap_data = await stock_data_service.get_market_cap_data(stock_code)
+
+        dart_data, fundamental_data, market_cap_data, market_data = await optional_sources
+        financial_data, company_data = dart_data or (None, None)
         # investor_trading_data 제거됨 (KIS API 미지원)
 
-        try:
-            market_df = await stock_data_service.get_market_index("KOSPI", days=30)
-            market_data = {
-                "index": "KOSPI",
-                "current": float(market_df.iloc[-1]["Close"])
-                if market_df is not None and len(market_df) > 0
-                else None,
-                "change": float(market_df.iloc[-1]["Close"] - market_df.iloc[-2]["Close"])
-                if market_df is not None and len(market_df) > 1
-                else None,
-                "change_rate": float(
-                    (market_df.iloc[-1]["Close"] / market_df.iloc[-2]["Close"] - 1) * 100
-                )
-                if market_df is not None and len(market_df) > 1
-                else None,
-            }
-        except Exception as exc:
-            logger.warning("⚠️ [Research/Data] 시장 지수 조회 실패: %s", exc)
-            market_data = {"index": "KOSPI", "current": None, "change": None, "change_rate": None}
+        partial = sorted(name for name, result in status.items() if result in {"timeout", "error"})
+        if partial:
+            logger.info("📊 [Research/Data] 부분 결과로 진행: %s", ", ".join(partial))
 
         cols = {
             "closing": price_data["latest_close"],
@@ -557,6 +725,7 @@ async def data_worker_node(state: ResearchState) -> ResearchState:
             "market_cap_data": market_cap_data,
             # investor_trading_data 제거됨 (KIS API 미지원)
             "technical_indicators": technical_indicators,
+            "data_sources": status,
             "messages": [message],
             "request_id": request_id,
         }
@@ -575,7 +744,7 @@ async def data_worker_node(state: ResearchState) -> ResearchState:
 
 async def bull_worker_node(state: ResearchState) -> ResearchState:
     if state.get("error"):
-        return state
+        return _skip_on_error()
 
     task = state.get("current_task")
     stock_code = state.get("stock_code") or await _extract_stock_code(state)
@@ -670,7 +839,7 @@ JSON 형식으로 답변하세요:
 
 async def bear_worker_node(state: ResearchState) -> ResearchState:
     if state.get("error"):
-        return state
+        return _skip_on_error()
 
     task = state.get("current_task")
     stock_code = state.get("stock_code") or await _extract_stock_code(state)
@@ -774,7 +943,7 @@ async def macro_worker_node(state: ResearchState) -> ResearchState:
     - 해당 종목에 미치는 영향
     """
     if state.get("error"):
-        return state
+        return _skip_on_error()
 
     task = state.get("current_task")
     stock_code = state.get("stock_code") or await _extract_stock_code(state)
@@ -782,13 +951,11 @@ async def macro_worker_node(state: ResearchState) -> ResearchState:
     logger.info("🌍 [Research/Macro] 거시경제 분석 시작: %s", stock_code)
 
     try:
-        # 1. BOK API로 거시경제 데이터 수집
-        from src.services.macro_data_service import macro_data_service
+        # 1. 공유 시장 컨텍스트에서 거시경제 데이터 조회 (데이터 기준일별로 한 번 수집)
+        from src.services.market_context_service import market_context_service
 
-        macro_data = macro_data_service.macro_summary()
-        if not macro_data.get("base_rate"):
-            await macro_data_service.refresh_all()
-            macro_data = macro_data_service.macro_summary()
+        market_context = await market_context_service.get_context()
+        macro_data = market_context.get("macro") or {}
 
         # 2. 종목 정보 추출 (기업명, 업종 등)
         company_data = state.get("company_data") or {}
@@ -828,7 +995,9 @@ JSON 형식으로 답변하세요:
 }}
 """
 
-        response = await llm.ainvoke(prompt)
+        # 같은 데이터 기준일이면 종목별 분석 결과를 재사용
+        with llm_cache_scope("macro_worker", data_version=market_context.get("version")):
+            response = await llm.ainvoke(prompt)
         analysis = safe_json_parse(response.content, "Research/Macro")
 
         if not isinstance(analysis, dict):
@@ -837,6 +1006,8 @@ JSON 형식으로 답변하세요:
         # 4. 거시경제 데이터와 분석 결과 통합
         macro_analysis = {
             "raw_data": macro_data,
+            "market_cycle": market_context.get("market_cycle"),
+            "data_version": market_context.get("version"),
             "analysis": analysis,
             "timestamp": asyncio.get_event_loop().time(),
         }
@@ -878,7 +1049,7 @@ JSON 형식으로 답변하세요:
 
 async def insight_worker_node(state: ResearchState) -> ResearchState:
     if state.get("error"):
-        return state
+        return _skip_on_error()
 
     task = state.get("current_task")
     stock_code = state.get("stock_code") or await _extract_stock_code(state)
@@ -964,7 +1135,7 @@ async def technical_analyst_worker_node(state: ResearchState) -> ResearchState:
     - RSI, MACD, 볼린저밴드 등 기술적 지표 해석
     """
     if state.get("error"):
-        return state
+        return _skip_on_error()
 
     task = state.get("current_task")
     stock_code = state.get("stock_code") or await _extract_stock_code(state)
@@ -991,6 +1162,8 @@ async def technical_analyst_worker_node(state: ResearchState) -> ResearchState:
 
     current_price = price_data.get("latest_close", 0)
     volume = price_data.get("latest_volume", 0)
+    # 일별 시세는 상태에 핸들로만 있으므로 지지/저항, 거래량 패턴 분석에 필요할 때 역참조
+    price_records = await resolve_blob(price_data.get("prices"), default=[])
 
     prompt = f"""당신은 기술적 분석 전문가입니다. 다음 데이터를 기반으로 상세한 기술적 분석을 제공하세요.
 
@@ -999,6 +1172,9 @@ async def technical_analyst_worker_node(state: ResearchState) -> ResearchState:
 - 현재가: {current_price:,}원
 - 거래량: {volume:,}주
 
+## 최근 일봉 (최근 {RECENT_BARS_IN_PROMPT}거래일)
+{_format_recent_bars(price_records or [])}
+
 ## 기술적 지표 
 {_dumps(technical, indent=2)} 
 
@@ -1120,7 +1296,7 @@ async def trading_flow_analyst_worker_node(state: ResearchState) -> ResearchStat
     - 수급 전망
     """
     if state.get("error"):
-        return state
+        return _skip_on_error()
 
     task = state.get("current_task")
     stock_code = state.get("stock_code") or await _extract_stock_code(state)
@@ -1268,7 +1444,7 @@ async def information_analyst_worker_node(state: ResearchState) -> ResearchState
     향후 뉴스 API 연동 시 실제 뉴스 크롤링 추가 예정
     """
     if state.get("error"):
-        return state
+        return _skip_on_error()
 
     task = state.get("current_task")
     stock_code = state.get("stock_code") or await _extract_stock_code(state)
@@ -1391,7 +1567,7 @@ async def synthesis_node(state: ResearchState) -> ResearchState:
     를 종합하여 최종 투자 의견 생성
     """
     if state.get("error"):
-        return state
+        return _skip_on_error()
 
     logger.info("🤝 [Research/Synthesis] 최종 의견 통합 시작 ")
 
@@ -1667,11 +1843,8 @@ async def synthesis_node(state: ResearchState) -> ResearchState:
 
     message = AIMessage(content=dashboard_content)
 
-    notes = list(state.get("task_notes") or [])
-    notes.append(f"최종 의견 {recommendation} (신뢰도 {confidence})")
-
-    completed = list(state.get("completed_tasks") or [])
-    completed.append(
+    notes = [f"최종 의견 {recommendation} (신뢰도 {confidence})"]
+    completed = [
         {
             "id": "synthesis",
             "worker": "synthesis",
@@ -1679,7 +1852,7 @@ async def synthesis_node(state: ResearchState) -> ResearchState:
             "status": "done",
             "summary": consensus["summary"],
         }
-    )
+    ]
 
     return {
         "consensus": consensus,
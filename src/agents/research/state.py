@@ -5,13 +5,30 @@ from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
 
 
+def _append_log(left: Optional[List[Any]], right: Optional[List[Any]]) -> List[Any]:
+    """
+    병렬 worker 결과 병합용 reducer
+
+    같은 superstep에서 여러 worker가 쓴 값을 이어 붙입니다.
+    None을 쓰면 목록을 비웁니다 (planner가 새 조사를 시작할 때 사용).
+    """
+    if right is None:
+        return []
+    return list(left or []) + list(right)
+
+
+def _latest(left: Any, right: Any) -> Any:
+    """병렬 worker가 동시에 써도 충돌하지 않도록 마지막 값만 유지"""
+    return right
+
+
 class ResearchState(TypedDict, total=False):
     """
     Research Agent 서브그래프 State
 
     Flow:
     1. planner: 조사 계획 수립
-    2. worker loop: data → bull → bear → insight
+    2. worker DAG: data → (technical, trading_flow, information, macro, bull, bear 병렬) → insight
     3. synthesis: 최종 의견 통합
 
     Note: total=False로 설정하여 partial update 지원 (Langgraph 패턴)
@@ -50,21 +67,24 @@ class ResearchState(TypedDict, total=False):
     pending_tasks: Optional[List[Dict[str, Any]]]
     """남은 작업 목록"""
 
-    completed_tasks: Optional[List[Dict[str, Any]]]
-    """완료된 작업 및 산출물"""
+    ready_tasks: Optional[List[Dict[str, Any]]]
+    """이번 단계에서 병렬로 실행할 작업 (task_router가 선택)"""
 
-    current_task: Optional[Dict[str, Any]]
-    """현재 수행 중인 작업"""
+    completed_tasks: Annotated[Optional[List[Dict[str, Any]]], _append_log]
+    """완료된 작업 및 산출물 (worker별 추가분이 병합됨)"""
 
-    task_notes: Optional[List[str]]
-    """작업 중 생성된 요약/메모"""
+    current_task: Annotated[Optional[Dict[str, Any]], _latest]
+    """현재 수행 중인 작업 (Send로 worker마다 개별 전달)"""
+
+    task_notes: Annotated[Optional[List[str]], _append_log]
+    """작업 중 생성된 요약/메모 (worker별 추가분이 병합됨)"""
 
     # 데이터 수집 결과
     price_data: Optional[dict]
-    """주가 데이터 (pykrx)"""
+    """주가 데이터 (pykrx) - 일별 레코드(prices)는 blob 핸들, `await resolve_blob(...)`으로 역참조"""
 
     financial_data: Optional[dict]
-    """재무제표 데이터 (DART)"""
+    """재무제표 데이터 (DART) - 원본(statements)은 blob 핸들, `await resolve_blob(...)`으로 역참조"""
 
     company_data: Optional[dict]
     """기업 정보 (DART)"""
@@ -82,6 +102,9 @@ class ResearchState(TypedDict, total=False):
     investor_trading_data: Optional[dict]
     """투자주체별 매매 동향 (외국인, 기관, 개인)"""
 
+    data_sources: Optional[Dict[str, str]]
+    """소스별 수집 상태 ("ok" | "empty" | "timeout" | "error")"""
+
     # 기술적 지표
     technical_indicators: Optional[dict]
     """기술적 지표 계산 결과 (RSI, MACD, Bollinger Bands 등)"""
@@ -109,5 +132,5 @@ class ResearchState(TypedDict, total=False):
     """최종 합의 의견"""
 
     # 메타데이터
-    error: Optional[str]
+    error: Annotated[Optional[str], _latest]
     """에러 메시지"""
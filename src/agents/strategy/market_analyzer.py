@@ -9,9 +9,10 @@ Market Analyzer - 시장 사이클 분석 서브모듈
 
 from typing import Dict, Any
 from src.schemas.strategy import MarketCycle
-from src.services.macro_data_service import macro_data_service
+from src.services.market_context_service import market_context_service
 from src.services.sector_data_service import sector_data_service
 from src.utils.llm_factory import get_llm
+from src.utils.llm_cache import llm_cache_scope
 from src.utils.json_parser import safe_json_parse
 import json
 
@@ -23,7 +24,7 @@ class MarketAnalyzer:
     Week 14 실제 구현:
     - 거시경제 데이터 수집 (한국은행 API)
     - 섹터 성과 데이터 수집
-    - LLM 기반 사이클 분석
+    - LLM 기반 사이클 분석 (데이터 기준일마다 한 번, market_context_service가 호출)
     """
 
     def __init__(self):
@@ -36,24 +37,22 @@ class MarketAnalyzer:
         """
         시장 사이클 분석
 
+        macro_data를 주지 않으면 데이터 기준일별로 공유되는 시장 컨텍스트
+        (market_context_service)의 판단을 그대로 사용합니다.
+
         Args:
             macro_data: 거시경제 데이터 (옵션)
 
         Returns:
             MarketCycle: 시장 사이클 정보
         """
-        # 1. 거시경제 데이터 수집
         if not macro_data:
-            macro_data = macro_data_service.macro_summary()
-            if not macro_data.get("base_rate"):
-                await macro_data_service.refresh_all()
-                macro_data = macro_data_service.macro_summary()
-
-        # 2. 섹터 성과 데이터 수집
-        sector_ranking = sector_data_service.get_sector_ranking(days=30)
-
-        # 3. LLM을 사용한 시장 사이클 분석
-        cycle_analysis = await self._analyze_with_llm(macro_data, sector_ranking)
+            context = await market_context_service.get_context()
+            cycle_analysis = context["market_cycle"]
+        else:
+            # 섹터 성과 데이터 수집 후 LLM 분석
+            sector_ranking = sector_data_service.get_sector_ranking(days=30)
+            cycle_analysis = await self.analyze_cycle(macro_data, sector_ranking)
 
         return MarketCycle(
             cycle=cycle_analysis["cycle"],
@@ -61,7 +60,7 @@ class MarketAnalyzer:
             summary=cycle_analysis["summary"]
         )
 
-    async def _analyze_with_llm(
+    async def analyze_cycle(
         self,
         macro_data: Dict,
         sector_ranking: list
@@ -130,7 +129,9 @@ class MarketAnalyzer:
 }}"""
 
         try:
-            response = await self.llm.ainvoke(prompt)
+            # 같은 거시 지표/섹터 순위면 캐시된 판단을 재사용
+            with llm_cache_scope("market_analyzer"):
+                response = await self.llm.ainvoke(prompt)
             content = response.content
 
             # 안전한 JSON 파싱
@@ -158,7 +159,8 @@ class MarketAnalyzer:
                 "cycle": cycle,
                 "confidence": 0.6,
                 "summary": f"상위 5개 섹터 중 {top_sectors_positive}개 상승",
-                "key_factors": ["섹터 성과 기반 판단"]
+                "key_factors": ["섹터 성과 기반 판단"],
+                "fallback": True,  # 공유 컨텍스트로 저장하지 않고 다음 갱신 때 재시도
             }
 
 
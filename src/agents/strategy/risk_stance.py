@@ -10,6 +10,7 @@ Risk Stance - 리스크 스탠스 결정 서브모듈
 import logging
 from decimal import Decimal
 from src.schemas.strategy import AssetAllocation
+from src.services.market_context_service import annualized_volatility, market_context_service
 from src.services.stock_data_service import stock_data_service
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,9 @@ class RiskStanceAnalyzer:
         """
         자산 배분 결정 (LLM 기반)
 
+        변동성을 직접 주지 않으면 공유 시장 컨텍스트에 미리 계산된
+        리스크 성향별 배분을 사용합니다 (시장 사이클이 같을 때).
+
         Args:
             market_cycle: 시장 사이클
             risk_tolerance: 리스크 허용도 (conservative/moderate/aggressive)
@@ -45,13 +49,37 @@ class RiskStanceAnalyzer:
         Returns:
             AssetAllocation: 자산 배분 전략
         """
+        if volatility_index is None:
+            try:
+                context = await market_context_service.get_context()
+            except Exception as e:
+                logger.warning(f"⚠️ [Risk Stance] 공유 시장 컨텍스트 조회 실패: {e}")
+                context = {}
+
+            shared = (context.get("allocations") or {}).get(risk_tolerance)
+            if shared and (context.get("market_cycle") or {}).get("cycle") == market_cycle:
+                return AssetAllocation(
+                    stocks=Decimal(str(shared["stocks"])),
+                    cash=Decimal(str(shared["cash"])),
+                    rationale=shared["rationale"]
+                )
+
+            volatility_index = (context.get("market_index") or {}).get("volatility")
+            if volatility_index is None:
+                volatility_index = await self._calculate_market_volatility()
+
+        return await self.compute_allocation(market_cycle, risk_tolerance, volatility_index)
+
+    async def compute_allocation(
+        self,
+        market_cycle: str,
+        risk_tolerance: str,
+        volatility_index: float
+    ) -> AssetAllocation:
+        """LLM으로 주식/현금 비율 계산"""
         from src.utils.llm_factory import get_llm
         from src.utils.json_parser import safe_json_parse
 
-        # 변동성 계산
-        if volatility_index is None:
-            volatility_index = await self._calculate_market_volatility()
-
         llm = get_llm(max_tokens=1000, temperature=0.1)
 
         prompt = f"""당신은 자산 배분 전문가입니다. 다음 정보를 바탕으로 주식/현금 비율을 결정하세요.
@@ -109,22 +137,14 @@ class RiskStanceAnalyzer:
             Exception: Rate Limit 등으로 데이터 조회 실패 시
         """
         # KOSPI 지수 최근 60일 데이터 조회 (Rate Limit 방지 최적화)
-        df = await stock_data_service.get_market_index("KS11", days=60)
+        df = await stock_data_service.get_market_index("KOSPI", days=60)
 
-        if df is None or len(df) < 20:
+        # 변동성 = 일일 수익률 표준편차 * √252 (연환산, %)
+        volatility_pct = annualized_volatility(df)
+        if volatility_pct is None:
             logger.warning("⚠️ [Risk Stance] KOSPI 데이터 부족, 변동성 계산 불가")
             return None
 
-        # 일일 수익률 계산
-        returns = df["Close"].pct_change().dropna()
-
-        # 변동성 = 일일 수익률 표준편차 * √252 (연환산)
-        daily_volatility = returns.std()
-        annual_volatility = daily_volatility * (252 ** 0.5)
-
-        # 백분율로 변환
-        volatility_pct = annual_volatility * 100
-
         logger.info(f"📊 [Risk Stance] KOSPI 변동성: {volatility_pct:.2f}%")
         return float(volatility_pct)
 
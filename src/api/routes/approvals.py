@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import Optional
+import asyncio
 import logging
 
 from src.models.database import get_db
@@ -76,7 +77,8 @@ async def list_approval_history(
     - 2페이지: `GET /approvals?limit=20&offset=20`
     """
     try:
-        items, total = approval_service.list_approval_history(
+        items, total = await asyncio.to_thread(
+            approval_service.list_approval_history,
             db=db,
             user_id=DEMO_USER_UUID,
             status=status,
@@ -152,7 +154,8 @@ async def get_approval_detail(
     **에러:**
     - `404`: 승인 요청이 존재하지 않음
     """
-    detail = approval_service.get_approval_detail(
+    detail = await asyncio.to_thread(
+        approval_service.get_approval_detail,
         db=db,
         request_id=request_id,
         user_id=DEMO_USER_UUID
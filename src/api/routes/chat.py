@@ -4,6 +4,7 @@
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator, model_validator
 from typing import List, Optional, Dict, Any, Literal, cast
+import asyncio
 import uuid
 import os
 import logging
@@ -16,7 +17,7 @@ from langchain_core.runnables import RunnableConfig
 from langgraph_sdk.schema import Command
 from src.services import chat_history_service
 from src.services.hitl_interrupt_service import handle_hitl_interrupt
-from src.services.user_profile_service import UserProfileService
+from src.services.user_profile_service import user_profile_service
 from src.schemas.hitl_config import (
     HITLConfig,
     PRESET_COPILOT,
@@ -156,9 +157,8 @@ async def chat(request: ChatRequest, db: Session = Depends(get_db)):
         hitl_config = request.hitl_config
         legacy_level = config_to_level(hitl_config)
 
-        # Get user profile for dynamic worker selection
-        user_profile_service = UserProfileService()
-        user_profile = user_profile_service.get_user_profile(DEMO_USER_UUID, db)
+        # Get user profile for dynamic worker selection (캐시 miss 시에만 스레드에서 DB 조회)
+        user_profile = await user_profile_service.aget_user_profile(DEMO_USER_UUID)
         logger.info("📋 [Chat] UserProfile 로드 완료: preferred_depth=%s, expertise_level=%s",
                     user_profile.get("preferred_depth"), user_profile.get("expertise_level"))
 
@@ -363,10 +363,19 @@ async def chat(request: ChatRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/history/{conversation_id}")
-async def get_chat_history(conversation_id: str, limit: int = Query(100, ge=1, le=500)):
-    """특정 대화의 메시지 히스토리를 조회합니다."""
+async def get_chat_history(
+    conversation_id: str,
+    limit: int = Query(100, ge=1, le=500),
+    before: Optional[str] = Query(None, description="이전 페이지 커서 (이전 응답의 next_before)"),
+):
+    """특정 대화의 최근 메시지 히스토리를 조회합니다 (오래된 순 정렬, before로 이전 페이지)."""
     conversation_uuid = _ensure_uuid(conversation_id)
-    history = await chat_history_service.get_history(conversation_id=conversation_uuid, limit=limit)
+    try:
+        history = await chat_history_service.get_history(
+            conversation_id=conversation_uuid, limit=limit, before=before
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid before cursor")
 
     if not history:
         raise HTTPException(status_code=404, detail="Conversation not found")
@@ -394,6 +403,8 @@ async def get_chat_history(conversation_id: str, limit: int = Query(100, ge=1, l
             }
             for message in messages
         ],
+        "has_more": history.get("has_more", False),
+        "next_before": history.get("next_before"),
     }
 
 
@@ -418,19 +429,14 @@ async def list_chat_sessions(limit: int = Query(50, ge=1, le=100)):
         message_count = summary.get("message_count") or 0
 
         raw_title = session.summary
-        if not raw_title and first_user_message and first_user_message.content:
-            raw_title = first_user_message.content.strip()
+        if not raw_title and first_user_message:
+            raw_title = first_user_message.strip()
         if not raw_title:
             raw_title = "새 대화"
 
         title = raw_title[:50]
-        last_message_text = None
-        if last_message and last_message.content:
-            last_message_text = last_message.content.strip()[:100]
-
-        last_message_at = (
-            last_message.created_at if last_message else session.last_message_at or session.updated_at
-        )
+        last_message_text = last_message.strip()[:100] if last_message else None
+        last_message_at = session.last_message_at or session.updated_at
 
         response.append(
             ChatSessionSummary(
@@ -549,8 +555,8 @@ async def approve_action(
         conversation_uuid = _ensure_uuid(approval.thread_id)
         conversation_id = str(conversation_uuid)
 
-        session_row = (
-            db.query(ChatSession)
+        session_row = await asyncio.to_thread(
+            lambda: db.query(ChatSession)
             .filter(ChatSession.conversation_id == conversation_uuid)
             .first()
         )
@@ -600,7 +606,8 @@ async def approve_action(
         if approval.request_id:
             try:
                 request_uuid = uuid.UUID(approval.request_id)
-                _save_user_decision_to_db(
+                await asyncio.to_thread(
+                    _save_user_decision_to_db,
                     db=db,
                     request_id=request_uuid,
                     user_id=DEMO_USER_UUID,
@@ -19,7 +19,6 @@ from src.agents.graph_master import build_graph
 from src.services.user_profile_service import user_profile_service
 from src.services import chat_history_service
 from src.services.hitl_interrupt_service import handle_hitl_interrupt
-from src.models.database import get_db_context
 from src.utils.hitl_compat import automation_level_to_hitl_config
 from src.config.settings import settings
 
@@ -171,8 +170,7 @@ async def stream_multi_agent_execution(
     try:
         yield _sse("master_start", {"message": "분석을 시작합니다..."})
 
-        with get_db_context() as db:
-            user_profile = user_profile_service.get_user_profile(user_id, db)
+        user_profile = await user_profile_service.aget_user_profile(user_id)
 
         yield _sse("user_profile", {"profile_loaded": True})
 
@@ -194,12 +192,12 @@ async def stream_multi_agent_execution(
 
         conversation_history: list[dict] = []
         try:
-            history_data = await chat_history_service.get_history(conversation_id=conversation_uuid, limit=10)
+            # 방금 저장한 사용자 메시지 + 직전 6개 (최근 구간만 조회)
+            history_data = await chat_history_service.get_history(conversation_id=conversation_uuid, limit=7)
             if history_data and "messages" in history_data:
-                messages = history_data["messages"][:-1]
                 conversation_history = [
                     {"role": msg.role, "content": msg.content}
-                    for msg in messages[-6:]
+                    for msg in history_data["messages"][:-1]
                 ]
         except Exception as history_error:  # pragma: no cover - 히스토리 조회 실패는 치명적이지 않음
             logger.warning("⚠️ [MultiAgentStream] 대화 히스토리 로드 실패: %s", history_error)
@@ -241,16 +239,14 @@ async def stream_multi_agent_execution(
 
         if pending_nodes:
             logger.info("⚠️ [MultiAgentStream] Interrupt 감지: next=%s", pending_nodes)
-            with get_db_context() as db:
-                hitl_result = await handle_hitl_interrupt(
-                    state=state,
-                    conversation_uuid=conversation_uuid,
-                    conversation_id=conversation_id,
-                    user_id=demo_user_uuid,
-                    db=db,
-                    automation_level=automation_level,
-                    hitl_config=hitl_config,
-                )
+            hitl_result = await handle_hitl_interrupt(
+                state=state,
+                conversation_uuid=conversation_uuid,
+                conversation_id=conversation_id,
+                user_id=demo_user_uuid,
+                automation_level=automation_level,
+                hitl_config=hitl_config,
+            )
 
             if hitl_result:
                 yield _sse(
@@ -447,26 +443,25 @@ async def get_chat_sessions(
         # Demo 사용자 UUID
         demo_user_uuid = settings.demo_user_uuid
 
-        # 세션 목록 조회 (전체 조회 후 offset 적용)
-        all_sessions = await chat_history_service.list_sessions(
+        # 세션 목록 조회 (비정규화 컬럼 사용, 메시지 테이블 미조회)
+        sessions = await chat_history_service.list_sessions(
             user_id=demo_user_uuid,
-            limit=limit + offset  # offset만큼 더 가져옴
+            limit=limit,
+            offset=offset,
         )
-
-        # offset 적용하여 슬라이싱
-        sessions_slice = all_sessions[offset:offset + limit]
+        total = await chat_history_service.count_sessions(user_id=demo_user_uuid)
 
         # API 응답 형식으로 포맷팅
         formatted_sessions = []
-        for session_data in sessions_slice:
+        for session_data in sessions:
             first_msg = session_data.get("first_user_message")
             last_msg = session_data.get("last_message")
             chat_session = session_data.get("session")
 
             formatted_sessions.append({
                 "conversation_id": str(session_data["conversation_id"]),
-                "title": first_msg.content[:50] if first_msg and first_msg.content else "새 대화",
-                "last_message": last_msg.content[:100] if last_msg and last_msg.content else "",
+                "title": first_msg[:50] if first_msg else "새 대화",
+                "last_message": last_msg[:100] if last_msg else "",
                 "created_at": chat_session.created_at.isoformat() if chat_session and hasattr(chat_session, "created_at") else None,
                 "updated_at": chat_session.last_message_at.isoformat() if chat_session and hasattr(chat_session, "last_message_at") and chat_session.last_message_at else None,
                 "message_count": session_data.get("message_count", 0)
@@ -474,7 +469,7 @@ async def get_chat_sessions(
 
         return {
             "sessions": formatted_sessions,
-            "total": len(all_sessions),
+            "total": total,
             "limit": limit,
             "offset": offset
         }
@@ -492,12 +487,13 @@ async def get_chat_sessions(
 
 
 @router.get("/sessions/{conversation_id}")
-async def get_chat_session(conversation_id: str):
+async def get_chat_session(conversation_id: str, before: Optional[str] = None):
     """
     특정 대화 세션의 메시지 조회
 
     Args:
         conversation_id: 대화 ID (UUID)
+        before: 이전 페이지 커서 (이전 응답의 next_before, 미지정 시 최신 구간)
 
     Returns:
         {
@@ -520,7 +516,8 @@ async def get_chat_session(conversation_id: str):
         conversation_uuid = uuid.UUID(conversation_id)
         history = await chat_history_service.get_history(
             conversation_id=conversation_uuid,
-            limit=100  # 최근 100개 메시지
+            limit=100,  # 최근 100개 메시지
+            before=before,
         )
 
         if not history:
@@ -540,7 +537,9 @@ async def get_chat_session(conversation_id: str):
 
         return {
             "conversation_id": conversation_id,
-            "messages": messages
+            "messages": messages,
+            "has_more": history.get("has_more", False),
+            "next_before": history.get("next_before"),
         }
 
     except ValueError:
@@ -12,7 +12,6 @@ from pydantic import BaseModel, Field
 
 from src.services.profile_generator import generate_ai_profile
 from src.services.user_profile_service import user_profile_service
-from src.models.database import get_db_context
 
 logger = logging.getLogger(__name__)
 
@@ -137,27 +136,25 @@ async def create_profile_from_screening(request: OnboardingRequest):
             detail=f"프로파일 생성 실패: {str(e)}"
         )
 
-    # 4. DB 저장
-    with get_db_context() as db:
-        try:
-            # 기존 프로파일 확인
-            existing_profile = user_profile_service.get_user_profile(user_uuid, db)
+    # 4. DB 저장 (스레드에서 실행, 프로파일 캐시 갱신)
+    try:
+        # 기존 프로파일 확인 (없으면 기본값 생성)
+        await user_profile_service.aget_user_profile(user_uuid)
 
-            # 업데이트
-            updated_profile = user_profile_service.update_user_profile(
-                user_id=user_uuid,
-                updates=generated_profile,
-                db=db
-            )
+        # 업데이트
+        await user_profile_service.aupdate_user_profile(
+            user_id=user_uuid,
+            updates=generated_profile,
+        )
 
-            logger.info(f"✅ [Onboarding] 프로파일 저장 완료: {user_id_str}")
+        logger.info(f"✅ [Onboarding] 프로파일 저장 완료: {user_id_str}")
 
-        except Exception as e:
-            logger.error(f"❌ [Onboarding] DB 저장 실패: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"DB 저장 실패: {str(e)}"
-            )
+    except Exception as e:
+        logger.error(f"❌ [Onboarding] DB 저장 실패: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"DB 저장 실패: {str(e)}"
+        )
 
     # 5. 응답 생성
     expertise_level = generated_profile["expertise_level"]
@@ -201,15 +198,14 @@ async def get_investment_profile(user_id: str):
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid user_id format")
 
-    with get_db_context() as db:
-        try:
-            profile = user_profile_service.get_user_profile(user_uuid, db)
-        except Exception as e:
-            logger.error(f"❌ [Onboarding] 프로파일 조회 실패: {e}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"프로파일을 찾을 수 없습니다: {user_id}"
-            )
+    try:
+        profile = await user_profile_service.aget_user_profile(user_uuid)
+    except Exception as e:
+        logger.error(f"❌ [Onboarding] 프로파일 조회 실패: {e}")
+        raise HTTPException(
+            status_code=404,
+            detail=f"프로파일을 찾을 수 없습니다: {user_id}"
+        )
 
     # 프로파일 요약 생성
     expertise = profile.get("expertise_level", "intermediate")
@@ -3,7 +3,6 @@
 """
 from __future__ import annotations
 
-import asyncio
 from datetime import date
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
@@ -14,7 +13,8 @@ from pydantic import BaseModel
 from langchain_core.messages import HumanMessage
 
 from src.agents.research import research_agent
-from src.services import stock_data_service
+from src.config.settings import settings
+from src.services import quote_service, stock_data_service, stock_search_index
 
 router = APIRouter()
 
@@ -62,58 +62,60 @@ async def _latest_price(stock_code: str) -> Dict[str, Any]:
     }
 
 
+def _quote_payload(quote: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """KIS 현재가 응답을 검색 결과 형식으로 변환 (등락률은 비율)"""
+    if not quote:
+        return {}
+    current_price = quote.get("current_price")
+    change_rate = quote.get("change_rate")
+    return {
+        "current_price": Decimal(str(current_price)) if current_price is not None else None,
+        "change_rate": Decimal(str(change_rate)) / 100 if change_rate is not None else None,
+        "volume": quote.get("volume"),
+    }
+
+
 @router.get("/search")
 async def search_stocks(q: str = Query(..., min_length=1), market: str = Query("KOSPI")):
-    """종목명 또는 종목코드로 주식을 검색합니다."""
-    df = await stock_data_service.get_stock_listing(market)
-    if df is None or df.empty:
+    """
+    종목명 또는 종목코드로 주식을 검색합니다.
+
+    메모리 검색 인덱스(접두/중간/초성 일치)를 사용하고, 현재가는 캐시된 값 위주로
+    짧게만 기다려 채웁니다.
+    """
+    if not await stock_search_index.ensure_loaded():
+        # DB에 종목 목록이 아직 없으면 한 번 적재한 뒤 인덱스 구성
+        df = await stock_data_service.get_stock_listing(market)
+        if df is not None and not df.empty:
+            await stock_search_index.ensure_loaded(force=True)
+    if not stock_search_index.loaded:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="종목 목록을 조회할 수 없습니다.",
         )
 
-    query = q.strip().upper()
-    is_code = query.isdigit()
-
-    if is_code:
-        mask = df["Code"].str.contains(query, case=False, na=False)
-    else:
-        mask = df["Name"].str.contains(query, case=False, na=False)
-
-    filtered = df[mask]
-    if filtered.empty and not is_code:
-        mask = df["Code"].str.contains(query, case=False, na=False)
-        filtered = df[mask]
-
-    matches = filtered.head(10)
+    matches, total = stock_search_index.search(q, market=market, limit=10)
+    quotes = await quote_service.get_cached_quotes(
+        [entry.code for entry in matches],
+        wait_seconds=settings.STOCK_SEARCH_QUOTE_WAIT_SECONDS,
+    )
 
     results: List[Dict[str, Any]] = []
-    codes = matches["Code"].tolist()
-
-    price_tasks = [asyncio.create_task(_latest_price(code)) for code in codes]
-    price_results = await asyncio.gather(*price_tasks, return_exceptions=True)
-    price_map: Dict[str, Dict[str, Any]] = {}
-    for code, value in zip(codes, price_results):
-        if isinstance(value, Exception):
-            continue
-        price_map[code] = value
-
-    for _, row in matches.iterrows():
-        code = row["Code"]
-        price_payload = price_map.get(code, {})
+    for entry in matches:
+        price_payload = _quote_payload(quotes.get(entry.code))
         results.append(
             {
-                "stock_code": code,
-                "stock_name": row["Name"],
-                "market": row.get("Market", market),
-                "sector": row.get("Industry"),
+                "stock_code": entry.code,
+                "stock_name": entry.name,
+                "market": entry.market or market,
+                "sector": entry.sector,
                 "current_price": price_payload.get("current_price"),
                 "change_rate": price_payload.get("change_rate"),
                 "volume": price_payload.get("volume"),
             }
         )
 
-    return {"results": results, "total": int(filtered.shape[0])}
+    return {"results": results, "total": total}
 
 
 @router.get("/{stock_code}", response_model=StockInfo)
@@ -131,6 +133,7 @@ async def get_stock_info(stock_code: str, market: str = Query("KOSPI")):
         raise HTTPException(status_code=404, detail="요청한 종목을 찾을 수 없습니다.")
 
     row = match.iloc[0]
+    stock_search_index.record_view(stock_code)
     price_payload = await _latest_price(stock_code)
 
     return StockInfo(
@@ -4,7 +4,7 @@ Application configuration and settings
 import os
 import uuid
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
@@ -49,6 +49,10 @@ class Settings(BaseSettings):
     ROUTER_MODEL: str = "claude-haiku-4-5-20251001"  # 종목명 인식 개선을 위해 Claude 사용
 
 
+    # 규칙 기반 사전 라우터 (시세/지수 조회, 용어 질문, 매매 명령은 LLM 라우터 생략)
+    PRE_ROUTER_ENABLED: bool = True
+    PRE_ROUTER_MAX_QUERY_LENGTH: int = 60  # 이보다 긴 문장은 항상 LLM 라우터로
+
     # Web Search
     ENABLE_WEB_SEARCH: bool = True
     WEB_SEARCH_MAX_RESULTS: int = 5
@@ -60,6 +64,13 @@ class Settings(BaseSettings):
     MAX_TOKENS: int = 4000
     LLM_TEMPERATURE: float = 0.1
 
+    # LLM 응답 캐시 (llm_cache_scope로 지정한 노드만)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PERSIST: bool = True  # DB(llm_response_cache 테이블)에도 저장해 재시작/워커 간 공유
+    LLM_CACHE_MAXSIZE: int = 512
+    LLM_CACHE_DEFAULT_TTL_SECONDS: int = 600
+    LLM_CACHE_TTLS: str = ""  # 노드별 TTL 재정의 ("macro_worker=21600,intent_classifier=3600")
+
     @property
     def llm_provider(self) -> str:
         """현재 LLM 모드에 따라 사용할 프로바이더 반환
@@ -95,6 +106,9 @@ class Settings(BaseSettings):
 
     # DART API
     DART_API_KEY: str = ""
+    DART_CORP_CODE_CACHE_PATH: str = ""  # 고유번호 매핑 캐시 파일 (비우면 시스템 임시 디렉터리)
+    DART_CORP_CODE_REFRESH_HOURS: int = 24
+    DART_CORP_CODE_RETRY_MINUTES: int = 60  # 매핑 다운로드 실패 후 재시도까지 대기
 
     # BOK API
     BOK_API_KEY: str = ""
@@ -108,6 +122,53 @@ class Settings(BaseSettings):
     KIS_APP_KEY: str | None = None
     KIS_APP_SECRET: str | None = None
     KIS_ACCOUNT_NUMBER: str | None = None
+    # KIS 호출 한도 (초당 호출 수, 실전 20회/모의 2회 한도에서 여유분 확보)
+    KIS_RATE_LIMIT_REAL: float = 15.0
+    KIS_RATE_LIMIT_DEMO: float = 2.0
+    KIS_RATE_LIMIT_BURST: int = 1
+    KIS_TR_RATE_LIMITS: str = ""  # TR_ID별 추가 한도 ("FHKST01010100=5,FHKST03010100=2")
+    KIS_HTTP_TIMEOUT_SECONDS: float = 10.0
+    KIS_HTTP_MAX_CONNECTIONS: int = 20
+    KIS_HTTP_MAX_RETRIES: int = 3  # 5xx/호출 한도 초과 시 재시도 횟수
+    KIS_HTTP_BACKOFF_BASE_SECONDS: float = 0.5
+    KIS_HTTP_BACKOFF_MAX_SECONDS: float = 8.0
+    KIS_TOKEN_STORE_PATH: str = ""  # 워커 간 토큰 공유 파일 (비우면 시스템 임시 디렉터리)
+    KIS_TOKEN_REFRESH_MARGIN_SECONDS: int = 300  # 만료 5분 전부터는 재사용하지 않음
+    KIS_TOKEN_REFRESH_AHEAD_SECONDS: int = 3600  # 백그라운드 선갱신 시점 (만료 1시간 전)
+
+    # 공유 시장 컨텍스트 (거시 지표/지수 기준일별 시장 사이클·자산 배분)
+    MARKET_CONTEXT_SCHEDULER_ENABLED: bool = True
+    MARKET_CONTEXT_CHECK_INTERVAL_SECONDS: int = 1800  # 데이터 기준일 변경 확인 주기
+    MACRO_REFRESH_INTERVAL_HOURS: int = 24  # BOK 지표 재수집 주기
+
+    # 로컬 종목명 해석기/검색 인덱스 (stocks 테이블 인덱스)
+    STOCK_RESOLVER_REFRESH_SECONDS: int = 21600  # 인덱스 재구성 주기 (6시간)
+    STOCK_SEARCH_QUOTE_WAIT_SECONDS: float = 0.3  # 검색 결과 현재가 조회 대기 한도 (초과분은 다음 요청에 반영)
+
+    # KIS 현재가 공유 캐시
+    QUOTE_CACHE_TTL_SECONDS: float = 3.0  # 장중 TTL
+    QUOTE_CACHE_CLOSED_TTL_SECONDS: int = 1800  # 장 마감 후/개장 전 TTL (다음 장 시작 전까지로 제한)
+    QUOTE_CACHE_MAXSIZE: int = 2048
+    QUOTE_CACHE_PERSIST: bool = False  # realtime_prices 테이블에도 저장 (장 마감 후 워커/재시작 간 공유)
+
+    # KIS 실시간 시세(WebSocket) 수신
+    MARKET_STREAM_ENABLED: bool = False  # 보유 종목 체결가/호가 실시간 수신 (REST 현재가 호출 대체)
+    MARKET_STREAM_URL: str = ""  # 비어 있으면 KIS 환경별 기본 URL (테스트/리플레이 서버용)
+    MARKET_STREAM_ORDERBOOK: bool = True  # 호가(H0STASP0)도 구독
+    MARKET_STREAM_BUFFER_SIZE: int = 256  # 종목별 체결 틱 보관 개수
+    MARKET_STREAM_FLUSH_SECONDS: float = 5.0  # realtime_prices/stock_quotes 일괄 저장 주기 (0이면 저장 안 함)
+    MARKET_STREAM_SUBSCRIPTION_REFRESH_SECONDS: int = 60  # 구독 종목(보유 종목 합집합) 갱신 주기
+    MARKET_STREAM_RECONNECT_MAX_SECONDS: float = 30.0  # 재접속 대기 상한 (지수 백오프)
+
+    # 주가 히스토리 캐시
+    PRICE_CACHE_MAXSIZE: int = 2048
+    PRICE_CACHE_TTL_SECONDS: int = 600
+    PRICE_FETCH_CONCURRENCY: int = 4  # 외부 API 주가 보충 시 동시 실행 수
+    PRICE_GAP_MEMO_TTL_SECONDS: int = 86400  # 소스에 없는 거래일(상장 전/거래정지) 재조회 억제 기간
+
+    # 사용자 프로파일 캐시 (업데이트 시 명시적으로 무효화, 워커 간 불일치는 TTL까지 허용)
+    USER_PROFILE_CACHE_MAXSIZE: int = 1024
+    USER_PROFILE_CACHE_TTL_SECONDS: int = 300
 
     # LangSmith (Optional)
     LANGSMITH_API_KEY: str | None = None
@@ -121,6 +182,14 @@ class Settings(BaseSettings):
     # Langgraph persistence
     LANGGRAPH_CHECKPOINT_TTL_MINUTES: int = 43200  # 30일
     LANGGRAPH_CHECKPOINT_REFRESH_ON_READ: bool = True
+    GRAPH_CHECKPOINT_BACKEND: str = "memory"  # memory | postgres (애플리케이션 DB) | sqlite
+    GRAPH_CHECKPOINT_SQLITE_PATH: str = "data/graph_checkpoints.db"
+    LANGGRAPH_CHECKPOINT_MAX_THREADS: int = 1000  # 메모리 계층에 유지할 최대 대화 수 (LRU)
+    LANGGRAPH_CHECKPOINT_MAX_HISTORY: int = 20  # 대화(네임스페이스)별 보관 체크포인트 수
+    LANGGRAPH_CHECKPOINT_COMPRESS_BYTES: int = 2048  # 이 크기 이상 직렬화 결과는 zlib 압축
+    LANGGRAPH_CHECKPOINT_SWEEP_SECONDS: int = 600  # 만료 스레드 DB 정리 주기
+    GRAPH_BLOB_STORE_MAXSIZE: int = 256  # 상태 밖에 두는 큰 데이터(가격 시계열, 재무제표) 최대 보관 수
+    GRAPH_BLOB_STORE_TTL_SECONDS: int = 3600
 
     # CORS
     CORS_ORIGINS: str = (
@@ -141,6 +210,26 @@ class Settings(BaseSettings):
         """Parse CORS origins from comma-separated string"""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()]
 
+    @property
+    def kis_tr_rate_limits(self) -> Dict[str, float]:
+        """Parse per-TR-ID rate limits from comma-separated `TR_ID=rate` pairs"""
+        limits: Dict[str, float] = {}
+        for item in self.KIS_TR_RATE_LIMITS.split(","):
+            tr_id, _, rate = item.partition("=")
+            if tr_id.strip() and rate.strip():
+                limits[tr_id.strip()] = float(rate)
+        return limits
+
+    @property
+    def llm_cache_ttls(self) -> Dict[str, int]:
+        """Parse per-node LLM cache TTLs from comma-separated `node=seconds` pairs"""
+        ttls: Dict[str, int] = {}
+        for item in self.LLM_CACHE_TTLS.split(","):
+            node, _, seconds = item.partition("=")
+            if node.strip() and seconds.strip():
+                ttls[node.strip()] = int(seconds)
+        return ttls
+
     @property
     def cors_origin_regex(self) -> Optional[str]:
         """Return combined CORS origin regex pattern or None"""
@@ -14,6 +14,7 @@ class AnalysisDepthConfig(TypedDict):
     required_workers: List[str]
     optional_workers: List[str]
     max_workers: int
+    max_parallel_workers: int
     estimated_time: str
     use_cases: List[str]
 
@@ -26,6 +27,7 @@ ANALYSIS_DEPTH_LEVELS: Dict[str, AnalysisDepthConfig] = {
         "required_workers": ["data"],
         "optional_workers": ["technical"],  # 쿼리에 따라 추가
         "max_workers": 3,
+        "max_parallel_workers": 2,  # 동시에 실행할 worker 수 상한
         "estimated_time": "10-20초",
         "use_cases": [
             "현재가 확인",
@@ -40,6 +42,7 @@ ANALYSIS_DEPTH_LEVELS: Dict[str, AnalysisDepthConfig] = {
         "required_workers": ["data", "technical"],
         "optional_workers": ["trading_flow", "information", "bull", "bear"],
         "max_workers": 5,
+        "max_parallel_workers": 4,
         "estimated_time": "30-45초",
         "use_cases": [
             "일반적인 종목 분석",
@@ -54,6 +57,7 @@ ANALYSIS_DEPTH_LEVELS: Dict[str, AnalysisDepthConfig] = {
         "required_workers": ["data", "technical", "trading_flow", "information"],
         "optional_workers": ["macro", "bull", "bear", "insight"],
         "max_workers": 8,
+        "max_parallel_workers": 6,
         "estimated_time": "60-90초",
         "use_cases": [
             "신규 종목 발굴",
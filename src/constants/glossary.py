@@ -0,0 +1,77 @@
+"""
+투자 용어 사전
+
+사전 라우터가 "PER이 뭐야?" 같은 단순 용어 질문에 LLM 호출 없이 답할 때 사용합니다.
+키는 소문자/공백 제거 기준이며, 같은 용어의 다른 표기는 GLOSSARY_ALIASES로 연결합니다.
+"""
+from typing import Dict
+
+GLOSSARY: Dict[str, str] = {
+    "per": (
+        "PER(주가수익비율)은 주가를 주당순이익(EPS)으로 나눈 값입니다. "
+        "회사가 버는 이익에 비해 주가가 몇 배로 거래되는지를 보여 주며, "
+        "같은 업종 안에서 낮을수록 이익 대비 저평가로 해석합니다."
+    ),
+    "pbr": (
+        "PBR(주가순자산비율)은 주가를 주당순자산(BPS)으로 나눈 값입니다. "
+        "1배 미만이면 장부상 순자산보다 낮은 가격에 거래된다는 뜻입니다."
+    ),
+    "eps": (
+        "EPS(주당순이익)는 당기순이익을 발행 주식 수로 나눈 값으로, "
+        "주식 1주가 1년 동안 벌어들인 이익을 뜻합니다."
+    ),
+    "bps": "BPS(주당순자산)는 순자산(자본총계)을 발행 주식 수로 나눈 값입니다.",
+    "roe": (
+        "ROE(자기자본이익률)는 당기순이익을 자기자본으로 나눈 비율입니다. "
+        "주주가 맡긴 자본으로 얼마나 효율적으로 이익을 냈는지 보여 줍니다."
+    ),
+    "배당수익률": "배당수익률은 주당 배당금을 현재 주가로 나눈 비율로, 주가 대비 받을 수 있는 배당의 크기를 뜻합니다.",
+    "시가총액": "시가총액은 현재 주가에 상장 주식 수를 곱한 값으로, 시장이 평가하는 회사 전체의 가치입니다.",
+    "etf": (
+        "ETF(상장지수펀드)는 코스피200 같은 지수나 특정 자산의 움직임을 따라가도록 만든 펀드로, "
+        "주식처럼 거래소에서 실시간으로 사고팔 수 있습니다."
+    ),
+    "공매도": (
+        "공매도는 갖고 있지 않은 주식을 빌려서 먼저 판 뒤, 나중에 사서 갚는 거래입니다. "
+        "주가가 떨어지면 이익, 오르면 손실이 납니다."
+    ),
+    "rsi": (
+        "RSI(상대강도지수)는 일정 기간 상승폭과 하락폭을 비교한 0~100 사이의 지표입니다. "
+        "보통 70 이상은 과매수, 30 이하는 과매도로 봅니다."
+    ),
+    "macd": (
+        "MACD는 단기(12일)와 장기(26일) 지수이동평균의 차이로 추세의 방향과 힘을 보는 지표입니다. "
+        "MACD선이 시그널선을 위로 뚫으면 상승 신호로 해석합니다."
+    ),
+    "볼린저밴드": (
+        "볼린저 밴드는 20일 이동평균선을 중심으로 표준편차 2배만큼 위아래로 그린 띠입니다. "
+        "주가가 상단에 닿으면 과열, 하단에 닿으면 과매도 구간으로 봅니다."
+    ),
+    "이동평균선": "이동평균선은 일정 기간(5일, 20일, 60일 등) 종가의 평균을 이은 선으로, 추세를 파악할 때 씁니다.",
+    "골든크로스": "골든크로스는 단기 이동평균선이 장기 이동평균선을 아래에서 위로 뚫는 현상으로, 상승 전환 신호로 봅니다.",
+    "데드크로스": "데드크로스는 단기 이동평균선이 장기 이동평균선을 위에서 아래로 뚫는 현상으로, 하락 전환 신호로 봅니다.",
+    "상한가": "상한가는 하루에 오를 수 있는 최대 가격으로, 국내 주식은 전일 종가 대비 +30%입니다.",
+    "하한가": "하한가는 하루에 내릴 수 있는 최저 가격으로, 국내 주식은 전일 종가 대비 -30%입니다.",
+    "예수금": "예수금은 증권 계좌에 들어 있는 현금으로, 주식을 살 때 쓰거나 출금할 수 있는 돈입니다.",
+    "손절매": "손절매는 손실이 더 커지기 전에 정해 둔 가격에서 보유 주식을 팔아 손실을 확정하는 것입니다.",
+    "분할매수": "분할매수는 한 번에 사지 않고 여러 번에 나눠 사서 평균 매입 단가와 타이밍 위험을 낮추는 방법입니다.",
+    "배당락": "배당락은 배당 받을 권리가 사라진 날로, 보통 그만큼 주가가 조정되어 시작합니다.",
+    "코스피": "코스피(KOSPI)는 유가증권시장에 상장된 전체 종목의 시가총액을 기준으로 계산한 대표 주가지수입니다.",
+    "코스닥": "코스닥(KOSDAQ)은 기술·성장 기업 중심의 코스닥 시장 상장 종목으로 계산한 주가지수입니다.",
+}
+
+# 다른 표기 → GLOSSARY 키
+GLOSSARY_ALIASES: Dict[str, str] = {
+    "주가수익비율": "per",
+    "주가순자산비율": "pbr",
+    "주당순이익": "eps",
+    "주당순자산": "bps",
+    "자기자본이익률": "roe",
+    "시총": "시가총액",
+    "상장지수펀드": "etf",
+    "볼린저": "볼린저밴드",
+    "이평선": "이동평균선",
+    "손절": "손절매",
+    "kospi": "코스피",
+    "kosdaq": "코스닥",
+}
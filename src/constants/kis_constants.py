@@ -8,12 +8,20 @@ KIS_BASE_URLS = {
     "demo": "https://openapivts.koreainvestment.com:29443",
 }
 
+# KIS 실시간 시세 WebSocket URL (환경별)
+KIS_WEBSOCKET_URLS = {
+    "prod": "ws://ops.koreainvestment.com:21000",
+    "demo": "ws://ops.koreainvestment.com:31000",
+}
+
 # KIS API 엔드포인트
 KIS_ENDPOINTS = {
     "auth": "/oauth2/tokenP",
+    "approval": "/oauth2/Approval",  # 실시간(WebSocket) 접속키 발급
     "balance": "/uapi/domestic-stock/v1/trading/inquire-balance",
     "account_balance": "/uapi/domestic-stock/v1/trading/inquire-account-balance",
     "stock_price": "/uapi/domestic-stock/v1/quotations/inquire-price",
+    "multi_stock_price": "/uapi/domestic-stock/v1/quotations/intstock-multprice",  # 관심종목(멀티종목) 시세
     "stock_daily_price": "/uapi/domestic-stock/v1/quotations/inquire-daily-price",  # 국내주식 일자별 시세
     "order": "/uapi/domestic-stock/v1/trading/order-cash",
     # 지수 조회 관련
@@ -28,6 +36,7 @@ KIS_TR_IDS = {
         "demo": "VTTC8434R",
     },
     "stock_price": "FHKST01010100",
+    "multi_stock_price": "FHKST11300006",  # 관심종목(멀티종목) 시세조회 (실전 전용)
     "stock_daily_price": "FHKST03010100",  # 국내주식 일자별 시세
     "order_buy": {
         "real": "TTTC0012U",
@@ -42,6 +51,23 @@ KIS_TR_IDS = {
     "index_daily_price": "FHPUP02120000",  # 국내업종 일자별지수
 }
 
+# 실시간 시세 TR ID (WebSocket)
+KIS_REALTIME_TR_IDS = {
+    "execution": "H0STCNT0",  # 국내주식 실시간체결가
+    "orderbook": "H0STASP0",  # 국내주식 실시간호가
+}
+
+# 실시간 시세 접속키 1개당 최대 등록 건수 (체결가/호가 각각 1건)
+KIS_REALTIME_MAX_REGISTRATIONS = 41
+
+# 멀티종목 시세조회 1회당 최대 종목 수
+KIS_MULTI_PRICE_MAX_CODES = 30
+
+# 호출 한도 초과 응답 코드 (잠시 후 재시도하면 성공)
+KIS_THROTTLE_MSG_CODES = frozenset({
+    "EGW00201",  # 초당 거래건수를 초과하였습니다
+})
+
 # 지수 코드 매핑 (지수명 → KIS 코드)
 INDEX_CODES = {
     "KOSPI": "0001",      # 코스피 지수
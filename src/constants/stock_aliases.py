@@ -0,0 +1,63 @@
+"""
+종목 별칭 사전
+
+사용자가 흔히 쓰는 약칭/구 사명/영문 표기를 공식 종목명으로 매핑합니다.
+자동 생성되는 별칭(공백 제거, 영문 약어 한글 발음, 초성)으로 잡히지 않는 것만 등록합니다.
+"""
+from typing import Dict, FrozenSet
+
+# 별칭 → 공식 종목명 (stocks.stock_name)
+STOCK_NAME_ALIASES: Dict[str, str] = {
+    "삼전": "삼성전자",
+    "삼성": "삼성전자",
+    "삼전우": "삼성전자우",
+    "하이닉스": "SK하이닉스",
+    "하닉": "SK하이닉스",
+    "엔솔": "LG에너지솔루션",
+    "엘엔솔": "LG에너지솔루션",
+    "삼바": "삼성바이오로직스",
+    "삼성바이오": "삼성바이오로직스",
+    "삼성sdi": "삼성SDI",
+    "현대자동차": "현대차",
+    "현차": "현대차",
+    "기아차": "기아",
+    "기아자동차": "기아",
+    "네이버": "NAVER",
+    "카카오톡": "카카오",
+    "카뱅": "카카오뱅크",
+    "포스코": "POSCO홀딩스",
+    "포스코홀딩스": "POSCO홀딩스",
+    "셀트": "셀트리온",
+    "모비스": "현대모비스",
+    "엘지전자": "LG전자",
+    "엘지화학": "LG화학",
+    "엘화": "LG화학",
+    "케이티": "KT",
+    "케이티앤지": "KT&G",
+    "에쓰오일": "S-Oil",
+    "에스오일": "S-Oil",
+    "한전": "한국전력",
+    "한국전력공사": "한국전력",
+    "신한금융": "신한지주",
+    "신한은행": "신한지주",
+    "국민은행": "KB금융",
+    "케이비금융": "KB금융",
+    "하나은행": "하나금융지주",
+    "하나금융": "하나금융지주",
+    "우리은행": "우리금융지주",
+    "에코비엠": "에코프로비엠",
+    "두산에너빌": "두산에너빌리티",
+    "한화에어로": "한화에어로스페이스",
+    "한에어": "한화에어로스페이스",
+    "엔씨": "엔씨소프트",
+}
+
+# 일반 단어와 겹치는 종목명 - 문장 스캔에서는 제외하고 정확한 이름 조회로만 매칭
+AMBIGUOUS_STOCK_NAMES: FrozenSet[str] = frozenset({
+    "대상",
+    "동서",
+    "전방",
+    "국보",
+    "성안",
+    "원익",
+})
@@ -10,6 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.agents.master.pre_router import pre_router_stats
 from src.api.routes import chat, dashboard, portfolio, stocks, multi_agent_stream, artifacts, approvals, news
 from src.api.routes import settings as settings_router
 from src.api.middleware.logging import RequestLoggingMiddleware
@@ -17,6 +18,11 @@ from src.api.error_handlers import setup_error_handlers
 from src.config.settings import settings
 from src.models.database import SessionLocal, init_db
 from src.services import init_kis_service
+from src.services.kis_service import close_kis_service, kis_rate_limit_stats
+from src.services.market_context_service import market_context_service
+from src.services.market_stream_service import market_stream_service
+from src.utils.cache import cache_stats
+from src.utils.llm_cache import llm_cache_stats
 
 tags_metadata = [
     {
@@ -59,7 +65,16 @@ async def lifespan(_: FastAPI):
     # KIS 서비스 초기화
     kis_env = "real" if settings.ENV.lower() == "production" else "demo"
     await init_kis_service(env=kis_env)
+    # 공유 시장 컨텍스트 갱신 스케줄러 (BOK/지수 데이터가 바뀔 때만 재생성)
+    if settings.MARKET_CONTEXT_SCHEDULER_ENABLED:
+        market_context_service.start_scheduler()
+    # 보유 종목 실시간 시세 수신 (현재가 조회를 REST 대신 메모리에서 처리)
+    if settings.MARKET_STREAM_ENABLED:
+        market_stream_service.start()
     yield
+    await market_stream_service.stop()
+    await market_context_service.stop_scheduler()
+    await close_kis_service()
 
 
 # Create FastAPI app
@@ -159,6 +174,11 @@ async def health():
         "status": status_value,
         "database": db_status,
         "agents": "ready",
+        "caches": cache_stats(),
+        "llm_cache": llm_cache_stats(),
+        "kis_rate_limit": kis_rate_limit_stats(),
+        "market_stream": market_stream_service.stats(),
+        "routing": pre_router_stats(),
         "app": settings.APP_NAME,
     }
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import Column, ForeignKey, Integer, JSON, String, Text, TIMESTAMP
+from sqlalchemy import Column, ForeignKey, Index, Integer, JSON, String, Text, TIMESTAMP
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
@@ -27,6 +27,15 @@ class ChatSession(Base):
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), index=True)
     last_message_at = Column(TIMESTAMP, server_default=func.now(), index=True)
 
+    # 세션 목록용 비정규화 컬럼 (메시지 추가 시 갱신, 목록 조회에서 메시지 테이블을 읽지 않음)
+    message_count = Column(Integer, nullable=False, default=0, server_default="0")
+    first_user_message = Column(Text)
+    last_message = Column(Text)
+
+    __table_args__ = (
+        Index("ix_chat_sessions_user_id_last_message_at", "user_id", "last_message_at"),
+    )
+
 
 class ChatMessage(Base):
     """Individual chat messages exchanged within a session."""
@@ -45,3 +54,8 @@ class ChatMessage(Base):
     agent_id = Column(String(50))
     message_metadata = Column(JSON)
     created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
+
+    __table_args__ = (
+        # 최근 N개(tail window) / created_at 키셋 페이지네이션용
+        Index("ix_chat_messages_conversation_id_created_at", "conversation_id", "created_at"),
+    )
@@ -66,5 +66,7 @@ def init_db():
     import src.models.agent  # noqa: F401
     import src.models.chat  # noqa: F401
     import src.models.macro  # noqa: F401
+    import src.models.llm_cache  # noqa: F401
+    import src.models.graph_checkpoint  # noqa: F401
 
     Base.metadata.create_all(bind=engine)
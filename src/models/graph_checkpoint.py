@@ -0,0 +1,52 @@
+"""
+LangGraph 체크포인트 모델 (대화 상태/HITL 중단 지점 영속화)
+"""
+from sqlalchemy import Column, Integer, LargeBinary, String, TIMESTAMP
+from sqlalchemy.sql import func
+
+from src.models.database import Base
+
+
+class GraphCheckpointThread(Base):
+    """대화 스레드별 만료 시각 (TTL 기준 정리 단위)"""
+
+    __tablename__ = "graph_checkpoint_threads"
+
+    thread_id = Column(String(255), primary_key=True)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+    expires_at = Column(TIMESTAMP, nullable=False, index=True)
+
+
+class GraphCheckpoint(Base):
+    """체크포인트 1건 (serde 직렬화 + 압축된 바이너리)"""
+
+    __tablename__ = "graph_checkpoints"
+
+    thread_id = Column(String(255), primary_key=True)
+    checkpoint_ns = Column(String(255), primary_key=True, default="")
+    checkpoint_id = Column(String(64), primary_key=True)
+    parent_checkpoint_id = Column(String(64))
+
+    type = Column(String(32), nullable=False)
+    checkpoint = Column(LargeBinary, nullable=False)
+    metadata_type = Column(String(32), nullable=False)
+    checkpoint_metadata = Column(LargeBinary, nullable=False)
+
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+
+class GraphCheckpointWrite(Base):
+    """체크포인트에 연결된 대기 중 쓰기 (중단된 노드 결과 등)"""
+
+    __tablename__ = "graph_checkpoint_writes"
+
+    thread_id = Column(String(255), primary_key=True)
+    checkpoint_ns = Column(String(255), primary_key=True, default="")
+    checkpoint_id = Column(String(64), primary_key=True)
+    task_id = Column(String(255), primary_key=True)
+    idx = Column(Integer, primary_key=True)
+
+    channel = Column(String(255), nullable=False)
+    type = Column(String(32), nullable=False)
+    value = Column(LargeBinary, nullable=False)
+    task_path = Column(String(500), nullable=False, default="")
@@ -0,0 +1,25 @@
+"""
+LLM 응답 캐시 모델
+"""
+from sqlalchemy import Column, String, Text, TIMESTAMP, Integer, Float
+from sqlalchemy.sql import func
+
+from src.models.database import Base
+
+
+class LLMResponseCacheEntry(Base):
+    """결정적 LLM 호출 결과 (프롬프트 해시 기준, 재시작/워커 간 공유)"""
+
+    __tablename__ = "llm_response_cache"
+
+    cache_key = Column(String(64), primary_key=True)  # sha256(모델 설정 + 정규화 프롬프트 + 데이터 버전)
+    node = Column(String(100), nullable=False, default="default")
+    model = Column(String(200))
+
+    generations = Column(Text, nullable=False)  # langchain_core.load.dumps 직렬화 결과
+    total_tokens = Column(Integer, default=0)
+    latency_ms = Column(Float, default=0.0)
+    hit_count = Column(Integer, default=0)
+
+    created_at = Column(TIMESTAMP, server_default=func.now())
+    expires_at = Column(TIMESTAMP, nullable=False, index=True)
@@ -34,3 +34,14 @@ class MacroIndicator(Base):
     @property
     def reference_datetime(self) -> datetime:
         return datetime.combine(self.reference_date, datetime.min.time())
+
+
+class MarketContextSnapshot(Base):
+    """거시 지표/지수 기준일별로 한 번 생성해 모든 사용자가 공유하는 시장 컨텍스트"""
+
+    __tablename__ = "market_context_snapshots"
+
+    version = Column(String(200), primary_key=True)  # 지표 기준일 + 지수 종가 조합
+    payload = Column(JSON, nullable=False)
+
+    created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
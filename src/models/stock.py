@@ -309,6 +309,9 @@ class StockIndicator(Base):
     volume_ratio = Column(DECIMAL(10, 4))
     is_high_volume = Column(String(1), default="N")
 
+    # 증분 계산 상태 (IndicatorStream.to_dict, 확정된 일봉 기준)
+    stream_state = Column(JSON(none_as_null=True))
+
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
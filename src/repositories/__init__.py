@@ -14,6 +14,20 @@ from .macro_indicator_repository import (
 )
 from .news_repository import news_repository, NewsRepository
 from .disclosure_repository import disclosure_repository, DisclosureRepository
+from .llm_cache_repository import llm_cache_repository, LLMCacheRepository
+from .realtime_price_repository import (
+    realtime_price_repository,
+    RealtimePriceRepository,
+)
+from .stock_quote_repository import stock_quote_repository, StockQuoteRepository
+from .graph_checkpoint_repository import (
+    graph_checkpoint_repository,
+    GraphCheckpointRepository,
+)
+from .market_context_repository import (
+    market_context_repository,
+    MarketContextRepository,
+)
 
 __all__ = [
     "stock_repository",
@@ -28,4 +42,14 @@ __all__ = [
     "NewsRepository",
     "disclosure_repository",
     "DisclosureRepository",
+    "llm_cache_repository",
+    "LLMCacheRepository",
+    "realtime_price_repository",
+    "RealtimePriceRepository",
+    "stock_quote_repository",
+    "StockQuoteRepository",
+    "graph_checkpoint_repository",
+    "GraphCheckpointRepository",
+    "market_context_repository",
+    "MarketContextRepository",
 ]
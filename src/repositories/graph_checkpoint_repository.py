@@ -0,0 +1,230 @@
+"""
+LangGraph 체크포인트 테이블 Repository
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, select, tuple_
+from sqlalchemy.orm import Session
+
+from src.models.database import SessionLocal
+from src.models.graph_checkpoint import GraphCheckpoint, GraphCheckpointThread, GraphCheckpointWrite
+
+from .base import BaseRepository
+
+# (task_id, idx, channel, type, value, task_path)
+WriteRow = Tuple[str, int, str, str, bytes, str]
+
+
+def _checkpoint_row(row: GraphCheckpoint) -> Dict[str, Any]:
+    return {
+        "thread_id": row.thread_id,
+        "checkpoint_ns": row.checkpoint_ns,
+        "checkpoint_id": row.checkpoint_id,
+        "parent_checkpoint_id": row.parent_checkpoint_id,
+        "checkpoint": (row.type, row.checkpoint),
+        "metadata": (row.metadata_type, row.checkpoint_metadata),
+    }
+
+
+class GraphCheckpointRepository(BaseRepository):
+    """체크포인트/대기 쓰기 저장 및 스레드 단위 TTL 정리"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        super().__init__(session_factory or SessionLocal)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """체크포인트 1건 + 대기 쓰기 (checkpoint_id가 없으면 최신, 만료된 스레드는 None)"""
+        rows = self.list(thread_id, checkpoint_ns, checkpoint_id=checkpoint_id, limit=1, now=now)
+        return rows[0] if rows else None
+
+    def list(
+        self,
+        thread_id: Optional[str],
+        checkpoint_ns: Optional[str] = None,
+        *,
+        checkpoint_id: Optional[str] = None,
+        before: Optional[str] = None,
+        limit: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """체크포인트 목록 (최신 순, 각 항목에 대기 쓰기 포함)"""
+        stmt = (
+            select(GraphCheckpoint)
+            .join(GraphCheckpointThread, GraphCheckpointThread.thread_id == GraphCheckpoint.thread_id)
+            .where(GraphCheckpointThread.expires_at > (now or datetime.now()))
+            .order_by(GraphCheckpoint.checkpoint_id.desc())
+        )
+        if thread_id is not None:
+            stmt = stmt.where(GraphCheckpoint.thread_id == thread_id)
+        if checkpoint_ns is not None:
+            stmt = stmt.where(GraphCheckpoint.checkpoint_ns == checkpoint_ns)
+        if checkpoint_id is not None:
+            stmt = stmt.where(GraphCheckpoint.checkpoint_id == checkpoint_id)
+        if before is not None:
+            stmt = stmt.where(GraphCheckpoint.checkpoint_id < before)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        with self.session_scope() as session:
+            rows = [_checkpoint_row(row) for row in session.execute(stmt).scalars()]
+            if not rows:
+                return []
+            keys = {(row["thread_id"], row["checkpoint_ns"], row["checkpoint_id"]) for row in rows}
+            writes: Dict[Tuple[str, str, str], List[WriteRow]] = {key: [] for key in keys}
+            write_stmt = (
+                select(GraphCheckpointWrite)
+                .where(
+                    tuple_(
+                        GraphCheckpointWrite.thread_id,
+                        GraphCheckpointWrite.checkpoint_ns,
+                        GraphCheckpointWrite.checkpoint_id,
+                    ).in_(list(keys))
+                )
+                .order_by(GraphCheckpointWrite.task_id, GraphCheckpointWrite.idx)
+            )
+            for write in session.execute(write_stmt).scalars():
+                writes[(write.thread_id, write.checkpoint_ns, write.checkpoint_id)].append(
+                    (write.task_id, write.idx, write.channel, write.type, write.value, write.task_path)
+                )
+        for row in rows:
+            row["writes"] = writes[(row["thread_id"], row["checkpoint_ns"], row["checkpoint_id"])]
+        return rows
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def put(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        parent_checkpoint_id: Optional[str],
+        checkpoint: Tuple[str, bytes],
+        metadata: Tuple[str, bytes],
+        expires_at: datetime,
+        keep: Optional[int] = None,
+    ) -> None:
+        """체크포인트 저장 + 스레드 만료 연장 (keep개를 넘는 오래된 체크포인트는 삭제)"""
+        with self.session_scope() as session:
+            self._touch(session, thread_id, expires_at)
+            row = session.get(GraphCheckpoint, (thread_id, checkpoint_ns, checkpoint_id))
+            if row is None:
+                row = GraphCheckpoint(thread_id=thread_id, checkpoint_ns=checkpoint_ns, checkpoint_id=checkpoint_id)
+                session.add(row)
+            row.parent_checkpoint_id = parent_checkpoint_id
+            row.type, row.checkpoint = checkpoint
+            row.metadata_type, row.checkpoint_metadata = metadata
+            session.flush()
+            if keep:
+                self._prune(session, thread_id, checkpoint_ns, keep)
+
+    def put_writes(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        writes: Iterable[WriteRow],
+    ) -> None:
+        """
+        대기 쓰기 저장
+
+        idx >= 0인 일반 쓰기는 이미 있으면 유지하고(재실행 시 중복 방지),
+        특수 쓰기(idx < 0, 오류/중단 등)는 덮어씁니다.
+        """
+        with self.session_scope() as session:
+            for task_id, idx, channel, type_, value, task_path in writes:
+                key = (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+                row = session.get(GraphCheckpointWrite, key)
+                if row is not None and idx >= 0:
+                    continue
+                if row is None:
+                    row = GraphCheckpointWrite(
+                        thread_id=thread_id,
+                        checkpoint_ns=checkpoint_ns,
+                        checkpoint_id=checkpoint_id,
+                        task_id=task_id,
+                        idx=idx,
+                    )
+                    session.add(row)
+                row.channel = channel
+                row.type = type_
+                row.value = value
+                row.task_path = task_path
+
+    def touch(self, thread_id: str, expires_at: datetime) -> None:
+        """스레드 만료 시각 연장 (조회 시 TTL 갱신)"""
+        with self.session_scope() as session:
+            row = session.get(GraphCheckpointThread, thread_id)
+            if row is not None:
+                row.expires_at = max(row.expires_at, expires_at)
+
+    # ------------------------------------------------------------------
+    # 삭제
+    # ------------------------------------------------------------------
+    def delete_thread(self, thread_id: str) -> None:
+        with self.session_scope() as session:
+            self._delete_threads(session, [thread_id])
+
+    def purge_expired(self, now: Optional[datetime] = None) -> int:
+        """만료된 스레드의 체크포인트/대기 쓰기 삭제"""
+        stmt = select(GraphCheckpointThread.thread_id).where(
+            GraphCheckpointThread.expires_at <= (now or datetime.now())
+        )
+        with self.session_scope() as session:
+            thread_ids = list(session.execute(stmt).scalars())
+            if thread_ids:
+                self._delete_threads(session, thread_ids)
+            return len(thread_ids)
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _touch(session: Session, thread_id: str, expires_at: datetime) -> None:
+        row = session.get(GraphCheckpointThread, thread_id)
+        if row is None:
+            session.add(GraphCheckpointThread(thread_id=thread_id, expires_at=expires_at))
+        else:
+            row.expires_at = expires_at
+
+    @staticmethod
+    def _prune(session: Session, thread_id: str, checkpoint_ns: str, keep: int) -> None:
+        scope = and_(GraphCheckpoint.thread_id == thread_id, GraphCheckpoint.checkpoint_ns == checkpoint_ns)
+        oldest_kept = session.execute(
+            select(GraphCheckpoint.checkpoint_id)
+            .where(scope)
+            .order_by(GraphCheckpoint.checkpoint_id.desc())
+            .offset(keep - 1)
+            .limit(1)
+        ).scalar()
+        if oldest_kept is None:
+            return
+        session.execute(delete(GraphCheckpoint).where(scope, GraphCheckpoint.checkpoint_id < oldest_kept))
+        session.execute(
+            delete(GraphCheckpointWrite).where(
+                GraphCheckpointWrite.thread_id == thread_id,
+                GraphCheckpointWrite.checkpoint_ns == checkpoint_ns,
+                GraphCheckpointWrite.checkpoint_id < oldest_kept,
+            )
+        )
+
+    @staticmethod
+    def _delete_threads(session: Session, thread_ids: List[str]) -> None:
+        session.execute(delete(GraphCheckpointWrite).where(GraphCheckpointWrite.thread_id.in_(thread_ids)))
+        session.execute(delete(GraphCheckpoint).where(GraphCheckpoint.thread_id.in_(thread_ids)))
+        session.execute(delete(GraphCheckpointThread).where(GraphCheckpointThread.thread_id.in_(thread_ids)))
+
+
+graph_checkpoint_repository = GraphCheckpointRepository()
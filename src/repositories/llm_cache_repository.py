@@ -0,0 +1,79 @@
+"""
+LLMResponseCacheEntry 테이블 Repository
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+
+from src.models.database import SessionLocal
+from src.models.llm_cache import LLMResponseCacheEntry
+
+from .base import BaseRepository
+
+
+class LLMCacheRepository(BaseRepository):
+    """LLM 응답 캐시 저장/조회"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        super().__init__(session_factory or SessionLocal)
+
+    def get(self, cache_key: str, now: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """만료되지 않은 엔트리를 조회하고 hit_count를 올립니다."""
+        now = now or datetime.now()
+        with self.session_scope() as session:
+            entry = session.get(LLMResponseCacheEntry, cache_key)
+            if entry is None or entry.expires_at <= now:
+                return None
+            session.execute(
+                update(LLMResponseCacheEntry)
+                .where(LLMResponseCacheEntry.cache_key == cache_key)
+                .values(hit_count=LLMResponseCacheEntry.hit_count + 1)
+            )
+            return {
+                "generations": entry.generations,
+                "total_tokens": entry.total_tokens or 0,
+                "latency_ms": entry.latency_ms or 0.0,
+                "expires_at": entry.expires_at,
+            }
+
+    def put(
+        self,
+        cache_key: str,
+        *,
+        node: str,
+        model: Optional[str],
+        generations: str,
+        total_tokens: int,
+        latency_ms: float,
+        expires_at: datetime,
+    ) -> None:
+        with self.session_scope() as session:
+            entry = session.get(LLMResponseCacheEntry, cache_key)
+            if entry is None:
+                entry = LLMResponseCacheEntry(cache_key=cache_key, hit_count=0)
+                session.add(entry)
+            entry.node = node
+            entry.model = model
+            entry.generations = generations
+            entry.total_tokens = total_tokens
+            entry.latency_ms = latency_ms
+            entry.expires_at = expires_at
+
+    def purge_expired(self, now: Optional[datetime] = None) -> int:
+        """만료된 엔트리 삭제"""
+        stmt = delete(LLMResponseCacheEntry).where(
+            LLMResponseCacheEntry.expires_at <= (now or datetime.now())
+        )
+        with self.session_scope() as session:
+            return session.execute(stmt).rowcount or 0
+
+    def clear(self) -> None:
+        with self.session_scope() as session:
+            session.execute(delete(LLMResponseCacheEntry))
+
+
+llm_cache_repository = LLMCacheRepository()
@@ -0,0 +1,57 @@
+"""
+MarketContextSnapshot 테이블 Repository
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.models.database import SessionLocal
+from src.models.macro import MarketContextSnapshot
+
+from .base import BaseRepository
+
+
+class MarketContextRepository(BaseRepository):
+    """공유 시장 컨텍스트 저장/조회"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        super().__init__(session_factory or SessionLocal)
+
+    def get(self, version: str) -> Optional[Dict[str, Any]]:
+        with self.session_scope() as session:
+            snapshot = session.get(MarketContextSnapshot, version)
+            return dict(snapshot.payload) if snapshot else None
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        stmt = (
+            select(MarketContextSnapshot)
+            .order_by(MarketContextSnapshot.created_at.desc())
+            .limit(1)
+        )
+        with self.session_scope() as session:
+            snapshot = session.execute(stmt).scalar_one_or_none()
+            return dict(snapshot.payload) if snapshot else None
+
+    def save(self, version: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        버전별 컨텍스트 저장 (먼저 저장한 워커가 우선)
+
+        여러 워커가 같은 버전을 동시에 생성하면 기본 키 충돌이 나므로,
+        충돌 시 이미 저장된 컨텍스트를 다시 읽어 반환합니다.
+        """
+        try:
+            with self.session_scope() as session:
+                session.add(MarketContextSnapshot(version=version, payload=payload))
+            return payload
+        except IntegrityError:
+            stored = self.get(version)
+            if stored is None:
+                raise
+            return stored
+
+
+market_context_repository = MarketContextRepository()
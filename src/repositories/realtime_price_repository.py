@@ -0,0 +1,120 @@
+"""
+RealtimePrice 테이블 Repository
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.models.database import SessionLocal
+from src.models.stock import RealtimePrice, Stock
+
+from .base import BaseRepository
+
+# KIS 현재가 응답 키 → RealtimePrice 컬럼
+_QUOTE_COLUMNS = {
+    "current_price": "current_price",
+    "open_price": "open_price",
+    "high_price": "high_price",
+    "low_price": "low_price",
+    "change_price": "change_amount",
+    "change_rate": "change_rate",
+    "volume": "volume",
+    "market_cap": "market_cap",
+    "per": "per",
+    "pbr": "pbr",
+}
+# 단건 현재가에만 있는 값 (일괄 조회/실시간 체결은 부분 시세라 비어 있음)
+_FUNDAMENTAL_COLUMNS = ("market_cap", "per", "pbr")
+
+
+def _to_number(value: Any) -> Any:
+    return float(value) if isinstance(value, Decimal) else value
+
+
+class RealtimePriceRepository(BaseRepository):
+    """종목별 최신 현재가 1건을 저장/조회"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        super().__init__(session_factory or SessionLocal)
+
+    def latest(self, stock_code: str, since: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
+        """가장 최근 현재가 (since 이전 데이터는 무시)"""
+        return self.latest_many([stock_code], since).get(stock_code)
+
+    def latest_many(
+        self,
+        stock_codes: Iterable[str],
+        since: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """종목별 가장 최근 현재가 (since 이전 데이터는 무시, 종목명은 stocks에서 조인)"""
+        codes = list(stock_codes)
+        if not codes:
+            return {}
+        stmt = (
+            select(RealtimePrice, Stock.stock_name)
+            .outerjoin(Stock, Stock.stock_code == RealtimePrice.stock_code)
+            .where(RealtimePrice.stock_code.in_(codes))
+            .order_by(RealtimePrice.timestamp.desc())
+        )
+        if since is not None:
+            stmt = stmt.where(RealtimePrice.timestamp >= since)
+
+        quotes: Dict[str, Dict[str, Any]] = {}
+        with self.session_scope() as session:
+            for row, stock_name in session.execute(stmt):
+                if row.stock_code in quotes:
+                    continue
+                quote = {key: _to_number(getattr(row, column)) for key, column in _QUOTE_COLUMNS.items()}
+                quote["stock_code"] = row.stock_code
+                quote["stock_name"] = stock_name or ""
+                quote["timestamp"] = row.timestamp.isoformat()
+                if all(quote[key] is None for key in _FUNDAMENTAL_COLUMNS):
+                    quote["partial"] = True
+                quotes[row.stock_code] = quote
+        return quotes
+
+    def save(self, quote: Dict[str, Any], timestamp: Optional[datetime] = None) -> None:
+        self.save_many([quote], timestamp)
+
+    def save_many(self, quotes: List[Dict[str, Any]], timestamp: Optional[datetime] = None) -> None:
+        """
+        현재가 저장 (종목별 최신 행을 갱신해 테이블이 호출 수만큼 커지지 않도록 함)
+
+        부분 시세(partial)는 가격/거래량만 갱신하고 기존 PER/PBR/시가총액은 유지합니다.
+        """
+        by_code = {quote["stock_code"]: quote for quote in quotes if quote.get("stock_code")}
+        if not by_code:
+            return
+        timestamp = timestamp or datetime.now()
+
+        with self.session_scope() as session:
+            existing: Dict[str, RealtimePrice] = {}
+            stmt = (
+                select(RealtimePrice)
+                .where(RealtimePrice.stock_code.in_(list(by_code)))
+                .order_by(RealtimePrice.timestamp.desc())
+            )
+            for row in session.execute(stmt).scalars():
+                existing.setdefault(row.stock_code, row)
+
+            for stock_code, quote in by_code.items():
+                values = {
+                    column: quote.get(key)
+                    for key, column in _QUOTE_COLUMNS.items()
+                    if not (quote.get("partial") and column in _FUNDAMENTAL_COLUMNS)
+                }
+                values["timestamp"] = timestamp
+                row = existing.get(stock_code)
+                if row is None:
+                    session.add(RealtimePrice(stock_code=stock_code, **values))
+                    continue
+                for column, value in values.items():
+                    setattr(row, column, value)
+
+
+realtime_price_repository = RealtimePriceRepository()
@@ -40,30 +40,33 @@ class StockIndicatorRepository(BaseRepository):
                 setattr(instance, key, value)
 
     def bulk_upsert(self, stock_code: str, rows: Iterable[Dict[str, Any]]) -> int:
-        count = 0
+        rows = [row for row in rows if row.get("date") is not None]
+        if not rows:
+            return 0
+
+        stmt = select(StockIndicator).where(
+            StockIndicator.stock_code == stock_code,
+            StockIndicator.date.in_([row["date"] for row in rows]),
+        )
         with self.session_scope() as session:
+            # 기존 스냅샷을 한 번에 조회해 행마다 SELECT하지 않도록 함
+            existing = {
+                instance.date: instance
+                for instance in session.execute(stmt).scalars().all()
+            }
             for row in rows:
-                date_ = row.get("date")
-                if date_ is None:
-                    continue
-                instance = (
-                    session.query(StockIndicator)
-                    .filter(
-                        StockIndicator.stock_code == stock_code,
-                        StockIndicator.date == date_,
-                    )
-                    .first()
-                )
+                date_ = row["date"]
+                instance = existing.get(date_)
                 if instance is None:
                     instance = StockIndicator(stock_code=stock_code, date=date_)
                     session.add(instance)
+                    existing[date_] = instance
 
                 for key, value in row.items():
                     if key in {"indicator_id", "stock_code", "date"}:
                         continue
                     setattr(instance, key, value)
-                count += 1
-        return count
+        return len(rows)
 
     def latest(self, stock_code: str) -> Optional[StockIndicator]:
         stmt = (
@@ -75,5 +78,19 @@ class StockIndicatorRepository(BaseRepository):
         with self.session_scope() as session:
             return session.execute(stmt).scalar_one_or_none()
 
+    def latest_with_state(self, stock_code: str) -> Optional[StockIndicator]:
+        """증분 계산 상태가 저장된 가장 최근 스냅샷"""
+        stmt = (
+            select(StockIndicator)
+            .where(
+                StockIndicator.stock_code == stock_code,
+                StockIndicator.stream_state.isnot(None),
+            )
+            .order_by(StockIndicator.date.desc())
+            .limit(1)
+        )
+        with self.session_scope() as session:
+            return session.execute(stmt).scalar_one_or_none()
+
 
 stock_indicator_repository = StockIndicatorRepository()
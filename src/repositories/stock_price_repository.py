@@ -4,9 +4,10 @@ StockPrice 테이블에 대한 Repository
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Sequence
 
-from sqlalchemy import select
+import pandas as pd
+from sqlalchemy import Float, cast, select
 
 from src.models.database import SessionLocal
 from src.models.stock import StockPrice
@@ -14,6 +15,9 @@ from src.models.stock import StockPrice
 from .base import BaseRepository
 
 
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Change"]
+
+
 class StockPriceRepository(BaseRepository):
     """주가 히스토리 저장/조회"""
 
@@ -32,6 +36,84 @@ class StockPriceRepository(BaseRepository):
         with self.session_scope() as session:
             return list(session.execute(stmt).scalars().all())
 
+    def get_ohlcv_frame(self, stock_code: str, start: date) -> pd.DataFrame:
+        """
+        OHLCV 컬럼만 선택해 DataFrame으로 반환 (ORM 객체 생성 없음)
+
+        DECIMAL → float 변환은 DB에서 수행합니다.
+
+        Returns:
+            Date(DatetimeIndex) 인덱스, Open/High/Low/Close/Volume/Change 컬럼.
+            데이터가 없으면 빈 DataFrame.
+        """
+        stmt = (
+            select(
+                StockPrice.date,
+                cast(StockPrice.open_price, Float),
+                cast(StockPrice.high_price, Float),
+                cast(StockPrice.low_price, Float),
+                cast(StockPrice.close_price, Float),
+                StockPrice.volume,
+                cast(StockPrice.change_amount, Float),
+            )
+            .where(
+                StockPrice.stock_code == stock_code,
+                StockPrice.date >= start,
+                StockPrice.close_price.is_not(None),
+            )
+            .order_by(StockPrice.date.asc())
+        )
+        with self.session_scope() as session:
+            rows = session.execute(stmt).all()
+
+        df = pd.DataFrame.from_records(rows, columns=["Date", *OHLCV_COLUMNS])
+        df["Date"] = pd.to_datetime(df["Date"])
+        df["Volume"] = df["Volume"].fillna(0).astype("int64")
+        return df.set_index("Date")
+
+    def get_close_panel(self, stock_codes: Sequence[str], start: date) -> pd.DataFrame:
+        """
+        여러 종목의 종가를 한 번의 쿼리로 조회해 (날짜 × 종목) 패널로 반환
+
+        Returns:
+            DatetimeIndex 인덱스, 종목 코드 컬럼의 wide DataFrame.
+            DB에 없는 종목은 컬럼에서 빠집니다.
+        """
+        return self._get_panel(stock_codes, start, cast(StockPrice.close_price, Float))
+
+    def get_volume_panel(self, stock_codes: Sequence[str], start: date) -> pd.DataFrame:
+        """여러 종목의 거래량을 (날짜 × 종목) 패널로 반환 (get_close_panel과 같은 형식)"""
+        return self._get_panel(stock_codes, start, cast(StockPrice.volume, Float))
+
+    def _get_panel(self, stock_codes: Sequence[str], start: date, value_column) -> pd.DataFrame:
+        codes = list(dict.fromkeys(stock_codes))
+        if not codes:
+            return pd.DataFrame()
+
+        stmt = (
+            select(
+                StockPrice.date,
+                StockPrice.stock_code,
+                value_column,
+            )
+            .where(
+                StockPrice.stock_code.in_(codes),
+                StockPrice.date >= start,
+                StockPrice.close_price.is_not(None),
+            )
+        )
+        with self.session_scope() as session:
+            rows = session.execute(stmt).all()
+
+        long_df = pd.DataFrame.from_records(rows, columns=["Date", "Code", "Value"])
+        if long_df.empty:
+            return pd.DataFrame()
+
+        long_df["Date"] = pd.to_datetime(long_df["Date"])
+        panel = long_df.pivot_table(index="Date", columns="Code", values="Value", aggfunc="last")
+        panel.columns.name = None
+        return panel.sort_index()
+
     def latest_price_date(self, stock_code: str) -> Optional[date]:
         stmt = (
             select(StockPrice.date)
@@ -0,0 +1,103 @@
+"""
+StockQuote(호가) 테이블 Repository
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import select
+
+from src.models.database import SessionLocal
+from src.models.stock import StockQuote
+
+from .base import BaseRepository
+
+ORDERBOOK_DEPTH = 10
+
+
+def _to_number(value: Any) -> Any:
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def _book_columns(book: Dict[str, Any]) -> Dict[str, Any]:
+    """{"asks": [(가격, 잔량), ...], "bids": [...]} → StockQuote 컬럼 값"""
+    values: Dict[str, Any] = {}
+    for side in ("ask", "bid"):
+        levels = list(book.get(f"{side}s") or [])[:ORDERBOOK_DEPTH]
+        levels += [(None, None)] * (ORDERBOOK_DEPTH - len(levels))
+        for level, (price, volume) in enumerate(levels, start=1):
+            values[f"{side}_price_{level}"] = price
+            values[f"{side}_volume_{level}"] = volume
+    values["total_ask_volume"] = book.get("total_ask_volume")
+    values["total_bid_volume"] = book.get("total_bid_volume")
+    return values
+
+
+class StockQuoteRepository(BaseRepository):
+    """종목별 최신 호가 1건을 저장/조회"""
+
+    def __init__(self):
+        super().__init__(SessionLocal)
+
+    def latest_many(self, stock_codes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """종목별 가장 최근 호가"""
+        codes = list(stock_codes)
+        if not codes:
+            return {}
+        stmt = (
+            select(StockQuote)
+            .where(StockQuote.stock_code.in_(codes))
+            .order_by(StockQuote.quote_time.desc())
+        )
+        books: Dict[str, Dict[str, Any]] = {}
+        with self.session_scope() as session:
+            for row in session.execute(stmt).scalars():
+                if row.stock_code in books:
+                    continue
+                books[row.stock_code] = {
+                    "stock_code": row.stock_code,
+                    "asks": [
+                        (_to_number(getattr(row, f"ask_price_{level}")), getattr(row, f"ask_volume_{level}"))
+                        for level in range(1, ORDERBOOK_DEPTH + 1)
+                    ],
+                    "bids": [
+                        (_to_number(getattr(row, f"bid_price_{level}")), getattr(row, f"bid_volume_{level}"))
+                        for level in range(1, ORDERBOOK_DEPTH + 1)
+                    ],
+                    "total_ask_volume": row.total_ask_volume,
+                    "total_bid_volume": row.total_bid_volume,
+                    "timestamp": row.quote_time.isoformat(),
+                }
+        return books
+
+    def save_many(self, books: List[Dict[str, Any]], timestamp: Optional[datetime] = None) -> None:
+        """호가 저장 (종목별 최신 행을 갱신해 테이블이 수신 건수만큼 커지지 않도록 함)"""
+        by_code = {book["stock_code"]: book for book in books if book.get("stock_code")}
+        if not by_code:
+            return
+        timestamp = timestamp or datetime.now()
+
+        with self.session_scope() as session:
+            existing: Dict[str, StockQuote] = {}
+            stmt = (
+                select(StockQuote)
+                .where(StockQuote.stock_code.in_(list(by_code)))
+                .order_by(StockQuote.quote_time.desc())
+            )
+            for row in session.execute(stmt).scalars():
+                existing.setdefault(row.stock_code, row)
+
+            for stock_code, book in by_code.items():
+                values = _book_columns(book)
+                values["quote_time"] = timestamp
+                row = existing.get(stock_code)
+                if row is None:
+                    session.add(StockQuote(stock_code=stock_code, **values))
+                    continue
+                for column, value in values.items():
+                    setattr(row, column, value)
+
+
+stock_quote_repository = StockQuoteRepository()
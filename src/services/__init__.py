@@ -10,16 +10,23 @@ from .kis_service import (
     KISService,
     KISAPIError,
     KISAuthError,
+    KISOrderStatusUnknownError,
     kis_service,
     init_kis_service,
 )
 from .dart_service import dart_service
+from .quote_service import quote_service
 from .stock_data_service import (
+    refresh_market_indicators,
     seed_market_data,
     update_recent_prices_for_market,
     stock_data_service,
 )
+from .stock_name_resolver import stock_name_resolver
+from .stock_search_index import stock_search_index
 from .macro_data_service import macro_data_service, seed_macro_data
+from .market_context_service import market_context_service
+from .market_stream_service import market_stream_service
 from .portfolio_optimizer import portfolio_optimizer
 from .chat_history_service import chat_history_service
 from .search_service import web_search_service, WebSearchService
@@ -30,11 +37,17 @@ __all__ = [
     "kis_service",
     "init_kis_service",
     "dart_service",
+    "quote_service",
     "stock_data_service",
+    "stock_name_resolver",
+    "stock_search_index",
     "seed_market_data",
     "update_recent_prices_for_market",
+    "refresh_market_indicators",
     "macro_data_service",
     "seed_macro_data",
+    "market_context_service",
+    "market_stream_service",
     "portfolio_optimizer",
     "chat_history_service",
     "web_search_service",
@@ -45,4 +58,5 @@ __all__ = [
     "KISService",
     "KISAPIError",
     "KISAuthError",
+    "KISOrderStatusUnknownError",
 ]
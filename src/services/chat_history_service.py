@@ -5,14 +5,39 @@ from __future__ import annotations
 
 import asyncio
 import uuid
-from typing import Any, Dict, Optional, Sequence
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple, Union
 
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Session
 
 from src.config.settings import settings
 from src.models.chat import ChatMessage, ChatSession
 from src.models.database import SessionLocal
 
+# 세션 목록용 비정규화 미리보기 최대 길이
+PREVIEW_LENGTH = 500
+
+_CURSOR_SEPARATOR = "|"
+
+
+def encode_history_cursor(message: ChatMessage) -> str:
+    """Keyset cursor for the page ending at ``message`` (created_at + message_id)."""
+    return f"{message.created_at.isoformat()}{_CURSOR_SEPARATOR}{message.message_id}"
+
+
+def decode_history_cursor(cursor: Union[str, datetime]) -> Tuple[datetime, Optional[uuid.UUID]]:
+    """
+    Parse a ``next_before`` cursor.
+
+    A bare timestamp (older clients) is accepted and pages on created_at only.
+    Raises ValueError for malformed cursors.
+    """
+    if isinstance(cursor, datetime):
+        return cursor, None
+    created_at, _, message_id = cursor.partition(_CURSOR_SEPARATOR)
+    return datetime.fromisoformat(created_at), uuid.UUID(message_id) if message_id else None
+
 
 class ChatHistoryService:
     """Service wrapper around chat session/message persistence."""
@@ -87,14 +112,20 @@ class ChatHistoryService:
                 session.add(message)
                 session.flush()
 
-                # Update last message timestamp on session if it exists.
-                chat_session = (
-                    session.query(ChatSession)
-                    .filter(ChatSession.conversation_id == conversation_id)
-                    .first()
-                )
-                if chat_session:
-                    chat_session.last_message_at = message.created_at
+                # 세션 요약 컬럼은 단일 UPDATE로 갱신 (동시 추가 시에도 카운트 누락 없음)
+                preview = content[:PREVIEW_LENGTH] if content else content
+                values: Dict[Any, Any] = {
+                    ChatSession.last_message_at: message.created_at,
+                    ChatSession.message_count: func.coalesce(ChatSession.message_count, 0) + 1,
+                    ChatSession.last_message: preview,
+                }
+                if role == "user" and content:
+                    values[ChatSession.first_user_message] = func.coalesce(
+                        ChatSession.first_user_message, preview
+                    )
+                session.query(ChatSession).filter(
+                    ChatSession.conversation_id == conversation_id
+                ).update(values, synchronize_session=False)
 
                 session.commit()
                 session.refresh(message)
@@ -107,8 +138,16 @@ class ChatHistoryService:
         *,
         conversation_id: uuid.UUID,
         limit: int = 100,
+        before: Optional[Union[str, datetime]] = None,
     ) -> Dict[str, Any]:
-        """Fetch chat session metadata and messages."""
+        """
+        Fetch chat session metadata and the latest ``limit`` messages.
+
+        Messages are returned oldest-first. Pass ``next_before`` from the
+        previous page as ``before`` to page further back (keyset on
+        ``(created_at, message_id)`` so messages sharing a timestamp are not skipped).
+        """
+        cursor = decode_history_cursor(before) if before is not None else None
 
         def _load() -> Dict[str, Any]:
             with self._session_factory() as session:  # type: Session
@@ -120,17 +159,30 @@ class ChatHistoryService:
                 if chat_session is None:
                     return {}
 
-                messages: Sequence[ChatMessage] = (
-                    session.query(ChatMessage)
-                    .filter(ChatMessage.conversation_id == conversation_id)
-                    .order_by(ChatMessage.created_at.asc())
-                    .limit(limit)
+                query = session.query(ChatMessage).filter(ChatMessage.conversation_id == conversation_id)
+                if cursor is not None:
+                    created_at, message_id = cursor
+                    if message_id is None:
+                        query = query.filter(ChatMessage.created_at < created_at)
+                    else:
+                        query = query.filter(
+                            tuple_(ChatMessage.created_at, ChatMessage.message_id) < (created_at, message_id)
+                        )
+
+                # limit + 1개를 읽어 이전 페이지 존재 여부 판단
+                rows: Sequence[ChatMessage] = (
+                    query.order_by(ChatMessage.created_at.desc(), ChatMessage.message_id.desc())
+                    .limit(limit + 1)
                     .all()
                 )
+                has_more = len(rows) > limit
+                messages = list(reversed(rows[:limit]))
 
                 return {
                     "session": chat_session,
-                    "messages": list(messages),
+                    "messages": messages,
+                    "has_more": has_more,
+                    "next_before": encode_history_cursor(messages[0]) if has_more and messages else None,
                 }
 
         return await asyncio.to_thread(_load)
@@ -155,6 +207,7 @@ class ChatHistoryService:
         *,
         user_id: Optional[uuid.UUID] = None,
         limit: int = 50,
+        offset: int = 0,
     ) -> Sequence[Dict[str, Any]]:
         """Return chat session summaries ordered by last activity."""
 
@@ -168,63 +221,37 @@ class ChatHistoryService:
 
                 sessions: Sequence[ChatSession] = (
                     query.order_by(ChatSession.last_message_at.desc().nullslast())
+                    .offset(offset)
                     .limit(limit)
                     .all()
                 )
 
-                if not sessions:
-                    return []
-
-                conversation_ids = [s.conversation_id for s in sessions]
-
-                messages: Sequence[ChatMessage] = (
-                    session.query(ChatMessage)
-                    .filter(ChatMessage.conversation_id.in_(conversation_ids))
-                    .order_by(ChatMessage.conversation_id.asc(), ChatMessage.created_at.asc())
-                    .all()
-                )
-
-                grouped_messages: Dict[uuid.UUID, Sequence[ChatMessage]] = {}
-                current_conversation = None
-                buffer: list[ChatMessage] = []
-
-                for message in messages:
-                    if message.conversation_id != current_conversation:
-                        if current_conversation is not None:
-                            grouped_messages[current_conversation] = list(buffer)
-                        current_conversation = message.conversation_id
-                        buffer = [message]
-                    else:
-                        buffer.append(message)
+                return [
+                    {
+                        "conversation_id": chat_session.conversation_id,
+                        "session": chat_session,
+                        "first_user_message": chat_session.first_user_message,
+                        "last_message": chat_session.last_message,
+                        "message_count": chat_session.message_count or 0,
+                    }
+                    for chat_session in sessions
+                ]
 
-                if current_conversation is not None:
-                    grouped_messages[current_conversation] = list(buffer)
+        return await asyncio.to_thread(_list)
 
-                summaries: list[Dict[str, Any]] = []
-                for chat_session in sessions:
-                    convo_id = chat_session.conversation_id
-                    session_messages = grouped_messages.get(convo_id, [])
+    async def count_sessions(self, *, user_id: Optional[uuid.UUID] = None) -> int:
+        """Return the number of chat sessions for a user."""
 
-                    first_user_message = next(
-                        (msg for msg in session_messages if msg.role == "user" and msg.content),
-                        None,
-                    )
-                    last_message = session_messages[-1] if session_messages else None
-                    message_count = len(session_messages)
-
-                    summaries.append(
-                        {
-                            "conversation_id": convo_id,
-                            "session": chat_session,
-                            "first_user_message": first_user_message,
-                            "last_message": last_message,
-                            "message_count": message_count,
-                        }
-                    )
+        effective_user_id = user_id or settings.demo_user_uuid
 
-                return summaries
+        def _count() -> int:
+            with self._session_factory() as session:  # type: Session
+                query = session.query(func.count(ChatSession.conversation_id))
+                if effective_user_id:
+                    query = query.filter(ChatSession.user_id == effective_user_id)
+                return int(query.scalar() or 0)
 
-        return await asyncio.to_thread(_list)
+        return await asyncio.to_thread(_count)
 
 
 chat_history_service = ChatHistoryService()
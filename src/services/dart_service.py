@@ -1,11 +1,15 @@
 """DART 공시 서비스"""
 
 import asyncio
+import json
 import logging
+import os
+import tempfile
+import time
 import xml.etree.ElementTree as ET
 import zipfile
-from io import BytesIO
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Tuple
 
 import requests
 
@@ -21,10 +25,23 @@ class DARTService:
     - DART Open API 기반 공시 데이터 조회
     """
 
-    def __init__(self):
+    def __init__(self, corp_code_cache_path: Optional[str] = None):
         self.api_key = settings.DART_API_KEY
         self.base_url = "https://opendart.fss.or.kr/api"
 
+        # 종목코드 → 고유번호 매핑 (디스크 캐시 + 프로세스 메모리)
+        self.corp_code_cache_path = (
+            corp_code_cache_path
+            or settings.DART_CORP_CODE_CACHE_PATH
+            or os.path.join(tempfile.gettempdir(), "hama_dart_corp_codes.json")
+        )
+        self._corp_codes: Optional[Dict[str, str]] = None
+        self._corp_code_cache: Optional[Dict[str, Any]] = None
+        self._corp_code_lock: Optional[asyncio.Lock] = None
+        self._corp_code_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._refresh_failed_at: Optional[float] = None  # 마지막 다운로드 실패 시각 (monotonic)
+
     async def get_company_info(self, corp_code: str) -> Optional[Dict[str, Any]]:
         """
         기업 개황 조회
@@ -40,7 +57,7 @@ class DARTService:
         params = {"crtfc_key": self.api_key, "corp_code": corp_code}
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = await asyncio.to_thread(requests.get, url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -84,7 +101,7 @@ class DARTService:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = await asyncio.to_thread(requests.get, url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -126,7 +143,7 @@ class DARTService:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = await asyncio.to_thread(requests.get, url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -167,7 +184,7 @@ class DARTService:
         }
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = await asyncio.to_thread(requests.get, url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
@@ -184,58 +201,175 @@ class DARTService:
             print(f"❌ 주요주주 조회 에러: {corp_code}, {e}")
             return []
 
-    async def _download_and_parse_corp_code_mapping(self) -> Dict[str, str]:
+    async def get_corp_code_mapping(self) -> Dict[str, str]:
+        """
+        {stock_code: corp_code} 매핑 조회
+
+        프로세스당 한 번 디스크 캐시에서 읽어 메모리에 보관합니다. 캐시가 없을 때만
+        요청 경로에서 다운로드하고, 오래된 캐시는 그대로 반환하면서 백그라운드로 갱신합니다.
+        다운로드가 실패하면 DART_CORP_CODE_RETRY_MINUTES 동안 다시 시도하지 않습니다.
+        """
+        if self._corp_codes is None:
+            async with self._lock():
+                if self._corp_codes is None:
+                    cache = await asyncio.to_thread(self._load_corp_code_cache)
+                    if cache is None:
+                        if self._refresh_backing_off():
+                            return {}
+                        cache = await self._download_and_parse_corp_code_mapping()
+                        if cache is None:
+                            self._refresh_failed_at = time.monotonic()
+                            return {}
+                        await asyncio.to_thread(self._save_corp_code_cache, cache)
+                    self._apply_corp_code_cache(cache)
+
+        if self._corp_codes_stale() and not self._refresh_backing_off():
+            self._schedule_corp_code_refresh()
+        return self._corp_codes or {}
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._corp_code_lock is None or self._corp_code_lock_loop is not loop:
+            self._corp_code_lock = asyncio.Lock()
+            self._corp_code_lock_loop = loop
+        return self._corp_code_lock
+
+    def _refresh_backing_off(self) -> bool:
+        if self._refresh_failed_at is None:
+            return False
+        return time.monotonic() - self._refresh_failed_at < settings.DART_CORP_CODE_RETRY_MINUTES * 60
+
+    def _apply_corp_code_cache(self, cache: Dict[str, Any]) -> None:
+        self._corp_codes = cache.get("mapping") or {}
+        self._corp_code_cache = cache
+
+    def _corp_codes_stale(self) -> bool:
+        fetched_at = (self._corp_code_cache or {}).get("fetched_at")
+        if not fetched_at:
+            return True
+        try:
+            age = datetime.now() - datetime.fromisoformat(fetched_at)
+        except ValueError:
+            return True
+        return age > timedelta(hours=settings.DART_CORP_CODE_REFRESH_HOURS)
+
+    def _schedule_corp_code_refresh(self) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self.refresh_corp_code_mapping())
+
+    async def refresh_corp_code_mapping(self) -> bool:
+        """
+        매핑을 다시 받아 디스크/메모리 캐시를 교체 (조건부 요청)
+
+        Returns:
+            bool: 갱신(또는 변경 없음 확인) 성공 여부
+        """
+        cache = await self._download_and_parse_corp_code_mapping(self._corp_code_cache)
+        if cache is None:
+            self._refresh_failed_at = time.monotonic()
+            return False
+        await asyncio.to_thread(self._save_corp_code_cache, cache)
+        self._apply_corp_code_cache(cache)
+        self._refresh_failed_at = None
+        return True
+
+    async def _download_and_parse_corp_code_mapping(
+        self, cached: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         DART corp_code.zip 다운로드 및 파싱
 
+        이전 캐시의 ETag/Last-Modified로 조건부 요청을 보내고, 304 응답이면
+        기존 매핑을 그대로 사용합니다.
+
         Returns:
-            dict: {stock_code: corp_code} 매핑 딕셔너리
+            dict: {"fetched_at", "etag", "last_modified", "mapping": {stock_code: corp_code}}
+            실패 시 None
         """
         logger.info("📥 DART corp_code.zip 다운로드 시작...")
 
         if not self.api_key:
             logger.warning("⚠️ DART_API_KEY가 설정되지 않았습니다. 빈 매핑을 반환합니다.")
-            return {}
+            return None
 
-        url = f"{self.base_url}/corpCode.xml"
-        params = {"crtfc_key": self.api_key}
+        headers: Dict[str, str] = {}
+        if cached and cached.get("mapping"):
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
 
+        zip_path: Optional[str] = None
         try:
-            # ZIP 파일 다운로드 (동기 → 비동기 변환)
-            response = await asyncio.to_thread(
-                requests.get, url, params=params, timeout=30
-            )
-            response.raise_for_status()
-
-            # ZIP 파일 압축 해제
-            zip_data = BytesIO(response.content)
-
-            with zipfile.ZipFile(zip_data) as zip_file:
-                # CORPCODE.xml 파일 읽기
-                xml_data = zip_file.read("CORPCODE.xml")
+            downloaded = await asyncio.to_thread(self._download_corp_code_zip, headers)
+            now = datetime.now().isoformat()
+            if downloaded is None:
+                if not cached:
+                    return None
+                logger.info("✅ DART 종목 매핑 변경 없음 (304)")
+                return {**cached, "fetched_at": now}
+
+            zip_path, validators = downloaded
+            mapping = await asyncio.to_thread(parse_corp_code_zip, zip_path)
+            logger.info(f"✅ DART 종목 매핑 완료: {len(mapping)}개 종목")
+            return {"fetched_at": now, **validators, "mapping": mapping}
 
-            # XML 파싱
-            root = ET.fromstring(xml_data)
-            mapping = {}
+        except Exception as e:
+            logger.error(f"❌ DART corp_code 다운로드 실패: {e}")
+            return None
+        finally:
+            if zip_path and os.path.exists(zip_path):
+                os.unlink(zip_path)
+
+    def _download_corp_code_zip(
+        self, headers: Dict[str, str]
+    ) -> Optional[Tuple[str, Dict[str, Optional[str]]]]:
+        """ZIP을 임시 파일로 스트리밍 저장 (304면 None)"""
+        url = f"{self.base_url}/corpCode.xml"
+        params = {"crtfc_key": self.api_key}
 
-            for company in root.findall("list"):
-                corp_code_elem = company.find("corp_code")
-                stock_code_elem = company.find("stock_code")
+        with requests.get(url, params=params, headers=headers, timeout=30, stream=True) as response:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
 
-                if corp_code_elem is not None and stock_code_elem is not None:
-                    corp_code = corp_code_elem.text
-                    stock_code = stock_code_elem.text
+            fd, path = tempfile.mkstemp(prefix="dart_corp_code_", suffix=".zip")
+            with os.fdopen(fd, "wb") as f:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
 
-                    # stock_code가 유효한 경우에만 매핑 추가
-                    if stock_code and stock_code.strip() and len(stock_code.strip()) == 6:
-                        mapping[stock_code.strip()] = corp_code.strip()
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        return path, validators
 
-            logger.info(f"✅ DART 종목 매핑 완료: {len(mapping)}개 종목")
-            return mapping
+    def _load_corp_code_cache(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.corp_code_cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ DART 매핑 캐시를 읽지 못했습니다: {e}")
+            return None
+        if not isinstance(cache, dict) or not cache.get("mapping"):
+            return None
+        return cache
 
-        except Exception as e:
-            logger.error(f"❌ DART corp_code 다운로드 실패: {e}")
-            return {}
+    def _save_corp_code_cache(self, cache: Dict[str, Any]) -> None:
+        directory = os.path.dirname(self.corp_code_cache_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".dart_corp_codes_")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(tmp_path, self.corp_code_cache_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
 
     async def search_corp_code_by_stock_code(self, stock_code: str) -> Optional[str]:
         """
@@ -247,7 +381,7 @@ class DARTService:
         Returns:
             str: 고유번호 (8자리, 예: "00126380")
         """
-        mapping = await self._download_and_parse_corp_code_mapping()
+        mapping = await self.get_corp_code_mapping()
         if not mapping:
             logger.warning("⚠️ DART 매핑 테이블을 불러오지 못했습니다.")
             return None
@@ -262,5 +396,33 @@ class DARTService:
         return corp_code
 
 
+def parse_corp_code_zip(path: str) -> Dict[str, str]:
+    """
+    corpCode.zip의 CORPCODE.xml을 스트리밍 파싱
+
+    iterparse로 <list> 단위로 읽고 바로 비우므로 XML 전체를 메모리에 올리지 않습니다.
+
+    Returns:
+        dict: {stock_code: corp_code} (상장 종목만)
+    """
+    mapping: Dict[str, str] = {}
+    with zipfile.ZipFile(path) as zip_file, zip_file.open("CORPCODE.xml") as xml_file:
+        root = None
+        for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event != "end" or elem.tag != "list":
+                continue
+
+            corp_code = (elem.findtext("corp_code") or "").strip()
+            stock_code = (elem.findtext("stock_code") or "").strip()
+            # stock_code가 유효한 경우에만 매핑 추가
+            if corp_code and len(stock_code) == 6:
+                mapping[stock_code] = corp_code
+
+            root.clear()
+    return mapping
+
+
 # 싱글톤 인스턴스
 dart_service = DARTService()
@@ -6,6 +6,7 @@ DB에 저장하며, 채팅 히스토리에도 동일하게 기록한다.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from typing import Any, Dict, Optional
@@ -20,6 +21,7 @@ from src.services.portfolio_preview_service import (
     calculate_weight_change,
 )
 from src.models.agent import ApprovalRequest as ApprovalRequestModel
+from src.models.database import SessionLocal
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -79,13 +81,21 @@ def _save_approval_request_to_db(
         return None
 
 
+def _save_approval_request(db: Optional[Session], **kwargs: Any) -> Optional[uuid.UUID]:
+    """db가 없으면 전용 세션으로 저장 (스레드에서 호출)"""
+    if db is not None:
+        return _save_approval_request_to_db(db=db, **kwargs)
+    with SessionLocal() as session:
+        return _save_approval_request_to_db(db=session, **kwargs)
+
+
 async def handle_hitl_interrupt(
     *,
     state: Any,
     conversation_uuid: uuid.UUID,
     conversation_id: str,
     user_id: uuid.UUID,
-    db: Session,
+    db: Optional[Session] = None,
     automation_level: int,
     hitl_config: HITLConfig,
 ) -> Optional[Dict[str, Any]]:
@@ -176,8 +186,10 @@ async def handle_hitl_interrupt(
             }
         )
 
-    request_id = _save_approval_request_to_db(
-        db=db,
+    # DB 커밋은 이벤트 루프 밖에서 실행 (동시 SSE 스트림 지연 방지)
+    request_id = await asyncio.to_thread(
+        _save_approval_request,
+        db,
         user_id=user_id,
         request_type=approval_request.get("type", interrupt_type),
         approval_data=approval_request,
@@ -12,24 +12,42 @@ KIS API 연동:
 from __future__ import annotations
 
 import asyncio
+import bisect
+import importlib.util
+import itertools
 import json
 import logging
+import random
 import sys
 import time
 import types
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from enum import IntEnum
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+import httpx
 import pandas as pd
-import requests
-from requests.exceptions import RequestException
 
 from src.config.settings import settings
-from src.constants.kis_constants import KIS_BASE_URLS, KIS_ENDPOINTS, KIS_TR_IDS, INDEX_CODES
+from src.constants.kis_constants import (
+    INDEX_CODES,
+    KIS_BASE_URLS,
+    KIS_ENDPOINTS,
+    KIS_WEBSOCKET_URLS,
+    KIS_MULTI_PRICE_MAX_CODES,
+    KIS_THROTTLE_MSG_CODES,
+    KIS_TR_IDS,
+)
+from src.services.kis_token_store import FileTokenStore, TokenRecord, token_key
 
 logger = logging.getLogger(__name__)
 
+# h2 패키지가 설치된 경우에만 HTTP/2 사용 (없으면 HTTP/1.1 keep-alive)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class _KISServiceModule(types.ModuleType):
     """`src.services.kis_service.kis_service` 임포트가 전역 인스턴스에 위임되도록 하는 모듈 프록시."""
@@ -52,34 +70,229 @@ class _KISServiceModule(types.ModuleType):
             super().__setattr__(key, value)
 
 
+class Priority(IntEnum):
+    """KIS 호출 우선순위 (값이 작을수록 먼저 처리)"""
+
+    INTERACTIVE = 0  # 사용자 요청 (채팅, 시세 조회)
+    BACKGROUND = 1  # 일괄 적재/배치 작업
+
+
+_call_priority: ContextVar[Priority] = ContextVar("kis_call_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def call_priority(priority: Priority) -> Iterator[None]:
+    """
+    블록 안에서 실행되는 KIS 호출의 우선순위 지정
+
+    Usage:
+        with call_priority(Priority.BACKGROUND):
+            await stock_data_service.get_stock_price(code)
+    """
+    token = _call_priority.set(priority)
+    try:
+        yield
+    finally:
+        _call_priority.reset(token)
+
+
+class TokenBucket:
+    """토큰 버킷 (초당 rate개 충전, 최대 capacity개 보유)"""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = float(max(capacity, 1.0))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        elapsed = max(now - self.updated_at, 0.0)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def available(self) -> bool:
+        return self.tokens >= 1.0
+
+    def take(self) -> None:
+        self.tokens -= 1.0
+
+    def time_until_available(self) -> float:
+        return max(1.0 - self.tokens, 0.0) / self.rate
+
+
+class _Waiter:
+    __slots__ = ("priority", "seq", "tr_id", "future", "enqueued_at")
+
+    def __init__(self, priority: Priority, seq: int, tr_id: Optional[str], future: asyncio.Future):
+        self.priority = priority
+        self.seq = seq
+        self.tr_id = tr_id
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+    def sort_key(self) -> tuple:
+        return (self.priority, self.seq)
+
+
 class RateLimiter:
-    """API 호출 제한 관리 (초당 1회)"""
+    """
+    API 호출 제한 관리 (토큰 버킷 + 우선순위 대기열)
 
-    def __init__(self, calls_per_second: float = 1.0):
+    - 전체 호출 수를 초당 calls_per_second로 제한 (burst만큼 연속 호출 허용)
+    - TR_ID별 한도가 설정된 경우 해당 TR_ID 버킷도 함께 차감
+    - 대기 중인 요청은 우선순위(INTERACTIVE > BACKGROUND), 도착 순서대로 처리
+      (앞선 요청의 TR_ID 한도가 소진된 경우 다음 요청이 먼저 진행)
+    """
+
+    def __init__(
+        self,
+        calls_per_second: float = 1.0,
+        burst: int = 1,
+        tr_id_limits: Optional[Dict[str, float]] = None,
+    ):
         """
         Args:
-            calls_per_second: 초당 허용 호출 수 (기본 1회)
+            calls_per_second: 초당 허용 호출 수
+            burst: 유휴 상태에서 연속으로 허용할 최대 호출 수
+            tr_id_limits: TR_ID별 초당 허용 호출 수
         """
-        self.min_interval = 1.0 / calls_per_second  # 최소 간격 (초)
-        self.last_call_time: float = 0.0
-        self._lock = asyncio.Lock()
+        self.calls_per_second = calls_per_second
+        self._bucket = TokenBucket(calls_per_second, burst)
+        self._tr_buckets = {
+            tr_id: TokenBucket(rate, 1.0) for tr_id, rate in (tr_id_limits or {}).items()
+        }
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
 
-    async def acquire(self):
+        self._granted = {priority.name.lower(): 0 for priority in Priority}
+        self._total_wait = {priority.name.lower(): 0.0 for priority in Priority}
+        self._max_wait = 0.0
+        self._max_queue_depth = 0
+
+    async def acquire(self, tr_id: Optional[str] = None, priority: Optional[Priority] = None):
         """
         Rate limit을 준수하며 API 호출 허가를 얻음.
         필요시 대기.
+
+        Args:
+            tr_id: 거래ID (TR_ID별 한도 적용용)
+            priority: 우선순위 (None이면 call_priority 컨텍스트 값)
         """
-        async with self._lock:
-            current_time = time.time()
-            time_since_last_call = current_time - self.last_call_time
+        if priority is None:
+            priority = _call_priority.get()
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(priority, next(self._seq), tr_id, loop.create_future())
+        bisect.insort(self._waiters, waiter, key=_Waiter.sort_key)
+        self._max_queue_depth = max(self._max_queue_depth, len(self._waiters))
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+                self._dispatch()
+            raise
+
+    def _dispatch(self) -> None:
+        """사용 가능한 토큰만큼 대기 중인 요청을 우선순위 순으로 허가"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        # 종료된 이벤트 루프에 남은 대기자 정리 (테스트/재시작 시)
+        self._waiters = [
+            w for w in self._waiters
+            if not w.future.done() and not w.future.get_loop().is_closed()
+        ]
+
+        now = time.monotonic()
+        self._bucket.refill(now)
+        for bucket in self._tr_buckets.values():
+            bucket.refill(now)
+
+        while self._waiters and self._bucket.available():
+            waiter = next(
+                (w for w in self._waiters if self._tr_bucket_available(w.tr_id)),
+                None,
+            )
+            if waiter is None:
+                break
+
+            self._waiters.remove(waiter)
+            self._bucket.take()
+            if waiter.tr_id in self._tr_buckets:
+                self._tr_buckets[waiter.tr_id].take()
+
+            waited = now - waiter.enqueued_at
+            lane = waiter.priority.name.lower()
+            self._granted[lane] += 1
+            self._total_wait[lane] += waited
+            self._max_wait = max(self._max_wait, waited)
+            if waited > 0.5:
+                logger.debug(f"⏳ Rate limit: {waiter.tr_id} waited {waited:.2f}s ({lane})")
+            waiter.future.set_result(None)
+
+        if self._waiters:
+            delay = self._bucket.time_until_available()
+            tr_delays = [
+                self._tr_buckets[w.tr_id].time_until_available()
+                for w in self._waiters
+                if w.tr_id in self._tr_buckets
+            ]
+            if len(tr_delays) == len(self._waiters):
+                # 모든 대기 요청이 TR_ID 한도에 막힌 경우 가장 먼저 풀리는 시점까지 대기
+                delay = max(delay, min(tr_delays))
+            self._timer = asyncio.get_running_loop().call_later(max(delay, 0.001), self._dispatch)
+
+    def _tr_bucket_available(self, tr_id: Optional[str]) -> bool:
+        bucket = self._tr_buckets.get(tr_id) if tr_id else None
+        return bucket is None or bucket.available()
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 길이/대기 시간 통계"""
+        lanes = {}
+        for lane, granted in self._granted.items():
+            lanes[lane] = {
+                "granted": granted,
+                "avg_wait": round(self._total_wait[lane] / granted, 4) if granted else 0.0,
+                "queued": sum(1 for w in self._waiters if w.priority.name.lower() == lane),
+            }
+        return {
+            "calls_per_second": self.calls_per_second,
+            "burst": self._bucket.capacity,
+            "queue_depth": len(self._waiters),
+            "max_queue_depth": self._max_queue_depth,
+            "max_wait": round(self._max_wait, 4),
+            "lanes": lanes,
+        }
+
+
+def _is_retryable(response: httpx.Response) -> bool:
+    """재시도 대상 응답 여부 (서버 오류, 호출 한도 초과)"""
+    if response.status_code >= 500 or response.status_code == 429:
+        return True
+    try:
+        msg_cd = response.json().get("msg_cd", "")
+    except (ValueError, AttributeError):
+        return False
+    return msg_cd in KIS_THROTTLE_MSG_CODES
+
+
+def _is_unsent(error: httpx.TransportError) -> bool:
+    """요청 전송 전 단계(연결 수립)에서 실패했는지 여부"""
+    return isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
 
-            if time_since_last_call < self.min_interval:
-                # 최소 간격이 지나지 않았으면 대기
-                wait_time = self.min_interval - time_since_last_call
-                logger.debug(f"⏳ Rate limit: waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
 
-            self.last_call_time = time.time()
+def _backoff_delay(attempt: int) -> float:
+    """지수 백오프 + full jitter 대기 시간 (초)"""
+    ceiling = min(
+        settings.KIS_HTTP_BACKOFF_MAX_SECONDS,
+        settings.KIS_HTTP_BACKOFF_BASE_SECONDS * (2 ** attempt),
+    )
+    return random.uniform(0, ceiling)
 
 
 class KISAPIError(Exception):
@@ -92,6 +305,11 @@ class KISAuthError(Exception):
     pass
 
 
+class KISOrderStatusUnknownError(KISAPIError):
+    """주문 요청 전송 후 응답을 받지 못해 접수 여부를 알 수 없는 경우 (주문 내역 확인 필요)"""
+    pass
+
+
 class KISService:
     """한국투자증권 Open Trading API 서비스"""
 
@@ -101,6 +319,7 @@ class KISService:
         app_secret: Optional[str] = None,
         account_number: Optional[str] = None,
         env: str = "demo",  # "real" or "demo"
+        token_store: Optional[FileTokenStore] = None,
     ):
         """
         KIS 서비스 초기화
@@ -110,6 +329,7 @@ class KISService:
             app_secret: KIS 앱 시크릿 (None이면 settings에서 가져옴)
             account_number: 계좌번호 (8-2 형식, None이면 settings에서 가져옴)
             env: 환경 ("real": 실전, "demo": 모의투자)
+            token_store: 토큰 저장소 (None이면 settings 경로의 파일 저장소)
         """
         self.app_key = app_key or settings.KIS_APP_KEY
         self.app_secret = app_secret or settings.KIS_APP_SECRET
@@ -131,40 +351,190 @@ class KISService:
 
         # Base URL 설정
         self.base_url = KIS_BASE_URLS["prod"] if env == "real" else KIS_BASE_URLS["demo"]
+        self.websocket_url = KIS_WEBSOCKET_URLS["prod"] if env == "real" else KIS_WEBSOCKET_URLS["demo"]
 
         # 토큰 관리
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[datetime] = None
-
-        # Rate Limiter 설정 (초당 1회)
-        self._rate_limiter = RateLimiter(calls_per_second=1.0)
+        self._approval_key: Optional[str] = None
+
+        # 프로세스 간 공유 토큰 저장소
+        self._token_store = token_store or FileTokenStore(settings.KIS_TOKEN_STORE_PATH or None)
+        self._token_key = token_key(env, self.app_key or "")
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._token_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        # 공유 HTTP 클라이언트 (커넥션 풀/keep-alive, 이벤트 루프별 생성)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Rate Limiter 설정 (환경별 KIS 호출 한도)
+        self._rate_limiter = RateLimiter(
+            calls_per_second=settings.KIS_RATE_LIMIT_REAL if env == "real" else settings.KIS_RATE_LIMIT_DEMO,
+            burst=settings.KIS_RATE_LIMIT_BURST,
+            tr_id_limits=settings.kis_tr_rate_limits,
+        )
 
         logger.info(f"✅ KIS Service initialized (env={env}, base_url={self.base_url})")
 
+    # ==================== HTTP ====================
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """현재 이벤트 루프에서 사용할 공유 HTTP 클라이언트"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(settings.KIS_HTTP_TIMEOUT_SECONDS),
+                limits=httpx.Limits(
+                    max_connections=settings.KIS_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.KIS_HTTP_MAX_CONNECTIONS,
+                ),
+                http2=_HTTP2_AVAILABLE,
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._token_lock is None or self._token_lock_loop is not loop:
+            self._token_lock = asyncio.Lock()
+            self._token_lock_loop = loop
+        return self._token_lock
+
+    async def close(self) -> None:
+        """토큰 갱신 작업 및 HTTP 클라이언트 종료"""
+        if self._refresh_task is not None and self._refresh_task.get_loop() is asyncio.get_running_loop():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+
+        if (
+            self._client is not None
+            and not self._client.is_closed
+            and self._client_loop is asyncio.get_running_loop()
+        ):
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        tr_id: Optional[str] = None,
+        idempotent: bool = True,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        재시도 포함 HTTP 요청
+
+        연결 오류, 5xx/429 응답, 초당 거래건수 초과(msg_cd) 응답은
+        지수 백오프(full jitter) 후 재시도합니다. tr_id가 주어지면 시도마다
+        Rate Limiter 허가를 받습니다.
+
+        idempotent=False(주문 등)이면 요청이 서버에 도달하기 전의 연결 실패만
+        재시도합니다. 읽기 타임아웃이나 서버 오류 응답 뒤에는 이미 처리됐을 수 있어
+        재전송하지 않습니다.
+
+        Raises:
+            httpx.HTTPError: 재시도 후에도 연결에 실패한 경우
+        """
+        client = self._get_client()
+        max_retries = settings.KIS_HTTP_MAX_RETRIES
+
+        attempt = 0
+        while True:
+            if tr_id is not None:
+                # Rate Limit 적용 (우선순위는 call_priority 컨텍스트에서 결정)
+                await self._rate_limiter.acquire(tr_id)
+
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= max_retries or not (idempotent or _is_unsent(e)):
+                    raise
+                reason = e.__class__.__name__
+            else:
+                if attempt >= max_retries or not idempotent or not _is_retryable(response):
+                    return response
+                reason = f"HTTP {response.status_code}"
+
+            delay = _backoff_delay(attempt)
+            logger.warning(
+                f"⚠️ KIS request retry {attempt + 1}/{max_retries} in {delay:.2f}s ({tr_id or url}: {reason})"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
     # ==================== 인증 ====================
 
-    async def _get_access_token(self) -> str:
+    async def _get_access_token(self, min_remaining: Optional[float] = None) -> str:
         """
         OAuth 2.0 액세스 토큰 발급 (캐싱)
 
+        메모리 → 공유 토큰 저장소 순으로 확인하고, 둘 다 만료가 임박했을 때만
+        프로세스 간 잠금을 잡고 새 토큰을 발급합니다. 잠금을 기다리는 동안 다른
+        워커가 갱신했다면 그 토큰을 그대로 사용합니다.
+
+        Args:
+            min_remaining: 재사용하려면 남아 있어야 할 최소 유효 시간(초)
+                (None이면 KIS_TOKEN_REFRESH_MARGIN_SECONDS)
+
         Returns:
             access_token: 액세스 토큰
 
         Raises:
             KISAuthError: 인증 실패 시
         """
+        if min_remaining is None:
+            min_remaining = settings.KIS_TOKEN_REFRESH_MARGIN_SECONDS
+
         # 메모리에 보관 중인 토큰이 아직 유효한지 확인
-        if self._access_token and self._token_expires_at:
-            if datetime.now() < self._token_expires_at - timedelta(minutes=5):
-                logger.debug("✅ Using existing KIS access token")
+        if self._memory_token_valid(min_remaining):
+            logger.debug("✅ Using existing KIS access token")
+            return self._access_token
+
+        async with self._lock():
+            if self._memory_token_valid(min_remaining):
                 return self._access_token
 
+            # 다른 워커가 발급해 둔 토큰 확인
+            record = await asyncio.to_thread(self._token_store.load, self._token_key)
+            if record is not None and record.is_valid(min_remaining):
+                return self._adopt_token(record, source="shared store")
+
+            if not self.app_key or not self.app_secret:
+                raise KISAuthError("KIS_APP_KEY and KIS_APP_SECRET must be configured in .env")
+
+            async with self._token_store.lock():
+                record = await asyncio.to_thread(self._token_store.load, self._token_key)
+                if record is not None and record.is_valid(min_remaining):
+                    return self._adopt_token(record, source="shared store")
+
+                record = await self._issue_access_token()
+                await asyncio.to_thread(self._token_store.save, self._token_key, record)
+                return self._adopt_token(record, source="issued")
+
+    def _memory_token_valid(self, min_remaining: float) -> bool:
+        if not self._access_token or not self._token_expires_at:
+            return False
+        return datetime.now() < self._token_expires_at - timedelta(seconds=min_remaining)
+
+    def _adopt_token(self, record: TokenRecord, source: str) -> str:
+        self._access_token = record.access_token
+        self._token_expires_at = record.expires_at
+        logger.info(f"✅ KIS access token ready ({source}, expires at {record.expires_at:%Y-%m-%d %H:%M})")
+        return record.access_token
+
+    async def _issue_access_token(self) -> TokenRecord:
+        """KIS 토큰 발급 API 호출"""
         # 새 토큰 발급
         logger.info("🔑 Requesting new KIS access token...")
 
-        if not self.app_key or not self.app_secret:
-            raise KISAuthError("KIS_APP_KEY and KIS_APP_SECRET must be configured in .env")
-
         url = f"{self.base_url}{KIS_ENDPOINTS['auth']}"
         headers = {
             "Content-Type": "application/json",
@@ -178,10 +548,7 @@ class KISService:
         }
 
         try:
-            # 비동기로 실행
-            response = await asyncio.to_thread(
-                requests.post, url, json=data, headers=headers, timeout=10
-            )
+            response = await self._send("POST", url, json=data, headers=headers)
 
             if response.status_code != 200:
                 logger.error(f"❌ KIS auth failed: {response.status_code} - {response.text}")
@@ -194,20 +561,82 @@ class KISService:
             if not access_token:
                 raise KISAuthError("No access_token in response")
 
-            # 토큰 저장 (발급 시점 기준으로 유효 기간 관리)
-            self._access_token = access_token
-            self._token_expires_at = datetime.now() + timedelta(seconds=expires_in)
-
+            # 발급 시점 기준으로 유효 기간 관리
             logger.info(f"✅ KIS access token obtained (expires in {expires_in}s)")
-            return access_token
+            return TokenRecord(
+                access_token=access_token,
+                expires_at=datetime.now() + timedelta(seconds=int(expires_in)),
+            )
 
-        except RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"❌ KIS auth request failed: {e}")
             raise KISAuthError(f"Request failed: {e}") from e
         except json.JSONDecodeError as e:
             logger.error(f"❌ KIS auth response parsing failed: {e}")
             raise KISAuthError(f"JSON decode failed: {e}") from e
 
+    async def get_approval_key(self) -> str:
+        """
+        실시간 시세(WebSocket) 접속키 발급
+
+        접속키는 WebSocket 세션 등록에만 쓰이므로 REST 호출 한도와 무관하며,
+        WebSocket 재접속 시 재사용합니다.
+
+        Raises:
+            KISAuthError: 발급 실패 시
+        """
+        if self._approval_key:
+            return self._approval_key
+        if not self.app_key or not self.app_secret:
+            raise KISAuthError("KIS_APP_KEY and KIS_APP_SECRET must be configured in .env")
+
+        url = f"{self.base_url}{KIS_ENDPOINTS['approval']}"
+        data = {
+            "grant_type": "client_credentials",
+            "appkey": self.app_key,
+            "secretkey": self.app_secret,
+        }
+        try:
+            response = await self._send("POST", url, json=data, headers={"Content-Type": "application/json"})
+            if response.status_code != 200:
+                logger.error(f"❌ KIS approval key request failed: {response.status_code} - {response.text}")
+                raise KISAuthError(f"Approval key request failed: {response.status_code}")
+            approval_key = response.json().get("approval_key")
+        except httpx.HTTPError as e:
+            raise KISAuthError(f"Request failed: {e}") from e
+        except json.JSONDecodeError as e:
+            raise KISAuthError(f"JSON decode failed: {e}") from e
+
+        if not approval_key:
+            raise KISAuthError("No approval_key in response")
+        self._approval_key = approval_key
+        logger.info("✅ KIS websocket approval key obtained")
+        return approval_key
+
+    # ==================== 토큰 백그라운드 갱신 ====================
+
+    def start_token_refresher(self) -> None:
+        """만료 전에 토큰을 미리 갱신하는 백그라운드 작업 시작"""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_token_loop())
+
+    async def _refresh_token_loop(self) -> None:
+        ahead = settings.KIS_TOKEN_REFRESH_AHEAD_SECONDS
+        while True:
+            delay = 60.0
+            if self._token_expires_at is not None:
+                remaining = (self._token_expires_at - datetime.now()).total_seconds()
+                # 워커들이 동시에 깨어나지 않도록 약간의 지터 추가
+                delay = max(remaining - ahead, 0.0) + random.uniform(0, 30)
+            await asyncio.sleep(delay)
+
+            try:
+                await self._get_access_token(min_remaining=ahead)
+            except (KISAuthError, OSError) as e:
+                logger.warning(f"⚠️ KIS token refresh failed, retrying in 60s: {e}")
+                await asyncio.sleep(60)
+
     async def _api_call(
         self,
         url_path: str,
@@ -215,6 +644,7 @@ class KISService:
         params: Optional[Dict[str, Any]] = None,
         method: str = "GET",
         tr_cont: str = "",
+        idempotent: bool = True,
     ) -> Dict[str, Any]:
         """
         KIS API 공통 호출 함수
@@ -225,16 +655,15 @@ class KISService:
             params: 쿼리 파라미터 또는 Body 데이터
             method: HTTP 메서드 ("GET" or "POST")
             tr_cont: 연속거래여부 ("" or "N" or "M" or "F")
+            idempotent: False면 자동 재시도하지 않음 (주문 등 재전송 시 중복 처리되는 요청)
 
         Returns:
             API 응답 딕셔너리
 
         Raises:
+            KISOrderStatusUnknownError: idempotent=False 요청이 전송 후 실패해 처리 여부를 알 수 없을 때
             KISAPIError: API 호출 실패 시
         """
-        # Rate Limit 적용
-        await self._rate_limiter.acquire()
-
         access_token = await self._get_access_token()
         url = f"{self.base_url}{url_path}"
 
@@ -252,12 +681,18 @@ class KISService:
 
         try:
             if method == "GET":
-                response = await asyncio.to_thread(
-                    requests.get, url, params=params, headers=headers, timeout=10
+                response = await self._send(
+                    "GET", url, tr_id=tr_id, idempotent=idempotent, params=params, headers=headers
                 )
             else:  # POST
-                response = await asyncio.to_thread(
-                    requests.post, url, json=params, headers=headers, timeout=10
+                response = await self._send(
+                    "POST", url, tr_id=tr_id, idempotent=idempotent, json=params, headers=headers
+                )
+
+            if not idempotent and response.status_code >= 500:
+                logger.error(f"❌ KIS API status unknown: {tr_id} - {response.status_code} {response.text}")
+                raise KISOrderStatusUnknownError(
+                    f"Order status unknown ({tr_id}): server error {response.status_code}, check order history before retrying"
                 )
 
             if response.status_code != 200:
@@ -275,13 +710,25 @@ class KISService:
 
             return result
 
-        except RequestException as e:
+        except httpx.TransportError as e:
+            if not idempotent and not _is_unsent(e):
+                logger.error(f"❌ KIS API status unknown: {tr_id} - {e.__class__.__name__}")
+                raise KISOrderStatusUnknownError(
+                    f"Order status unknown ({tr_id}): {e.__class__.__name__}, check order history before retrying"
+                ) from e
+            logger.error(f"❌ KIS API request failed: {e}")
+            raise KISAPIError(f"Request failed: {e}") from e
+        except httpx.HTTPError as e:
             logger.error(f"❌ KIS API request failed: {e}")
             raise KISAPIError(f"Request failed: {e}") from e
         except json.JSONDecodeError as e:
             logger.error(f"❌ KIS API response parsing failed: {e}")
             raise KISAPIError(f"JSON decode failed: {e}") from e
 
+    def rate_limit_stats(self) -> Dict[str, Any]:
+        """KIS 호출 대기열 통계"""
+        return self._rate_limiter.stats()
+
     # ==================== 계좌 정보 ====================
 
     async def get_account_balance(self) -> Dict[str, Any]:
@@ -429,6 +876,85 @@ class KISService:
         logger.info(f"✅ Stock price fetched: {stock_code} = {response['current_price']:,}원")
         return response
 
+    async def get_stock_prices(self, stock_codes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 현재가 일괄 조회
+
+        실전 환경은 관심종목(멀티종목) 시세 TR로 최대 30종목씩 한 번에 조회하고,
+        모의투자(멀티종목 TR 미지원)나 멀티 조회 실패 시에는 단건 조회를 동시에
+        발행합니다 (호출 간격은 Rate Limiter가 조절).
+
+        멀티종목 응답에는 PER/PBR/시가총액이 없으므로 해당 값은 None이며
+        "partial": True로 표시됩니다.
+
+        Returns:
+            {종목코드: get_stock_price와 같은 형식의 dict} (조회 실패 종목은 제외)
+        """
+        codes = list(dict.fromkeys(code for code in stock_codes if code))
+        if not codes:
+            return {}
+
+        quotes: Dict[str, Dict[str, Any]] = {}
+        if self.env == "real":
+            for start in range(0, len(codes), KIS_MULTI_PRICE_MAX_CODES):
+                chunk = codes[start:start + KIS_MULTI_PRICE_MAX_CODES]
+                try:
+                    quotes.update(await self._get_multi_stock_price(chunk))
+                except KISAPIError as exc:
+                    logger.warning(f"⚠️ [KIS] 멀티종목 시세 조회 실패, 단건 조회로 전환: {exc}")
+                    break
+
+        missing = [code for code in codes if code not in quotes]
+        if missing:
+            results = await asyncio.gather(
+                *(self.get_stock_price(code) for code in missing),
+                return_exceptions=True,
+            )
+            for code, result in zip(missing, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"⚠️ [KIS] 현재가 조회 실패: {code} - {result}")
+                    continue
+                quotes[code] = result
+
+        logger.info(f"✅ [KIS] 현재가 일괄 조회: {len(quotes)}/{len(codes)}종목")
+        return quotes
+
+    async def _get_multi_stock_price(self, stock_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """관심종목(멀티종목) 시세조회 - 최대 30종목"""
+        params: Dict[str, Any] = {}
+        for idx, code in enumerate(stock_codes, start=1):
+            params[f"FID_COND_MRKT_DIV_CODE_{idx}"] = "J"
+            params[f"FID_INPUT_ISCD_{idx}"] = code
+
+        result = await self._api_call(
+            KIS_ENDPOINTS["multi_stock_price"],
+            KIS_TR_IDS["multi_stock_price"],
+            params,
+            method="GET",
+        )
+
+        quotes: Dict[str, Dict[str, Any]] = {}
+        for item in result.get("output", []) or []:
+            code = item.get("inter_shrn_iscd", "")
+            if not code:
+                continue
+            quotes[code] = {
+                "stock_code": code,
+                "stock_name": item.get("inter_kor_isnm", ""),
+                "current_price": int(item.get("inter2_prpr", 0) or 0),
+                "change_price": int(item.get("inter2_prdy_vrss", 0) or 0),
+                "change_rate": float(item.get("prdy_ctrt", 0) or 0),
+                "open_price": int(item.get("inter2_oprc", 0) or 0),
+                "high_price": int(item.get("inter2_hgpr", 0) or 0),
+                "low_price": int(item.get("inter2_lwpr", 0) or 0),
+                "volume": int(item.get("acml_vol", 0) or 0),
+                "per": None,
+                "pbr": None,
+                "market_cap": None,
+                "partial": True,
+            }
+        return quotes
+
     async def get_stock_daily_price(
         self,
         stock_code: str,
@@ -536,6 +1062,7 @@ class KISService:
             }
 
         Raises:
+            KISOrderStatusUnknownError: 주문 전송 후 응답을 받지 못한 경우 (자동 재주문하지 않음)
             KISAPIError: 주문 실패 시
         """
         if not self.cano or not self.acnt_prdt_cd:
@@ -579,7 +1106,8 @@ class KISService:
             "/uapi/domestic-stock/v1/trading/order-cash",
             tr_id,
             params,
-            method="POST"
+            method="POST",
+            idempotent=False,  # 중복 주문 방지: 자동 재시도 금지
         )
 
         # output 파싱
@@ -755,11 +1283,13 @@ async def init_kis_service(env: str = "demo") -> None:
         env: 환경 ("real" or "demo")
     """
     global kis_service, _kis_proxy_module
+    await kis_service.close()
     kis_service = KISService(env=env)
 
     # 토큰 미리 발급 (검증)
     try:
         await kis_service._get_access_token()
+        kis_service.start_token_refresher()
         logger.info("✅ KIS Service initialized and authenticated")
     except KISAuthError as e:
         logger.warning(f"⚠️ KIS authentication failed: {e}")
@@ -767,3 +1297,13 @@ async def init_kis_service(env: str = "demo") -> None:
     setattr(kis_service, "kis_service", kis_service)
     if isinstance(_kis_proxy_module, _KISServiceModule):
         setattr(_kis_proxy_module, "_service", kis_service)
+
+
+async def close_kis_service() -> None:
+    """KIS 서비스 HTTP 커넥션 정리 (앱 종료 시 호출)"""
+    await kis_service.close()
+
+
+def kis_rate_limit_stats() -> Dict[str, Any]:
+    """현재 전역 KIS 서비스의 호출 대기열 통계 (`/health`용)"""
+    return kis_service.rate_limit_stats()
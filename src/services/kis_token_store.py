@@ -0,0 +1,125 @@
+"""
+KIS 액세스 토큰 저장소
+
+여러 uvicorn 워커/재시작 간에 KIS OAuth 토큰을 공유하기 위한 파일 기반 저장소입니다.
+KIS는 토큰 발급 빈도를 제한하므로, 프로세스마다 새 토큰을 받지 않고
+파일 잠금(flock)으로 한 프로세스만 발급/갱신하도록 합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import IO, AsyncIterator, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows 등 flock 미지원 환경
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenRecord:
+    """저장된 액세스 토큰"""
+
+    access_token: str
+    expires_at: datetime
+
+    def is_valid(self, margin_seconds: float = 0.0, now: Optional[datetime] = None) -> bool:
+        """만료까지 margin_seconds 이상 남았는지 여부"""
+        remaining = (self.expires_at - (now or datetime.now())).total_seconds()
+        return remaining > margin_seconds
+
+
+def token_key(env: str, app_key: str) -> str:
+    """저장 키 (앱 키 원문은 파일에 남기지 않음)"""
+    digest = hashlib.sha256(app_key.encode("utf-8")).hexdigest()[:16]
+    return f"{env}:{digest}"
+
+
+class FileTokenStore:
+    """
+    JSON 파일 기반 토큰 저장소 (프로세스 간 공유)
+
+    - 읽기/쓰기는 임시 파일 교체(os.replace)로 원자적으로 처리
+    - lock()은 별도 .lock 파일에 배타적 flock을 잡아 발급 구간을 직렬화
+    - 토큰이 담기므로 파일 권한은 0600
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(tempfile.gettempdir(), "hama_kis_tokens.json")
+        self.lock_path = f"{self.path}.lock"
+
+    def load(self, key: str) -> Optional[TokenRecord]:
+        entry = self._read_all().get(key)
+        if not entry:
+            return None
+        try:
+            return TokenRecord(
+                access_token=entry["access_token"],
+                expires_at=datetime.fromisoformat(entry["expires_at"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, key: str, record: TokenRecord) -> None:
+        data = self._read_all()
+        data[key] = {
+            "access_token": record.access_token,
+            "expires_at": record.expires_at.isoformat(),
+        }
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".kis_token_")
+        try:
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    @asynccontextmanager
+    async def lock(self) -> AsyncIterator[None]:
+        """프로세스 간 배타 잠금 (대기는 스레드에서 수행해 이벤트 루프를 막지 않음)"""
+        handle = await asyncio.to_thread(self._acquire)
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(self._release, handle)
+
+    def _acquire(self) -> IO[str]:
+        os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+        handle = open(self.lock_path, "a", encoding="utf-8")
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        return handle
+
+    def _release(self, handle: IO[str]) -> None:
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            handle.close()
+
+    def _read_all(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"⚠️ KIS token store unreadable, ignoring: {e}")
+            return {}
+        return data if isinstance(data, dict) else {}
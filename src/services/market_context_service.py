@@ -0,0 +1,277 @@
+"""
+공유 시장 컨텍스트 서비스
+
+거시 지표(BOK)와 KOSPI 종가는 하루에 한 번 이하로 바뀌므로, 시장 사이클 판단과
+리스크 성향별 자산 배분을 데이터 기준일(vintage)마다 한 번만 LLM으로 계산해
+모든 사용자/에이전트가 공유합니다.
+
+- version: 기준금리/CPI/환율 기준일 + 지수 기준일·종가
+- 저장: 프로세스 메모리 + DB(market_context_snapshots) → 워커 간 공유
+- 스케줄러: 주기적으로 BOK 데이터를 갱신하고, version이 바뀌면 한 번 재생성
+- LLM 실패로 섹터 기반 fallback 판단이 나온 컨텍스트는 저장하지 않고 메모리에만 두며,
+  다음 확인 때 다시 생성합니다
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from src.config.settings import settings
+from src.repositories.market_context_repository import market_context_repository
+from src.services.macro_data_service import macro_data_service
+from src.services.stock_data_service import stock_data_service
+from src.utils.market_calendar import last_closed_session
+
+logger = logging.getLogger(__name__)
+
+RISK_TOLERANCES = ("conservative", "moderate", "aggressive")
+
+
+def _to_float(value: Any) -> Any:
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def _closed_bars(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """장중 현재 봉을 제외한 확정 일봉만 반환 (version이 장중에 바뀌지 않도록)"""
+    if df is None or df.empty:
+        return None
+    cutoff = pd.Timestamp(last_closed_session())
+    closed = df[pd.to_datetime(df.index) <= cutoff]
+    return closed if not closed.empty else None
+
+
+def _is_provisional(context: Dict[str, Any]) -> bool:
+    """LLM 판단 없이 fallback으로 만든 컨텍스트인지 (공유 저장 대상 아님)"""
+    return bool((context.get("market_cycle") or {}).get("fallback"))
+
+
+def annualized_volatility(df: Optional[pd.DataFrame]) -> Optional[float]:
+    """일간 수익률 표준편차 × √252 (%)"""
+    if df is None or len(df) < 20:
+        return None
+    returns = df["Close"].pct_change().dropna()
+    return float(returns.std() * (252 ** 0.5) * 100)
+
+
+class MarketContextService:
+    """데이터 기준일별 시장 컨텍스트 생성/조회"""
+
+    def __init__(self, repository=market_context_repository, index_name: str = "KOSPI"):
+        self._repository = repository
+        self.index_name = index_name
+        self._current: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._build_lock: Optional[asyncio.Lock] = None
+        self._build_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._macro_refreshed_at: Optional[datetime] = None
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    async def get_context(self) -> Dict[str, Any]:
+        """
+        현재 시장 컨텍스트 반환
+
+        메모리 → DB 최신본 순으로 조회하고, 아무것도 없을 때만 즉시 생성합니다.
+        최신 데이터 반영은 스케줄러(ensure_current)가 담당하며,
+        스케줄러가 없으면 확인 주기가 지난 뒤 첫 요청에서 확인합니다.
+        """
+        if self._current is not None:
+            scheduled = self._scheduler_task is not None and not self._scheduler_task.done()
+            age = time.monotonic() - self._checked_at
+            if scheduled or age < settings.MARKET_CONTEXT_CHECK_INTERVAL_SECONDS:
+                return self._current
+            return await self.ensure_current()
+
+        stored = await asyncio.to_thread(self._repository.latest)
+        if stored:
+            self._current = stored
+            self._checked_at = time.monotonic()
+            return stored
+
+        return await self.ensure_current()
+
+    async def ensure_current(self) -> Dict[str, Any]:
+        """데이터 기준일을 확인해 바뀌었으면 컨텍스트를 재생성"""
+        async with self._lock():
+            inputs = await self._collect_inputs()
+            version = inputs["version"]
+            self._checked_at = time.monotonic()
+            if (
+                self._current is not None
+                and self._current.get("version") == version
+                and not _is_provisional(self._current)
+            ):
+                return self._current
+
+            stored = await asyncio.to_thread(self._repository.get, version)
+            if stored:
+                logger.info("📦 [MarketContext] 공유 컨텍스트 로드: %s", version)
+                self._current = stored
+                return stored
+
+            context = await self._build(inputs)
+            if _is_provisional(context):
+                # 일시적인 LLM 오류가 기준일 내내 모든 워커에 공유되지 않도록 메모리에만 유지
+                logger.warning("⚠️ [MarketContext] fallback 시장 사이클, 저장하지 않고 다음 확인 때 재시도: %s", version)
+                self._current = context
+                return context
+
+            # 다른 워커가 먼저 저장했으면 그 컨텍스트로 통일
+            context = await asyncio.to_thread(self._repository.save, version, context)
+            self._current = context
+            logger.info("✅ [MarketContext] 컨텍스트 생성 완료: %s", version)
+            return context
+
+    # ------------------------------------------------------------------
+    # 생성
+    # ------------------------------------------------------------------
+    async def _collect_inputs(self) -> Dict[str, Any]:
+        macro = await asyncio.to_thread(macro_data_service.macro_summary)
+        if not macro.get("base_rate"):
+            await self.refresh_macro_data()
+            macro = await asyncio.to_thread(macro_data_service.macro_summary)
+        snapshot = await asyncio.to_thread(macro_data_service.latest_snapshot)
+
+        index_df = _closed_bars(await stock_data_service.get_market_index(self.index_name, days=90))
+        index_date = index_close = None
+        if index_df is not None:
+            index_date = pd.Timestamp(index_df.index[-1]).date().isoformat()
+            index_close = round(float(index_df["Close"].iloc[-1]), 2)
+
+        vintage = {
+            "base_rate_date": snapshot.get("base_rate_date"),
+            "cpi_date": snapshot.get("cpi_date"),
+            "usdkrw_date": snapshot.get("usdkrw_date"),
+            "index_date": index_date,
+            "index_close": index_close,
+        }
+        version = "|".join(
+            [
+                f"base:{vintage['base_rate_date']}",
+                f"cpi:{vintage['cpi_date']}",
+                f"fx:{vintage['usdkrw_date']}",
+                f"{self.index_name.lower()}:{index_date}@{index_close}",
+            ]
+        )
+        return {
+            "version": version,
+            "vintage": vintage,
+            "macro": {key: _to_float(value) for key, value in macro.items()},
+            "index_df": index_df,
+        }
+
+    async def _build(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        from src.agents.strategy.market_analyzer import market_analyzer
+        from src.agents.strategy.risk_stance import risk_stance_analyzer
+        from src.services.sector_data_service import sector_data_service
+
+        logger.info("🌐 [MarketContext] 컨텍스트 생성 시작: %s", inputs["version"])
+
+        try:
+            sector_ranking: List[Dict[str, Any]] = await asyncio.to_thread(
+                sector_data_service.get_sector_ranking, 30
+            )
+        except Exception as exc:
+            logger.warning("⚠️ [MarketContext] 섹터 성과 조회 불가, 섹터 없이 진행: %s", exc)
+            sector_ranking = []
+
+        index_df = inputs["index_df"]
+        volatility = annualized_volatility(index_df)
+
+        market_cycle = await market_analyzer.analyze_cycle(inputs["macro"], sector_ranking)
+
+        allocations: Dict[str, Dict[str, Any]] = {}
+        if volatility is not None:
+            results = await asyncio.gather(
+                *(
+                    risk_stance_analyzer.compute_allocation(market_cycle["cycle"], tolerance, volatility)
+                    for tolerance in RISK_TOLERANCES
+                ),
+                return_exceptions=True,
+            )
+            for tolerance, result in zip(RISK_TOLERANCES, results):
+                if isinstance(result, BaseException):
+                    logger.warning("⚠️ [MarketContext] 자산 배분 생성 실패 (%s): %s", tolerance, result)
+                    continue
+                allocations[tolerance] = {
+                    "stocks": float(result.stocks),
+                    "cash": float(result.cash),
+                    "rationale": result.rationale,
+                }
+
+        return {
+            "version": inputs["version"],
+            "generated_at": datetime.now().isoformat(),
+            "vintage": inputs["vintage"],
+            "macro": inputs["macro"],
+            "market_index": {
+                "name": self.index_name,
+                "date": inputs["vintage"]["index_date"],
+                "close": inputs["vintage"]["index_close"],
+                "volatility": volatility,
+            },
+            "sector_ranking": sector_ranking,
+            "market_cycle": market_cycle,
+            "allocations": allocations,
+        }
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._build_lock is None or self._build_lock_loop is not loop:
+            self._build_lock = asyncio.Lock()
+            self._build_lock_loop = loop
+        return self._build_lock
+
+    # ------------------------------------------------------------------
+    # 스케줄러
+    # ------------------------------------------------------------------
+    async def refresh_macro_data(self) -> None:
+        await macro_data_service.refresh_all()
+        self._macro_refreshed_at = datetime.now()
+
+    def start_scheduler(self) -> None:
+        """백그라운드 갱신 루프 시작 (이미 실행 중이면 무시)"""
+        if self._scheduler_task is not None and not self._scheduler_task.done():
+            return
+        self._scheduler_task = asyncio.create_task(self._scheduler_loop())
+
+    async def stop_scheduler(self) -> None:
+        task, self._scheduler_task = self._scheduler_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _scheduler_loop(self) -> None:
+        interval = settings.MARKET_CONTEXT_CHECK_INTERVAL_SECONDS
+        macro_interval = settings.MACRO_REFRESH_INTERVAL_HOURS * 3600
+        while True:
+            try:
+                if (
+                    self._macro_refreshed_at is None
+                    or (datetime.now() - self._macro_refreshed_at).total_seconds() >= macro_interval
+                ):
+                    await self.refresh_macro_data()
+                await self.ensure_current()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("⚠️ [MarketContext] 주기 갱신 실패: %s", exc)
+
+            # 여러 워커가 같은 시각에 몰리지 않도록 지터 추가
+            await asyncio.sleep(interval * random.uniform(0.9, 1.1))
+
+
+market_context_service = MarketContextService()
@@ -0,0 +1,473 @@
+"""
+KIS 실시간 시세(WebSocket) 수신 + 메모리 틱 저장소
+
+전체 사용자 보유 종목의 체결가(H0STCNT0)/호가(H0STASP0)를 하나의 WebSocket
+세션으로 구독해, 현재가 조회가 REST 호출 없이 메모리에서 끝나도록 합니다.
+
+- 종목별 체결 틱은 고정 크기 링 버퍼(MARKET_STREAM_BUFFER_SIZE)에 보관
+- 최신 시세/호가는 MARKET_STREAM_FLUSH_SECONDS마다 realtime_prices/stock_quotes에 일괄 저장
+- 구독 종목은 MARKET_STREAM_SUBSCRIPTION_REFRESH_SECONDS마다 보유 종목 합집합으로 갱신
+  (접속키 1개당 등록 한도 KIS_REALTIME_MAX_REGISTRATIONS 안에서 보유 포트폴리오 수가 많은 순)
+- 연결이 끊기면 지수 백오프로 재접속하며, 끊긴 동안에는 시세를 제공하지 않아
+  quote_service가 REST 조회로 대체합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+import websockets
+
+from src.config.settings import settings
+from src.constants.kis_constants import KIS_REALTIME_MAX_REGISTRATIONS, KIS_REALTIME_TR_IDS
+from src.repositories.realtime_price_repository import realtime_price_repository
+from src.repositories.stock_quote_repository import ORDERBOOK_DEPTH, stock_quote_repository
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_TR_ID = KIS_REALTIME_TR_IDS["execution"]
+ORDERBOOK_TR_ID = KIS_REALTIME_TR_IDS["orderbook"]
+
+# H0STCNT0 필드 위치 (^ 구분)
+_EXEC_FIELDS = {
+    "stock_code": 0,
+    "time": 1,
+    "current_price": 2,
+    "change_price": 4,
+    "change_rate": 5,
+    "open_price": 7,
+    "high_price": 8,
+    "low_price": 9,
+    "trade_volume": 12,
+    "volume": 13,
+}
+_EXEC_MIN_FIELDS = max(_EXEC_FIELDS.values()) + 1
+
+# H0STASP0 필드 위치: 매도호가 1~10, 매수호가 1~10, 매도잔량 1~10, 매수잔량 1~10, 총잔량
+_ASK_PRICE, _BID_PRICE, _ASK_VOLUME, _BID_VOLUME = 3, 13, 23, 33
+_TOTAL_ASK_VOLUME, _TOTAL_BID_VOLUME = 43, 44
+_BOOK_MIN_FIELDS = _TOTAL_BID_VOLUME + 1
+
+
+def _int(value: str) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _float(value: str) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def parse_frame(message: str) -> List[Tuple[str, List[str]]]:
+    """
+    실시간 데이터 프레임 파싱
+
+    "0|TR_ID|건수|필드^필드^..." → [(TR_ID, 1건의 필드 목록), ...]
+    한 프레임에 여러 건이 이어 붙어 올 수 있어 건수로 나눕니다.
+    암호화 프레임("1|...", 체결 통보 전용)과 JSON 제어 메시지는 빈 목록입니다.
+    """
+    parts = message.split("|", 3)
+    if len(parts) != 4 or parts[0] != "0":
+        return []
+    _, tr_id, count, payload = parts
+    fields = payload.split("^")
+    count = max(1, _int(count))
+    size = len(fields) // count
+    if size == 0:
+        return []
+    return [(tr_id, fields[idx * size:(idx + 1) * size]) for idx in range(count)]
+
+
+def parse_execution(fields: List[str]) -> Dict[str, Any]:
+    """체결가(H0STCNT0) 1건 → get_stock_price와 같은 키의 시세"""
+    tick: Dict[str, Any] = {}
+    for key, idx in _EXEC_FIELDS.items():
+        if key in ("stock_code", "time"):
+            tick[key] = fields[idx]
+        elif key == "change_rate":
+            tick[key] = _float(fields[idx])
+        else:
+            tick[key] = _int(fields[idx])
+    return tick
+
+
+def parse_orderbook(fields: List[str]) -> Dict[str, Any]:
+    """호가(H0STASP0) 1건 → {"asks": [(가격, 잔량)...], "bids": [...], 총잔량}"""
+    return {
+        "stock_code": fields[0],
+        "time": fields[1],
+        "asks": [
+            (_int(fields[_ASK_PRICE + level]), _int(fields[_ASK_VOLUME + level])) for level in range(ORDERBOOK_DEPTH)
+        ],
+        "bids": [
+            (_int(fields[_BID_PRICE + level]), _int(fields[_BID_VOLUME + level])) for level in range(ORDERBOOK_DEPTH)
+        ],
+        "total_ask_volume": _int(fields[_TOTAL_ASK_VOLUME]),
+        "total_bid_volume": _int(fields[_TOTAL_BID_VOLUME]),
+    }
+
+
+class TickStore:
+    """종목별 체결 틱 링 버퍼 + 최신 시세/호가"""
+
+    def __init__(self, buffer_size: Optional[int] = None):
+        self.buffer_size = settings.MARKET_STREAM_BUFFER_SIZE if buffer_size is None else buffer_size
+        self._ticks: Dict[str, Deque[Tuple[str, int, int]]] = {}
+        self._quotes: Dict[str, Dict[str, Any]] = {}
+        self._books: Dict[str, Dict[str, Any]] = {}
+        self._received_at: Dict[str, float] = {}
+        self._dirty_quotes: Set[str] = set()
+        self._dirty_books: Set[str] = set()
+
+    def add_execution(self, tick: Dict[str, Any]) -> None:
+        code = tick["stock_code"]
+        buffer = self._ticks.get(code)
+        if buffer is None:
+            buffer = self._ticks[code] = deque(maxlen=self.buffer_size)
+        buffer.append((tick["time"], tick["current_price"], tick["trade_volume"]))
+
+        quote = {key: value for key, value in tick.items() if key not in ("time", "trade_volume")}
+        quote["timestamp"] = datetime.now().isoformat()
+        quote["partial"] = True  # PER/PBR/시가총액 없음
+        quote["source"] = "stream"
+        self._quotes[code] = quote
+        self._received_at[code] = time.monotonic()
+        self._dirty_quotes.add(code)
+
+    def add_orderbook(self, book: Dict[str, Any]) -> None:
+        code = book["stock_code"]
+        self._books[code] = dict(book, timestamp=datetime.now().isoformat())
+        self._dirty_books.add(code)
+
+    def quote(self, stock_code: str, since: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """최신 시세 (since(monotonic) 이전에 받은 시세는 무시)"""
+        quote = self._quotes.get(stock_code)
+        if quote is None or (since is not None and self._received_at[stock_code] < since):
+            return None
+        return dict(quote)
+
+    def book(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        book = self._books.get(stock_code)
+        return dict(book) if book else None
+
+    def ticks(self, stock_code: str) -> List[Tuple[str, int, int]]:
+        """보관 중인 체결 틱 [(체결시각 HHMMSS, 체결가, 체결량), ...] (오래된 순)"""
+        return list(self._ticks.get(stock_code, ()))
+
+    def drain_dirty(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """마지막 호출 이후 갱신된 최신 시세/호가"""
+        quotes = [self._quotes[code] for code in self._dirty_quotes]
+        books = [self._books[code] for code in self._dirty_books]
+        self._dirty_quotes = set()
+        self._dirty_books = set()
+        return quotes, books
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+
+async def _held_stock_codes() -> List[str]:
+    from src.services.portfolio_service import portfolio_service
+
+    return await portfolio_service.list_held_stock_codes()
+
+
+class MarketStreamService:
+    """KIS 실시간 시세 WebSocket 수신기"""
+
+    def __init__(
+        self,
+        store: Optional[TickStore] = None,
+        url: Optional[str] = None,
+        approval_key_provider: Optional[Callable[[], Awaitable[str]]] = None,
+        codes_provider: Callable[[], Awaitable[Iterable[str]]] = _held_stock_codes,
+        price_repository=realtime_price_repository,
+        quote_repository=stock_quote_repository,
+        orderbook: Optional[bool] = None,
+        flush_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            store: 틱 저장소 (None이면 새로 생성)
+            url: WebSocket URL (None이면 MARKET_STREAM_URL, 비어 있으면 KIS 환경별 URL)
+            approval_key_provider: 접속키 발급 함수 (None이면 kis_service.get_approval_key)
+            codes_provider: 구독할 종목 코드 목록 (우선순위 순)
+            orderbook: 호가 구독 여부 (None이면 MARKET_STREAM_ORDERBOOK)
+            flush_seconds: DB 일괄 저장 주기 (None이면 MARKET_STREAM_FLUSH_SECONDS, 0이면 저장 안 함)
+        """
+        self.store = store if store is not None else TickStore()
+        self._url = url
+        self._approval_key_provider = approval_key_provider
+        self._codes_provider = codes_provider
+        self._price_repository = price_repository
+        self._quote_repository = quote_repository
+        self.orderbook = settings.MARKET_STREAM_ORDERBOOK if orderbook is None else orderbook
+        self.flush_seconds = settings.MARKET_STREAM_FLUSH_SECONDS if flush_seconds is None else flush_seconds
+
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._ws = None
+        self._approval_key: Optional[str] = None
+        self._connected_at: Optional[float] = None
+        self._subscribed: Set[str] = set()
+        self._subscription_lock: Optional[asyncio.Lock] = None
+        self._subscription_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {"frames": 0, "executions": 0, "orderbooks": 0, "reconnects": 0, "flushed": 0}
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @property
+    def connected(self) -> bool:
+        return self._connected_at is not None
+
+    @property
+    def max_tickers(self) -> int:
+        return KIS_REALTIME_MAX_REGISTRATIONS // len(self._tr_ids())
+
+    def latest_quote(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """
+        실시간 최신 시세 (REST 호출 없음)
+
+        현재 연결에서 구독 중이고 연결 이후 체결이 한 번 이상 들어온 종목만
+        반환합니다. 그 외에는 None (호출 측이 REST로 대체).
+        """
+        if not self.connected or stock_code not in self._subscribed:
+            return None
+        return self.store.quote(stock_code, since=self._connected_at)
+
+    def subscribed_codes(self) -> List[str]:
+        return sorted(self._subscribed)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self._task is not None and not self._task.done(),
+            "connected": self.connected,
+            "subscribed": len(self._subscribed),
+            "tickers": len(self.store),
+            **self._stats,
+        }
+
+    # ------------------------------------------------------------------
+    # 수명 주기
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """수신/저장 백그라운드 작업 시작 (이미 실행 중이면 무시)"""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+        if self.flush_seconds > 0:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        tasks = [task for task in (self._task, self._flush_task) if task is not None and not task.done()]
+        self._task = self._flush_task = None
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self.flush_seconds > 0:
+            await self.flush()
+
+    async def _run(self) -> None:
+        delay = 1.0
+        while True:
+            try:
+                await self._session()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("⚠️ [MarketStream] 실시간 시세 연결 실패: %s", exc)
+            finally:
+                established = self.connected
+                self._on_disconnect()
+
+            if established:
+                delay = 1.0
+            self._stats["reconnects"] += 1
+            logger.info("🔌 [MarketStream] %.0f초 후 재접속", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, settings.MARKET_STREAM_RECONNECT_MAX_SECONDS)
+
+    async def _session(self) -> None:
+        self._approval_key = await self._get_approval_key()
+        async with websockets.connect(self._resolve_url(), ping_interval=None) as ws:
+            self._ws = ws
+            self._connected_at = time.monotonic()
+            logger.info("✅ [MarketStream] 실시간 시세 연결: %s", self._resolve_url())
+
+            await self.refresh_subscriptions()
+            refresher = asyncio.create_task(self._subscription_loop())
+            try:
+                async for message in ws:
+                    await self._handle(message)
+            finally:
+                refresher.cancel()
+                try:
+                    await refresher
+                except asyncio.CancelledError:
+                    pass
+
+    def _on_disconnect(self) -> None:
+        self._ws = None
+        self._connected_at = None
+        self._subscribed = set()
+
+    # ------------------------------------------------------------------
+    # 구독
+    # ------------------------------------------------------------------
+    async def refresh_subscriptions(self) -> None:
+        """구독 종목을 현재 보유 종목 합집합으로 맞춤 (해지 먼저, 등록 한도 내에서 추가)"""
+        if self._ws is None:
+            return
+        try:
+            codes = list(dict.fromkeys(code for code in await self._codes_provider() if code))
+        except Exception as exc:
+            logger.warning("⚠️ [MarketStream] 구독 종목 조회 실패 (기존 구독 유지): %s", exc)
+            return
+        if len(codes) > self.max_tickers:
+            logger.info("ℹ️ [MarketStream] 구독 한도 초과: %d종목 중 %d종목만 구독", len(codes), self.max_tickers)
+        desired = set(codes[: self.max_tickers])
+
+        async with self._lock():
+            for code in sorted(self._subscribed - desired):
+                await self._send_subscription(code, subscribe=False)
+                self._subscribed.discard(code)
+            for code in codes[: self.max_tickers]:
+                if code not in self._subscribed:
+                    await self._send_subscription(code, subscribe=True)
+                    self._subscribed.add(code)
+
+    async def _subscription_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.MARKET_STREAM_SUBSCRIPTION_REFRESH_SECONDS)
+            await self.refresh_subscriptions()
+
+    async def _send_subscription(self, stock_code: str, subscribe: bool) -> None:
+        for tr_id in self._tr_ids():
+            await self._ws.send(
+                json.dumps(
+                    {
+                        "header": {
+                            "approval_key": self._approval_key,
+                            "custtype": "P",
+                            "tr_type": "1" if subscribe else "2",
+                            "content-type": "utf-8",
+                        },
+                        "body": {"input": {"tr_id": tr_id, "tr_key": stock_code}},
+                    }
+                )
+            )
+
+    def _tr_ids(self) -> Tuple[str, ...]:
+        return (EXECUTION_TR_ID, ORDERBOOK_TR_ID) if self.orderbook else (EXECUTION_TR_ID,)
+
+    # ------------------------------------------------------------------
+    # 수신
+    # ------------------------------------------------------------------
+    async def _handle(self, message: Any) -> None:
+        if isinstance(message, bytes):
+            message = message.decode("utf-8", errors="replace")
+        self._stats["frames"] += 1
+
+        if message[:1] in ("0", "1"):
+            for tr_id, fields in parse_frame(message):
+                if tr_id == EXECUTION_TR_ID and len(fields) >= _EXEC_MIN_FIELDS:
+                    self.store.add_execution(parse_execution(fields))
+                    self._stats["executions"] += 1
+                elif tr_id == ORDERBOOK_TR_ID and len(fields) >= _BOOK_MIN_FIELDS:
+                    self.store.add_orderbook(parse_orderbook(fields))
+                    self._stats["orderbooks"] += 1
+            return
+
+        try:
+            data = json.loads(message)
+        except ValueError:
+            logger.debug("⚠️ [MarketStream] 알 수 없는 메시지: %s", message[:100])
+            return
+
+        header = data.get("header") or {}
+        if header.get("tr_id") == "PINGPONG":
+            # 서버 keep-alive: 받은 메시지를 그대로 돌려보내야 연결이 유지됨
+            await self._ws.send(message)
+            return
+        body = data.get("body") or {}
+        if body.get("rt_cd") not in (None, "0"):
+            logger.warning(
+                "⚠️ [MarketStream] 구독 응답 오류: %s %s - %s",
+                header.get("tr_id"),
+                header.get("tr_key"),
+                body.get("msg1"),
+            )
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    async def flush(self) -> int:
+        """
+        마지막 저장 이후 갱신된 최신 시세/호가를 일괄 저장
+
+        체결 시세는 부분 시세(partial)로 저장되어 realtime_prices의 PER/PBR/시가총액을 덮어쓰지 않습니다.
+        """
+        quotes, books = self.store.drain_dirty()
+        if not quotes and not books:
+            return 0
+        now = datetime.now()
+        try:
+            if quotes:
+                quotes = [dict(quote, partial=True) for quote in quotes]
+                await asyncio.to_thread(self._price_repository.save_many, quotes, now)
+            if books:
+                await asyncio.to_thread(self._quote_repository.save_many, books, now)
+        except Exception as exc:
+            logger.warning("⚠️ [MarketStream] 실시간 시세 저장 실패: %s", exc)
+            return 0
+        self._stats["flushed"] += len(quotes) + len(books)
+        return len(quotes) + len(books)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_seconds)
+            await self.flush()
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _resolve_url(self) -> str:
+        if self._url:
+            return self._url
+        if settings.MARKET_STREAM_URL:
+            return settings.MARKET_STREAM_URL
+        from src.services.kis_service import kis_service
+
+        return kis_service.websocket_url
+
+    async def _get_approval_key(self) -> str:
+        if self._approval_key_provider is not None:
+            return await self._approval_key_provider()
+        from src.services.kis_service import kis_service
+
+        return await kis_service.get_approval_key()
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._subscription_lock is None or self._subscription_lock_loop is not loop:
+            self._subscription_lock = asyncio.Lock()
+            self._subscription_lock_loop = loop
+        return self._subscription_lock
+
+
+market_stream_service = MarketStreamService()
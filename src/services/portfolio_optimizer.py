@@ -229,12 +229,14 @@ class PortfolioOptimizer:
             returns_list = []
             volatility_list = []
 
+            panel = await stock_data_service.get_price_panel(stock_codes, days=120)
+
             for stock_code in stock_codes:
-                df = await stock_data_service.get_stock_price(stock_code, days=120)
+                closes = panel[stock_code].dropna() if stock_code in panel.columns else None
 
-                if df is not None and len(df) > 20:
+                if closes is not None and len(closes) > 20:
                     # 일일 수익률
-                    daily_returns = df["Close"].pct_change().dropna()
+                    daily_returns = closes.pct_change().dropna()
 
                     # 기대 수익률 (연환산)
                     mean_return = daily_returns.mean() * 252
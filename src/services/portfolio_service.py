@@ -11,6 +11,7 @@ from decimal import Decimal
 from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
+from sqlalchemy import func
 
 from src.config.settings import settings
 from src.models.database import SessionLocal
@@ -18,6 +19,7 @@ from src.models.portfolio import Portfolio, Position
 from src.models.stock import Stock
 from src.models.user import User
 from src.models.user_profile import UserProfile
+from src.services.quote_service import quote_service
 from src.services.stock_data_service import stock_data_service
 
 logger = logging.getLogger(__name__)
@@ -114,9 +116,12 @@ class PortfolioService:
         user_id: Optional[str] = None,
         portfolio_id: Optional[str] = None,
         lookback_days: int = 60,
+        live_quotes: bool = True,
     ) -> Optional[PortfolioSnapshot]:
         """Return a consolidated portfolio snapshot with risk metrics.
 
+        Holdings are revalued with current KIS quotes fetched in one batch
+        (``live_quotes=False`` keeps the stored prices).
         Falls back to ``None`` when the portfolio cannot be resolved.
         """
 
@@ -142,6 +147,9 @@ class PortfolioService:
         portfolio_data = base_snapshot["portfolio_data"]
         market_data = base_snapshot["market_data"]
 
+        if live_quotes:
+            await self._revalue_holdings(portfolio_data)
+
         try:
             metrics = await self._compute_market_metrics(
                 portfolio_data.get("holdings", []),
@@ -157,6 +165,26 @@ class PortfolioService:
             profile=base_snapshot.get("profile", {}),
         )
 
+    async def list_held_stock_codes(self) -> List[str]:
+        """All stock codes held by any portfolio, most widely held first.
+
+        Used to pick the real-time quote subscriptions shared by every user.
+        """
+
+        def _load() -> List[str]:
+            holders = func.count(Position.position_id)
+            with self._session_factory() as session:
+                rows = (
+                    session.query(Position.stock_code, holders)
+                    .filter(Position.quantity > 0, func.upper(Position.stock_code) != "CASH")
+                    .group_by(Position.stock_code)
+                    .order_by(holders.desc(), Position.stock_code.asc())
+                    .all()
+                )
+            return [code for code, _ in rows if code]
+
+        return await asyncio.to_thread(_load)
+
     async def sync_with_kis(
         self,
         *,
@@ -180,7 +208,8 @@ class PortfolioService:
         balance = await kis_service.get_account_balance()
         await asyncio.to_thread(self._sync_kis_balance_sync, resolved_id, balance)
 
-        snapshot = await self.get_portfolio_snapshot(portfolio_id=resolved_id)
+        # 잔고 응답에 현재가가 포함되어 있으므로 별도 시세 조회는 생략
+        snapshot = await self.get_portfolio_snapshot(portfolio_id=resolved_id, live_quotes=False)
         if snapshot:
             snapshot.portfolio_data["data_source"] = "kis_api"
         return snapshot
@@ -305,6 +334,50 @@ class PortfolioService:
                 "profile": profile,
             }
 
+    async def _revalue_holdings(self, portfolio_data: Dict[str, Any]) -> None:
+        """보유 종목을 KIS 현재가(일괄 조회)로 재평가하고 비중/섹터 비율을 다시 계산"""
+        holdings = portfolio_data.get("holdings") or []
+        stock_holdings = [h for h in holdings if h.get("stock_code", "").upper() != "CASH"]
+        if not stock_holdings:
+            return
+
+        try:
+            quotes = await quote_service.get_quotes(h["stock_code"] for h in stock_holdings)
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            logger.warning("Live quote refresh failed, using stored prices: %s", exc)
+            return
+        if not quotes:
+            return
+
+        for holding in stock_holdings:
+            price = (quotes.get(holding["stock_code"]) or {}).get("current_price")
+            if not price:
+                continue
+            quantity = holding.get("quantity") or 0
+            cost = (holding.get("average_price") or 0.0) * quantity
+            market_value = float(price) * quantity
+            holding["current_price"] = float(price)
+            holding["market_value"] = market_value
+            holding["unrealized_pnl"] = market_value - cost
+            holding["unrealized_pnl_rate"] = round((market_value - cost) / cost * 100, 2) if cost else None
+
+        cash_balance = portfolio_data.get("cash_balance") or 0.0
+        total_value = sum(h.get("market_value") or 0.0 for h in stock_holdings) + cash_balance
+        if total_value <= 0:
+            return
+
+        sectors: Dict[str, float] = defaultdict(float)
+        for holding in holdings:
+            if holding.get("stock_code", "").upper() == "CASH":
+                holding["weight"] = cash_balance / total_value
+                continue
+            holding["weight"] = (holding.get("market_value") or 0.0) / total_value
+            sectors[holding.get("sector") or "기타"] += holding["weight"]
+
+        portfolio_data["total_value"] = total_value
+        portfolio_data["sectors"] = dict(sectors)
+        portfolio_data["quotes_updated_at"] = datetime.utcnow().isoformat()
+
     def _build_holdings_snapshot(
         self,
         positions: Iterable[Position],
@@ -366,26 +439,13 @@ class PortfolioService:
         if not weights:
             return {}
 
-        tasks = [stock_data_service.get_stock_price(code, days=lookback_days) for code in weights]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        frames: List[pd.Series] = []
-        valid_codes: List[str] = []
-        for code, df in zip(weights, results):
-            if isinstance(df, Exception) or df is None:
-                logger.debug("Skipping volatility calc for %s: data unavailable", code)
-                continue
-            try:
-                series = df["Close"].rename(code)
-            except Exception:  # pragma: no cover - defensive
-                continue
-            frames.append(series)
-            valid_codes.append(code)
-
-        if not frames:
+        panel = await stock_data_service.get_price_panel(list(weights), days=lookback_days)
+        valid_codes = [code for code in weights if code in panel.columns]
+        if not valid_codes:
+            logger.debug("Skipping volatility calc: price data unavailable for %s", list(weights))
             return {}
 
-        price_df = pd.concat(frames, axis=1).dropna()
+        price_df = panel[valid_codes].dropna()
         returns_df = price_df.pct_change().dropna()
         if returns_df.empty:
             return {}
@@ -0,0 +1,234 @@
+"""
+KIS 현재가 공유 캐시
+
+KIS 현재가 호출은 초당 호출 한도를 공유하므로, 같은 종목을 여러 곳(시세 워커,
+펀더멘털/시가총액 조회, 종목 검색, 주문 체결가)에서 동시에 요청해도 한 번만
+호출하도록 합니다.
+
+- 장중: 짧은 TTL (QUOTE_CACHE_TTL_SECONDS, 기본 3초)
+- 장 마감 후/개장 전: 긴 TTL (QUOTE_CACHE_CLOSED_TTL_SECONDS, 다음 장 시작 전까지)
+- 동일 종목 동시 요청은 진행 중인 호출 하나로 합침 (single-flight)
+- 여러 종목은 캐시에 없는 종목만 KIS 일괄 조회(get_stock_prices) 한 번으로 채우며,
+  다른 일괄/단건 조회가 이미 진행 중인 종목은 그 호출을 기다림
+- 실시간 시세 수신(market_stream_service) 중인 종목은 REST 호출 없이 최신 체결가 사용
+- QUOTE_CACHE_PERSIST=True면 realtime_prices 테이블에도 저장해
+  장 마감 후에는 재시작/다른 워커에서도 KIS 호출 없이 재사용
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from src.config.settings import settings
+from src.repositories.realtime_price_repository import realtime_price_repository
+from src.services.market_stream_service import market_stream_service
+from src.utils.cache import TTLCache
+from src.utils.market_calendar import MARKET_CLOSE, is_market_open, last_closed_session, next_market_open
+
+logger = logging.getLogger(__name__)
+
+
+class QuoteService:
+    """종목별 현재가 캐시 + 동시 요청 합치기"""
+
+    def __init__(
+        self,
+        client=None,
+        repository=realtime_price_repository,
+        persist: Optional[bool] = None,
+        stream=None,
+    ):
+        """
+        Args:
+            client: get_stock_price/get_stock_prices를 제공하는 KIS 클라이언트
+                (None이면 호출 시점의 전역 kis_service - init_kis_service로 교체될 수 있음)
+            repository: realtime_prices 저장소
+            persist: DB 저장 여부 (None이면 settings.QUOTE_CACHE_PERSIST)
+            stream: latest_quote를 제공하는 실시간 시세 수신기 (None이면 market_stream_service)
+        """
+        self._client = client
+        self._stream = stream if stream is not None else market_stream_service
+        self._repository = repository
+        self.persist = settings.QUOTE_CACHE_PERSIST if persist is None else persist
+        self._cache = TTLCache(
+            "kis_quotes",
+            maxsize=settings.QUOTE_CACHE_MAXSIZE,
+            ttl=settings.QUOTE_CACHE_TTL_SECONDS,
+        )
+        self._tasks: set[asyncio.Task] = set()
+
+    @staticmethod
+    def ttl(now: Optional[datetime] = None) -> float:
+        """장중에는 짧게, 장 마감 후에는 다음 장 시작 전까지 길게"""
+        now = now or datetime.now()
+        if is_market_open(now):
+            return settings.QUOTE_CACHE_TTL_SECONDS
+        until_open = (next_market_open(now) - now).total_seconds()
+        return max(settings.QUOTE_CACHE_TTL_SECONDS, min(settings.QUOTE_CACHE_CLOSED_TTL_SECONDS, until_open))
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def peek(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """실시간/캐시된 현재가만 조회 (KIS 호출 없음)"""
+        streamed = self._streamed(stock_code)
+        if streamed:
+            return streamed
+        cached = self._cache.get(stock_code)
+        return dict(cached) if cached else None
+
+    async def get_quote(self, stock_code: str, full: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        현재가 조회 (실시간 시세 → 캐시 → 진행 중인 호출 → KIS)
+
+        Args:
+            full: PER/PBR/시가총액이 필요한 경우 True (실시간/일괄 조회로 채워진
+                부분 시세는 무시하고 단건 조회)
+
+        KIS 오류는 그대로 전달되며, 같은 호출을 기다리던 요청도 같은 오류를 받습니다.
+        """
+        if full:
+            cached = self._cache.get(stock_code)
+            if cached and cached.get("partial"):
+                self._cache.invalidate(stock_code)
+        else:
+            streamed = self._streamed(stock_code)
+            if streamed:
+                return streamed
+
+        quote = await self._cache.get_or_load(stock_code, lambda: self._load(stock_code, full), ttl=self.ttl())
+        if full and quote and quote.get("partial"):
+            # 진행 중이던 일괄 조회(부분 시세)에 합류한 경우 단건으로 다시 조회
+            self._cache.invalidate(stock_code)
+            quote = await self._cache.get_or_load(stock_code, lambda: self._load(stock_code, full), ttl=self.ttl())
+        return dict(quote) if quote else None
+
+    async def get_quotes(self, stock_codes: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 현재가 (실시간 시세/캐시에 없는 종목만 KIS 일괄 조회 1회)
+
+        조회에 실패한 종목은 결과에서 제외됩니다.
+        """
+        quotes: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for code in dict.fromkeys(code for code in stock_codes if code):
+            cached = self.peek(code)
+            if cached:
+                quotes[code] = cached
+            else:
+                missing.append(code)
+        if not missing:
+            return quotes
+
+        now = datetime.now()
+        loaded = await self._cache.get_or_load_many(
+            missing, lambda codes: self._load_many(codes, now), ttl=self.ttl(now)
+        )
+        for code in missing:
+            if code in loaded:
+                quotes[code] = dict(loaded[code])
+        return quotes
+
+    async def get_cached_quotes(
+        self,
+        stock_codes: Iterable[str],
+        wait_seconds: float = 0.0,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        캐시된 현재가를 즉시 반환하고, 없는 종목은 백그라운드로 조회
+
+        wait_seconds 동안만 조회 완료를 기다리며, 늦게 끝난 조회는 캐시에만 채워져
+        다음 요청에서 사용됩니다 (검색 자동완성이 호출 한도 대기열에 묶이지 않도록).
+        """
+        quotes: Dict[str, Dict[str, Any]] = {}
+        missing = []
+        for code in dict.fromkeys(stock_codes):
+            cached = self.peek(code)
+            if cached:
+                quotes[code] = cached
+            else:
+                missing.append(code)
+        if not missing:
+            return quotes
+
+        task = asyncio.create_task(self.get_quotes(missing))
+        self._track(task, ",".join(missing), "백그라운드 현재가 조회 실패")
+        if wait_seconds > 0:
+            await asyncio.wait([task], timeout=wait_seconds)
+        if task.done() and not task.cancelled() and task.exception() is None:
+            quotes.update(task.result())
+        return quotes
+
+    def invalidate(self, stock_code: str) -> bool:
+        return self._cache.invalidate(stock_code)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _streamed(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        return self._stream.latest_quote(stock_code)
+
+    def _kis(self):
+        if self._client is not None:
+            return self._client
+        from src.services.kis_service import kis_service
+
+        return kis_service
+
+    async def _load(self, stock_code: str, full: bool = False) -> Optional[Dict[str, Any]]:
+        now = datetime.now()
+        stored = (await self._load_stored([stock_code], now)).get(stock_code)
+        if stored and not (full and stored.get("partial")):
+            return stored
+
+        quote = await self._kis().get_stock_price(stock_code)
+        if quote and self.persist:
+            self._persist([quote], now)
+        return quote
+
+    async def _load_many(self, stock_codes, now: datetime) -> Dict[str, Dict[str, Any]]:
+        loaded = await self._load_stored(stock_codes, now)
+        remaining = [code for code in stock_codes if code not in loaded]
+        if remaining:
+            try:
+                fetched = await self._kis().get_stock_prices(remaining)
+            except Exception as exc:
+                logger.warning("⚠️ [Quote] 현재가 일괄 조회 실패: %s", exc)
+                fetched = {}
+            if fetched and self.persist:
+                self._persist(list(fetched.values()), now)
+            loaded.update(fetched)
+        return loaded
+
+    async def _load_stored(self, stock_codes, now: datetime) -> Dict[str, Dict[str, Any]]:
+        """장 마감 후에는 마지막 마감 이후 저장된 현재가를 재사용 (다음 장 시작 전까지 불변)"""
+        if not self.persist or is_market_open(now):
+            return {}
+        closed_at = datetime.combine(last_closed_session(now), MARKET_CLOSE)
+        try:
+            return await asyncio.to_thread(self._repository.latest_many, list(stock_codes), closed_at)
+        except Exception as exc:
+            logger.warning("⚠️ [Quote] 저장된 현재가 조회 실패: %s", exc)
+            return {}
+
+    def _persist(self, quotes, timestamp: datetime) -> None:
+        task = asyncio.create_task(asyncio.to_thread(self._repository.save_many, quotes, timestamp))
+        self._track(task, ",".join(quote.get("stock_code", "") for quote in quotes), "현재가 저장 실패")
+
+    def _track(self, task: asyncio.Task, stock_code: Optional[str], message: str) -> None:
+        self._tasks.add(task)
+
+        def _done(finished: asyncio.Task) -> None:
+            self._tasks.discard(finished)
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.debug("⚠️ [Quote] %s: %s - %s", message, stock_code, finished.exception())
+
+        task.add_done_callback(_done)
+
+
+quote_service = QuoteService()
@@ -3,7 +3,8 @@
 import asyncio
 import logging
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, Iterable, List, Optional
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import pandas as pd
 import FinanceDataReader as fdr
@@ -16,12 +17,54 @@ from src.repositories import (
     stock_repository,
     stock_indicator_repository,
 )
-from src.services.kis_service import kis_service
-from src.utils.indicators import calculate_all_indicators
+from src.services.kis_service import Priority, call_priority, kis_service
+from src.services.quote_service import quote_service
+from src.services.stock_name_resolver import stock_name_resolver
+from src.services.stock_search_index import stock_search_index
+from src.utils.cache import TTLCache
+from src.utils.indicator_stream import IndicatorStream
+from src.utils.indicators import (
+    calculate_indicator_panel,
+    indicator_panel_rows,
+)
 from src.utils.llm_factory import get_claude_llm
+from src.utils.market_calendar import (
+    last_closed_session,
+    missing_trading_ranges,
+    previous_trading_day,
+    trading_days_between,
+)
 
 logger = logging.getLogger(__name__)
 
+# 종목당 누락 구간 보충 시 허용하는 최대 외부 요청 수
+MAX_GAP_REQUESTS = 3
+
+# 누락 구간 하나를 채울 때 이어서 조회하는 최대 횟수 (KIS 일봉은 호출당 약 100건)
+MAX_PRICE_PAGES = 5
+
+# stock_indicators 스냅샷 필드
+INDICATOR_FIELDS = (
+    "ma5",
+    "ma20",
+    "ma60",
+    "ma120",
+    "rsi14",
+    "macd",
+    "macd_signal",
+    "macd_histogram",
+    "bollinger_upper",
+    "bollinger_middle",
+    "bollinger_lower",
+    "current_volume",
+    "average_volume",
+    "volume_ratio",
+    "is_high_volume",
+)
+
+# 지표 상태 재구성 시 DB에서 읽는 기간 (달력일, 최장 이동평균 120거래일 이상 확보)
+INDICATOR_REBUILD_DAYS = 200
+
 
 class StockMatchResult(BaseModel):
     """LLM이 반환하는 종목 매칭 결과"""
@@ -48,11 +91,29 @@ class StockDataService:
     - pykrx 기반 시세/종목 데이터 조회
     - FinanceDataReader를 fallback으로 활용하여 안정성 확보
     - 실시간 데이터는 Redis 캐시 우선 조회
-    - 캐싱 지원
+    - 주가 히스토리는 (종목, 기간, 기준 거래일) 단위 인메모리 캐시
     """
 
     def __init__(self):
-        pass
+        self._price_cache = TTLCache(
+            "stock_prices",
+            maxsize=settings.PRICE_CACHE_MAXSIZE,
+            ttl=settings.PRICE_CACHE_TTL_SECONDS,
+        )
+        # 종목별로 소스에서도 일봉이 없다고 확인된 거래일 (상장 전, 거래정지 등)
+        self._gap_memo = TTLCache(
+            "price_gap_memo",
+            maxsize=settings.PRICE_CACHE_MAXSIZE,
+            ttl=settings.PRICE_GAP_MEMO_TTL_SECONDS,
+        )
+
+    def price_cache_stats(self) -> Dict[str, Any]:
+        """주가 캐시 hit/miss 통계"""
+        return self._price_cache.stats()
+
+    def invalidate_price_cache(self, stock_code: str) -> int:
+        """지정 종목의 캐시된 주가 윈도우를 모두 무효화"""
+        return self._price_cache.invalidate_where(lambda key: key[0] == stock_code)
 
     async def _listing_from_db(self, market: Optional[str]) -> Optional[pd.DataFrame]:
         def _fetch():
@@ -171,6 +232,8 @@ class StockDataService:
         if records:
             logger.info(f"💾 [DB] 종목 {len(records)}개 저장 시작...")
             await asyncio.to_thread(stock_repository.upsert_many, records)
+            stock_name_resolver.invalidate()
+            stock_search_index.invalidate()
             logger.info(f"✅ [DB] 종목 {len(records)}개 저장 완료")
         else:
             logger.warning("⚠️ [DB] 저장할 유효한 레코드 없음")
@@ -178,40 +241,13 @@ class StockDataService:
     async def _prices_from_db(self, stock_code: str, days: int) -> Optional[pd.DataFrame]:
         start = (datetime.now() - timedelta(days=days + 5)).date()
 
-        rows = await asyncio.to_thread(
-            stock_price_repository.get_prices_since,
+        df = await asyncio.to_thread(
+            stock_price_repository.get_ohlcv_frame,
             stock_code,
             start,
         )
-        if not rows:
-            return None
-
-        records: List[Dict[str, Any]] = []
-        for row in rows:
-            if row.date is None:
-                continue
-            records.append(
-                {
-                    "Date": row.date,
-                    "Open": float(row.open_price) if row.open_price is not None else None,
-                    "High": float(row.high_price) if row.high_price is not None else None,
-                    "Low": float(row.low_price) if row.low_price is not None else None,
-                    "Close": float(row.close_price) if row.close_price is not None else None,
-                    "Volume": int(row.volume) if row.volume is not None else 0,
-                    "Change": float(row.change_amount) if row.change_amount is not None else None,
-                }
-            )
-
-        if not records:
-            return None
-
-        df = pd.DataFrame(records)
-        df = df.dropna(subset=["Close"])
         if df.empty:
             return None
-
-        df = df.sort_values("Date")
-        df = df.set_index("Date")
         return df
 
     async def _save_prices_to_db(self, stock_code: str, df: pd.DataFrame) -> None:
@@ -237,63 +273,119 @@ class StockDataService:
 
         if records:
             await asyncio.to_thread(stock_price_repository.upsert_many, stock_code, records)
+            self.invalidate_price_cache(stock_code)
+
+    async def _save_latest_indicators(
+        self,
+        stock_code: str,
+        df: pd.DataFrame,
+        updated_from: Optional[date] = None,
+    ) -> None:
+        """
+        신규 일봉만 증분 반영해 지표 스냅샷 저장
 
-    async def _save_latest_indicators(self, stock_code: str, df: pd.DataFrame) -> None:
+        저장된 IndicatorStream 상태가 있으면 그 이후 봉만 반영하고, 없거나
+        상태 기준일 이전 구간이 새로 적재된 경우(updated_from)에는 DB 장기 구간으로 재구성합니다.
+        장 마감 전 당일 봉은 확정 전이므로 스냅샷만 저장하고 상태는 남기지 않습니다.
+        """
+        df = df[df["Close"].notna()] if "Close" in df.columns else df.iloc[0:0]
         if df.empty:
             return
 
-        indicators = calculate_all_indicators(df)
-        if not indicators:
-            return
+        cutoff = pd.Timestamp(last_closed_session())
+        closed = df[df.index <= cutoff]
+        live = df[df.index > cutoff]
 
-        latest_idx = df.index[-1]
-        if isinstance(latest_idx, datetime):
-            ref_date = latest_idx.date()
-        else:
-            ref_date = latest_idx
-
-        ma = indicators.get("moving_averages", {})
-        bb = indicators.get("bollinger_bands", {})
-        macd = indicators.get("macd", {})
-        volume = indicators.get("volume", {})
-        rsi = indicators.get("rsi", {})
-
-        payload = {
-            "ma5": ma.get("MA5"),
-            "ma20": ma.get("MA20"),
-            "ma60": ma.get("MA60"),
-            "ma120": ma.get("MA120"),
-            "rsi14": rsi.get("value"),
-            "macd": macd.get("macd"),
-            "macd_signal": macd.get("signal"),
-            "macd_histogram": macd.get("histogram"),
-            "bollinger_upper": bb.get("upper"),
-            "bollinger_middle": bb.get("middle"),
-            "bollinger_lower": bb.get("lower"),
-            "current_volume": volume.get("current_volume"),
-            "average_volume": volume.get("avg_volume"),
-            "volume_ratio": volume.get("volume_ratio"),
-            "is_high_volume": "Y" if volume.get("is_high_volume") else "N",
-        }
+        stream, pending = await self._restore_indicator_stream(stock_code, closed, updated_from)
 
-        await asyncio.to_thread(
-            stock_indicator_repository.upsert,
-            stock_code,
-            ref_date,
-            payload,
-        )
+        rows: List[Dict[str, Any]] = []
+        if not pending.empty:
+            snapshot = stream.extend(pending)
+            rows.append(
+                {"date": pending.index[-1].date(), **snapshot, "stream_state": stream.to_dict()}
+            )
+        if not live.empty:
+            live_stream = IndicatorStream.from_dict(stream.to_dict())
+            snapshot = live_stream.extend(live)
+            rows.append({"date": live.index[-1].date(), **snapshot})
+
+        if rows:
+            await asyncio.to_thread(stock_indicator_repository.bulk_upsert, stock_code, rows)
+
+    async def _restore_indicator_stream(
+        self,
+        stock_code: str,
+        closed: pd.DataFrame,
+        updated_from: Optional[date],
+    ) -> Tuple[IndicatorStream, pd.DataFrame]:
+        """
+        저장된 상태를 복원하고, 상태에 아직 반영되지 않은 봉을 함께 반환
+
+        상태 기준일이 이번에 받은 구간 밖이면 기준일 이후 봉을 DB에서 보충해 이어가고,
+        상태를 쓸 수 없으면 방금 받은 몇 개 봉이 아니라 DB의 장기 구간으로 재구성합니다.
+        (짧은 구간으로 만든 상태가 저장되면 이후 증분 계산이 계속 틀어짐)
+        """
+        latest = await asyncio.to_thread(stock_indicator_repository.latest_with_state, stock_code)
+        if latest is not None and (updated_from is None or latest.date < updated_from):
+            state_date = pd.Timestamp(latest.date)
+            history = closed
+            if state_date not in history.index:
+                history = await self._closed_history(stock_code, closed, latest.date)
+            if state_date in history.index:
+                try:
+                    stream = IndicatorStream.from_dict(latest.stream_state)
+                except (KeyError, TypeError, ValueError) as exc:
+                    logger.warning(f"⚠️ [Indicator] 상태 복원 실패, 재계산: {stock_code} ({exc})")
+                else:
+                    return stream, history[history.index > state_date]
+
+        start = last_closed_session() - timedelta(days=INDICATOR_REBUILD_DAYS)
+        return IndicatorStream(), await self._closed_history(stock_code, closed, start)
+
+    async def _closed_history(
+        self, stock_code: str, closed: pd.DataFrame, start: date
+    ) -> pd.DataFrame:
+        """start 이후 DB 일봉에 이번에 받은 마감 봉을 합친 프레임"""
+        if not closed.empty and closed.index.min().date() <= start:
+            return closed
+        db_df = await asyncio.to_thread(stock_price_repository.get_ohlcv_frame, stock_code, start)
+        if db_df.empty:
+            return closed
+        db_df.index = pd.to_datetime(db_df.index)
+        db_df = db_df[db_df.index <= pd.Timestamp(last_closed_session())]
+        history = pd.concat([db_df, closed])
+        return history[~history.index.duplicated(keep="last")].sort_index()
+
+    async def get_latest_indicators(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 최신 기술적 지표 스냅샷 조회 (읽기 전용)
+
+        지표는 신규 주가가 적재될 때만 계산/저장되므로, 조회 시에는 재계산하지 않습니다.
+
+        Returns:
+            dict: {"date": 기준일, "ma5": ..., "rsi14": ..., ...} 또는 None
+        """
+        row = await asyncio.to_thread(stock_indicator_repository.latest, stock_code)
+        if row is None:
+            return None
+
+        snapshot: Dict[str, Any] = {"stock_code": stock_code, "date": row.date}
+        for key in INDICATOR_FIELDS:
+            value = getattr(row, key, None)
+            if isinstance(value, Decimal):
+                value = float(value)
+            snapshot[key] = value
+        return snapshot
 
     async def get_realtime_price(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """
-        실시간 주가 조회 (KIS API 직접 호출)
+        실시간 주가 조회 (KIS 현재가 공유 캐시 경유)
 
         Args:
             stock_code: 종목 코드 (예: "005930")
         """
-        from src.services.kis_service import kis_service
-
         try:
-            price_data = await kis_service.get_stock_price(stock_code)
+            price_data = await quote_service.get_quote(stock_code)
         except Exception as exc:  # pragma: no cover - 네트워크 예외 로깅
             logger.error("❌ [Realtime] 실시간 시세 조회 실패: %s - %s", stock_code, exc)
             return None
@@ -325,28 +417,134 @@ class StockDataService:
         Returns:
             DataFrame: 주가 데이터 (Open, High, Low, Close, Volume)
         """
+        # 로더가 마감된 세션까지만 조회하므로, 장 마감 시점에 키가 바뀌어야 당일 봉이 반영됨
+        cache_key = (stock_code, days, last_closed_session())
+        df = await self._price_cache.get_or_load(
+            cache_key,
+            lambda: self._load_stock_price(stock_code, days),
+        )
+        # 호출부에서 컬럼을 추가하는 경우가 있어 캐시 원본은 공유하지 않음
+        return df.copy() if df is not None else None
+
+    async def _load_stock_price(
+        self, stock_code: str, days: int
+    ) -> Optional[pd.DataFrame]:
+        """
+        캐시 miss 시 주가 조회
+
+        DB 데이터를 KRX 거래일 기준으로 검사해 누락된 구간만 외부 API로 보충합니다.
+        장중인 당일 일봉은 확정 전이므로 조회/저장하지 않고, 소스에도 없는 거래일은
+        `_gap_memo`에 기록해 매 호출마다 다시 조회하지 않습니다.
+        """
+        start = (datetime.now() - timedelta(days=days)).date()
+        end = last_closed_session()
+        known_empty = self._gap_memo.get(stock_code, frozenset())
+
         # DB 조회
         db_df = await self._prices_from_db(stock_code, days)
-        if db_df is not None and not db_df.empty:
-            await self._save_latest_indicators(stock_code, db_df)
+        have = set(db_df.index.date) if db_df is not None else set()
+        gaps = missing_trading_ranges(have | known_empty, start, end)
+        if not gaps:
+            # 새 데이터가 없으면 지표도 그대로이므로 읽기 경로에서는 쓰기 없음
             return db_df
+        if db_df is not None:
+            if len(gaps) > MAX_GAP_REQUESTS:
+                # 산발적 누락이 많으면 개별 요청 대신 한 구간으로 합쳐 조회
+                gaps = [(gaps[0][0], gaps[-1][1])]
+            logger.info(f"📊 [StockData] 누락 구간 보충: {stock_code} {gaps}")
+
+        fetched: List[pd.DataFrame] = []
+        for gap_start, gap_end in gaps:
+            df = await self._fetch_gap(stock_code, gap_start, gap_end)
+            if df is None:
+                continue
+            await self._save_prices_to_db(stock_code, df)
+            fetched.append(df)
+
+        if not fetched:
+            if db_df is None:
+                logger.warning(f"⚠️ 주가 데이터 없음: {stock_code}")
+            return db_df
+
+        frames = ([db_df] if db_df is not None else []) + fetched
+        df = pd.concat(frames)
+        df.index = pd.to_datetime(df.index)
+        df = df[~df.index.duplicated(keep="last")].sort_index()
+        # 신규 주가가 적재된 경우에만 지표 증분 계산/저장
+        updated_from = pd.Timestamp(min(frame.index.min() for frame in fetched)).date()
+        await self._save_latest_indicators(stock_code, df, updated_from)
+        return df
+
+    async def _fetch_gap(
+        self, stock_code: str, start: date, end: date
+    ) -> Optional[pd.DataFrame]:
+        """
+        누락 구간 하나를 조회
 
-        # pykrx 호출 - 날짜 형식 변환 ("YYYYMMDD")
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        소스가 구간의 최근 일부만 돌려주면(KIS 일봉은 호출당 약 100건) 가장 이른 봉 이전을
+        이어서 조회합니다. `_gap_memo`에는 소스가 실제로 응답한 범위 안의 빈 거래일만 기록합니다.
 
-        start_str = start_date.strftime("%Y%m%d")
-        end_str = end_date.strftime("%Y%m%d")
+        Returns:
+            조회된 일봉 (조회 실패나 구간 전체가 비어 있으면 None)
+        """
+        frames: List[pd.DataFrame] = []
+        page_end = end
+        for _ in range(MAX_PRICE_PAGES):
+            df = await self._fetch_price_range(stock_code, start, page_end)
+            if df is None:
+                # 조회 실패는 기록하지 않음 (다음 호출에서 재시도)
+                break
+            df = df[pd.to_datetime(df.index).date <= page_end]
+            if df.empty:
+                # 요청 구간 전체에 일봉이 없음 (상장 전, 거래정지 등)
+                self._remember_empty_days(stock_code, start, page_end, df)
+                break
+            returned = pd.to_datetime(df.index).date
+            earliest = max(returned.min(), start)
+            self._remember_empty_days(stock_code, earliest, min(returned.max(), page_end), df)
+            frames.append(df)
+            if earliest <= start:
+                break
+            page_end = previous_trading_day(earliest)
+            if page_end < start:
+                break
+
+        if not frames:
+            return None
+        df = pd.concat(frames)
+        return df[~pd.to_datetime(df.index).duplicated(keep="last")].sort_index()
+
+    def _remember_empty_days(
+        self, stock_code: str, start: date, end: date, df: pd.DataFrame
+    ) -> None:
+        """조회 구간 중 소스가 일봉을 주지 않은 거래일을 기록"""
+        # 방금 마감한 거래일은 소스 반영이 늦을 수 있어 기록하지 않음
+        last = min(end, previous_trading_day(last_closed_session()))
+        returned = set(pd.to_datetime(df.index).date)
+        missing = {day for day in trading_days_between(start, last) if day not in returned}
+        if missing:
+            known = self._gap_memo.get(stock_code, frozenset())
+            self._gap_memo.set(stock_code, known | missing)
+
+    async def _fetch_price_range(
+        self, stock_code: str, start: date, end: date
+    ) -> Optional[pd.DataFrame]:
+        """
+        지정 구간의 일봉을 KIS API → FinanceDataReader 순으로 조회
+
+        Returns:
+            조회 결과 (소스가 응답했지만 해당 구간 일봉이 없으면 빈 DataFrame, 조회 실패 시 None)
+        """
+        start_str = start.strftime("%Y%m%d")
+        end_str = end.strftime("%Y%m%d")
 
         # 1순위: KIS API
         try:
-            logger.info(f"📊 [KIS API] 주가 조회 시도: {stock_code}")
+            logger.info(f"📊 [KIS API] 주가 조회 시도: {stock_code} ({start_str}~{end_str})")
             df = await kis_service.get_stock_daily_price(stock_code, start_str, end_str)
 
             if df is not None and len(df) > 0:
                 # KIS API는 이미 표준 컬럼명 사용 (Open, High, Low, Close, Volume)
-                await self._save_prices_to_db(stock_code, df)
-                await self._save_latest_indicators(stock_code, df)
                 logger.info(f"✅ 주가 데이터 조회 성공 (KIS API): {stock_code}")
                 return df
 
@@ -363,18 +561,15 @@ class StockDataService:
                 end_str
             )
 
-            if df is not None and len(df) > 0:
+            if df is None:
+                return None
+            if len(df) > 0:
                 # FinanceDataReader 컬럼명 표준화 (필요 시)
                 if "Change" in df.columns:
                     df = df[["Open", "High", "Low", "Close", "Volume"]]
 
-                await self._save_prices_to_db(stock_code, df)
-                await self._save_latest_indicators(stock_code, df)
                 logger.info(f"✅ 주가 데이터 조회 성공 (FinanceDataReader): {stock_code}")
-                return df
-            else:
-                logger.warning(f"⚠️ 주가 데이터 없음: {stock_code}")
-                return None
+            return df
 
         except Exception as e:
             logger.error(f"❌ 주가 데이터 조회 실패 (모든 소스): {stock_code}, {e}")
@@ -522,6 +717,12 @@ class StockDataService:
         Returns:
             str: 종목 코드 (예: "005930")
         """
+        # 0차 시도: 로컬 해석기 (DB 종목 + 별칭/초성, 리스팅 조회 없음)
+        stock_code = await stock_name_resolver.aresolve(name, market)
+        if stock_code:
+            logger.info(f"✅ [StockData] 종목 코드 찾기 성공 (로컬 해석): {name} -> {stock_code}")
+            return stock_code
+
         df = await self.get_stock_listing(market)
 
         if df is None:
@@ -600,7 +801,7 @@ class StockDataService:
         self, stock_codes: List[str], days: int = 30
     ) -> dict[str, pd.DataFrame]:
         """
-        여러 종목 데이터 조회
+        여러 종목 데이터 조회 (동시 실행 수 제한)
 
         Args:
             stock_codes: 종목 코드 리스트
@@ -609,15 +810,80 @@ class StockDataService:
         Returns:
             dict: {종목코드: DataFrame}
         """
-        results = {}
+        semaphore = asyncio.Semaphore(settings.PRICE_FETCH_CONCURRENCY)
+
+        async def _fetch(code: str) -> Optional[pd.DataFrame]:
+            async with semaphore:
+                return await self.get_stock_price(code, days)
+
+        codes = list(dict.fromkeys(stock_codes))
+        frames = await asyncio.gather(*(_fetch(code) for code in codes), return_exceptions=True)
 
-        for stock_code in stock_codes:
-            df = await self.get_stock_price(stock_code, days)
+        results = {}
+        for stock_code, df in zip(codes, frames):
+            if isinstance(df, BaseException):
+                logger.warning(f"⚠️ 주가 데이터 조회 실패: {stock_code} - {df}")
+                continue
             if df is not None:
                 results[stock_code] = df
 
         return results
 
+    async def get_price_panel(
+        self, stock_codes: List[str], days: int = 60
+    ) -> pd.DataFrame:
+        """
+        여러 종목의 종가를 (날짜 × 종목) 행렬로 조회
+
+        DB에서 한 번의 쿼리로 전체 종목을 조회하고, DB에 없거나 거래일 누락이 있는
+        종목만 외부 API(KIS → FinanceDataReader)로 동시 실행 수를 제한해 보충합니다.
+
+        Args:
+            stock_codes: 종목 코드 리스트
+            days: 조회 기간 (일)
+
+        Returns:
+            DataFrame: DatetimeIndex × 종목코드 종가 패널 (외부 조회도 실패한 종목은 제외).
+            종목 간 거래일이 다르면 NaN이 포함될 수 있으므로 필요 시 호출부에서 dropna.
+        """
+        codes = list(dict.fromkeys(code for code in stock_codes if code))
+        if not codes:
+            return pd.DataFrame()
+
+        start = (datetime.now() - timedelta(days=days + 5)).date()
+        panel = await asyncio.to_thread(stock_price_repository.get_close_panel, codes, start)
+
+        window_start = (datetime.now() - timedelta(days=days)).date()
+        window_end = last_closed_session()
+        missing = [code for code in codes if code not in panel.columns]
+        stale = [
+            code
+            for code in codes
+            if code in panel.columns
+            and missing_trading_ranges(panel[code].dropna().index.date, window_start, window_end)
+        ]
+        if missing or stale:
+            logger.info(
+                f"📊 [PricePanel] 외부 보충: 미보유 {len(missing)}개, 누락 구간 {len(stale)}개 / 전체 {len(codes)}개"
+            )
+            fetched = await self.get_multiple_stocks(missing + stale, days=days)
+            series = [
+                df["Close"].rename(code)
+                for code, df in fetched.items()
+                if df is not None and not df.empty and "Close" in df.columns
+            ]
+            if series:
+                extra = pd.concat(series, axis=1)
+                extra.index = pd.to_datetime(extra.index)
+                panel = panel.drop(columns=[code for code in extra.columns if code in panel.columns])
+                panel = extra if panel.empty else panel.join(extra, how="outer")
+
+        if panel.empty:
+            return panel
+
+        available = [code for code in codes if code in panel.columns]
+        return panel[available].sort_index().astype(float)
+
     async def get_market_index(
         self, index_name: str = "KOSPI", days: int = 60, max_retries: int = 3
     ) -> Optional[pd.DataFrame]:
@@ -726,7 +992,7 @@ class StockDataService:
         """
         try:
             # KIS API로 현재가 조회 (PER/PBR 포함)
-            price_data = await kis_service.get_stock_price(stock_code)
+            price_data = await quote_service.get_quote(stock_code, full=True)
 
             if price_data:
                 fundamental = {
@@ -768,7 +1034,7 @@ class StockDataService:
         """
         try:
             # KIS API로 현재가 조회 (시가총액, 거래량 포함)
-            price_data = await kis_service.get_stock_price(stock_code)
+            price_data = await quote_service.get_quote(stock_code, full=True)
 
             if price_data:
                 market_cap_data = {
@@ -824,7 +1090,9 @@ async def seed_market_data(
     failures: List[str] = []
 
     for idx, code in enumerate(codes, start=1):
-        price_df = await stock_data_service.get_stock_price(code, days=days)
+        # 일괄 적재는 사용자 요청보다 낮은 우선순위로 KIS 호출
+        with call_priority(Priority.BACKGROUND):
+            price_df = await stock_data_service.get_stock_price(code, days=days)
         if price_df is None or price_df.empty:
             failures.append(code)
             continue
@@ -847,7 +1115,7 @@ async def update_recent_prices_for_market(
     days: int = 5,
     limit: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """지정한 시장의 종목들에 대해 최근 주가/지표를 갱신"""
+    """지정한 시장의 종목들에 대해 최근 주가/지표를 갱신 (누락 거래일만 외부 조회)"""
 
     listing = await stock_data_service.get_stock_listing(market)
     if listing is None or listing.empty:
@@ -861,15 +1129,25 @@ async def update_recent_prices_for_market(
         "market": market,
         "processed": 0,
         "success": 0,
+        "skipped": 0,
         "failed": [],
     }
 
+    closed_session = last_closed_session()
+
     for idx, code in enumerate(codes, start=1):
-        df = await stock_data_service.get_stock_price(code, days=days)
-        if df is None or df.empty:
-            summary["failed"].append(code)
-        else:
+        latest = await asyncio.to_thread(stock_price_repository.latest_price_date, code)
+        if latest is not None and latest >= closed_session:
+            # 이미 최신 거래일까지 적재된 종목은 외부 호출 없이 건너뜀
             summary["success"] += 1
+            summary["skipped"] += 1
+        else:
+            with call_priority(Priority.BACKGROUND):
+                df = await stock_data_service.get_stock_price(code, days=days)
+            if df is None or df.empty:
+                summary["failed"].append(code)
+            else:
+                summary["success"] += 1
         summary["processed"] = idx
 
         if idx % 20 == 0 or idx == len(codes):
@@ -879,3 +1157,67 @@ async def update_recent_prices_for_market(
             )
 
     return summary
+
+
+async def refresh_market_indicators(
+    market: str = "ALL",
+    days: int = 200,
+    full_history: bool = False,
+    limit: Optional[int] = None,
+    chunk_size: int = 500,
+) -> Dict[str, Any]:
+    """
+    DB에 적재된 주가로 시장 전체 기술적 지표를 일괄 재계산합니다.
+
+    종목 묶음(chunk_size) 단위로 종가/거래량 패널을 한 번에 조회해
+    벡터화 엔진으로 계산하므로 외부 API 호출이 없습니다.
+
+    Args:
+        market: 대상 시장 (KOSPI, KOSDAQ, KONEX, ALL)
+        days: 지표 계산에 사용할 과거 일수 (MA120 계산을 위해 180일 이상 권장)
+        full_history: True면 전체 기간 지표를 백필, False면 최신 거래일만 저장
+        limit: 상위 N개 종목만 처리 (테스트용)
+        chunk_size: 한 번에 조회/계산할 종목 수
+    """
+    listing = await stock_data_service.get_stock_listing(market)
+    if listing is None or listing.empty:
+        raise RuntimeError(f"{market} 시장의 종목 목록을 조회할 수 없습니다.")
+
+    codes = listing["Code"].dropna().astype(str).tolist()
+    if limit is not None:
+        codes = codes[:limit]
+
+    start = (datetime.now() - timedelta(days=days)).date()
+    summary = {
+        "market": market,
+        "processed": 0,
+        "updated": 0,
+        "rows": 0,
+        "missing": [],
+    }
+
+    for offset in range(0, len(codes), chunk_size):
+        chunk = codes[offset:offset + chunk_size]
+        close_panel, volume_panel = await asyncio.gather(
+            asyncio.to_thread(stock_price_repository.get_close_panel, chunk, start),
+            asyncio.to_thread(stock_price_repository.get_volume_panel, chunk, start),
+        )
+        panel = calculate_indicator_panel(close_panel, volume_panel)
+
+        for code in chunk:
+            rows = indicator_panel_rows(panel, code, last_n=None if full_history else 1)
+            if not rows:
+                summary["missing"].append(code)
+                continue
+            summary["rows"] += await asyncio.to_thread(
+                stock_indicator_repository.bulk_upsert, code, rows
+            )
+            summary["updated"] += 1
+
+        summary["processed"] = min(offset + chunk_size, len(codes))
+        print(
+            f"📦 지표 갱신 진행 ({market}): {summary['processed']}/{len(codes)} "
+            f"(갱신 {summary['updated']}, 데이터 없음 {len(summary['missing'])})"
+        )
+
+    return summary
@@ -0,0 +1,330 @@
+"""
+로컬 종목명 해석기
+
+`stocks` 테이블로 메모리 인덱스를 만들어 LLM 없이 종목명을 종목 코드로 바꿉니다.
+
+- 정확/별칭 조회: 정규화한 이름, 영문명, 영문 약어 한글 발음("에스케이하이닉스"),
+  수동 별칭(STOCK_NAME_ALIASES), 초성("ㅅㅅㅈㅈ")
+- 문장 스캔: Aho-Corasick 오토마톤으로 쿼리 안의 모든 종목명을 한 번에 찾음
+  ("삼성전자와 sk 하이닉스 비교" → 삼성전자, SK하이닉스)
+
+LLM 기반 추출/매칭은 여기서 찾지 못한 경우에만 사용합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.config.settings import settings
+from src.constants.stock_aliases import AMBIGUOUS_STOCK_NAMES, STOCK_NAME_ALIASES
+from src.repositories.stock_repository import stock_repository
+from src.utils.hangul import choseong, is_choseong_only, latin_reading, normalize_name
+
+logger = logging.getLogger(__name__)
+
+MARKET_RANK = {"KOSPI": 0, "KOSDAQ": 1, "KONEX": 2}
+
+# 별칭 종류별 우선순위 (낮을수록 우선)
+_PRIORITY_NAME = 0
+_PRIORITY_ENGLISH = 1
+_PRIORITY_ALIAS = 2
+_PRIORITY_READING = 3
+
+# 짧은 이름(2자 이하)은 단어 경계에서만 매칭 - 뒤에 올 수 있는 조사
+_PARTICLES = frozenset("와과이가은는을를의도랑에만")
+_SKIPPED_CHAR_RE = re.compile(r"[\s\-_.·&()\[\]/,'\"]")
+
+
+@dataclass(frozen=True)
+class StockEntry:
+    code: str
+    name: str
+    market: str
+    market_cap: int = 0
+
+
+@dataclass(frozen=True)
+class StockMatch:
+    """쿼리에서 찾은 종목"""
+
+    code: str
+    name: str
+    market: str
+    matched: str
+    start: int
+    end: int
+
+
+class _AhoCorasick:
+    """다중 패턴 문자열 검색 오토마톤"""
+
+    def __init__(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[str]] = [[]]
+
+    def add(self, pattern: str) -> None:
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(pattern)
+
+    def build(self) -> None:
+        queue: Deque[int] = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        """(끝 위치(exclusive), 패턴)"""
+        node = 0
+        for idx, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for pattern in self._out[node]:
+                yield idx + 1, pattern
+
+
+class StockNameResolver:
+    """stocks 테이블 기반 종목명 → 종목 코드 해석기"""
+
+    def __init__(self, repository=stock_repository, refresh_seconds: Optional[float] = None):
+        self._repository = repository
+        self.refresh_seconds = (
+            settings.STOCK_RESOLVER_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+        )
+        self._keys: Dict[str, List[Tuple[int, StockEntry]]] = {}
+        self._choseong: Dict[str, List[StockEntry]] = {}
+        self._by_code: Dict[str, StockEntry] = {}
+        self._automaton: Optional[_AhoCorasick] = None
+        self._loaded_at: Optional[float] = None
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._load_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------------------------------------------------------
+    # 인덱스 구성
+    # ------------------------------------------------------------------
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None and bool(self._by_code)
+
+    def load(self, rows: Iterable[Any]) -> int:
+        """Stock 모델(또는 같은 속성을 가진 객체) 목록으로 인덱스를 다시 만듦"""
+        keys: Dict[str, List[Tuple[int, StockEntry]]] = {}
+        choseong_index: Dict[str, List[StockEntry]] = {}
+        by_code: Dict[str, StockEntry] = {}
+        by_name: Dict[str, List[StockEntry]] = {}
+
+        def _add(key: str, priority: int, entry: StockEntry) -> None:
+            if key:
+                keys.setdefault(key, []).append((priority, entry))
+
+        for row in rows:
+            if (getattr(row, "status", None) or "active") == "delisted":
+                continue
+            code = str(getattr(row, "stock_code", "") or "").strip()
+            name = str(getattr(row, "stock_name", "") or "").strip()
+            if not code or not name:
+                continue
+
+            entry = StockEntry(
+                code=code,
+                name=name,
+                market=str(getattr(row, "market", "") or ""),
+                market_cap=int(getattr(row, "market_cap", None) or 0),
+            )
+            by_code[code] = entry
+
+            normalized = normalize_name(name)
+            by_name.setdefault(normalized, []).append(entry)
+            _add(normalized, _PRIORITY_NAME, entry)
+            _add(normalize_name(getattr(row, "stock_name_en", None) or ""), _PRIORITY_ENGLISH, entry)
+            _add(latin_reading(normalized), _PRIORITY_READING, entry)
+            choseong_index.setdefault(choseong(normalized), []).append(entry)
+
+        for alias, official in STOCK_NAME_ALIASES.items():
+            for entry in by_name.get(normalize_name(official), []):
+                _add(normalize_name(alias), _PRIORITY_ALIAS, entry)
+
+        for candidates in keys.values():
+            candidates.sort(key=lambda item: (item[0], *self._rank(item[1])))
+        for candidates in choseong_index.values():
+            candidates.sort(key=self._rank)
+
+        automaton = _AhoCorasick()
+        for key in keys:
+            if len(key) >= 2 and key not in AMBIGUOUS_STOCK_NAMES:
+                automaton.add(key)
+        automaton.build()
+
+        self._keys = keys
+        self._choseong = choseong_index
+        self._by_code = by_code
+        self._automaton = automaton
+        self._loaded_at = time.monotonic()
+        logger.info("✅ [StockResolver] 종목 인덱스 구성: %d종목, %d개 키", len(by_code), len(keys))
+        return len(by_code)
+
+    async def ensure_loaded(self, force: bool = False) -> bool:
+        """인덱스가 없거나 오래됐으면 DB에서 다시 읽음 (실패 시 기존 인덱스 유지)"""
+        if not force and self.loaded and time.monotonic() - self._loaded_at < self.refresh_seconds:
+            return True
+
+        async with self._lock():
+            if not force and self.loaded and time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return True
+            try:
+                rows = await asyncio.to_thread(self._repository.list_by_market, None)
+            except Exception as exc:
+                logger.warning("⚠️ [StockResolver] 종목 목록 조회 실패: %s", exc)
+                return self.loaded
+            if rows:
+                self.load(rows)
+            return self.loaded
+
+    def invalidate(self) -> None:
+        """다음 조회 때 DB에서 다시 읽도록 표시 (종목 목록 갱신 후 호출)"""
+        self._loaded_at = None if not self._by_code else float("-inf")
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._load_lock is None or self._load_lock_loop is not loop:
+            self._load_lock = asyncio.Lock()
+            self._load_lock_loop = loop
+        return self._load_lock
+
+    @staticmethod
+    def _rank(entry: StockEntry) -> Tuple[int, int]:
+        return MARKET_RANK.get(entry.market, len(MARKET_RANK)), -entry.market_cap
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get(self, code: str) -> Optional[StockEntry]:
+        return self._by_code.get(code)
+
+    def resolve_entry(self, name: str, market: Optional[str] = None) -> Optional[StockEntry]:
+        """종목명/별칭/초성 하나를 종목으로 해석"""
+        if not name:
+            return None
+        raw = name.strip()
+        if raw in self._by_code:
+            entry = self._by_code[raw]
+            return entry if not market or entry.market == market else None
+
+        if is_choseong_only(raw):
+            candidates = self._choseong.get(raw.replace(" ", ""), [])
+        else:
+            candidates = [entry for _, entry in self._keys.get(normalize_name(raw), [])]
+
+        for entry in candidates:
+            if not market or entry.market == market:
+                return entry
+        return None
+
+    def resolve(self, name: str, market: Optional[str] = None) -> Optional[str]:
+        entry = self.resolve_entry(name, market)
+        return entry.code if entry else None
+
+    async def aresolve(self, name: str, market: Optional[str] = None) -> Optional[str]:
+        await self.ensure_loaded()
+        return self.resolve(name, market)
+
+    def find_in_text(self, text: str) -> List[StockMatch]:
+        """
+        문장 안의 종목명을 모두 찾음 (왼쪽부터, 겹치면 긴 이름 우선)
+
+        공백/기호를 지운 소문자 문자열을 스캔하므로 "sk 하이닉스"도 찾습니다.
+        2자 이하 이름은 단어 시작에서만 인정해 일반 단어 속 오탐을 줄입니다.
+        """
+        if not text or self._automaton is None:
+            return []
+
+        normalized_chars: List[str] = []
+        positions: List[int] = []
+        for idx, char in enumerate(text):
+            if _SKIPPED_CHAR_RE.match(char):
+                continue
+            normalized_chars.append(char.lower())
+            positions.append(idx)
+        normalized = "".join(normalized_chars)
+
+        spans = []
+        for end, pattern in self._automaton.iter_matches(normalized):
+            start = end - len(pattern)
+            if len(pattern) <= 2 and not self._at_word_boundary(text, positions, start, end):
+                continue
+            spans.append((start, end, pattern))
+        spans.sort(key=lambda span: (span[0], -(span[1] - span[0])))
+
+        matches: List[StockMatch] = []
+        seen_codes = set()
+        cursor = 0
+        for start, end, pattern in spans:
+            if start < cursor:
+                continue
+            cursor = end
+            entry = self._keys[pattern][0][1]
+            if entry.code in seen_codes:
+                continue
+            seen_codes.add(entry.code)
+            orig_start, orig_end = positions[start], positions[end - 1] + 1
+            matches.append(
+                StockMatch(
+                    code=entry.code,
+                    name=entry.name,
+                    market=entry.market,
+                    matched=text[orig_start:orig_end],
+                    start=orig_start,
+                    end=orig_end,
+                )
+            )
+
+        # 초성만으로 쓴 단어 ("ㅅㅅㅈㅈ 주가")
+        for token in text.split():
+            if is_choseong_only(token) and len(token) >= 2:
+                entry = self.resolve_entry(token)
+                if entry and entry.code not in seen_codes:
+                    seen_codes.add(entry.code)
+                    start = text.index(token)
+                    matches.append(StockMatch(entry.code, entry.name, entry.market, token, start, start + len(token)))
+
+        return matches
+
+    async def afind_in_text(self, text: str) -> List[StockMatch]:
+        await self.ensure_loaded()
+        return self.find_in_text(text)
+
+    @staticmethod
+    def _at_word_boundary(text: str, positions: List[int], start: int, end: int) -> bool:
+        orig_start = positions[start]
+        orig_end = positions[end - 1] + 1
+        if orig_start > 0 and not text[orig_start - 1].isspace():
+            return False
+        if orig_end >= len(text):
+            return True
+        following = text[orig_end]
+        return following.isspace() or following in _PARTICLES or not following.isalnum()
+
+
+stock_name_resolver = StockNameResolver()
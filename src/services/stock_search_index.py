@@ -0,0 +1,288 @@
+"""
+종목 검색 인덱스 (/stocks/search 자동완성용)
+
+`stocks` 테이블을 메모리 인덱스로 만들어 요청마다 DataFrame을 만들거나
+전체를 스캔하지 않고 검색합니다.
+
+- 종목 코드: 정확/접두 일치
+- 접두 검색: 자모 분해 키 정렬 목록 + 이분 탐색 ("삼성젅" → 삼성전자)
+- 중간 일치: 2-gram 역색인 후보 교집합 → 포함 여부 확인
+- 초성 검색: "ㅅㅅㅈ" → 삼성전자, 삼성전기 ...
+- 정렬: 일치 종류(정확 > 접두 > 중간) → 인기도(시가총액 + 조회 수) 순
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import math
+import time
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.config.settings import settings
+from src.constants.stock_aliases import STOCK_NAME_ALIASES
+from src.repositories.stock_repository import stock_repository
+from src.utils.hangul import choseong, decompose, is_choseong_only, latin_reading, normalize_name
+
+logger = logging.getLogger(__name__)
+
+# 일치 종류 (낮을수록 상위)
+TIER_EXACT = 0
+TIER_PREFIX = 1
+TIER_INFIX = 2
+
+# 조회 수 가중치 (시가총액 log10 기준, 조회 수 2배마다 +0.5)
+VIEW_WEIGHT = 0.5
+
+
+@dataclass(frozen=True)
+class SearchEntry:
+    code: str
+    name: str
+    market: str
+    sector: Optional[str]
+    market_cap: int
+
+
+def _bigrams(text: str) -> Set[str]:
+    return {text[idx:idx + 2] for idx in range(len(text) - 1)}
+
+
+class StockSearchIndex:
+    """메모리 상주 종목 검색 인덱스"""
+
+    def __init__(self, repository=stock_repository, refresh_seconds: Optional[float] = None):
+        self._repository = repository
+        self.refresh_seconds = (
+            settings.STOCK_RESOLVER_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+        )
+        self._entries: List[SearchEntry] = []
+        self._keys: List[Tuple[str, ...]] = []
+        self._by_code: Dict[str, int] = {}
+        self._exact: Dict[str, Set[int]] = {}
+        self._prefix: List[Tuple[str, int]] = []
+        self._choseong: List[Tuple[str, int]] = []
+        self._ngrams: Dict[str, Set[int]] = {}
+        self._sorted_codes: List[str] = []
+        self._market_cap_scores: List[float] = []
+        self._views: Counter = Counter()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._loaded_at: Optional[float] = None
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._load_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ------------------------------------------------------------------
+    # 인덱스 구성
+    # ------------------------------------------------------------------
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None and bool(self._entries)
+
+    def load(self, rows: Iterable[Any]) -> int:
+        """Stock 모델(또는 같은 속성을 가진 객체) 목록으로 인덱스를 다시 만듦"""
+        entries: List[SearchEntry] = []
+        keys: List[Tuple[str, ...]] = []
+        by_code: Dict[str, int] = {}
+        exact: Dict[str, Set[int]] = {}
+        prefix: List[Tuple[str, int]] = []
+        choseong_keys: List[Tuple[str, int]] = []
+        ngrams: Dict[str, Set[int]] = {}
+
+        aliases: Dict[str, List[str]] = {}
+        for alias, official in STOCK_NAME_ALIASES.items():
+            aliases.setdefault(normalize_name(official), []).append(normalize_name(alias))
+
+        for row in rows:
+            if (getattr(row, "status", None) or "active") == "delisted":
+                continue
+            code = str(getattr(row, "stock_code", "") or "").strip()
+            name = str(getattr(row, "stock_name", "") or "").strip()
+            if not code or not name or code in by_code:
+                continue
+
+            idx = len(entries)
+            entries.append(
+                SearchEntry(
+                    code=code,
+                    name=name,
+                    market=str(getattr(row, "market", "") or ""),
+                    sector=getattr(row, "sector", None),
+                    market_cap=int(getattr(row, "market_cap", None) or 0),
+                )
+            )
+            by_code[code] = idx
+
+            normalized = normalize_name(name)
+            entry_keys = [normalized, normalize_name(getattr(row, "stock_name_en", None) or "")]
+            entry_keys.append(latin_reading(normalized))
+            entry_keys.extend(aliases.get(normalized, []))
+            entry_keys = list(dict.fromkeys(key for key in entry_keys if key))
+            keys.append(tuple(entry_keys))
+
+            for key in entry_keys:
+                exact.setdefault(key, set()).add(idx)
+                prefix.append((decompose(key), idx))
+                for gram in _bigrams(key):
+                    ngrams.setdefault(gram, set()).add(idx)
+            choseong_keys.append((choseong(normalized), idx))
+
+        prefix.sort()
+        choseong_keys.sort()
+
+        self._entries = entries
+        self._keys = keys
+        self._by_code = by_code
+        self._exact = exact
+        self._prefix = prefix
+        self._choseong = choseong_keys
+        self._ngrams = ngrams
+        self._sorted_codes = sorted(by_code)
+        self._market_cap_scores = [math.log10(1 + entry.market_cap) for entry in entries]
+        self._loaded_at = time.monotonic()
+        logger.info("✅ [StockSearch] 검색 인덱스 구성: %d종목, 접두 키 %d개", len(entries), len(prefix))
+        return len(entries)
+
+    async def ensure_loaded(self, force: bool = False) -> bool:
+        """
+        인덱스가 없으면 DB에서 읽어 구성
+
+        이미 있는 인덱스가 오래됐으면 기존 인덱스로 바로 응답하고 백그라운드에서
+        다시 구성합니다 (DB 실패 시 기존 인덱스 유지).
+        """
+        if not force and self._fresh():
+            return True
+        if not force and self.loaded:
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._reload(force=False))
+            return True
+        return await self._reload(force)
+
+    async def _reload(self, force: bool) -> bool:
+        async with self._lock():
+            if not force and self._fresh():
+                return True
+            try:
+                rows = await asyncio.to_thread(self._repository.list_by_market, None)
+            except Exception as exc:
+                logger.warning("⚠️ [StockSearch] 종목 목록 조회 실패: %s", exc)
+                return self.loaded
+            if rows:
+                self.load(rows)
+            return self.loaded
+
+    def invalidate(self) -> None:
+        """다음 검색 때 DB에서 다시 읽도록 표시 (종목 목록 갱신 후 호출)"""
+        self._loaded_at = float("-inf") if self._entries else None
+
+    def _fresh(self) -> bool:
+        return self.loaded and time.monotonic() - self._loaded_at < self.refresh_seconds
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._load_lock is None or self._load_lock_loop is not loop:
+            self._load_lock = asyncio.Lock()
+            self._load_lock_loop = loop
+        return self._load_lock
+
+    # ------------------------------------------------------------------
+    # 인기도
+    # ------------------------------------------------------------------
+    def record_view(self, stock_code: str) -> None:
+        """종목 상세 조회 수 기록 (검색 순위에 반영)"""
+        if stock_code in self._by_code:
+            self._views[stock_code] += 1
+
+    def popularity(self, stock_code: str) -> float:
+        idx = self._by_code.get(stock_code)
+        if idx is None:
+            return 0.0
+        return self._popularity(idx)
+
+    def _popularity(self, idx: int) -> float:
+        score = self._market_cap_scores[idx]
+        views = self._views.get(self._entries[idx].code)
+        return score + VIEW_WEIGHT * math.log2(1 + views) if views else score
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def get(self, stock_code: str) -> Optional[SearchEntry]:
+        idx = self._by_code.get(stock_code)
+        return self._entries[idx] if idx is not None else None
+
+    def search(
+        self,
+        query: str,
+        market: Optional[str] = None,
+        limit: int = 10,
+    ) -> Tuple[List[SearchEntry], int]:
+        """
+        종목 검색
+
+        Returns:
+            (상위 limit개 결과, 전체 일치 수)
+        """
+        term = normalize_name(query)
+        if not term or not self._entries:
+            return [], 0
+
+        tiers: Dict[int, int] = {}
+
+        def _mark(indices: Iterable[int], tier: int) -> None:
+            for idx in indices:
+                if tiers.get(idx, TIER_INFIX + 1) > tier:
+                    tiers[idx] = tier
+
+        if term.isdigit():
+            if term in self._by_code:
+                _mark([self._by_code[term]], TIER_EXACT)
+            start = bisect_left(self._sorted_codes, term)
+            for code in self._sorted_codes[start:]:
+                if not code.startswith(term):
+                    break
+                _mark([self._by_code[code]], TIER_PREFIX)
+            _mark((idx for code, idx in self._by_code.items() if term in code), TIER_INFIX)
+
+        if is_choseong_only(term):
+            _mark(self._prefix_scan(self._choseong, term), TIER_PREFIX)
+            _mark((idx for key, idx in self._choseong if term in key), TIER_INFIX)
+        else:
+            _mark(self._exact.get(term, ()), TIER_EXACT)
+            _mark(self._prefix_scan(self._prefix, decompose(term)), TIER_PREFIX)
+            _mark(self._infix_candidates(term), TIER_INFIX)
+
+        if market:
+            tiers = {idx: tier for idx, tier in tiers.items() if self._entries[idx].market == market}
+
+        top = heapq.nsmallest(
+            limit,
+            tiers.items(),
+            key=lambda item: (item[1], -self._popularity(item[0]), len(self._entries[item[0]].name), item[0]),
+        )
+        return [self._entries[idx] for idx, _ in top], len(tiers)
+
+    @staticmethod
+    def _prefix_scan(sorted_keys: List[Tuple[str, int]], term: str) -> List[int]:
+        start = bisect_left(sorted_keys, (term, -1))
+        found: List[int] = []
+        for key, idx in sorted_keys[start:]:
+            if not key.startswith(term):
+                break
+            found.append(idx)
+        return found
+
+    def _infix_candidates(self, term: str) -> List[int]:
+        if len(term) == 1:
+            candidates: Iterable[int] = range(len(self._entries))
+        else:
+            posting_lists = [self._ngrams.get(gram) for gram in _bigrams(term)]
+            if not all(posting_lists):
+                return []
+            candidates = set.intersection(*sorted(posting_lists, key=len))
+        return [idx for idx in candidates if any(term in key for key in self._keys[idx])]
+
+
+stock_search_index = StockSearchIndex()
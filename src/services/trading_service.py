@@ -16,6 +16,7 @@ from src.services.portfolio_service import (
     PortfolioNotFoundError,
     portfolio_service,
 )
+from src.services.quote_service import quote_service
 from src.services.stock_data_service import stock_data_service
 
 logger = logging.getLogger(__name__)
@@ -155,9 +156,9 @@ class TradingService:
         kis_order_no = None
         kis_executed = False
 
-        try:
-            from src.services import kis_service
+        from src.services import KISOrderStatusUnknownError, kis_service
 
+        try:
             logger.info(f"💰 [Trading] KIS API 주문 실행: {order_type} {stock_code} {quantity}주")
 
             kis_result = await kis_service.place_order(
@@ -172,6 +173,10 @@ class TradingService:
 
             logger.info(f"✅ [Trading] KIS 주문 성공: {kis_order_no}")
 
+        except KISOrderStatusUnknownError:
+            # 접수 여부를 알 수 없으면 재주문/시뮬레이션 체결 모두 하지 않음
+            logger.error(f"❌ [Trading] KIS 주문 상태 불명, 주문 내역 확인 필요: {order_id}")
+            raise
         except Exception as exc:
             # KIS API 실패 시 경고 로그만 남기고 DB 시뮬레이션 진행
             logger.warning(f"⚠️ [Trading] KIS API 실패, DB 시뮬레이션으로 진행: {exc}")
@@ -241,6 +246,14 @@ class TradingService:
         return result
 
     async def _fetch_market_price(self, stock_code: str) -> Optional[float]:
+        try:
+            quote = await quote_service.get_quote(stock_code)
+        except Exception as exc:
+            logger.warning(f"⚠️ [Trading] 현재가 조회 실패, 일봉 종가 사용: {stock_code} - {exc}")
+            quote = None
+        if quote and quote.get("current_price"):
+            return float(quote["current_price"])
+
         try:
             df = await stock_data_service.get_stock_price(stock_code, days=1)
         except Exception:  # pragma: no cover - defensive fallback
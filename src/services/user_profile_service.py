@@ -2,16 +2,29 @@
 사용자 프로파일 서비스
 
 user_profiles 테이블 스키마는 SQLAlchemy 모델과 동일하게 관리된다.
+
+- 사용자별 프로파일은 프로세스 로컬 캐시(`TTLCache`)에 보관하고,
+  `update_user_profile`/`invalidate_cache`에서 명시적으로 갱신/무효화한다.
+- 갱신/무효화할 때마다 사용자별 세대(generation)를 올리고, 조회 결과는 조회 시작 시점의
+  세대가 그대로일 때만 캐시에 쓴다 (진행 중이던 조회가 최신 프로파일을 덮어쓰지 않도록).
+- 비동기 경로(채팅, SSE 스트림)는 `aget_user_profile`/`aupdate_user_profile`을 사용해
+  DB 조회/커밋을 이벤트 루프 밖(`asyncio.to_thread`)에서 실행한다.
 """
 
+import asyncio
+import copy
 import logging
+import threading
 import uuid
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.config.settings import settings
+from src.models.database import SessionLocal
 from src.models.user_profile import UserProfile
+from src.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +32,20 @@ logger = logging.getLogger(__name__)
 class UserProfileService:
     """사용자 프로파일 조회/저장 로직"""
 
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        cache: Optional[TTLCache] = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._cache = cache or TTLCache(
+            "user_profiles",
+            maxsize=settings.USER_PROFILE_CACHE_MAXSIZE,
+            ttl=settings.USER_PROFILE_CACHE_TTL_SECONDS,
+        )
+        self._generations: Dict[uuid.UUID, int] = {}
+        self._generation_lock = threading.Lock()
+
     def _normalize_user_id(self, user_id: Union[str, uuid.UUID]) -> uuid.UUID:
         if isinstance(user_id, uuid.UUID):
             return user_id
@@ -40,33 +67,35 @@ class UserProfileService:
         raise TypeError("user_id must be a UUID or string")
 
     def get_user_profile(self, user_id: Union[str, uuid.UUID], db: Session) -> Dict[str, Any]:
-        """사용자 프로파일 조회 (DB 조회 후 없으면 기본값 생성)"""
+        """사용자 프로파일 조회 (캐시 → DB 조회 후 없으면 기본값 생성)"""
         user_uuid = self._normalize_user_id(user_id)
-        logger.info("🔍 [UserProfile] DB에서 조회: %s", user_uuid)
-        profile = db.execute(select(UserProfile).filter_by(user_id=user_uuid)).scalars().first()
+        cached = self._cache.get(user_uuid)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        generation = self._generation(user_uuid)
+        profile = self._load(user_uuid, db)
+        self._cache.set(user_uuid, profile, only_if=self._unchanged_since(user_uuid, generation))
+        return copy.deepcopy(profile)
+
+    async def aget_user_profile(
+        self, user_id: Union[str, uuid.UUID], db: Optional[Session] = None
+    ) -> Dict[str, Any]:
+        """
+        비동기 프로파일 조회
 
-        if not profile:
-            logger.info("🆕 [UserProfile] 기본 프로파일 생성: %s", user_uuid)
-            profile = UserProfile(
-                user_id=user_uuid,
-                expertise_level="intermediate",
-                investment_style="moderate",
-                risk_tolerance="medium",
-                avg_trades_per_day=1.0,
-                preferred_sectors=[],
-                trading_style="long_term",
-                portfolio_concentration=0.5,
-                technical_level="intermediate",
-                preferred_depth="detailed",
-                wants_explanations=True,
-                wants_analogies=False,
-            )
-            db.add(profile)
-            db.commit()
-            db.refresh(profile)
+        캐시 miss일 때만 스레드에서 DB를 조회하며, 같은 사용자에 대한 동시 miss는
+        한 번의 조회로 합쳐진다. db를 넘기지 않으면 전용 세션을 연다.
+        """
+        user_uuid = self._normalize_user_id(user_id)
+        generation = self._generation(user_uuid)
 
-        profile_dict = profile.to_dict()
-        return profile_dict
+        async def _loader() -> Dict[str, Any]:
+            return await asyncio.to_thread(self._run, self._load, user_uuid, db)
+
+        profile = await self._cache.get_or_load(
+            user_uuid, _loader, only_if=self._unchanged_since(user_uuid, generation)
+        )
+        return copy.deepcopy(profile)
 
     def update_user_profile(
         self, user_id: Union[str, uuid.UUID], updates: Dict[str, Any], db: Session
@@ -77,6 +106,7 @@ class UserProfileService:
         user_uuid = self._normalize_user_id(user_id)
         logger.info("📝 [UserProfile] 업데이트: %s", user_uuid)
 
+        generation = self._bump_generation(user_uuid)
         profile = db.execute(select(UserProfile).filter_by(user_id=user_uuid)).scalars().first()
         if not profile:
             raise ValueError(f"User profile not found: {user_uuid}")
@@ -89,13 +119,77 @@ class UserProfileService:
         db.refresh(profile)
 
         profile_dict = profile.to_dict()
+        # 그 사이 다른 업데이트/무효화가 있었다면 그쪽이 최신이므로 쓰지 않음
+        self._cache.set(user_uuid, profile_dict, only_if=self._unchanged_since(user_uuid, generation))
         logger.info("✅ [UserProfile] 업데이트 완료: %s", user_uuid)
 
-        return profile_dict
+        return copy.deepcopy(profile_dict)
+
+    async def aupdate_user_profile(
+        self,
+        user_id: Union[str, uuid.UUID],
+        updates: Dict[str, Any],
+        db: Optional[Session] = None,
+    ) -> Dict[str, Any]:
+        """비동기 프로파일 업데이트 (DB 커밋은 스레드에서 실행)"""
+        return await asyncio.to_thread(self._run, self.update_user_profile, user_id, updates, db)
 
     def invalidate_cache(self, user_id: Union[str, uuid.UUID]) -> None:
-        """캐싱 제거 이후에도 API 호환성을 위한 no-op 메서드."""
-        logger.info("ℹ️ [UserProfile] invalidate_cache 호출 (캐싱 기능 제거됨)")
+        """사용자 프로파일 캐시 무효화 (다음 조회 시 DB에서 다시 읽음)"""
+        user_uuid = self._normalize_user_id(user_id)
+        self._bump_generation(user_uuid)
+        logger.info("🧹 [UserProfile] 캐시 무효화: %s", user_uuid)
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _generation(self, user_uuid: uuid.UUID) -> int:
+        return self._generations.get(user_uuid, 0)
+
+    def _bump_generation(self, user_uuid: uuid.UUID) -> int:
+        """세대를 올리고 캐시를 비움 (새 세대 반환)"""
+        with self._generation_lock:
+            generation = self._generations.get(user_uuid, 0) + 1
+            self._generations[user_uuid] = generation
+        self._cache.invalidate(user_uuid)
+        return generation
+
+    def _unchanged_since(self, user_uuid: uuid.UUID, generation: int) -> Callable[[], bool]:
+        return lambda: self._generation(user_uuid) == generation
+
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """마지막 인자(db)가 None이면 전용 세션을 열어 fn 실행"""
+        *head, db = args
+        if db is not None:
+            return fn(*head, db)
+        with self._session_factory() as session:
+            return fn(*head, session)
+
+    def _load(self, user_uuid: uuid.UUID, db: Session) -> Dict[str, Any]:
+        logger.info("🔍 [UserProfile] DB에서 조회: %s", user_uuid)
+        profile = db.execute(select(UserProfile).filter_by(user_id=user_uuid)).scalars().first()
+
+        if not profile:
+            logger.info("🆕 [UserProfile] 기본 프로파일 생성: %s", user_uuid)
+            profile = UserProfile(
+                user_id=user_uuid,
+                expertise_level="intermediate",
+                investment_style="moderate",
+                risk_tolerance="medium",
+                avg_trades_per_day=1.0,
+                preferred_sectors=[],
+                trading_style="long_term",
+                portfolio_concentration=0.5,
+                technical_level="intermediate",
+                preferred_depth="detailed",
+                wants_explanations=True,
+                wants_analogies=False,
+            )
+            db.add(profile)
+            db.commit()
+            db.refresh(profile)
+
+        return profile.to_dict()
 
 
 user_profile_service = UserProfileService()
@@ -0,0 +1,113 @@
+"""
+그래프 상태용 콘텐츠 주소 기반 사이드 저장소
+
+가격 시계열, 재무제표 원본처럼 큰 데이터를 그래프 상태에 직접 넣으면
+체크포인트 저장, 상태 diff, SSE 이벤트 직렬화가 매 단계마다 MB 단위가 됩니다.
+큰 데이터는 이 저장소에 두고 상태에는 작은 핸들만 남깁니다.
+
+- 핸들: {"$blob": sha256, "kind": 종류, "size": 직렬화 바이트 수, "ref": 재조회 인자}
+- 같은 내용은 같은 핸들 (재실행/재시도 시 중복 저장 없음)
+- 프로세스 로컬 LRU + TTL (`TTLCache`, `/health`의 caches에 노출)은 재조회를 줄이는 캐시일 뿐,
+  원본의 출처는 kind별로 등록한 loader입니다. 다른 워커에서 재개했거나, 재시작/만료/LRU 축출로
+  캐시에 없으면 `aresolve`가 핸들의 ref로 loader를 호출해 다시 가져옵니다.
+  재조회 결과가 핸들의 digest와 다르면(원본 갱신) 반환만 하고 캐시하지 않습니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from src.config.settings import settings
+from src.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+BLOB_KEY = "$blob"
+
+BlobLoader = Callable[..., Awaitable[Any]]
+
+
+class BlobStore:
+    """콘텐츠 주소(sha256) 기반 blob 저장소 (인메모리 캐시 + kind별 재조회)"""
+
+    def __init__(self, name: str = "graph_blobs", maxsize: int = 256, ttl: float = 3600.0):
+        self._cache = TTLCache(name, maxsize=maxsize, ttl=ttl)
+        self._loaders: Dict[str, BlobLoader] = {}
+
+    def register_loader(self, kind: str, loader: BlobLoader) -> None:
+        """캐시에 없을 때 `loader(**handle["ref"])`로 원본을 다시 가져오도록 등록"""
+        self._loaders[kind] = loader
+
+    def put(self, value: Any, kind: str = "data", ref: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        값을 저장하고 상태에 넣을 핸들을 반환
+
+        Args:
+            ref: 재조회 인자 (JSON 직렬화 가능한 작은 dict, kind의 loader에 키워드 인자로 전달)
+        """
+        digest, encoded = _digest(value)
+        self._cache.set(digest, value)
+        handle = {BLOB_KEY: digest, "kind": kind, "size": len(encoded)}
+        if ref is not None:
+            handle["ref"] = dict(ref)
+        return handle
+
+    def resolve(self, value: Any, default: Any = None) -> Any:
+        """캐시에서만 역참조 (핸들이 아니면 그대로, 캐시에 없으면 default)"""
+        if not is_blob_handle(value):
+            return value
+        return self._cache.get(value[BLOB_KEY], default)
+
+    async def aresolve(self, value: Any, default: Any = None) -> Any:
+        """핸들을 원본으로 역참조 (캐시에 없으면 등록된 loader로 재조회)"""
+        if not is_blob_handle(value):
+            return value
+        digest = value[BLOB_KEY]
+        loader = self._loaders.get(value.get("kind"))
+        ref = value.get("ref")
+        if loader is None or ref is None:
+            return self._cache.get(digest, default)
+
+        matches = False
+
+        async def _reload() -> Any:
+            nonlocal matches
+            logger.info("📦 [BlobStore] 캐시에 없는 %s 재조회: %s", value.get("kind"), ref)
+            loaded = await loader(**ref)
+            # 원본이 바뀌었으면 핸들의 digest 아래에 다른 내용을 캐시하지 않음
+            matches = loaded is not None and _digest(loaded)[0] == digest
+            if loaded is not None and not matches:
+                logger.info("📦 [BlobStore] 재조회한 %s 내용이 핸들과 달라 캐시하지 않음: %s", value.get("kind"), ref)
+            return loaded
+
+        try:
+            loaded = await self._cache.get_or_load(digest, _reload, only_if=lambda: matches)
+        except Exception as exc:
+            logger.warning("⚠️ [BlobStore] %s 재조회 실패: %s", value.get("kind"), exc)
+            return default
+        return default if loaded is None else loaded
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+def _digest(value: Any) -> Tuple[str, bytes]:
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest(), encoded
+
+
+def is_blob_handle(value: Any) -> bool:
+    return isinstance(value, dict) and isinstance(value.get(BLOB_KEY), str)
+
+
+async def resolve_blob(value: Any, default: Optional[Any] = None) -> Any:
+    """모듈 싱글톤 저장소 기준 역참조 (노드에서 필요할 때만 호출)"""
+    return await blob_store.aresolve(value, default)
+
+
+blob_store = BlobStore(
+    maxsize=settings.GRAPH_BLOB_STORE_MAXSIZE,
+    ttl=settings.GRAPH_BLOB_STORE_TTL_SECONDS,
+)
@@ -0,0 +1,280 @@
+"""
+인메모리 캐시 유틸리티
+
+LRU + TTL 기반의 프로세스 로컬 캐시를 제공합니다.
+
+- 최대 엔트리 수 초과 시 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+- 엔트리별 만료 시간 (TTL)
+- 동일 키에 대한 동시 miss를 하나의 로더 호출로 합침 (single-flight, 일괄 로드 포함)
+- hit/miss/coalesced/eviction 카운터 (`/health`에서 노출)
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+_MISSING = object()
+_RETRY = object()  # 로더 실행자가 취소됨 → 대기자가 다시 로드
+
+_registry: Dict[str, "TTLCache"] = {}
+_registry_lock = threading.Lock()
+
+
+class TTLCache:
+    """LRU + TTL 인메모리 캐시 (single-flight 로더 지원)"""
+
+    def __init__(self, name: str, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Args:
+            name: 캐시 이름 (통계 조회용, 프로세스 내에서 유일해야 함)
+            maxsize: 최대 엔트리 수
+            ttl: 기본 만료 시간 (초)
+        """
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+        with _registry_lock:
+            _registry[name] = self
+
+    # ------------------------------------------------------------------
+    # 기본 연산
+    # ------------------------------------------------------------------
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (만료된 항목은 제거 후 miss 처리)"""
+        value = self._lookup(key)
+        if value is _MISSING:
+            return default
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        only_if: Optional[Callable[[], bool]] = None,
+    ) -> bool:
+        """
+        캐시 저장 (ttl 미지정 시 기본 TTL 사용)
+
+        only_if가 주어지면 잠금 안에서 확인해 False일 때 저장하지 않습니다
+        (로드 중에 원본이 바뀐 경우 오래된 값으로 덮어쓰지 않도록).
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if only_if is not None and not only_if():
+                return False
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, key: Hashable) -> bool:
+        """단일 키 무효화"""
+        with self._lock:
+            removed = self._data.pop(key, _MISSING) is not _MISSING
+            if removed:
+                self.invalidations += 1
+            return removed
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """조건에 맞는 키를 모두 무효화하고 제거된 개수를 반환"""
+        with self._lock:
+            targets = [key for key in self._data if predicate(key)]
+            for key in targets:
+                del self._data[key]
+            self.invalidations += len(targets)
+            return len(targets)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # ------------------------------------------------------------------
+    # single-flight 로더
+    # ------------------------------------------------------------------
+    async def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        only_if: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """
+        캐시 조회 후 miss이면 loader를 실행해 채웁니다.
+
+        동일 키에 대해 이미 진행 중인 로더가 있으면 새로 호출하지 않고
+        그 결과를 함께 기다립니다. loader가 None을 반환하면 캐싱하지 않습니다.
+        로더를 실행하던 호출자가 취소되면 대기자에게 취소를 넘기지 않고
+        대기자 중 하나가 다시 로드합니다.
+        only_if는 로드 결과를 캐시에 쓸 때 `set`에 그대로 전달됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                return value
+
+            pending = self._inflight.get(key)
+            if pending is None or pending.get_loop() is not loop:
+                break
+            with self._lock:
+                self.coalesced += 1
+            value = await asyncio.shield(pending)
+            if value is not _RETRY:
+                return value
+
+        future: asyncio.Future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            if not future.done():
+                future.set_result(_RETRY)
+            raise
+        except BaseException as exc:
+            if not future.done():
+                future.set_exception(exc)
+                # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+                future.exception()
+            raise
+        else:
+            if value is not None:
+                self.set(key, value, ttl=ttl, only_if=only_if)
+            if not future.done():
+                future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def get_or_load_many(
+        self,
+        keys: Iterable[Hashable],
+        loader: Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]],
+        ttl: Optional[float] = None,
+    ) -> Dict[Hashable, Any]:
+        """
+        여러 키를 한 번에 조회하고, 캐시에 없고 진행 중인 로드도 없는 키만 loader로 일괄 로드
+
+        `get_or_load`와 같은 키별 진행 중 목록을 공유하므로, 겹치는 일괄 조회나
+        단건 조회가 이미 로드 중인 키는 새로 호출하지 않고 그 결과를 기다립니다.
+        loader는 키 목록을 받아 {키: 값}을 반환하며, 값이 없거나 None인 키와
+        다른 호출자의 로드가 실패한 키는 결과에서 제외됩니다.
+        """
+        loop = asyncio.get_running_loop()
+        results: Dict[Hashable, Any] = {}
+        waiting: Dict[Hashable, asyncio.Future] = {}
+        owned: Dict[Hashable, asyncio.Future] = {}
+        for key in dict.fromkeys(keys):
+            value = self._lookup(key)
+            if value is not _MISSING:
+                results[key] = value
+                continue
+            pending = self._inflight.get(key)
+            if pending is not None and pending.get_loop() is loop:
+                with self._lock:
+                    self.coalesced += 1
+                waiting[key] = pending
+            else:
+                owned[key] = self._inflight[key] = loop.create_future()
+
+        if owned:
+            try:
+                loaded = await loader(list(owned))
+            except asyncio.CancelledError:
+                for future in owned.values():
+                    if not future.done():
+                        future.set_result(_RETRY)
+                raise
+            except BaseException as exc:
+                for future in owned.values():
+                    if not future.done():
+                        future.set_exception(exc)
+                        future.exception()
+                raise
+            else:
+                for key, future in owned.items():
+                    value = (loaded or {}).get(key)
+                    if value is not None:
+                        self.set(key, value, ttl=ttl)
+                        results[key] = value
+                    if not future.done():
+                        future.set_result(value)
+            finally:
+                for key, future in owned.items():
+                    if self._inflight.get(key) is future:
+                        del self._inflight[key]
+
+        retry = []
+        for key, pending in waiting.items():
+            try:
+                value = await asyncio.shield(pending)
+            except Exception:
+                continue
+            if value is _RETRY:
+                retry.append(key)
+            elif value is not None:
+                results[key] = value
+        if retry:
+            results.update(await self.get_or_load_many(retry, loader, ttl=ttl))
+        return results
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _lookup(self, key: Hashable) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return _MISSING
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """등록된 모든 캐시의 통계를 반환"""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return {cache.name: cache.stats() for cache in caches}
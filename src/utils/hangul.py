@@ -0,0 +1,99 @@
+"""
+한글 처리 유틸리티
+
+종목명 검색/매칭에 쓰는 정규화와 자모 분해 함수입니다.
+
+- normalize_name: 대소문자/공백/기호 차이 제거 ("SK 하이닉스" → "sk하이닉스")
+- choseong: 초성 추출 ("삼성전자" → "ㅅㅅㅈㅈ")
+- decompose: 자모 분해 ("삼성" → "ㅅㅏㅁㅅㅓㅇ") - 입력 중인 음절의 접두 매칭용
+- latin_reading: 영문 약어의 한글 발음 ("SK" → "에스케이")
+"""
+from __future__ import annotations
+
+import re
+
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+             "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+_CHOSEONG_SET = frozenset(CHOSEONG)
+
+# 겹받침은 입력 중간 상태("젅" → "전자")와 맞추기 위해 두 자음으로 분해
+_COMPOUND_JONGSEONG = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+
+# 영문 알파벳의 한글 발음 (종목명 약어: SK, LG, KT, CJ ...)
+LATIN_READINGS = {
+    "a": "에이", "b": "비", "c": "씨", "d": "디", "e": "이", "f": "에프", "g": "지",
+    "h": "에이치", "i": "아이", "j": "제이", "k": "케이", "l": "엘", "m": "엠", "n": "엔",
+    "o": "오", "p": "피", "q": "큐", "r": "알", "s": "에스", "t": "티", "u": "유",
+    "v": "브이", "w": "더블유", "x": "엑스", "y": "와이", "z": "지",
+}
+
+_NON_WORD_RE = re.compile(r"[\s\-_.·&()\[\]/,'\"]+")
+_LATIN_PREFIX_RE = re.compile(r"^([a-z]{1,4})(?=[가-힣]|$)")
+
+
+def is_hangul_syllable(char: str) -> bool:
+    return _HANGUL_BASE <= ord(char) <= _HANGUL_LAST
+
+
+def is_choseong_only(text: str) -> bool:
+    """공백을 제외한 모든 글자가 초성 자음인지 여부 (예: "ㅅㅅㅈㅈ")"""
+    stripped = text.replace(" ", "")
+    return bool(stripped) and all(char in _CHOSEONG_SET for char in stripped)
+
+
+def normalize_name(text: str) -> str:
+    """검색 비교용 정규화 (소문자, 공백/기호 제거)"""
+    return _NON_WORD_RE.sub("", text or "").lower()
+
+
+def choseong(text: str) -> str:
+    """한글 음절은 초성으로 바꾸고 나머지 글자는 그대로 둠"""
+    result = []
+    for char in text:
+        if is_hangul_syllable(char):
+            result.append(CHOSEONG[(ord(char) - _HANGUL_BASE) // 588])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def decompose(text: str) -> str:
+    """
+    한글 음절을 초성/중성/종성 자모로 분해 (겹받침은 두 자음으로)
+
+    입력 중인 글자도 접두 비교가 되도록 합니다: "삼성젅" → "ㅅㅏㅁㅅㅓㅇㅈㅓㄴㅈ"
+    (완성형 "삼성전자"의 분해 결과 "ㅅㅏㅁㅅㅓㅇㅈㅓㄴㅈㅏ"의 접두어)
+    """
+    result = []
+    for char in text:
+        if is_hangul_syllable(char):
+            offset = ord(char) - _HANGUL_BASE
+            jong = JONGSEONG[offset % 28]
+            result.append(CHOSEONG[offset // 588])
+            result.append(JUNGSEONG[(offset % 588) // 28])
+            result.append(_COMPOUND_JONGSEONG.get(jong, jong))
+        else:
+            result.append(_COMPOUND_JONGSEONG.get(char, char))
+    return "".join(result)
+
+
+def latin_reading(normalized: str) -> str:
+    """
+    정규화된 이름 앞쪽의 영문 약어를 한글 발음으로 바꿈
+
+    "sk하이닉스" → "에스케이하이닉스", "lg" → "엘지". 약어가 없으면 빈 문자열.
+    """
+    match = _LATIN_PREFIX_RE.match(normalized)
+    if not match:
+        return ""
+    prefix = match.group(1)
+    return "".join(LATIN_READINGS[char] for char in prefix) + normalized[len(prefix):]
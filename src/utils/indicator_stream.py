@@ -0,0 +1,316 @@
+"""
+증분(스트리밍) 기술적 지표 계산 모듈
+
+새 봉이 추가될 때마다 전체 구간을 다시 계산하지 않고, 누적 상태만 갱신해
+O(1)로 지표를 계산합니다. 정의는 `src.utils.indicators`의 함수들과 동일합니다.
+
+- 이동평균/볼린저 밴드/평균 거래량: 고정 길이 윈도우의 누적합/제곱합
+- RSI: 최근 N개 상승/하락폭의 누적합 (calculate_rsi와 같은 단순 이동평균 방식)
+- MACD: EMA 상태값
+
+상태는 `to_dict()`/`from_dict()`로 JSON 직렬화할 수 있어
+`stock_indicators.stream_state`에 함께 저장합니다.
+"""
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Optional
+
+import pandas as pd
+
+from src.utils.indicators import MOVING_AVERAGE_WINDOWS
+
+STATE_VERSION = 1
+
+# 누적합 부동소수점 오차가 쌓이지 않도록 주기적으로 윈도우에서 다시 합산
+_RESYNC_INTERVAL = 1000
+
+
+class RollingWindow:
+    """고정 길이 윈도우의 합/제곱합을 O(1)로 유지"""
+
+    def __init__(self, size: int, min_periods: Optional[int] = None):
+        self.size = size
+        self.min_periods = size if min_periods is None else min_periods
+        self.values: Deque[float] = deque()
+        self.total = 0.0
+        self.total_sq = 0.0
+        self._pushes = 0
+
+    def push(self, value: float) -> None:
+        self.values.append(value)
+        self.total += value
+        self.total_sq += value * value
+        if len(self.values) > self.size:
+            evicted = self.values.popleft()
+            self.total -= evicted
+            self.total_sq -= evicted * evicted
+
+        self._pushes += 1
+        if self._pushes % _RESYNC_INTERVAL == 0:
+            self._resync()
+
+    def replace_last(self, value: float) -> None:
+        """마지막 값 교체 (장중 현재 봉 갱신용)"""
+        previous = self.values[-1]
+        self.values[-1] = value
+        self.total += value - previous
+        self.total_sq += value * value - previous * previous
+
+    def mean(self) -> Optional[float]:
+        if len(self.values) < self.min_periods or not self.values:
+            return None
+        return self.total / len(self.values)
+
+    def std(self) -> Optional[float]:
+        """표본표준편차 (ddof=1)"""
+        n = len(self.values)
+        if n < self.min_periods or n < 2:
+            return None
+        variance = (self.total_sq - self.total * self.total / n) / (n - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def _resync(self) -> None:
+        self.total = sum(self.values)
+        self.total_sq = sum(v * v for v in self.values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"size": self.size, "min_periods": self.min_periods, "values": list(self.values)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RollingWindow":
+        window = cls(data["size"], data.get("min_periods"))
+        for value in data.get("values", []):
+            window.push(float(value))
+        return window
+
+
+class EMAState:
+    """지수이동평균 상태 (pandas `ewm(span, adjust=False)`와 동일)"""
+
+    def __init__(self, span: int):
+        self.span = span
+        self.alpha = 2.0 / (span + 1)
+        self.value: Optional[float] = None
+        self._previous: Optional[float] = None
+
+    def push(self, x: float) -> float:
+        self._previous = self.value
+        self.value = self._step(self._previous, x)
+        return self.value
+
+    def replace_last(self, x: float) -> float:
+        self.value = self._step(self._previous, x)
+        return self.value
+
+    def _step(self, previous: Optional[float], x: float) -> float:
+        if previous is None:
+            return x
+        return self.alpha * x + (1 - self.alpha) * previous
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"span": self.span, "value": self.value, "previous": self._previous}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EMAState":
+        state = cls(data["span"])
+        state.value = data.get("value")
+        state._previous = data.get("previous")
+        return state
+
+
+class IndicatorStream:
+    """
+    종목 하나의 지표를 봉 단위로 증분 계산
+
+    Usage:
+        stream = IndicatorStream.from_history(df)   # 과거 데이터로 워밍업
+        snapshot = stream.update(close, volume)     # 새 일봉 추가
+        snapshot = stream.update(close, volume, new_bar=False)  # 장중 현재 봉 갱신
+        state = stream.to_dict()                    # 저장
+    """
+
+    def __init__(
+        self,
+        rsi_period: int = 14,
+        bollinger_period: int = 20,
+        bollinger_std: float = 2.0,
+        volume_window: int = 20,
+    ):
+        self.bollinger_std = bollinger_std
+        self.moving_averages = {w: RollingWindow(w) for w in MOVING_AVERAGE_WINDOWS}
+        self.bollinger = RollingWindow(bollinger_period)
+        self.gains = RollingWindow(rsi_period, min_periods=1)
+        self.losses = RollingWindow(rsi_period, min_periods=1)
+        self.volume = RollingWindow(volume_window, min_periods=1)
+        self.ema_fast = EMAState(12)
+        self.ema_slow = EMAState(26)
+        self.signal = EMAState(9)
+
+        self.last_close: Optional[float] = None
+        self.prev_close: Optional[float] = None
+        self.last_volume: Optional[float] = None
+        self.bars = 0
+
+    def update(
+        self,
+        close: float,
+        volume: Optional[float] = None,
+        new_bar: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        봉 하나를 반영하고 최신 지표 스냅샷을 반환
+
+        Args:
+            close: 종가 (장중에는 현재가)
+            volume: 거래량 (누적 거래량)
+            new_bar: False면 마지막 봉을 교체 (장중 갱신)
+
+        Returns:
+            dict: StockIndicator 컬럼명 기준 지표 값
+        """
+        close = float(close)
+        if not new_bar and self.bars == 0:
+            new_bar = True
+
+        if new_bar:
+            self.prev_close = self.last_close
+        delta = close - self.prev_close if self.prev_close is not None else 0.0
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+
+        if new_bar:
+            for window in self.moving_averages.values():
+                window.push(close)
+            self.bollinger.push(close)
+            self.gains.push(gain)
+            self.losses.push(loss)
+            fast = self.ema_fast.push(close)
+            slow = self.ema_slow.push(close)
+            self.signal.push(fast - slow)
+            if volume is not None:
+                self.volume.push(float(volume))
+            self.bars += 1
+        else:
+            for window in self.moving_averages.values():
+                window.replace_last(close)
+            self.bollinger.replace_last(close)
+            self.gains.replace_last(gain)
+            self.losses.replace_last(loss)
+            fast = self.ema_fast.replace_last(close)
+            slow = self.ema_slow.replace_last(close)
+            self.signal.replace_last(fast - slow)
+            if volume is not None:
+                if self.volume.values and self.last_volume is not None:
+                    self.volume.replace_last(float(volume))
+                else:
+                    self.volume.push(float(volume))
+
+        self.last_close = close
+        if volume is not None:
+            self.last_volume = float(volume)
+        return self.snapshot()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 기준 지표 값"""
+        result: Dict[str, Any] = {
+            f"ma{w}": window.mean() for w, window in self.moving_averages.items()
+        }
+
+        total_gain, total_loss = self.gains.total, self.losses.total
+        if not self.gains.values or (total_gain == 0 and total_loss == 0):
+            result["rsi14"] = None
+        elif total_loss == 0:
+            result["rsi14"] = 100.0
+        else:
+            result["rsi14"] = 100 - 100 / (1 + total_gain / total_loss)
+
+        macd = None
+        if self.ema_fast.value is not None and self.ema_slow.value is not None:
+            macd = self.ema_fast.value - self.ema_slow.value
+        signal = self.signal.value
+        result["macd"] = macd
+        result["macd_signal"] = signal
+        result["macd_histogram"] = macd - signal if macd is not None and signal is not None else None
+
+        middle = self.bollinger.mean()
+        std = self.bollinger.std()
+        if middle is not None and std is not None:
+            result["bollinger_upper"] = middle + std * self.bollinger_std
+            result["bollinger_middle"] = middle
+            result["bollinger_lower"] = middle - std * self.bollinger_std
+        else:
+            result["bollinger_upper"] = result["bollinger_middle"] = result["bollinger_lower"] = None
+
+        avg_volume = self.volume.mean()
+        if self.last_volume is not None and avg_volume is not None:
+            ratio = self.last_volume / avg_volume if avg_volume > 0 else 0.0
+            result["current_volume"] = int(self.last_volume)
+            result["average_volume"] = int(avg_volume)
+            result["volume_ratio"] = ratio
+            result["is_high_volume"] = "Y" if ratio > 1.5 else "N"
+
+        return result
+
+    # ------------------------------------------------------------------
+    # 직렬화
+    # ------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": STATE_VERSION,
+            "bollinger_std": self.bollinger_std,
+            "moving_averages": {str(w): window.to_dict() for w, window in self.moving_averages.items()},
+            "bollinger": self.bollinger.to_dict(),
+            "gains": self.gains.to_dict(),
+            "losses": self.losses.to_dict(),
+            "volume": self.volume.to_dict(),
+            "ema_fast": self.ema_fast.to_dict(),
+            "ema_slow": self.ema_slow.to_dict(),
+            "signal": self.signal.to_dict(),
+            "last_close": self.last_close,
+            "prev_close": self.prev_close,
+            "last_volume": self.last_volume,
+            "bars": self.bars,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "IndicatorStream":
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"지원하지 않는 지표 상태 버전: {data.get('version')}")
+
+        stream = cls(bollinger_std=data.get("bollinger_std", 2.0))
+        stream.moving_averages = {
+            int(w): RollingWindow.from_dict(window) for w, window in data["moving_averages"].items()
+        }
+        stream.bollinger = RollingWindow.from_dict(data["bollinger"])
+        stream.gains = RollingWindow.from_dict(data["gains"])
+        stream.losses = RollingWindow.from_dict(data["losses"])
+        stream.volume = RollingWindow.from_dict(data["volume"])
+        stream.ema_fast = EMAState.from_dict(data["ema_fast"])
+        stream.ema_slow = EMAState.from_dict(data["ema_slow"])
+        stream.signal = EMAState.from_dict(data["signal"])
+        stream.last_close = data.get("last_close")
+        stream.prev_close = data.get("prev_close")
+        stream.last_volume = data.get("last_volume")
+        stream.bars = data.get("bars", 0)
+        return stream
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame, **kwargs: Any) -> "IndicatorStream":
+        """과거 주가 DataFrame(Close, Volume)으로 상태를 워밍업"""
+        stream = cls(**kwargs)
+        stream.extend(df)
+        return stream
+
+    def extend(self, df: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """여러 봉을 순서대로 반영하고 마지막 스냅샷을 반환"""
+        snapshot = None
+        volumes: Iterable[Optional[float]] = (
+            df["Volume"].tolist() if "Volume" in df.columns else [None] * len(df)
+        )
+        for close, volume in zip(df["Close"].tolist(), volumes):
+            if close is None or pd.isna(close):
+                continue
+            snapshot = self.update(close, None if volume is None or pd.isna(volume) else volume)
+        return snapshot
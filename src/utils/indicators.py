@@ -3,9 +3,11 @@
 
 주가 데이터를 기반으로 각종 기술적 지표를 계산합니다.
 """
+import warnings
+
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 
 def calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
@@ -291,3 +293,195 @@ def _determine_overall_trend(rsi: float, macd_histogram: float, signals: list) -
         return "약세"
     else:
         return "중립"
+
+
+# ==================== 다종목 일괄 계산 (벡터화) ====================
+
+MOVING_AVERAGE_WINDOWS = (5, 20, 60, 120)
+
+
+def _rolling_mean(values: np.ndarray, window: int, min_periods: Optional[int] = None) -> np.ndarray:
+    """
+    열(종목) 단위 NaN 인식 rolling mean
+
+    pandas `rolling(window, min_periods).mean()`과 동일한 결과를 누적합으로 계산합니다.
+    """
+    min_periods = window if min_periods is None else min_periods
+    valid = ~np.isnan(values)
+    csum = np.cumsum(np.where(valid, values, 0.0), axis=0)
+    ccount = np.cumsum(valid, axis=0)
+
+    sums = csum.copy()
+    counts = ccount.copy()
+    sums[window:] -= csum[:-window]
+    counts[window:] -= ccount[:-window]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = sums / counts
+    out[counts < min_periods] = np.nan
+    return out
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """열 단위 rolling 표본표준편차 (ddof=1, pandas `rolling(window).std()`와 동일)"""
+    # 가격 수준을 빼서 제곱합 계산 시 자릿수 손실을 줄임
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        center = np.nanmean(values, axis=0)
+    shifted = values - np.nan_to_num(center)
+
+    mean = _rolling_mean(shifted, window)
+    mean_sq = _rolling_mean(shifted * shifted, window)
+    variance = (mean_sq - mean * mean) * window / (window - 1)
+    return np.sqrt(np.clip(variance, 0.0, None))
+
+
+def _ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    열 단위 지수이동평균 (pandas `ewm(span, adjust=False).mean()`과 동일)
+
+    종목별 첫 유효값에서 시작하며, 중간 결측은 직전 값을 유지합니다.
+    """
+    alpha = 2.0 / (span + 1)
+    out = np.full(values.shape, np.nan)
+    state = np.full(values.shape[1], np.nan)
+    for t in range(values.shape[0]):
+        x = values[t]
+        has_value = ~np.isnan(x)
+        state = np.where(
+            has_value,
+            np.where(np.isnan(state), x, alpha * x + (1 - alpha) * state),
+            state,
+        )
+        out[t] = state
+    return out
+
+
+def calculate_indicator_panel(
+    close: pd.DataFrame,
+    volume: Optional[pd.DataFrame] = None,
+    rsi_period: int = 14,
+    bollinger_period: int = 20,
+    bollinger_std: float = 2.0,
+    volume_window: int = 20,
+) -> Dict[str, pd.DataFrame]:
+    """
+    (날짜 × 종목) 종가/거래량 행렬로 모든 종목의 지표를 한 번에 계산
+
+    단일 종목 함수(`calculate_rsi`, `calculate_macd`, `calculate_bollinger_bands`,
+    `calculate_moving_averages`)와 같은 정의를 사용하며, 전체 기간 결과를 반환하므로
+    `stock_indicator_repository.bulk_upsert` 백필에 그대로 사용할 수 있습니다.
+
+    거래량 컬럼(average_volume, volume_ratio)은 `IndicatorStream`과 같이 최근
+    volume_window일 이동평균 기준입니다. 조회 기간 전체 평균을 쓰는
+    `calculate_volume_analysis`와는 달리 조회 기간에 따라 값이 바뀌지 않습니다.
+
+    Args:
+        close: 종가 패널 (index: 날짜, columns: 종목코드)
+        volume: 거래량 패널 (close와 같은 모양, 선택)
+        rsi_period: RSI 기간
+        bollinger_period: 볼린저 밴드 기간
+        bollinger_std: 볼린저 밴드 표준편차 배수
+        volume_window: 평균 거래량 계산 기간
+
+    Returns:
+        dict: {StockIndicator 컬럼명: (날짜 × 종목) DataFrame}
+    """
+    if close is None or close.empty:
+        return {}
+
+    index, columns = close.index, close.columns
+    prices = close.to_numpy(dtype=float)
+
+    def _frame(values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=index, columns=columns)
+
+    result: Dict[str, pd.DataFrame] = {}
+
+    # 이동평균
+    for window in MOVING_AVERAGE_WINDOWS:
+        result[f"ma{window}"] = _frame(_rolling_mean(prices, window))
+
+    # RSI (단순 이동평균 방식, calculate_rsi와 동일)
+    delta = np.diff(prices, axis=0, prepend=np.nan)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = _rolling_mean(gain, rsi_period, min_periods=1)
+    avg_loss = _rolling_mean(loss, rsi_period, min_periods=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rs = avg_gain / avg_loss
+        rsi = 100 - (100 / (1 + rs))
+    result["rsi14"] = _frame(rsi)
+
+    # MACD
+    macd = _ema(prices, 12) - _ema(prices, 26)
+    signal = _ema(macd, 9)
+    result["macd"] = _frame(macd)
+    result["macd_signal"] = _frame(signal)
+    result["macd_histogram"] = _frame(macd - signal)
+
+    # Bollinger Bands
+    middle = _rolling_mean(prices, bollinger_period)
+    std = _rolling_std(prices, bollinger_period)
+    result["bollinger_upper"] = _frame(middle + std * bollinger_std)
+    result["bollinger_middle"] = _frame(middle)
+    result["bollinger_lower"] = _frame(middle - std * bollinger_std)
+
+    # 거래량
+    if volume is not None and not volume.empty:
+        volumes = volume.reindex(index=index, columns=columns).to_numpy(dtype=float)
+        avg_volume = _rolling_mean(volumes, volume_window, min_periods=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = np.where(avg_volume > 0, volumes / avg_volume, 0.0)
+        ratio[np.isnan(volumes)] = np.nan
+        result["current_volume"] = _frame(volumes)
+        result["average_volume"] = _frame(avg_volume)
+        result["volume_ratio"] = _frame(ratio)
+
+    # 종가가 없는 날짜(상장 전/거래정지)는 지표도 비움
+    missing = np.isnan(prices)
+    for name, frame in result.items():
+        result[name] = frame.mask(missing)
+
+    return result
+
+
+def indicator_panel_rows(
+    panel: Dict[str, pd.DataFrame],
+    stock_code: str,
+    last_n: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    지표 패널에서 한 종목의 행을 `stock_indicators` upsert 형식으로 추출
+
+    Args:
+        panel: calculate_indicator_panel 결과
+        stock_code: 종목 코드
+        last_n: 최근 N일만 추출 (None이면 전체 기간)
+
+    Returns:
+        [{"date": date, "ma5": ..., "rsi14": ..., ...}, ...] (종가가 없는 날짜는 제외)
+    """
+    if not panel or stock_code not in panel["ma5"].columns:
+        return []
+
+    frame = pd.DataFrame({name: values[stock_code] for name, values in panel.items()})
+    frame = frame.dropna(how="all")
+    if last_n is not None:
+        frame = frame.tail(last_n)
+
+    rows: List[Dict[str, Any]] = []
+    for idx, values in frame.iterrows():
+        row: Dict[str, Any] = {"date": idx.date() if hasattr(idx, "date") else idx}
+        for name, value in values.items():
+            if pd.isna(value):
+                row[name] = None
+            elif name in ("current_volume", "average_volume"):
+                row[name] = int(value)
+            else:
+                row[name] = float(value)
+        if "volume_ratio" in row:
+            ratio = row["volume_ratio"]
+            row["is_high_volume"] = "Y" if ratio is not None and ratio > 1.5 else "N"
+        rows.append(row)
+    return rows
@@ -0,0 +1,356 @@
+"""
+LLM 응답 캐시
+
+`llm_factory._build_llm`이 생성하는 Chat 모델에 LangChain `BaseCache`로 연결되어,
+동일한 프롬프트에 대한 반복 호출을 LLM 없이 응답합니다.
+
+- 키: sha256(모델 설정(llm_string) + 정규화한 프롬프트 + 데이터 버전)
+- 저장소: 프로세스 내 LRU(TTLCache) → DB(llm_response_cache 테이블) 2단계
+- 대상: `llm_cache_scope()` 안의 호출만 (temperature와 무관, 매매/라우팅 등 scope 밖 호출은 캐시하지 않음)
+- TTL: 노드별 (DEFAULT_NODE_TTLS, settings.LLM_CACHE_TTLS로 재정의)
+- 통계: hit/miss, 절약한 토큰/지연 시간 (`/health`에서 노출)
+
+Usage:
+    with llm_cache_scope("macro_worker", data_version=snapshot_date):
+        response = await llm.ainvoke(prompt)
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.outputs import Generation
+
+from src.config.settings import settings
+from src.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# 노드별 기본 TTL (초) - 입력 데이터 갱신 주기에 맞춤
+DEFAULT_NODE_TTLS: Dict[str, int] = {
+    "intent_classifier": 3600,
+    "macro_worker": 24 * 3600,  # 데이터 기준일(market context version)이 키에 포함됨
+    "market_analyzer": 6 * 3600,
+}
+
+_WHITESPACE_RE = re.compile(r"(?:\\[nrt]|\s)+")
+
+# 응답이 저장되지 않은 miss의 시작 시각은 이 개수까지만 보관
+_MAX_PENDING_TIMERS = 1024
+
+
+@dataclass(frozen=True)
+class LLMCacheScope:
+    """캐시 적용 범위 (노드 이름 + 데이터 버전)"""
+
+    node: str
+    data_version: Optional[str] = None
+
+
+_cache_scope: ContextVar[Optional[LLMCacheScope]] = ContextVar("llm_cache_scope", default=None)
+
+
+@contextmanager
+def llm_cache_scope(node: str, data_version: Optional[Any] = None) -> Iterator[LLMCacheScope]:
+    """
+    블록 안의 LLM 호출을 노드 단위로 캐싱
+
+    scope 밖의 호출은 temperature=0이어도 캐시하지 않으므로, 같은 입력이면
+    같은 응답을 재사용해도 되는 노드에서만 명시적으로 감쌉니다.
+    data_version은 프롬프트에 드러나지 않는 입력 데이터의 버전(기준일 등)입니다.
+    """
+    scope = LLMCacheScope(node=node, data_version=None if data_version is None else str(data_version))
+    token = _cache_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _cache_scope.reset(token)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """공백/개행 차이만 있는 프롬프트가 같은 키를 갖도록 정규화"""
+    return _WHITESPACE_RE.sub(" ", prompt).strip()
+
+
+def _model_name(llm_string: str) -> Optional[str]:
+    match = re.search(r"'model(?:_name)?', '([^']+)'", llm_string)
+    return match.group(1) if match else None
+
+
+def _total_tokens(generations: Sequence[Generation]) -> int:
+    total = 0
+    for generation in generations:
+        usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+        total += int(usage.get("total_tokens") or 0)
+    return total
+
+
+class LLMResponseCache(BaseCache):
+    """LRU + DB 2단계 LLM 응답 캐시 (모든 모델이 하나의 인스턴스를 공유)"""
+
+    def __init__(
+        self,
+        repository: Any = None,
+        maxsize: int = 512,
+        default_ttl: float = 600.0,
+        node_ttls: Optional[Dict[str, int]] = None,
+        name: str = "llm_response",
+    ):
+        """
+        Args:
+            repository: DB 저장소 (get/put 제공, None이면 메모리만 사용)
+            maxsize: 메모리 LRU 최대 엔트리 수
+            default_ttl: 노드 TTL이 없을 때 기본 TTL (초)
+            node_ttls: 노드별 TTL (초)
+        """
+        self.repository = repository
+        self.default_ttl = default_ttl
+        self.node_ttls = {**DEFAULT_NODE_TTLS, **(node_ttls or {})}
+        self._memory = TTLCache(name, maxsize=maxsize, ttl=default_ttl)
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, float] = {}
+        self._node_stats: Dict[str, Dict[str, int]] = {}
+
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.store_errors = 0
+        self.saved_tokens = 0
+        self.saved_latency_ms = 0.0
+
+    def ttl_for(self, node: str) -> float:
+        return float(self.node_ttls.get(node, self.default_ttl))
+
+    def make_key(self, prompt: str, llm_string: str, scope: LLMCacheScope) -> str:
+        raw = "\n".join([llm_string, scope.data_version or "", normalize_prompt(prompt)])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # BaseCache 인터페이스 (llm_cache_scope 밖에서는 조회/저장하지 않음)
+    # ------------------------------------------------------------------
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        scope = _cache_scope.get()
+        if scope is None:
+            return None
+        key = self.make_key(prompt, llm_string, scope)
+        cached = self._lookup_memory(key, scope)
+        if cached is not None:
+            return cached
+        record = self._store_get(key)
+        return self._resolve_store_hit(key, scope, record)
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        scope = _cache_scope.get()
+        if scope is None:
+            return None
+        key = self.make_key(prompt, llm_string, scope)
+        cached = self._lookup_memory(key, scope)
+        if cached is not None:
+            return cached
+        record = await asyncio.to_thread(self._store_get, key) if self.repository else None
+        return self._resolve_store_hit(key, scope, record)
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        entry = self._prepare_entry(prompt, llm_string, return_val)
+        if entry is not None:
+            self._store_put(entry)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        entry = self._prepare_entry(prompt, llm_string, return_val)
+        if entry is not None and self.repository is not None:
+            await asyncio.to_thread(self._store_put, entry)
+
+    def clear(self, **kwargs: Any) -> None:
+        self._memory.clear()
+        with self._lock:
+            self._pending.clear()
+        if self.repository is not None:
+            try:
+                self.repository.clear()
+            except Exception as exc:
+                logger.warning(f"⚠️ LLM cache store clear failed: {exc}")
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _lookup_memory(self, key: str, scope: LLMCacheScope) -> Optional[Sequence[Generation]]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        generations, total_tokens, latency_ms = entry
+        self._record_hit(scope, total_tokens, latency_ms, store=False)
+        # LangChain이 응답 메시지 id 등을 채우므로 캐시 원본은 복사해서 반환
+        return [generation.model_copy(deep=True) for generation in generations]
+
+    def _resolve_store_hit(
+        self,
+        key: str,
+        scope: LLMCacheScope,
+        record: Optional[Dict[str, Any]],
+    ) -> Optional[Sequence[Generation]]:
+        generations = None
+        if record is not None:
+            try:
+                generations = [loads(item) for item in json.loads(record["generations"])]
+            except Exception as exc:
+                logger.warning(f"⚠️ LLM cache entry unreadable, ignoring: {exc}")
+
+        if not generations:
+            with self._lock:
+                self.misses += 1
+                self._node_counter(scope)["misses"] += 1
+                if len(self._pending) >= _MAX_PENDING_TIMERS:
+                    self._pending.clear()
+                self._pending[key] = time.monotonic()
+            return None
+
+        remaining = (record["expires_at"] - datetime.now()).total_seconds()
+        self._remember(key, generations, record["total_tokens"], record["latency_ms"], max(remaining, 1.0))
+        self._record_hit(scope, record["total_tokens"], record["latency_ms"], store=True)
+        return [generation.model_copy(deep=True) for generation in generations]
+
+    def _prepare_entry(
+        self,
+        prompt: str,
+        llm_string: str,
+        return_val: Sequence[Generation],
+    ) -> Optional[Dict[str, Any]]:
+        scope = _cache_scope.get()
+        if scope is None or not return_val:
+            return None
+
+        key = self.make_key(prompt, llm_string, scope)
+        node = scope.node
+        ttl = self.ttl_for(node)
+
+        with self._lock:
+            started = self._pending.pop(key, None)
+            self.writes += 1
+        latency_ms = (time.monotonic() - started) * 1000 if started is not None else 0.0
+        total_tokens = _total_tokens(return_val)
+
+        generations = [generation.model_copy(deep=True) for generation in return_val]
+        self._remember(key, generations, total_tokens, latency_ms, ttl)
+        return {
+            "cache_key": key,
+            "node": node,
+            "model": _model_name(llm_string),
+            "generations": generations,
+            "total_tokens": total_tokens,
+            "latency_ms": latency_ms,
+            "expires_at": datetime.now() + timedelta(seconds=ttl),
+        }
+
+    def _remember(
+        self,
+        key: str,
+        generations: Sequence[Generation],
+        total_tokens: int,
+        latency_ms: float,
+        ttl: float,
+    ) -> None:
+        self._memory.set(key, (list(generations), total_tokens, latency_ms), ttl=ttl)
+
+    def _record_hit(self, scope: LLMCacheScope, tokens: int, latency_ms: float, store: bool) -> None:
+        with self._lock:
+            if store:
+                self.store_hits += 1
+            else:
+                self.memory_hits += 1
+            self.saved_tokens += int(tokens or 0)
+            self.saved_latency_ms += float(latency_ms or 0.0)
+            self._node_counter(scope)["hits"] += 1
+
+    def _node_counter(self, scope: LLMCacheScope) -> Dict[str, int]:
+        return self._node_stats.setdefault(scope.node, {"hits": 0, "misses": 0})
+
+    def _store_get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.repository is None:
+            return None
+        try:
+            return self.repository.get(key)
+        except Exception as exc:
+            with self._lock:
+                self.store_errors += 1
+            logger.warning(f"⚠️ LLM cache store lookup failed: {exc}")
+            return None
+
+    def _store_put(self, entry: Dict[str, Any]) -> None:
+        if self.repository is None:
+            return
+        try:
+            self.repository.put(
+                entry["cache_key"],
+                node=entry["node"],
+                model=entry["model"],
+                generations=json.dumps([dumps(g) for g in entry["generations"]]),
+                total_tokens=entry["total_tokens"],
+                latency_ms=entry["latency_ms"],
+                expires_at=entry["expires_at"],
+            )
+        except Exception as exc:
+            with self._lock:
+                self.store_errors += 1
+            logger.warning(f"⚠️ LLM cache store write failed: {exc}")
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits = self.memory_hits + self.store_hits
+            lookups = hits + self.misses
+            return {
+                "size": len(self._memory),
+                "persist": self.repository is not None,
+                "hits": hits,
+                "memory_hits": self.memory_hits,
+                "store_hits": self.store_hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "store_errors": self.store_errors,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "saved_tokens": self.saved_tokens,
+                "saved_latency_ms": round(self.saved_latency_ms, 1),
+                "nodes": {node: dict(counts) for node, counts in self._node_stats.items()},
+            }
+
+
+class _LazyRepository:
+    """첫 사용 시 DB repository를 불러옴 (llm_factory import만으로 DB 엔진을 만들지 않도록)"""
+
+    def __getattr__(self, name: str) -> Any:
+        from src.repositories.llm_cache_repository import llm_cache_repository
+
+        return getattr(llm_cache_repository, name)
+
+
+def _create_default_cache() -> LLMResponseCache:
+    return LLMResponseCache(
+        repository=_LazyRepository() if settings.LLM_CACHE_PERSIST else None,
+        maxsize=settings.LLM_CACHE_MAXSIZE,
+        default_ttl=settings.LLM_CACHE_DEFAULT_TTL_SECONDS,
+        node_ttls=settings.llm_cache_ttls,
+    )
+
+
+llm_response_cache = _create_default_cache()
+
+
+def llm_cache_stats() -> Dict[str, Any]:
+    """LLM 응답 캐시 통계 (hit율, 절약 토큰/지연 시간)"""
+    return {"enabled": settings.LLM_CACHE_ENABLED, **llm_response_cache.stats()}
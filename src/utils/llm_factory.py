@@ -16,6 +16,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 
 from src.config.settings import settings
+from src.utils.llm_cache import llm_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,9 @@ def _build_llm(
 
     동일한 설정(provider, model, temperature, max_tokens, loop_token)에 대해서는
     캐시된 인스턴스를 재사용하여 초기화 비용을 줄입니다.
+
+    LLM_CACHE_ENABLED이면 응답 캐시(`src.utils.llm_cache`)를 연결합니다.
+    temperature와 무관하게 llm_cache_scope 안의 호출만 캐시됩니다.
     """
     logger.info(
         "🤖 LLM 초기화: provider=%s, model=%s, temperature=%s, max_tokens=%s, loop=%s",
@@ -58,6 +62,8 @@ def _build_llm(
         loop_token,
     )
 
+    cache = llm_response_cache if settings.LLM_CACHE_ENABLED else None
+
     if provider == "anthropic":
         # Claude 프롬프트 캐싱 활성화
         return ChatAnthropic(
@@ -66,6 +72,7 @@ def _build_llm(
             max_tokens=max_tokens,
             api_key=settings.ANTHROPIC_API_KEY,
             default_headers={"anthropic-beta": "prompt-caching-2024-07-31"},
+            cache=cache,
         )
 
     if provider == "google":
@@ -74,6 +81,7 @@ def _build_llm(
             temperature=temperature,
             max_output_tokens=max_tokens,
             google_api_key=settings.GEMINI_API_KEY,
+            cache=cache,
         )
 
     if provider == "openai":
@@ -82,6 +90,7 @@ def _build_llm(
             temperature=temperature,
             max_tokens=max_tokens,
             api_key=settings.OPENAI_API_KEY,
+            cache=cache,
         )
 
     raise ValueError(f"지원하지 않는 LLM provider: {provider}")
@@ -0,0 +1,160 @@
+"""
+KRX 거래일 계산 유틸리티
+
+주말과 KRX 휴장일을 제외한 거래일을 계산합니다.
+휴장일은 KRX 공지 기준이며, 연도가 바뀌면 `KRX_HOLIDAYS`에 추가해야 합니다.
+표에 없는 연도는 주말만 휴장으로 보고 연도별로 한 번 경고를 남깁니다.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 정규장 시작/마감 시각 (마감 이후에야 당일 일봉이 확정됨)
+MARKET_OPEN = time(9, 0)
+MARKET_CLOSE = time(15, 30)
+
+KRX_HOLIDAYS = frozenset(
+    date.fromisoformat(day)
+    for day in (
+        # 2024
+        "2024-01-01", "2024-02-09", "2024-02-12", "2024-03-01", "2024-04-10",
+        "2024-05-01", "2024-05-06", "2024-05-15", "2024-06-06", "2024-08-15",
+        "2024-09-16", "2024-09-17", "2024-09-18", "2024-10-01", "2024-10-03",
+        "2024-10-09", "2024-12-25", "2024-12-31",
+        # 2025
+        "2025-01-01", "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30",
+        "2025-03-03", "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03",
+        "2025-06-06", "2025-08-15", "2025-10-03", "2025-10-06", "2025-10-07",
+        "2025-10-08", "2025-10-09", "2025-12-25", "2025-12-31",
+        # 2026
+        "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02",
+        "2026-05-01", "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17",
+        "2026-09-24", "2026-09-25", "2026-10-05", "2026-10-09", "2026-12-25",
+        "2026-12-31",
+    )
+)
+
+
+KRX_HOLIDAY_YEARS = frozenset(day.year for day in KRX_HOLIDAYS)
+_warned_years: Set[int] = set()
+
+
+def _check_holiday_table(year: int) -> None:
+    if year in KRX_HOLIDAY_YEARS or year in _warned_years:
+        return
+    _warned_years.add(year)
+    logger.warning(
+        "⚠️ [MarketCalendar] %s년 KRX 휴장일이 등록되지 않아 주말만 휴장으로 처리합니다. "
+        "KRX_HOLIDAYS를 갱신하세요.",
+        year,
+    )
+
+
+def is_trading_day(day: date) -> bool:
+    """주말/KRX 휴장일을 제외한 거래일 여부"""
+    if day.weekday() >= 5:
+        return False
+    _check_holiday_table(day.year)
+    return day not in KRX_HOLIDAYS
+
+
+def previous_trading_day(day: date) -> date:
+    """지정일 직전(당일 제외)의 거래일"""
+    day -= timedelta(days=1)
+    while not is_trading_day(day):
+        day -= timedelta(days=1)
+    return day
+
+
+def latest_trading_day(now: Optional[datetime] = None) -> date:
+    """
+    기준 시각 이전(당일 포함)의 가장 최근 거래일
+
+    Args:
+        now: 기준 시각 (None이면 현재 시각)
+    """
+    day = (now or datetime.now()).date()
+    if is_trading_day(day):
+        return day
+    return previous_trading_day(day)
+
+
+def last_closed_session(now: Optional[datetime] = None) -> date:
+    """
+    일봉이 확정된 가장 최근 거래일
+
+    장 마감(15:30) 전이면 당일은 아직 확정되지 않았으므로 직전 거래일을 반환합니다.
+    """
+    now = now or datetime.now()
+    day = now.date()
+    if is_trading_day(day) and now.time() >= MARKET_CLOSE:
+        return day
+    return previous_trading_day(day)
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """정규장(거래일 09:00~15:30) 진행 중 여부"""
+    now = now or datetime.now()
+    return is_trading_day(now.date()) and MARKET_OPEN <= now.time() < MARKET_CLOSE
+
+
+def next_market_open(now: Optional[datetime] = None) -> datetime:
+    """기준 시각 이후 가장 가까운 정규장 시작 시각 (장중이면 다음 거래일 시작)"""
+    now = now or datetime.now()
+    day = now.date()
+    if not (is_trading_day(day) and now.time() < MARKET_OPEN):
+        day += timedelta(days=1)
+        while not is_trading_day(day):
+            day += timedelta(days=1)
+    return datetime.combine(day, MARKET_OPEN)
+
+
+def trading_days_between(start: date, end: date) -> List[date]:
+    """start~end(양끝 포함) 사이의 거래일 목록"""
+    days: List[date] = []
+    current = start
+    while current <= end:
+        if is_trading_day(current):
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+def missing_trading_ranges(
+    existing: Iterable[date],
+    start: date,
+    end: date,
+) -> List[Tuple[date, date]]:
+    """
+    보유 중인 날짜와 비교해 누락된 거래일 구간을 연속 구간 단위로 반환
+
+    Args:
+        existing: 이미 보유한 날짜들
+        start: 확인 구간 시작일
+        end: 확인 구간 종료일
+
+    Returns:
+        [(구간 시작일, 구간 종료일), ...] - 각 구간은 연속된 누락 거래일
+    """
+    have = set(existing)
+    ranges: List[Tuple[date, date]] = []
+    range_start: Optional[date] = None
+    range_end: Optional[date] = None
+
+    for day in trading_days_between(start, end):
+        if day in have:
+            if range_start is not None:
+                ranges.append((range_start, range_end))
+                range_start = None
+            continue
+        if range_start is None:
+            range_start = day
+        range_end = day
+
+    if range_start is not None:
+        ranges.append((range_start, range_end))
+    return ranges
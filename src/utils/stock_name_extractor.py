@@ -1,7 +1,9 @@
 """
 종목명 추출 유틸리티
 
-Claude Haiku 4.5 LLM을 사용하여 사용자 쿼리에서 종목명을 정확하게 추출합니다.
+사용자 쿼리에서 종목명을 추출합니다.
+로컬 종목명 해석기(stocks 테이블 + 별칭/초성)로 먼저 찾고,
+찾지 못한 경우에만 Claude Haiku 4.5 LLM을 사용합니다.
 """
 import logging
 import re
@@ -15,7 +17,7 @@ logger = logging.getLogger(__name__)
 
 async def extract_stock_names_from_query(query: str) -> List[str]:
     """
-    사용자 쿼리에서 종목명을 추출합니다 (Claude 기반).
+    사용자 쿼리에서 종목명을 추출합니다 (로컬 해석기 → Claude 순).
 
     Args:
         query: 사용자 쿼리 (예: "sk 하이닉스 전망 분석해줘", "삼성전자와 SK하이닉스 비교해줘")
@@ -41,7 +43,20 @@ async def extract_stock_names_from_query(query: str) -> List[str]:
         logger.info(f"✅ [StockExtractor] 종목 코드 발견: {codes}")
         return codes
 
-    # 2. Claude LLM으로 종목명 추출
+    # 2. 로컬 종목명 해석기 (별칭/띄어쓰기/초성 포함, LLM 호출 없음)
+    from src.services.stock_name_resolver import stock_name_resolver
+
+    try:
+        matches = await stock_name_resolver.afind_in_text(query)
+    except Exception as e:
+        logger.warning(f"⚠️ [StockExtractor] 로컬 해석 실패, LLM으로 진행: {e}")
+        matches = []
+    if matches:
+        stock_names = list(dict.fromkeys(match.name for match in matches))
+        logger.info(f"✅ [StockExtractor] 로컬 매칭 성공: {stock_names}")
+        return stock_names
+
+    # 3. Claude LLM으로 종목명 추출
     try:
         llm = get_claude_llm(temperature=0, max_tokens=500)
 
@@ -12,6 +12,7 @@ from typing import Any, Dict, Optional
 
 from src.constants.kis_constants import INDEX_CODES
 from src.services.kis_service import kis_service
+from src.services.quote_service import quote_service
 
 logger = logging.getLogger(__name__)
 
@@ -42,8 +43,8 @@ async def get_stock_price(stock_code: str, stock_name: Optional[str] = None) ->
     logger.info(f"⚡ [Worker:StockPrice] 주가 조회: {stock_code} ({stock_name or 'Unknown'})")
 
     try:
-        # KIS Service로 실시간 시세 조회
-        price_data = await kis_service.get_stock_price(stock_code)
+        # KIS 현재가 (공유 캐시 경유, 동일 종목 동시 요청은 한 번만 호출)
+        price_data = await quote_service.get_quote(stock_code) or {}
 
         # 응답 포맷팅
         current_price = price_data.get("current_price", 0)
@@ -25,6 +25,10 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from langchain_core.messages import AIMessage
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # SQLAlchemy 로그를 완전히 비활성화 (ERROR만 표시)
 logging.getLogger('sqlalchemy.engine').setLevel(logging.ERROR)
@@ -324,6 +328,24 @@ def event_loop():
         loop.close()
 
 
+@compiles(BigInteger, "sqlite")
+def _sqlite_bigint(type_, compiler, **kw):
+    # SQLite는 INTEGER PRIMARY KEY만 자동 증가
+    return "INTEGER"
+
+
+@pytest.fixture
+def realtime_price_repository():
+    """SQLite 인메모리 realtime_prices Repository"""
+    from src.models.stock import RealtimePrice, Stock
+    from src.repositories.realtime_price_repository import RealtimePriceRepository
+
+    sqlite_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Stock.__table__.create(sqlite_engine)
+    RealtimePrice.__table__.create(sqlite_engine)
+    return RealtimePriceRepository(sessionmaker(bind=sqlite_engine, expire_on_commit=False))
+
+
 @pytest.fixture(autouse=True)
 def reset_llm_cache():
     """
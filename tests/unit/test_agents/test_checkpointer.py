@@ -0,0 +1,127 @@
+"""
+그래프 체크포인터 단위 테스트 (작은 StateGraph + SQLite 저장소)
+"""
+import operator
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.agents.checkpointer import BoundedMemorySaver, DatabaseCheckpointSaver, _CompactCheckpointSaver
+from src.models.graph_checkpoint import GraphCheckpoint, GraphCheckpointThread, GraphCheckpointWrite
+from src.repositories.graph_checkpoint_repository import GraphCheckpointRepository
+
+
+class _State(TypedDict):
+    steps: Annotated[List[str], operator.add]
+    prices: List[dict]
+
+
+def _graph(checkpointer):
+    builder = StateGraph(_State)
+    builder.add_node("fetch", lambda state: {"steps": ["fetch"], "prices": [{"close": 70000 + i} for i in range(500)]})
+    builder.add_node("approve", lambda state: {"steps": ["approve"]})
+    builder.add_edge(START, "fetch")
+    builder.add_edge("fetch", "approve")
+    builder.add_edge("approve", END)
+    return builder.compile(checkpointer=checkpointer, interrupt_before=["approve"])
+
+
+def _config(thread_id):
+    return {"configurable": {"thread_id": thread_id}}
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def repository():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for model in (GraphCheckpointThread, GraphCheckpoint, GraphCheckpointWrite):
+        model.__table__.create(engine)
+    return GraphCheckpointRepository(sessionmaker(bind=engine, expire_on_commit=False))
+
+
+class TestBoundedMemorySaver:
+    @pytest.mark.asyncio
+    async def test_interrupt_resume_and_compression(self):
+        saver = BoundedMemorySaver(compress_bytes=256)
+        graph = _graph(saver)
+
+        await graph.ainvoke({"steps": [], "prices": []}, _config("t1"))
+        assert (await graph.aget_state(_config("t1"))).next == ("approve",)
+
+        result = await graph.ainvoke(None, _config("t1"))
+        assert result["steps"] == ["fetch", "approve"]
+        assert len(result["prices"]) == 500
+
+        saved = saver._threads["t1"].checkpoints[""]
+        assert any(checkpoint[0].endswith("+zlib") for checkpoint, _, _ in saved.values())
+
+    def test_thread_cap_history_cap_and_ttl(self):
+        clock = _Clock()
+        saver = BoundedMemorySaver(max_threads=3, max_history=2, ttl_minutes=1, clock=clock, sweep_seconds=0)
+        graph = _graph(saver)
+
+        for idx in range(10):
+            graph.invoke({"steps": [], "prices": []}, _config(f"t{idx}"))
+            graph.invoke(None, _config(f"t{idx}"))
+
+        assert len(saver._threads) == 3
+        assert list(saver._threads) == ["t7", "t8", "t9"]
+        assert all(len(entry.checkpoints[""]) <= 2 for entry in saver._threads.values())
+        assert graph.get_state(_config("t9")).values["steps"] == ["fetch", "approve"]
+
+        clock.now += 30
+        graph.get_state(_config("t9"))  # 조회도 사용으로 간주 (REFRESH_ON_READ)
+        clock.now += 45
+        assert saver.sweep() == 2
+        assert list(saver._threads) == ["t9"]
+
+
+    def test_backend_must_implement_sweep(self):
+        class _NoSweep(_CompactCheckpointSaver):
+            pass
+
+        with pytest.raises(TypeError):
+            _NoSweep()
+
+
+class TestDatabaseCheckpointSaver:
+    @pytest.mark.asyncio
+    async def test_pending_interrupt_survives_restart(self, repository):
+        graph = _graph(DatabaseCheckpointSaver(repository, serialize=True, compress_bytes=256))
+        await graph.ainvoke({"steps": [], "prices": []}, _config("t1"))
+
+        # 새 인스턴스 = 재시작 후
+        restarted = _graph(DatabaseCheckpointSaver(repository, serialize=True))
+        assert (await restarted.aget_state(_config("t1"))).next == ("approve",)
+        result = await restarted.ainvoke(None, _config("t1"))
+
+        assert result["steps"] == ["fetch", "approve"]
+        history = [snapshot async for snapshot in restarted.aget_state_history(_config("t1"))]
+        assert len(history) == 4
+
+    def test_history_cap_and_expiry(self, repository):
+        saver = DatabaseCheckpointSaver(repository, serialize=True, max_history=2, ttl_minutes=0, sweep_seconds=0)
+        graph = _graph(saver)
+        graph.invoke({"steps": [], "prices": []}, _config("t1"))
+
+        rows = repository.list("t1", "", now=None)
+        assert rows == []  # TTL 0분 → 바로 만료
+        assert saver.sweep() == 1
+
+        saver = DatabaseCheckpointSaver(repository, serialize=True, max_history=2, sweep_seconds=0)
+        graph = _graph(saver)
+        graph.invoke({"steps": [], "prices": []}, _config("t2"))
+        graph.invoke(None, _config("t2"))
+        assert len(list(saver.list(_config("t2")))) == 2
+        assert graph.get_state(_config("t2")).values["steps"] == ["fetch", "approve"]
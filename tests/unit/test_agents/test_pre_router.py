@@ -0,0 +1,99 @@
+"""
+규칙 기반 사전 라우터 단위 테스트 (가짜 종목 사전, LLM 라우터 모킹)
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.agents.master import pre_router, routing_nodes
+from src.agents.master.pre_router import pre_route, routing_stats
+from src.services.stock_name_resolver import StockNameResolver
+
+
+def _stock(code, name, market_cap):
+    return SimpleNamespace(stock_code=code, stock_name=name, stock_name_en=None, market="KOSPI", market_cap=market_cap)
+
+
+class _Repository:
+    def list_by_market(self, market=None):
+        return [
+            _stock("005930", "삼성전자", 400_000_000_000_000),
+            _stock("000660", "SK하이닉스", 100_000_000_000_000),
+        ]
+
+
+@pytest.fixture(autouse=True)
+def resolver():
+    resolver = StockNameResolver(repository=_Repository())
+    resolver.load(_Repository().list_by_market())
+    routing_stats.reset()
+    with patch.object(pre_router, "stock_name_resolver", resolver):
+        yield resolver
+
+
+class TestPreRoute:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "query, path, expected",
+        [
+            ("삼성전자 현재가", "stock_price", {"worker_action": "stock_price", "stock_code": "005930"}),
+            ("삼전 주가 얼마야?", "stock_price", {"worker_action": "stock_price", "stock_code": "005930"}),
+            ("000660 시세 알려줘", "stock_price", {"worker_action": "stock_price", "stock_name": "SK하이닉스"}),
+            ("코스피 지수", "index_price", {"worker_action": "index_price", "worker_params": {"index_name": "코스피"}}),
+            ("코스닥 지금 얼마야", "index_price", {"worker_params": {"index_name": "코스닥"}}),
+            ("PER이 뭐야?", "glossary", {"worker_action": None, "agents_to_call": []}),
+            ("이평선 뜻", "glossary", {"worker_action": None}),
+            ("삼성전자 10주 매수해줘", "trade", {"agents_to_call": ["trading"], "stock_code": "005930"}),
+            ("SK하이닉스 5주 시장가로 매도", "trade", {"agents_to_call": ["trading"], "stock_code": "000660"}),
+            ("005930 3주 매수", "trade", {"agents_to_call": ["trading"], "stock_name": "삼성전자"}),
+        ],
+    )
+    async def test_confident_queries_skip_llm(self, query, path, expected):
+        result = await pre_route(query)
+
+        assert result is not None and result.path == path
+        for key, value in expected.items():
+            assert result.update[key] == value
+        assert result.update["routing_decision"]["pre_routed"] is True
+        if path == "glossary":
+            assert result.update["direct_answer"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "삼성전자 분석해줘",
+            "삼성전자 주가 전망 어때?",
+            "삼성전자 PER 얼마야",
+            "삼성전자 SK하이닉스 현재가",
+            "삼성전자 매수할까?",
+            "삼성 10주 매수",
+            "삼성 사줘",
+            "삼전 5주 매도해줘",
+            "코스피 전망",
+            "PER이랑 PBR 차이가 뭐야?",
+            "내 포트폴리오 리밸런싱해줘",
+        ],
+    )
+    async def test_uncertain_queries_fall_through(self, query):
+        assert await pre_route(query) is None
+
+
+class TestRoutingNode:
+    @pytest.mark.asyncio
+    async def test_counts_pre_routed_and_llm_paths(self):
+        llm_update = {"agents_to_call": ["research"], "stock_code": "005930"}
+        with patch.object(routing_nodes, "_route_with_llm", new=AsyncMock(return_value=llm_update)) as llm_route:
+            first = await routing_nodes.routing_node({"query": "삼성전자 현재가"})
+            second = await routing_nodes.routing_node({"query": "삼성전자 분석해줘"})
+
+        assert first["worker_action"] == "stock_price"
+        assert second == llm_update
+        llm_route.assert_awaited_once()
+
+        assert routing_nodes.determine_routing_path(first) == "worker_dispatch"
+        stats = routing_stats.stats()
+        assert stats["total"] == 2
+        assert stats["llm_skipped"] == 1
+        assert set(stats["paths"]) == {"stock_price", "llm"}
@@ -0,0 +1,118 @@
+"""
+Research data_worker_node 병렬 수집 단위 테스트 (외부 소스 모킹)
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.agents.research import nodes
+from src.agents.research.nodes import data_worker_node, technical_analyst_worker_node
+from src.utils.blob_store import blob_store, is_blob_handle, resolve_blob
+
+
+def _price_df():
+    index = pd.bdate_range("2025-01-02", periods=30)
+    closes = np.linspace(70000, 72000, len(index))
+    return pd.DataFrame(
+        {"Open": closes, "High": closes, "Low": closes, "Close": closes, "Volume": 1_000_000},
+        index=index,
+    )
+
+
+def _delayed(value, delay):
+    async def _fn(*args, **kwargs):
+        await asyncio.sleep(delay)
+        return value
+    return _fn
+
+
+@pytest.fixture
+def sources():
+    """각 소스가 0.2초씩 걸리는 환경 (순차 실행 시 1초 이상)"""
+    market_df = pd.DataFrame({"Close": [2500.0, 2510.0]})
+    with patch.object(nodes.stock_data_service, "get_stock_price", new=_delayed(_price_df(), 0.2)), \
+            patch.object(nodes.stock_data_service, "get_fundamental_data", new=_delayed({"PER": 12.0, "PBR": 1.1}, 0.2)), \
+            patch.object(nodes.stock_data_service, "get_market_cap_data", new=_delayed({"market_cap": 1}, 0.2)), \
+            patch.object(nodes.stock_data_service, "get_market_index", new=_delayed(market_df, 0.2)), \
+            patch.object(nodes.dart_service, "search_corp_code_by_stock_code", new=_delayed("00126380", 0.2)), \
+            patch.object(nodes.dart_service, "get_financial_statement", new=_delayed([], 0.2)), \
+            patch.object(nodes.dart_service, "get_company_info", new=_delayed({"corp_name": "삼성전자"}, 0.2)):
+        yield
+
+
+class TestDataWorkerNode:
+    @pytest.mark.asyncio
+    async def test_sources_are_collected_concurrently(self, sources):
+        started = time.monotonic()
+        result = await data_worker_node({"stock_code": "005930"})
+        elapsed = time.monotonic() - started
+
+        # 가장 긴 의존 체인(DART: 고유번호 → 재무제표/개황) 기준
+        assert elapsed < 0.7
+        assert result["fundamental_data"]["PER"] == 12.0
+        assert result["company_data"]["corp_code"] == "00126380"
+        assert result["market_index_data"]["current"] == 2510.0
+        assert set(result["data_sources"].values()) == {"ok"}
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_are_kept_out_of_state(self, sources):
+        result = await data_worker_node({"stock_code": "005930"})
+        again = await data_worker_node({"stock_code": "005930"})
+
+        handle = result["price_data"]["prices"]
+        assert is_blob_handle(handle)
+        assert handle == again["price_data"]["prices"]  # 같은 내용 → 같은 핸들
+        assert len(await resolve_blob(handle)) == 30
+        assert await resolve_blob(result["financial_data"]["statements"]) == {}
+        assert await resolve_blob({"$blob": "missing"}, default=[]) == []
+
+    @pytest.mark.asyncio
+    async def test_handles_resolve_after_cache_loss(self, sources):
+        result = await data_worker_node({"stock_code": "005930"})
+        blob_store._cache.clear()  # 다른 워커에서 재개/재시작/LRU 축출
+
+        handle = result["price_data"]["prices"]
+        assert handle["ref"] == {"stock_code": "005930", "days": nodes.PRICE_HISTORY_DAYS}
+        records = await resolve_blob(handle)
+        assert len(records) == 30
+        assert await resolve_blob(result["financial_data"]["statements"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_technical_analyst_reads_price_records(self, sources):
+        state = await data_worker_node({"stock_code": "005930"})
+        blob_store._cache.clear()
+        llm = SimpleNamespace(ainvoke=AsyncMock(return_value=SimpleNamespace(content='{"trend": "상승추세"}')))
+
+        with patch.object(nodes, "get_llm", return_value=llm):
+            result = await technical_analyst_worker_node({**state, "stock_code": "005930"})
+
+        prompt = llm.ainvoke.await_args.args[0]
+        assert "최근 일봉" in prompt
+        assert "종가 72,000" in prompt
+        assert result["technical_analysis"]["trend"] == "상승추세"
+
+    @pytest.mark.asyncio
+    async def test_slow_source_returns_partial_result(self, sources):
+        timeouts = {**nodes.DATA_SOURCE_TIMEOUTS, "dart": 0.3}
+        with patch.dict(nodes.DATA_SOURCE_TIMEOUTS, timeouts), \
+                patch.object(nodes.dart_service, "get_company_info", new=_delayed({}, 5)):
+            started = time.monotonic()
+            result = await data_worker_node({"stock_code": "005930"})
+
+        assert time.monotonic() - started < 0.7
+        assert result["data_sources"]["dart"] == "timeout"
+        assert result["financial_data"] is None
+        assert result["price_data"]["latest_close"] == pytest.approx(72000.0)
+        assert "error" not in result
+
+    @pytest.mark.asyncio
+    async def test_price_failure_is_an_error(self, sources):
+        with patch.object(nodes.stock_data_service, "get_stock_price", new=_delayed(None, 0)):
+            result = await data_worker_node({"stock_code": "005930"})
+
+        assert "주가 데이터 조회 실패" in result["error"]
@@ -0,0 +1,153 @@
+"""
+Research 서브그래프 병렬 worker 실행 단위 테스트 (LLM/외부 소스 없이 worker 모킹)
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.agents.research import graph as research_graph
+from src.agents.research.nodes import _task_complete, task_router_node
+
+
+def _task(idx, worker):
+    return {"id": f"task_{idx}", "worker": worker, "description": worker}
+
+
+COMPREHENSIVE_PLAN = [
+    _task(1, "data"),
+    _task(2, "technical"),
+    _task(3, "trading_flow"),
+    _task(4, "information"),
+    _task(5, "macro"),
+    _task(6, "bull"),
+    _task(7, "bear"),
+    _task(8, "insight"),
+]
+
+
+class TestTaskRouter:
+    def test_data_runs_alone_first(self):
+        result = task_router_node({"pending_tasks": COMPREHENSIVE_PLAN, "analysis_depth": "comprehensive"})
+
+        assert [task["worker"] for task in result["ready_tasks"]] == ["data"]
+        assert len(result["pending_tasks"]) == 7
+
+    def test_independent_workers_are_batched_up_to_depth_cap(self):
+        state = {
+            "pending_tasks": COMPREHENSIVE_PLAN[1:],
+            "completed_tasks": [{**COMPREHENSIVE_PLAN[0], "status": "done"}],
+            "analysis_depth": "comprehensive",
+        }
+        result = task_router_node(state)
+
+        assert [task["worker"] for task in result["ready_tasks"]] == [
+            "technical", "trading_flow", "information", "macro", "bull", "bear",
+        ]
+        # insight는 bull/bear/macro 완료 후
+        assert [task["worker"] for task in result["pending_tasks"]] == ["insight"]
+
+        quick = task_router_node({**state, "analysis_depth": "quick"})
+        assert len(quick["ready_tasks"]) == 2
+
+    def test_unplanned_dependencies_are_not_awaited(self):
+        result = task_router_node({"pending_tasks": [_task(1, "bull"), _task(2, "insight")]})
+
+        assert [task["worker"] for task in result["ready_tasks"]] == ["bull"]
+
+        result = task_router_node({"pending_tasks": [_task(1, "insight")]})
+        assert [task["worker"] for task in result["ready_tasks"]] == ["insight"]
+
+
+def _fake_worker(delay):
+    async def _worker(state):
+        await asyncio.sleep(delay)
+        task = state["current_task"]
+        return _task_complete(state, task, f"{task['worker']} 완료", {})
+    return _worker
+
+
+class TestParallelSubgraph:
+    @pytest.mark.asyncio
+    async def test_comprehensive_plan_runs_in_three_waves(self):
+        async def _classifier(state):
+            return {"analysis_depth": "comprehensive"}
+
+        async def _planner(state):
+            return {
+                "pending_tasks": list(COMPREHENSIVE_PLAN),
+                "ready_tasks": [],
+                "completed_tasks": None,
+                "task_notes": None,
+                "current_task": None,
+            }
+
+        async def _synthesis(state):
+            return {"consensus": {"workers": [task["worker"] for task in state["completed_tasks"]]}}
+
+        worker_patches = {
+            name: _fake_worker(0.2)
+            for name in (
+                "data_worker_node",
+                "technical_analyst_worker_node",
+                "trading_flow_analyst_worker_node",
+                "information_analyst_worker_node",
+                "macro_worker_node",
+                "bull_worker_node",
+                "bear_worker_node",
+                "insight_worker_node",
+            )
+        }
+        with patch.multiple(
+            research_graph,
+            query_intent_classifier_node=_classifier,
+            planner_node=_planner,
+            synthesis_node=_synthesis,
+            **worker_patches,
+        ):
+            app = research_graph.build_research_subgraph()
+
+        started = time.monotonic()
+        result = await app.ainvoke({"completed_tasks": [{"id": "old", "worker": "old"}]})
+        elapsed = time.monotonic() - started
+
+        # data → 6개 병렬 → insight (순차 실행이면 1.6초)
+        assert elapsed < 1.0
+        workers = result["consensus"]["workers"]
+        assert len(workers) == 8
+        assert workers[0] == "data" and workers[-1] == "insight"
+        assert len(result["task_notes"]) == 8
+
+    @pytest.mark.asyncio
+    async def test_failed_data_worker_skips_remaining_workers(self):
+        async def _classifier(state):
+            return {"analysis_depth": "comprehensive", "query": "삼성전자 분석"}
+
+        async def _planner(state):
+            return {
+                "pending_tasks": list(COMPREHENSIVE_PLAN),
+                "ready_tasks": [],
+                "completed_tasks": None,
+                "task_notes": None,
+                "current_task": None,
+            }
+
+        async def _failing_data_worker(state):
+            return {"error": "주가 데이터 조회 실패", "current_task": None}
+
+        # 나머지 worker/synthesis는 실제 노드의 오류 시 조기 종료 경로를 그대로 사용
+        with patch.multiple(
+            research_graph,
+            query_intent_classifier_node=_classifier,
+            planner_node=_planner,
+            data_worker_node=_failing_data_worker,
+        ):
+            app = research_graph.build_research_subgraph()
+
+        result = await app.ainvoke({"query": "삼성전자 분석"})
+
+        assert result["error"] == "주가 데이터 조회 실패"
+        assert result["pending_tasks"] == []
+        assert not result.get("completed_tasks")
+        assert result["query"] == "삼성전자 분석"
@@ -0,0 +1,103 @@
+"""
+ChatHistoryService 단위 테스트 (SQLite 인메모리 DB)
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.models.chat import ChatMessage, ChatSession
+from src.services.chat_history_service import ChatHistoryService
+
+USER_ID = uuid.UUID("3e9a1c52-7d4b-4f0e-9a6c-1b2d3e4f5a6b")
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    for model in (ChatSession, ChatMessage):
+        model.__table__.create(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False)
+
+
+async def _conversation(service, messages):
+    conversation_id = uuid.uuid4()
+    await service.upsert_session(conversation_id=conversation_id, user_id=USER_ID)
+    for role, content in messages:
+        await service.append_message(conversation_id=conversation_id, role=role, content=content)
+    return conversation_id
+
+
+class TestChatHistoryService:
+    @pytest.mark.asyncio
+    async def test_tail_window_and_keyset_pages(self, session_factory):
+        service = ChatHistoryService(session_factory)
+        conversation_id = await _conversation(
+            service, [("user" if idx % 2 == 0 else "assistant", f"m{idx}") for idx in range(10)]
+        )
+        # SQLite CURRENT_TIMESTAMP는 초 단위라 시각을 명시적으로 분리
+        base = datetime(2026, 1, 5, 9, 0)
+        with session_factory() as session:
+            for message in session.query(ChatMessage).all():
+                message.created_at = base + timedelta(minutes=int(message.content[1:]))
+            session.commit()
+
+        latest = await service.get_history(conversation_id=conversation_id, limit=4)
+        assert [msg.content for msg in latest["messages"]] == ["m6", "m7", "m8", "m9"]
+        assert latest["has_more"] is True
+
+        older = await service.get_history(
+            conversation_id=conversation_id, limit=4, before=latest["next_before"]
+        )
+        assert [msg.content for msg in older["messages"]] == ["m2", "m3", "m4", "m5"]
+
+        oldest = await service.get_history(
+            conversation_id=conversation_id, limit=4, before=older["next_before"]
+        )
+        assert [msg.content for msg in oldest["messages"]] == ["m0", "m1"]
+        assert oldest["has_more"] is False
+        assert oldest["next_before"] is None
+
+    @pytest.mark.asyncio
+    async def test_pages_do_not_skip_messages_sharing_a_timestamp(self, session_factory):
+        service = ChatHistoryService(session_factory)
+        conversation_id = await _conversation(service, [("user", f"m{idx}") for idx in range(7)])
+        same_second = datetime(2026, 1, 5, 9, 0)
+        with session_factory() as session:
+            for message in session.query(ChatMessage).all():
+                message.created_at = same_second
+            session.commit()
+
+        seen = []
+        before = None
+        while True:
+            page = await service.get_history(conversation_id=conversation_id, limit=3, before=before)
+            seen = [msg.message_id for msg in page["messages"]] + seen
+            if not page["has_more"]:
+                break
+            before = page["next_before"]
+
+        assert len(seen) == len(set(seen)) == 7
+
+    @pytest.mark.asyncio
+    async def test_session_summary_columns_maintained_on_append(self, session_factory):
+        service = ChatHistoryService(session_factory)
+        await _conversation(service, [])
+        conversation_id = await _conversation(
+            service,
+            [("system", "안내"), ("user", "삼성전자 분석해줘"), ("assistant", "분석 결과"), ("user", "매수할까?")],
+        )
+
+        summaries = await service.list_sessions(user_id=USER_ID)
+        summary = next(item for item in summaries if item["conversation_id"] == conversation_id)
+        assert summary["message_count"] == 4
+        assert summary["first_user_message"] == "삼성전자 분석해줘"
+        assert summary["last_message"] == "매수할까?"
+        assert await service.count_sessions(user_id=USER_ID) == 2
+
+        empty = next(item for item in summaries if item["conversation_id"] != conversation_id)
+        assert empty["message_count"] == 0
+        assert empty["first_user_message"] is None
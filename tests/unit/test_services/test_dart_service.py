@@ -0,0 +1,123 @@
+"""
+DARTService 고유번호 매핑 캐시 단위 테스트
+"""
+import asyncio
+import json
+import zipfile
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.dart_service import DARTService, parse_corp_code_zip
+
+CORPCODE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<result>
+    <list><corp_code>00126380</corp_code><corp_name>삼성전자</corp_name><stock_code>005930</stock_code></list>
+    <list><corp_code>00164779</corp_code><corp_name>SK하이닉스</corp_name><stock_code>000660</stock_code></list>
+    <list><corp_code>00999999</corp_code><corp_name>비상장사</corp_name><stock_code> </stock_code></list>
+</result>
+"""
+
+
+def _write_zip(path):
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("CORPCODE.xml", CORPCODE_XML)
+    return str(path)
+
+
+def _cache(mapping, hours_ago=0):
+    return {
+        "fetched_at": (datetime.now() - timedelta(hours=hours_ago)).isoformat(),
+        "etag": '"v1"',
+        "last_modified": None,
+        "mapping": mapping,
+    }
+
+
+class TestCorpCodeMapping:
+    def test_parse_zip_keeps_listed_companies_only(self, tmp_path):
+        mapping = parse_corp_code_zip(_write_zip(tmp_path / "corp.zip"))
+
+        assert mapping == {"005930": "00126380", "000660": "00164779"}
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_is_loaded_once_without_download(self, tmp_path):
+        cache_path = tmp_path / "corp_codes.json"
+        cache_path.write_text(json.dumps(_cache({"005930": "00126380"})))
+        service = DARTService(corp_code_cache_path=str(cache_path))
+
+        with patch.object(service, "_download_and_parse_corp_code_mapping", new=AsyncMock()) as mock_download, \
+                patch.object(service, "_load_corp_code_cache", wraps=service._load_corp_code_cache) as mock_load:
+            assert await service.search_corp_code_by_stock_code("005930") == "00126380"
+            assert await service.search_corp_code_by_stock_code("000660") is None
+
+        mock_download.assert_not_awaited()
+        assert mock_load.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cold_start_downloads_and_persists(self, tmp_path):
+        cache_path = tmp_path / "corp_codes.json"
+        service = DARTService(corp_code_cache_path=str(cache_path))
+        service.api_key = "key"
+
+        def fake_download(headers):
+            return _write_zip(tmp_path / "download.zip"), {"etag": '"v1"', "last_modified": None}
+
+        with patch.object(service, "_download_corp_code_zip", side_effect=fake_download):
+            assert await service.search_corp_code_by_stock_code("000660") == "00164779"
+
+        saved = json.loads(cache_path.read_text())
+        assert saved["mapping"]["005930"] == "00126380"
+        assert saved["etag"] == '"v1"'
+        assert not (tmp_path / "download.zip").exists()
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_refreshes_in_background_with_conditional_request(self, tmp_path):
+        cache_path = tmp_path / "corp_codes.json"
+        cache_path.write_text(json.dumps(_cache({"005930": "00126380"}, hours_ago=48)))
+        service = DARTService(corp_code_cache_path=str(cache_path))
+        service.api_key = "key"
+        seen_headers = []
+
+        def not_modified(headers):
+            seen_headers.append(headers)
+            return None
+
+        with patch.object(service, "_download_corp_code_zip", side_effect=not_modified):
+            # 오래된 캐시도 즉시 반환하고 갱신은 백그라운드에서 진행
+            assert await service.search_corp_code_by_stock_code("005930") == "00126380"
+            await asyncio.wait_for(service._refresh_task, timeout=1)
+
+        assert seen_headers == [{"If-None-Match": '"v1"'}]
+        assert not service._corp_codes_stale()
+        assert service._corp_codes == {"005930": "00126380"}
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_backs_off(self, tmp_path):
+        cache_path = tmp_path / "corp_codes.json"
+        cache_path.write_text(json.dumps(_cache({"005930": "00126380"}, hours_ago=48)))
+        service = DARTService(corp_code_cache_path=str(cache_path))
+        service.api_key = "key"
+
+        with patch.object(service, "_download_corp_code_zip", side_effect=OSError("timeout")) as mock_download:
+            assert await service.search_corp_code_by_stock_code("005930") == "00126380"
+            await asyncio.wait_for(service._refresh_task, timeout=1)
+            # 실패 직후 요청들은 다시 다운로드하지 않음
+            assert await service.search_corp_code_by_stock_code("005930") == "00126380"
+            assert await service.search_corp_code_by_stock_code("005930") == "00126380"
+
+        assert mock_download.call_count == 1
+        assert service._refresh_task.done()
+
+    def test_mapping_lock_works_across_event_loops(self, tmp_path):
+        cache_path = tmp_path / "corp_codes.json"
+        cache_path.write_text(json.dumps(_cache({"005930": "00126380"})))
+
+        async def contended(service):
+            return await asyncio.gather(service.get_corp_code_mapping(), service.get_corp_code_mapping())
+
+        service = DARTService(corp_code_cache_path=str(cache_path))
+        assert asyncio.run(contended(service))[0] == {"005930": "00126380"}
+        service._corp_codes = None  # 다른 루프에서 다시 적재
+        assert asyncio.run(contended(service))[1] == {"005930": "00126380"}
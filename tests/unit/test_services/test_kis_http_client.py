@@ -0,0 +1,188 @@
+"""
+KISService HTTP 클라이언트 단위 테스트 (재시도/커넥션 재사용)
+"""
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.services.kis_service import KISAPIError, KISOrderStatusUnknownError, KISService
+
+
+def _service_with_transport(handler):
+    service = KISService(app_key="key", app_secret="secret", account_number="12345678-01")
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    service._get_client = lambda: client
+    return service, client
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff():
+    with patch("src.services.kis_service._backoff_delay", return_value=0.0), \
+            patch("src.services.kis_service.RateLimiter.acquire"):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _fixed_token():
+    async def _token(self):
+        return "token"
+
+    with patch.object(KISService, "_get_access_token", _token):
+        yield
+
+
+class TestKISHttpClient:
+    @pytest.mark.asyncio
+    async def test_retries_server_error_then_succeeds(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) < 3:
+                return httpx.Response(500, text="busy")
+            return httpx.Response(200, json={"rt_cd": "0", "output": {"ok": True}})
+
+        service, _ = _service_with_transport(handler)
+        result = await service._api_call("/path", "TR0001")
+
+        assert result["output"] == {"ok": True}
+        assert len(calls) == 3
+        assert calls[-1].headers["tr_id"] == "TR0001"
+
+    @pytest.mark.asyncio
+    async def test_retries_throttle_msg_code(self):
+        responses = [
+            httpx.Response(200, json={"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."}),
+            httpx.Response(200, json={"rt_cd": "0"}),
+        ]
+        service, _ = _service_with_transport(lambda request: responses.pop(0))
+
+        result = await service._api_call("/path", "TR0001")
+
+        assert result["rt_cd"] == "0"
+        assert not responses
+
+    @pytest.mark.asyncio
+    async def test_business_error_is_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"rt_cd": "1", "msg_cd": "APBK0919", "msg1": "invalid"})
+
+        service, _ = _service_with_transport(handler)
+        with pytest.raises(KISAPIError):
+            await service._api_call("/path", "TR0001")
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        service, _ = _service_with_transport(handler)
+        with patch("src.services.kis_service.settings.KIS_HTTP_MAX_RETRIES", 2):
+            with pytest.raises(KISAPIError):
+                await service._api_call("/path", "TR0001")
+
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "outcome, expected",
+        [
+            (httpx.ReadTimeout("timed out"), KISOrderStatusUnknownError),
+            (httpx.Response(500, text="busy"), KISOrderStatusUnknownError),
+            (
+                httpx.Response(200, json={"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."}),
+                KISAPIError,
+            ),
+        ],
+    )
+    async def test_order_is_never_resent_after_delivery(self, outcome, expected):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        service, _ = _service_with_transport(handler)
+        with pytest.raises(expected):
+            await service.place_order("005930", "BUY", 1, price=70000)
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_order_retries_connect_error_before_send(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json={"rt_cd": "0", "output": {"ODNO": "0001", "ORD_TMD": "090000"}})
+
+        service, _ = _service_with_transport(handler)
+        result = await service.place_order("005930", "BUY", 1, price=70000)
+
+        assert result["order_no"] == "0001"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared_within_loop(self):
+        service = KISService(app_key="key", app_secret="secret")
+
+        first = service._get_client()
+        assert service._get_client() is first
+
+        await service.close()
+        assert first.is_closed
+        assert service._get_client() is not first
+        await service.close()
+
+
+class TestKISBulkQuotes:
+    @pytest.mark.asyncio
+    async def test_real_env_uses_multi_price_tr_in_chunks(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            params = request.url.params
+            codes = [params[f"FID_INPUT_ISCD_{idx}"] for idx in range(1, 31) if f"FID_INPUT_ISCD_{idx}" in params]
+            output = [{"inter_shrn_iscd": code, "inter2_prpr": "1000", "prdy_ctrt": "1.5"} for code in codes]
+            return httpx.Response(200, json={"rt_cd": "0", "output": output})
+
+        service = KISService(app_key="key", app_secret="secret", env="real")
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service._get_client = lambda: client
+
+        codes = [f"{idx:06d}" for idx in range(45)]
+        quotes = await service.get_stock_prices(codes)
+
+        assert len(calls) == 2
+        assert all(call.headers["tr_id"] == "FHKST11300006" for call in calls)
+        assert set(quotes) == set(codes)
+        assert quotes["000001"]["current_price"] == 1000
+        assert quotes["000001"]["partial"] is True
+
+    @pytest.mark.asyncio
+    async def test_demo_env_fans_out_single_quotes(self):
+        def handler(request):
+            code = request.url.params["FID_INPUT_ISCD"]
+            if code == "000002":
+                return httpx.Response(200, json={"rt_cd": "1", "msg1": "없는 종목"})
+            return httpx.Response(200, json={"rt_cd": "0", "output": {"stck_prpr": "500"}})
+
+        service, _ = _service_with_transport(handler)
+        quotes = await service.get_stock_prices(["000001", "000002", "000003"])
+
+        assert set(quotes) == {"000001", "000003"}
+        assert quotes["000003"]["current_price"] == 500
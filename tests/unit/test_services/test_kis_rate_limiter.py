@@ -0,0 +1,87 @@
+"""
+KIS RateLimiter 단위 테스트 (토큰 버킷 + 우선순위 대기열)
+"""
+import asyncio
+import time
+
+import pytest
+
+from src.services.kis_service import Priority, RateLimiter, call_priority
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_burst_is_granted_immediately(self):
+        limiter = RateLimiter(calls_per_second=10, burst=3)
+
+        started = time.monotonic()
+        for _ in range(3):
+            await limiter.acquire()
+
+        assert time.monotonic() - started < 0.05
+        assert limiter.stats()["lanes"]["interactive"]["granted"] == 3
+
+    @pytest.mark.asyncio
+    async def test_calls_are_spaced_by_rate(self):
+        limiter = RateLimiter(calls_per_second=20, burst=1)
+
+        started = time.monotonic()
+        for _ in range(4):
+            await limiter.acquire()
+
+        # 첫 호출은 즉시, 이후 3회는 0.05초 간격
+        assert time.monotonic() - started >= 0.14
+
+    @pytest.mark.asyncio
+    async def test_interactive_preempts_queued_background(self):
+        limiter = RateLimiter(calls_per_second=20, burst=1)
+        await limiter.acquire()  # 버킷 비우기
+        order = []
+
+        async def call(name, priority):
+            await limiter.acquire(priority=priority)
+            order.append(name)
+
+        background = [
+            asyncio.create_task(call(f"bg{i}", Priority.BACKGROUND)) for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(call("user", Priority.INTERACTIVE))
+        await asyncio.gather(*background, interactive)
+
+        assert order[0] == "user"
+        assert limiter.stats()["max_queue_depth"] == 4
+
+    @pytest.mark.asyncio
+    async def test_call_priority_context(self):
+        limiter = RateLimiter(calls_per_second=100, burst=1)
+
+        with call_priority(Priority.BACKGROUND):
+            await limiter.acquire()
+        await limiter.acquire()
+
+        lanes = limiter.stats()["lanes"]
+        assert lanes["background"]["granted"] == 1
+        assert lanes["interactive"]["granted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_tr_id_budget_does_not_block_other_tr_ids(self):
+        limiter = RateLimiter(calls_per_second=100, burst=5, tr_id_limits={"SLOW": 1})
+        await limiter.acquire("SLOW")
+        order = []
+
+        async def call(tr_id):
+            await limiter.acquire(tr_id)
+            order.append(tr_id)
+
+        slow = asyncio.create_task(call("SLOW"))
+        await asyncio.sleep(0)
+        fast = asyncio.create_task(call("FAST"))
+        await asyncio.wait_for(fast, timeout=0.5)
+
+        assert order == ["FAST"]
+        assert not slow.done()
+        slow.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await slow
+        assert limiter.stats()["queue_depth"] == 0
@@ -0,0 +1,90 @@
+"""
+KIS 토큰 공유 저장소 단위 테스트
+"""
+import asyncio
+import os
+import stat
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.services.kis_service import KISService
+from src.services.kis_token_store import FileTokenStore, TokenRecord, token_key
+
+
+def _record(token: str, hours: float = 24) -> TokenRecord:
+    return TokenRecord(access_token=token, expires_at=datetime.now() + timedelta(hours=hours))
+
+
+def _service(store: FileTokenStore) -> KISService:
+    return KISService(app_key="key", app_secret="secret", token_store=store)
+
+
+class TestFileTokenStore:
+    def test_round_trip_and_permissions(self, tmp_path):
+        store = FileTokenStore(str(tmp_path / "tokens.json"))
+        key = token_key("demo", "key")
+
+        store.save(key, _record("abc"))
+        loaded = store.load(key)
+
+        assert loaded.access_token == "abc"
+        assert loaded.is_valid(3600)
+        assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+        assert "key" not in key.split(":", 1)[1]
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "tokens.json"
+        path.write_text("{not json")
+
+        assert FileTokenStore(str(path)).load("demo:x") is None
+
+
+class TestSharedAccessToken:
+    @pytest.mark.asyncio
+    async def test_workers_share_one_issued_token(self, tmp_path):
+        store_path = str(tmp_path / "tokens.json")
+        issued = []
+
+        async def fake_issue(self):
+            issued.append(self)
+            await asyncio.sleep(0.05)
+            return _record(f"token-{len(issued)}")
+
+        workers = [_service(FileTokenStore(store_path)) for _ in range(3)]
+        with patch.object(KISService, "_issue_access_token", fake_issue):
+            tokens = await asyncio.gather(*(w._get_access_token() for w in workers))
+
+        assert len(issued) == 1
+        assert set(tokens) == {"token-1"}
+
+    @pytest.mark.asyncio
+    async def test_refresh_ahead_issues_new_token(self, tmp_path):
+        store = FileTokenStore(str(tmp_path / "tokens.json"))
+        store.save(token_key("demo", "key"), _record("old", hours=0.5))
+        service = _service(store)
+
+        async def fake_issue(self):
+            return _record("new")
+
+        with patch.object(KISService, "_issue_access_token", fake_issue):
+            assert await service._get_access_token() == "old"
+            assert await service._get_access_token(min_remaining=3600) == "new"
+
+        assert store.load(token_key("demo", "key")).access_token == "new"
+
+    def test_token_lock_works_across_event_loops(self, tmp_path):
+        service = _service(FileTokenStore(str(tmp_path / "tokens.json")))
+
+        async def fake_issue(self):
+            await asyncio.sleep(0.01)
+            return _record("expired", hours=0)
+
+        async def contended():
+            return await asyncio.gather(service._get_access_token(), service._get_access_token())
+
+        with patch.object(KISService, "_issue_access_token", fake_issue):
+            # 시드 스크립트/워커처럼 asyncio.run을 여러 번 호출해도 잠금이 이전 루프에 묶이지 않아야 함
+            assert asyncio.run(contended()) == ["expired", "expired"]
+            assert asyncio.run(contended()) == ["expired", "expired"]
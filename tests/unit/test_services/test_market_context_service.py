@@ -0,0 +1,149 @@
+"""
+공유 시장 컨텍스트 서비스 단위 테스트 (외부 데이터/LLM 모킹)
+"""
+import importlib
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.agents.strategy.market_analyzer import market_analyzer
+from src.agents.strategy.risk_stance import risk_stance_analyzer
+from src.models.macro import MarketContextSnapshot
+from src.repositories.market_context_repository import MarketContextRepository
+from src.schemas.strategy import AssetAllocation
+from src.services.market_context_service import MarketContextService
+
+# src.services 패키지가 같은 이름의 싱글톤을 re-export하므로 모듈은 직접 가져옴
+module = importlib.import_module("src.services.market_context_service")
+
+
+class _MemoryRepository:
+    def __init__(self):
+        self.rows = {}
+
+    def get(self, version):
+        return self.rows.get(version)
+
+    def latest(self):
+        return list(self.rows.values())[-1] if self.rows else None
+
+    def save(self, version, payload):
+        return self.rows.setdefault(version, payload)
+
+
+def _index_df(last_close=2500.0):
+    index = pd.bdate_range("2026-07-01", periods=40)
+    closes = np.linspace(2400, last_close, len(index))
+    return pd.DataFrame({"Close": closes}, index=index)
+
+
+@pytest.fixture
+def inputs():
+    state = {"index": _index_df(), "base_rate_date": "2026-09-01"}
+    macro = {"base_rate": Decimal("2.50"), "base_rate_trend": "유지", "cpi": Decimal("115.2"),
+             "cpi_yoy": 2.1, "exchange_rate": Decimal("1380.5")}
+
+    def _snapshot():
+        return {"base_rate_date": state["base_rate_date"], "cpi_date": "2026-09-01", "usdkrw_date": "2026-10-15"}
+
+    async def _index(*args, **kwargs):
+        return state["index"]
+
+    cycle = {"cycle": "mid_bull_market", "confidence": 0.7, "summary": "강세 지속", "key_factors": []}
+    allocation = AssetAllocation(stocks=Decimal("0.70"), cash=Decimal("0.30"), rationale="균형")
+
+    with patch.object(module.macro_data_service, "macro_summary", return_value=macro), \
+            patch.object(module.macro_data_service, "latest_snapshot", side_effect=_snapshot), \
+            patch.object(module.stock_data_service, "get_market_index", new=_index), \
+            patch.object(module, "last_closed_session", return_value=pd.Timestamp("2026-12-31").date()), \
+            patch.object(market_analyzer, "analyze_cycle", new=AsyncMock(return_value=cycle)) as analyze, \
+            patch.object(risk_stance_analyzer, "compute_allocation", new=AsyncMock(return_value=allocation)) as allocate:
+        yield {"state": state, "analyze": analyze, "allocate": allocate}
+
+
+class TestMarketContextService:
+    @pytest.mark.asyncio
+    async def test_context_is_built_once_per_data_vintage(self, inputs):
+        service = MarketContextService(repository=_MemoryRepository())
+
+        first = await service.ensure_current()
+        second = await service.ensure_current()
+
+        assert first is second
+        assert inputs["analyze"].await_count == 1
+        assert inputs["allocate"].await_count == 3
+        assert set(first["allocations"]) == {"conservative", "moderate", "aggressive"}
+        assert first["macro"]["base_rate"] == 2.5
+
+        inputs["state"]["base_rate_date"] = "2026-10-01"
+        third = await service.ensure_current()
+        assert third["version"] != first["version"]
+        assert inputs["analyze"].await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_cycle_is_not_persisted(self, inputs):
+        repository = _MemoryRepository()
+        service = MarketContextService(repository=repository)
+        fallback = {"cycle": "consolidation", "confidence": 0.6, "summary": "상위 5개 섹터 중 2개 상승",
+                    "key_factors": ["섹터 성과 기반 판단"], "fallback": True}
+        inputs["analyze"].return_value = fallback
+
+        provisional = await service.ensure_current()
+
+        assert provisional["market_cycle"]["cycle"] == "consolidation"
+        assert repository.rows == {}
+        assert await service.get_context() is provisional
+
+        # 같은 기준일이어도 다음 확인 때 다시 생성해 저장
+        inputs["analyze"].return_value = {"cycle": "mid_bull_market", "confidence": 0.7,
+                                          "summary": "강세 지속", "key_factors": []}
+        context = await service.ensure_current()
+
+        assert context["version"] == provisional["version"]
+        assert context["market_cycle"]["cycle"] == "mid_bull_market"
+        assert repository.get(context["version"]) is context
+        assert inputs["analyze"].await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_other_workers_reuse_stored_context(self, inputs):
+        repository = _MemoryRepository()
+        await MarketContextService(repository=repository).ensure_current()
+
+        other = MarketContextService(repository=repository)
+        context = await other.get_context()
+
+        assert context["market_cycle"]["cycle"] == "mid_bull_market"
+        assert inputs["analyze"].await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_agents_read_shared_context(self, inputs):
+        service = MarketContextService(repository=_MemoryRepository())
+        with patch("src.agents.strategy.market_analyzer.market_context_service", service), \
+                patch("src.agents.strategy.risk_stance.market_context_service", service):
+            cycle = await market_analyzer.analyze()
+            allocation = await risk_stance_analyzer.determine_allocation("mid_bull_market", "moderate")
+
+        assert cycle.cycle == "mid_bull_market"
+        assert allocation.stocks == Decimal("0.7")
+        # 컨텍스트 생성 시 1회 + 3회 외에 요청 처리 중 LLM 호출 없음
+        assert inputs["analyze"].await_count == 1
+        assert inputs["allocate"].await_count == 3
+
+
+class TestMarketContextRepository:
+    def test_concurrent_save_keeps_first_snapshot(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        MarketContextSnapshot.__table__.create(engine)
+        factory = sessionmaker(bind=engine, expire_on_commit=False)
+        worker_a, worker_b = MarketContextRepository(factory), MarketContextRepository(factory)
+
+        assert worker_a.save("v1", {"cycle": "a"}) == {"cycle": "a"}
+        # 다른 워커가 같은 버전을 늦게 저장하면 충돌 대신 먼저 저장된 컨텍스트를 받음
+        assert worker_b.save("v1", {"cycle": "b"}) == {"cycle": "a"}
+        assert worker_b.latest() == {"cycle": "a"}
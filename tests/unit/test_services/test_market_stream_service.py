@@ -0,0 +1,208 @@
+"""
+KIS 실시간 시세 수신 단위 테스트 (로컬 리플레이 서버가 KIS WebSocket을 대신함)
+"""
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+import websockets
+
+from src.services.market_stream_service import (
+    MarketStreamService,
+    parse_execution,
+    parse_frame,
+    parse_orderbook,
+)
+from src.services.quote_service import QuoteService
+
+
+def _execution(code, hhmmss, price, change, rate, volume):
+    fields = ["0"] * 46
+    fields[0], fields[1], fields[2] = code, hhmmss, str(price)
+    fields[4], fields[5] = str(change), str(rate)
+    fields[7], fields[8], fields[9] = str(price - 500), str(price + 300), str(price - 700)
+    fields[12], fields[13] = "10", str(volume)
+    return fields
+
+
+def _orderbook(code, best_ask, best_bid):
+    fields = ["0"] * 59
+    fields[0], fields[1] = code, "090001"
+    for level in range(10):
+        fields[3 + level] = str(best_ask + 100 * level)
+        fields[13 + level] = str(best_bid - 100 * level)
+        fields[23 + level] = str(1000 + level)
+        fields[33 + level] = str(2000 + level)
+    fields[43], fields[44] = "10045", "20045"
+    return fields
+
+
+def _frame(tr_id, *records):
+    return f"0|{tr_id}|{len(records):03d}|" + "^".join(field for record in records for field in record)
+
+
+class ReplayServer:
+    """구독 요청을 받으면 녹화된 프레임을 재생하는 KIS WebSocket 대역"""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.requests = []
+        self.pongs = []
+        self.sent = asyncio.Event()
+
+    async def handler(self, ws):
+        async for message in ws:
+            data = json.loads(message)
+            if data["header"].get("tr_id") == "PINGPONG":
+                self.pongs.append(data)
+                continue
+            self.requests.append(data)
+            tr_id = data["body"]["input"]["tr_id"]
+            code = data["body"]["input"]["tr_key"]
+            await ws.send(json.dumps({
+                "header": {"tr_id": tr_id, "tr_key": code, "encrypt": "N"},
+                "body": {"rt_cd": "0", "msg_cd": "OPSP0000", "msg1": "SUBSCRIBE SUCCESS"},
+            }))
+            for frame in self.frames.get((tr_id, code), []):
+                await ws.send(frame)
+            await ws.send(json.dumps({"header": {"tr_id": "PINGPONG", "datetime": "20251016090001"}}))
+            self.sent.set()
+
+
+class _Repository:
+    def __init__(self):
+        self.saved = []
+
+    def save_many(self, rows, timestamp=None):
+        self.saved.extend(rows)
+
+
+async def _until(predicate, timeout=2.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+class TestParsing:
+    def test_frame_with_multiple_records(self):
+        frame = _frame(
+            "H0STCNT0",
+            _execution("005930", "090000", 71900, -100, -0.14, 1000),
+            _execution("005930", "090001", 72000, 0, 0.0, 1010),
+        )
+        records = parse_frame(frame)
+
+        assert [tr_id for tr_id, _ in records] == ["H0STCNT0", "H0STCNT0"]
+        tick = parse_execution(records[1][1])
+        assert tick["current_price"] == 72000
+        assert tick["volume"] == 1010
+        assert tick["change_rate"] == 0.0
+        assert parse_frame("1|H0STCNI0|001|encrypted") == []
+
+    def test_orderbook(self):
+        book = parse_orderbook(parse_frame(_frame("H0STASP0", _orderbook("005930", 72000, 71900)))[0][1])
+
+        assert book["asks"][0] == (72000, 1000)
+        assert book["bids"][9] == (71000, 2009)
+        assert book["total_bid_volume"] == 20045
+
+
+class TestMarketStreamService:
+    @pytest.mark.asyncio
+    async def test_flush_keeps_stored_fundamentals(self, realtime_price_repository):
+        realtime_price_repository.save_many(
+            [{"stock_code": "005930", "current_price": 71000, "per": 15.2, "pbr": 1.3, "market_cap": 400}],
+            datetime(2025, 10, 10, 9, 0),
+        )
+        stream = MarketStreamService(price_repository=realtime_price_repository, quote_repository=_Repository())
+        stream.store.add_execution(parse_execution(parse_frame(
+            _frame("H0STCNT0", _execution("005930", "090001", 72000, 1000, 1.41, 1010))
+        )[0][1]))
+
+        assert await stream.flush() == 1
+        stored = realtime_price_repository.latest("005930")
+        assert stored["current_price"] == 72000
+        assert (stored["per"], stored["pbr"], stored["market_cap"]) == (15.2, 1.3, 400)
+
+    @pytest.mark.asyncio
+    async def test_replay_feeds_quotes_without_rest_calls(self):
+        server = ReplayServer({
+            ("H0STCNT0", "005930"): [
+                _frame("H0STCNT0", _execution("005930", "090000", 71900, -100, -0.14, 1000)),
+                _frame("H0STCNT0", _execution("005930", "090001", 72000, 0, 0.0, 1010)),
+            ],
+            ("H0STASP0", "005930"): [_frame("H0STASP0", _orderbook("005930", 72100, 72000))],
+            ("H0STCNT0", "000660"): [_frame("H0STCNT0", _execution("000660", "090000", 180000, 500, 0.28, 50))],
+        })
+        prices, books = _Repository(), _Repository()
+
+        async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            stream = MarketStreamService(
+                url=f"ws://127.0.0.1:{port}",
+                approval_key_provider=AsyncMock(return_value="approval-key"),
+                codes_provider=AsyncMock(return_value=["005930", "000660"]),
+                price_repository=prices,
+                quote_repository=books,
+                flush_seconds=0,
+            )
+            stream.start()
+            try:
+                await _until(lambda: len(server.pongs) >= 4 and stream.store.book("005930"))
+
+                client = AsyncMock()
+                quotes = QuoteService(client=client, persist=False, stream=stream)
+                quote = await quotes.get_quote("005930")
+                batch = await quotes.get_quotes(["005930", "000660"])
+
+                assert quote["current_price"] == 72000
+                assert quote["source"] == "stream"
+                assert batch["000660"]["current_price"] == 180000
+                client.get_stock_price.assert_not_called()
+                client.get_stock_prices.assert_not_called()
+
+                assert [price for _, price, _ in stream.store.ticks("005930")] == [71900, 72000]
+                assert server.requests[0]["header"]["approval_key"] == "approval-key"
+                assert {req["body"]["input"]["tr_id"] for req in server.requests} == {"H0STCNT0", "H0STASP0"}
+
+                assert await stream.flush() == 3
+                assert {row["stock_code"] for row in prices.saved} == {"005930", "000660"}
+                assert books.saved[0]["asks"][0] == (72100, 1000)
+            finally:
+                await stream.stop()
+
+        # 연결이 끊기면 실시간 시세를 쓰지 않고 REST 조회로 대체
+        assert stream.latest_quote("005930") is None
+
+    @pytest.mark.asyncio
+    async def test_subscriptions_follow_holdings(self):
+        server = ReplayServer({})
+        holdings = AsyncMock(return_value=["005930", "000660"])
+
+        async with websockets.serve(server.handler, "127.0.0.1", 0) as ws_server:
+            port = ws_server.sockets[0].getsockname()[1]
+            stream = MarketStreamService(
+                url=f"ws://127.0.0.1:{port}",
+                approval_key_provider=AsyncMock(return_value="approval-key"),
+                codes_provider=holdings,
+                orderbook=False,
+                flush_seconds=0,
+            )
+            stream.start()
+            try:
+                await _until(lambda: len(server.requests) == 2)
+                holdings.return_value = ["000660", "035420"]
+                await stream.refresh_subscriptions()
+                await _until(lambda: len(server.requests) == 4)
+            finally:
+                await stream.stop()
+
+        changes = [
+            (req["header"]["tr_type"], req["body"]["input"]["tr_key"]) for req in server.requests[2:]
+        ]
+        assert changes == [("2", "005930"), ("1", "035420")]
+        assert stream.max_tickers == 41
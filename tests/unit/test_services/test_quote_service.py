@@ -0,0 +1,174 @@
+"""
+KIS 현재가 공유 캐시 단위 테스트 (KIS/DB 모킹)
+"""
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.services.quote_service import QuoteService
+
+QUOTE = {"stock_code": "005930", "current_price": 70000, "change_rate": 1.5, "volume": 10}
+FULL_QUOTE = dict(QUOTE, per=15.2, pbr=1.3, market_cap=400_000_000_000_000)
+
+
+class _FakeKIS:
+    def __init__(self, delay=0.05):
+        async def _fetch(stock_code):
+            await asyncio.sleep(delay)
+            return dict(QUOTE, stock_code=stock_code)
+
+        async def _fetch_many(stock_codes):
+            await asyncio.sleep(delay)
+            return {code: dict(QUOTE, stock_code=code, partial=True) for code in stock_codes}
+
+        self.get_stock_price = AsyncMock(side_effect=_fetch)
+        self.get_stock_prices = AsyncMock(side_effect=_fetch_many)
+
+
+class _MemoryRepository:
+    def __init__(self):
+        self.rows = {}
+
+    def latest_many(self, stock_codes, since=None):
+        return {code: self.rows[code] for code in stock_codes if code in self.rows}
+
+    def save_many(self, quotes, timestamp=None):
+        for quote in quotes:
+            self.rows[quote["stock_code"]] = dict(quote)
+
+
+class TestQuoteService:
+    def test_ttl_short_in_session_long_after_close(self):
+        with patch("src.services.quote_service.settings.QUOTE_CACHE_TTL_SECONDS", 3.0), \
+                patch("src.services.quote_service.settings.QUOTE_CACHE_CLOSED_TTL_SECONDS", 1800):
+            assert QuoteService.ttl(datetime(2025, 10, 10, 10, 0)) == 3.0
+            assert QuoteService.ttl(datetime(2025, 10, 10, 16, 0)) == 1800
+            # 개장 10분 전에는 개장 시각까지만 유지
+            assert QuoteService.ttl(datetime(2025, 10, 10, 8, 50)) == 600
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        kis = _FakeKIS()
+        service = QuoteService(client=kis, persist=False)
+
+        results = await asyncio.gather(*(service.get_quote("005930") for _ in range(5)))
+        again = await service.get_quote("005930")
+
+        kis.get_stock_price.assert_awaited_once_with("005930")
+        assert all(result["current_price"] == 70000 for result in results)
+        assert again["current_price"] == 70000
+
+    @pytest.mark.asyncio
+    async def test_batch_fetches_only_uncached_codes_once(self):
+        kis = _FakeKIS(0)
+        service = QuoteService(client=kis, persist=False)
+        await service.get_quote("005930")
+
+        quotes = await service.get_quotes(["005930", "000660", "035420"])
+
+        assert set(quotes) == {"005930", "000660", "035420"}
+        kis.get_stock_prices.assert_awaited_once_with(["000660", "035420"])
+
+        # 일괄 조회 결과(PER/PBR 없음)는 full 조회 시 단건으로 다시 채움
+        await service.get_quote("000660", full=True)
+        assert kis.get_stock_price.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_overlapping_batches_share_in_flight_calls(self):
+        kis = _FakeKIS()
+        service = QuoteService(client=kis, persist=False)
+
+        single, first, second, third = await asyncio.gather(
+            service.get_quote("005930"),
+            service.get_quotes(["005930", "000660"]),
+            service.get_quotes(["000660", "035420"]),
+            service.get_quotes(["005930", "000660", "035420"]),
+        )
+
+        # 이미 진행 중인 종목은 기존 호출을 기다리고, 처음 보는 종목만 새로 조회
+        kis.get_stock_price.assert_awaited_once_with("005930")
+        assert [call.args[0] for call in kis.get_stock_prices.await_args_list] == [["000660"], ["035420"]]
+        assert single["current_price"] == 70000
+        assert set(first) == {"005930", "000660"}
+        assert set(second) == set(third) - {"005930"} == {"000660", "035420"}
+        assert set(third) == {"005930", "000660", "035420"}
+
+    @pytest.mark.asyncio
+    async def test_slow_quotes_do_not_block_and_fill_cache(self):
+        service = QuoteService(client=_FakeKIS(0.2), persist=False)
+
+        started = time.perf_counter()
+        assert await service.get_cached_quotes(["005930"], wait_seconds=0.01) == {}
+        assert time.perf_counter() - started < 0.15
+
+        await asyncio.sleep(0.3)
+        quotes = await service.get_cached_quotes(["005930"], wait_seconds=0.01)
+        assert quotes["005930"]["current_price"] == 70000
+
+    @pytest.mark.asyncio
+    async def test_persisted_quote_reused_after_close(self):
+        repository = _MemoryRepository()
+        kis = _FakeKIS(0)
+        closed = datetime(2025, 10, 10, 17, 0)
+
+        with patch("src.services.quote_service.datetime") as mock_datetime:
+            mock_datetime.now.return_value = closed
+            mock_datetime.combine = datetime.combine
+
+            first = QuoteService(client=kis, repository=repository, persist=True)
+            await first.get_quote("005930")
+            await asyncio.sleep(0.05)  # 백그라운드 저장 완료 대기
+
+            other_worker = QuoteService(client=kis, repository=repository, persist=True)
+            quote = await other_worker.get_quote("005930")
+
+        assert kis.get_stock_price.await_count == 1
+        assert quote["current_price"] == 70000
+
+    def test_partial_quote_keeps_stored_fundamentals(self, realtime_price_repository):
+        repository = realtime_price_repository
+        closed = datetime(2025, 10, 10, 17, 0)
+
+        repository.save_many([FULL_QUOTE], closed)
+        repository.save_many([dict(QUOTE, current_price=71000, per=None, pbr=None, market_cap=None, partial=True)], closed)
+        stored = repository.latest("005930")
+        assert stored["current_price"] == 71000
+        assert stored["per"] == 15.2 and stored["market_cap"] == 400_000_000_000_000
+        assert not stored.get("partial")
+
+    def test_stored_quote_carries_stock_name(self, realtime_price_repository):
+        from src.models.stock import Stock
+
+        repository = realtime_price_repository
+        with repository.session_scope() as session:
+            session.add(Stock(stock_code="005930", stock_name="삼성전자", market="KOSPI"))
+        repository.save_many([FULL_QUOTE, dict(FULL_QUOTE, stock_code="999999")], datetime(2025, 10, 10, 17, 0))
+
+        stored = repository.latest_many(["005930", "999999"])
+        assert stored["005930"]["stock_name"] == "삼성전자"
+        assert stored["999999"]["stock_name"] == ""
+
+    @pytest.mark.asyncio
+    async def test_full_quote_skips_stored_partial_row(self, realtime_price_repository):
+        repository = realtime_price_repository
+        kis = _FakeKIS(0)
+        kis.get_stock_price.side_effect = None
+        kis.get_stock_price.return_value = dict(FULL_QUOTE)
+        closed = datetime(2025, 10, 10, 17, 0)
+        repository.save_many([dict(QUOTE, per=None, pbr=None, market_cap=None, partial=True)], closed)
+
+        with patch("src.services.quote_service.datetime") as mock_datetime:
+            mock_datetime.now.return_value = closed
+            mock_datetime.combine = datetime.combine
+
+            service = QuoteService(client=kis, repository=repository, persist=True)
+            assert (await service.get_quote("005930"))["partial"] is True
+            kis.get_stock_price.assert_not_awaited()
+
+            quote = await service.get_quote("005930", full=True)
+
+        kis.get_stock_price.assert_awaited_once_with("005930")
+        assert quote["per"] == 15.2
@@ -0,0 +1,377 @@
+"""
+StockDataService 단위 테스트 (DB/외부 API 모킹)
+"""
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pandas as pd
+import pytest
+
+from src.services.quote_service import quote_service
+from src.services.stock_data_service import StockDataService
+from src.utils.indicator_stream import IndicatorStream
+from src.utils.market_calendar import last_closed_session, trading_days_between
+
+
+def _recent_trading_days(days):
+    end = last_closed_session()
+    return trading_days_between(end - timedelta(days=days), end)
+
+
+def _ohlcv(dates, closes):
+    index = pd.to_datetime(dates)
+    return pd.DataFrame(
+        {
+            "Open": closes,
+            "High": closes,
+            "Low": closes,
+            "Close": closes,
+            "Volume": [1000] * len(closes),
+        },
+        index=index,
+    )
+
+
+class TestGetPricePanel:
+    """get_price_panel: 단일 DB 쿼리 + 누락 종목만 외부 보충"""
+
+    @pytest.mark.asyncio
+    async def test_fetches_only_missing_codes(self):
+        service = StockDataService()
+        dates = _recent_trading_days(30)
+        closes = [100.0 + i for i in range(len(dates))]
+        db_panel = pd.DataFrame({"005930": closes}, index=pd.to_datetime(dates))
+
+        with patch(
+            "src.services.stock_data_service.stock_price_repository.get_close_panel",
+            return_value=db_panel,
+        ) as mock_panel, patch.object(
+            service,
+            "get_multiple_stocks",
+            new=AsyncMock(return_value={"000660": _ohlcv(dates, closes)}),
+        ) as mock_fetch:
+            panel = await service.get_price_panel(["005930", "000660"], days=30)
+
+        mock_panel.assert_called_once()
+        mock_fetch.assert_awaited_once_with(["000660"], days=30)
+        assert list(panel.columns) == ["005930", "000660"]
+        assert len(panel) == len(dates)
+        assert panel["000660"].iloc[-1] == closes[-1]
+
+    @pytest.mark.asyncio
+    async def test_skips_external_when_db_complete(self):
+        service = StockDataService()
+        dates = _recent_trading_days(30)
+        db_panel = pd.DataFrame(
+            {"005930": [100.0] * len(dates), "000660": [200.0] * len(dates)},
+            index=pd.to_datetime(dates),
+        )
+
+        with patch(
+            "src.services.stock_data_service.stock_price_repository.get_close_panel",
+            return_value=db_panel,
+        ), patch.object(service, "get_multiple_stocks", new=AsyncMock()) as mock_fetch:
+            panel = await service.get_price_panel(["000660", "005930"], days=30)
+
+        mock_fetch.assert_not_awaited()
+        assert list(panel.columns) == ["000660", "005930"]
+
+    @pytest.mark.asyncio
+    async def test_empty_codes(self):
+        service = StockDataService()
+        panel = await service.get_price_panel([], days=30)
+        assert panel.empty
+
+    @pytest.mark.asyncio
+    async def test_refetches_codes_with_gaps(self):
+        service = StockDataService()
+        dates = _recent_trading_days(30)
+        db_panel = pd.DataFrame(
+            {"005930": [100.0] * len(dates), "000660": [200.0] * len(dates)},
+            index=pd.to_datetime(dates),
+        )
+        db_panel.loc[db_panel.index[-1], "000660"] = float("nan")
+
+        with patch(
+            "src.services.stock_data_service.stock_price_repository.get_close_panel",
+            return_value=db_panel,
+        ), patch.object(
+            service,
+            "get_multiple_stocks",
+            new=AsyncMock(return_value={"000660": _ohlcv(dates, [201.0] * len(dates))}),
+        ) as mock_fetch:
+            panel = await service.get_price_panel(["005930", "000660"], days=30)
+
+        mock_fetch.assert_awaited_once_with(["000660"], days=30)
+        assert panel["000660"].iloc[-1] == 201.0
+
+
+class TestPriceCacheKey:
+    """get_stock_price: 캐시 키는 마지막 마감 세션 기준"""
+
+    @pytest.mark.asyncio
+    async def test_key_rolls_over_when_session_closes(self):
+        service = StockDataService()
+        dates = _recent_trading_days(30)
+        before_close = _ohlcv(dates[:-1], [100.0] * (len(dates) - 1))
+        after_close = _ohlcv(dates, [100.0] * len(dates))
+
+        with patch.object(
+            service, "_load_stock_price", new=AsyncMock(side_effect=[before_close, after_close])
+        ) as mock_load, patch(
+            "src.services.stock_data_service.last_closed_session",
+            side_effect=[dates[-2], dates[-2], dates[-1]],
+        ):
+            await service.get_stock_price("005930", days=30)
+            await service.get_stock_price("005930", days=30)
+            df = await service.get_stock_price("005930", days=30)
+
+        assert mock_load.await_count == 2
+        assert df.index.max().date() == dates[-1]
+
+
+class TestIncrementalGapFill:
+    """_load_stock_price: 누락 거래일 구간만 외부 조회"""
+
+    @pytest.mark.asyncio
+    async def test_fetches_only_missing_range(self):
+        service = StockDataService()
+        dates = _recent_trading_days(30)
+        db_df = _ohlcv(dates[:-2], [100.0] * (len(dates) - 2))
+        fetched = _ohlcv(dates[-2:], [110.0, 111.0])
+
+        with patch.object(service, "_prices_from_db", new=AsyncMock(return_value=db_df)), \
+                patch.object(service, "_fetch_price_range", new=AsyncMock(return_value=fetched)) as mock_fetch, \
+                patch.object(service, "_save_prices_to_db", new=AsyncMock()), \
+                patch.object(service, "_save_latest_indicators", new=AsyncMock()) as mock_save_indicators:
+            df = await service._load_stock_price("005930", days=30)
+
+        mock_fetch.assert_awaited_once_with("005930", dates[-2], dates[-1])
+        mock_save_indicators.assert_awaited_once()
+        assert len(df) == len(dates)
+        assert df["Close"].iloc[-1] == 111.0
+
+    @pytest.mark.asyncio
+    async def test_complete_db_window_skips_external(self):
+        service = StockDataService()
+        dates = _recent_trading_days(30)
+        db_df = _ohlcv(dates, [100.0] * len(dates))
+
+        with patch.object(service, "_prices_from_db", new=AsyncMock(return_value=db_df)), \
+                patch.object(service, "_fetch_price_range", new=AsyncMock()) as mock_fetch, \
+                patch.object(service, "_save_prices_to_db", new=AsyncMock()) as mock_save_prices, \
+                patch.object(service, "_save_latest_indicators", new=AsyncMock()) as mock_save_indicators:
+            df = await service._load_stock_price("005930", days=30)
+
+        mock_fetch.assert_not_awaited()
+        # 읽기 경로에서는 주가/지표 쓰기가 발생하지 않아야 함
+        mock_save_prices.assert_not_awaited()
+        mock_save_indicators.assert_not_awaited()
+        assert df is db_df
+
+
+    @pytest.mark.asyncio
+    async def test_empty_db_stops_at_last_closed_session(self):
+        service = StockDataService()
+        dates = _recent_trading_days(30)
+        fetched = _ohlcv(dates + [dates[-1] + timedelta(days=1)], [100.0] * (len(dates) + 1))
+
+        with patch.object(service, "_prices_from_db", new=AsyncMock(return_value=None)), \
+                patch.object(service, "_fetch_price_range", new=AsyncMock(return_value=fetched)) as mock_fetch, \
+                patch.object(service, "_save_prices_to_db", new=AsyncMock()) as mock_save_prices, \
+                patch.object(service, "_save_latest_indicators", new=AsyncMock()):
+            df = await service._load_stock_price("005930", days=30)
+
+        assert mock_fetch.await_args.args[2] == last_closed_session()
+        saved = mock_save_prices.await_args.args[1]
+        assert saved.index.max().date() == dates[-1]
+        assert df.index.max().date() == dates[-1]
+
+    @pytest.mark.asyncio
+    async def test_days_missing_at_source_are_not_refetched(self):
+        service = StockDataService()
+        dates = _recent_trading_days(30)
+        listed = dates[10:]  # 구간 중간 상장
+        fetched = _ohlcv(listed, [100.0] * len(listed))
+
+        with patch.object(service, "_prices_from_db", new=AsyncMock(side_effect=[None, fetched])), \
+                patch.object(service, "_fetch_price_range", new=AsyncMock(return_value=fetched)) as mock_fetch, \
+                patch.object(service, "_save_prices_to_db", new=AsyncMock()), \
+                patch.object(service, "_save_latest_indicators", new=AsyncMock()):
+            await service._load_stock_price("005930", days=30)
+            df = await service._load_stock_price("005930", days=30)
+
+        # 상장일 이전 구간은 한 번 더 조회해 비어 있음을 확인한 뒤에만 기록
+        assert mock_fetch.await_count == 2
+        assert mock_fetch.await_args_list[1].args[2] < listed[0]
+        assert df is fetched
+
+    @pytest.mark.asyncio
+    async def test_truncated_source_response_is_paged_not_remembered(self):
+        service = StockDataService()
+        dates = _recent_trading_days(30)
+        frame = _ohlcv(dates, [100.0 + i for i in range(len(dates))])
+
+        async def _kis_last_rows(stock_code, start, end):
+            # KIS 일봉처럼 요청 구간의 최근 N건만 반환
+            window = frame[(frame.index >= pd.Timestamp(start)) & (frame.index <= pd.Timestamp(end))]
+            return window.iloc[-8:]
+
+        with patch.object(service, "_prices_from_db", new=AsyncMock(return_value=None)), \
+                patch(
+                    "src.services.stock_data_service.kis_service.get_stock_daily_price",
+                    new=AsyncMock(side_effect=_kis_last_rows),
+                ) as mock_kis, \
+                patch.object(service, "_save_prices_to_db", new=AsyncMock()), \
+                patch.object(service, "_save_latest_indicators", new=AsyncMock()):
+            df = await service._load_stock_price("005930", days=30)
+
+        start = (datetime.now() - timedelta(days=30)).date()
+        assert mock_kis.await_count > 1
+        assert list(df.index.date) == [day for day in dates if day >= start]
+        assert service._gap_memo.get("005930") is None
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_not_remembered(self):
+        service = StockDataService()
+
+        with patch.object(service, "_prices_from_db", new=AsyncMock(return_value=None)), \
+                patch.object(service, "_fetch_price_range", new=AsyncMock(return_value=None)) as mock_fetch:
+            await service._load_stock_price("005930", days=30)
+            await service._load_stock_price("005930", days=30)
+
+        assert mock_fetch.await_count == 2
+
+
+class TestIncrementalIndicators:
+    """_save_latest_indicators: 저장된 상태 이후 봉만 반영"""
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_stored_state(self):
+        service = StockDataService()
+        dates = _recent_trading_days(60)
+        df = _ohlcv(dates, [100.0 + (i % 7) for i in range(len(dates))])
+        state = IndicatorStream.from_history(df.iloc[:-2]).to_dict()
+        stored = SimpleNamespace(date=dates[-3], stream_state=state)
+
+        with patch(
+            "src.services.stock_data_service.stock_indicator_repository.latest_with_state",
+            return_value=stored,
+        ), patch(
+            "src.services.stock_data_service.stock_indicator_repository.bulk_upsert",
+        ) as mock_upsert, patch(
+            "src.services.stock_data_service.IndicatorStream.extend",
+            autospec=True,
+            side_effect=IndicatorStream.extend,
+        ) as mock_extend:
+            await service._save_latest_indicators("005930", df)
+
+        # 상태 이후 2개 봉만 반영
+        assert len(mock_extend.call_args.args[1]) == 2
+        _, rows = mock_upsert.call_args.args
+        assert len(rows) == 1
+        assert rows[0]["date"] == dates[-1]
+        assert rows[0]["stream_state"]["bars"] == len(dates)
+        expected = IndicatorStream.from_history(df).snapshot()
+        assert rows[0]["ma20"] == pytest.approx(expected["ma20"])
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_when_older_rows_backfilled(self):
+        service = StockDataService()
+        dates = _recent_trading_days(60)
+        df = _ohlcv(dates, [100.0 + (i % 7) for i in range(len(dates))])
+        stored = SimpleNamespace(date=dates[-3], stream_state={"version": 1})
+
+        with patch(
+            "src.services.stock_data_service.stock_indicator_repository.latest_with_state",
+            return_value=stored,
+        ), patch(
+            "src.services.stock_data_service.stock_price_repository.get_ohlcv_frame",
+            return_value=df.iloc[0:0],
+        ), patch(
+            "src.services.stock_data_service.stock_indicator_repository.bulk_upsert",
+        ) as mock_upsert:
+            await service._save_latest_indicators("005930", df, updated_from=dates[0])
+
+        _, rows = mock_upsert.call_args.args
+        assert rows[0]["stream_state"]["bars"] == len(dates)
+        expected = IndicatorStream.from_history(df).snapshot()
+        assert rows[0]["rsi14"] == pytest.approx(expected["rsi14"])
+
+    @pytest.mark.asyncio
+    async def test_backfill_rebuilds_from_db_history(self):
+        service = StockDataService()
+        dates = _recent_trading_days(200)
+        history = _ohlcv(dates, [100.0 + (i % 7) for i in range(len(dates))])
+        stored = SimpleNamespace(date=dates[-3], stream_state={"version": 1})
+
+        with patch(
+            "src.services.stock_data_service.stock_indicator_repository.latest_with_state",
+            return_value=stored,
+        ), patch(
+            "src.services.stock_data_service.stock_price_repository.get_ohlcv_frame",
+            return_value=history.iloc[:-5],
+        ), patch(
+            "src.services.stock_data_service.stock_indicator_repository.bulk_upsert",
+        ) as mock_upsert:
+            await service._save_latest_indicators("005930", history.iloc[-5:], updated_from=dates[-5])
+
+        _, rows = mock_upsert.call_args.args
+        assert rows[0]["stream_state"]["bars"] == len(dates)
+        expected = IndicatorStream.from_history(history).snapshot()
+        assert rows[0]["ma120"] == pytest.approx(expected["ma120"])
+
+    @pytest.mark.asyncio
+    async def test_state_outside_fetched_window_resumes_from_db(self):
+        service = StockDataService()
+        dates = _recent_trading_days(200)
+        history = _ohlcv(dates, [100.0 + (i % 7) for i in range(len(dates))])
+        # 상태는 10거래일 전 기준, 이번 조회(days=5)로는 최근 5개 봉만 받음
+        state = IndicatorStream.from_history(history.iloc[:-10]).to_dict()
+        stored = SimpleNamespace(date=dates[-11], stream_state=state)
+
+        with patch(
+            "src.services.stock_data_service.stock_indicator_repository.latest_with_state",
+            return_value=stored,
+        ), patch(
+            "src.services.stock_data_service.stock_price_repository.get_ohlcv_frame",
+            return_value=history.iloc[-11:],
+        ) as mock_frame, patch(
+            "src.services.stock_data_service.stock_indicator_repository.bulk_upsert",
+        ) as mock_upsert:
+            await service._save_latest_indicators("005930", history.iloc[-5:], updated_from=dates[-5])
+
+        assert mock_frame.call_args.args == ("005930", dates[-11])
+        _, rows = mock_upsert.call_args.args
+        assert rows[0]["date"] == dates[-1]
+        assert rows[0]["stream_state"]["bars"] == len(dates)
+        expected = IndicatorStream.from_history(history).snapshot()
+        assert rows[0]["ma120"] == pytest.approx(expected["ma120"])
+        assert rows[0]["macd"] == pytest.approx(expected["macd"])
+
+
+class TestQuoteCoalescing:
+    @pytest.mark.asyncio
+    async def test_fundamental_and_market_cap_share_one_quote(self):
+        service = StockDataService()
+        quote_service.invalidate("005930")
+        quote = {"per": 12.0, "pbr": 1.1, "market_cap": 100, "volume": 10}
+
+        async def slow_quote(code):
+            await asyncio.sleep(0.05)
+            return quote
+
+        with patch(
+            "src.services.stock_data_service.kis_service.get_stock_price",
+            new=AsyncMock(side_effect=slow_quote),
+        ) as mock_quote:
+            fundamental, market_cap = await asyncio.gather(
+                service.get_fundamental_data("005930"),
+                service.get_market_cap_data("005930"),
+            )
+
+        mock_quote.assert_awaited_once_with("005930")
+        assert fundamental["PER"] == 12.0
+        assert market_cap["market_cap"] == 100
@@ -0,0 +1,85 @@
+"""
+로컬 종목명 해석기 단위 테스트 (DB 없이 가짜 종목 목록 사용)
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.services.stock_name_resolver import StockNameResolver
+from src.utils.stock_name_extractor import extract_stock_names_from_query
+
+
+def _stock(code, name, market="KOSPI", market_cap=0, name_en=None, status="active"):
+    return SimpleNamespace(
+        stock_code=code,
+        stock_name=name,
+        stock_name_en=name_en,
+        market=market,
+        market_cap=market_cap,
+        status=status,
+    )
+
+
+STOCKS = [
+    _stock("005930", "삼성전자", market_cap=400_000_000_000_000, name_en="Samsung Electronics"),
+    _stock("000660", "SK하이닉스", market_cap=100_000_000_000_000, name_en="SK hynix"),
+    _stock("035420", "NAVER", market_cap=30_000_000_000_000),
+    _stock("373220", "LG에너지솔루션", market_cap=90_000_000_000_000),
+    _stock("001680", "대상", market_cap=800_000_000_000),
+    _stock("999990", "폐지종목", status="delisted"),
+]
+
+
+class _Repository:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def list_by_market(self, market=None):
+        self.calls += 1
+        return self.rows
+
+
+@pytest.fixture
+def resolver():
+    resolver = StockNameResolver(repository=_Repository(STOCKS))
+    resolver.load(STOCKS)
+    return resolver
+
+
+class TestStockNameResolver:
+    def test_resolves_official_name_alias_and_reading(self, resolver):
+        assert resolver.resolve("삼성전자") == "005930"
+        assert resolver.resolve("삼전") == "005930"
+        assert resolver.resolve("sk 하이닉스") == "000660"
+        assert resolver.resolve("에스케이하이닉스") == "000660"
+        assert resolver.resolve("네이버") == "035420"
+        assert resolver.resolve("Samsung Electronics") == "005930"
+        assert resolver.resolve("폐지종목") is None
+
+    def test_resolves_choseong(self, resolver):
+        assert resolver.resolve("ㅅㅅㅈㅈ") == "005930"
+        assert resolver.resolve("ㅅㅅㅈㅈ", market="KOSDAQ") is None
+
+    def test_finds_every_stock_in_one_scan(self, resolver):
+        matches = resolver.find_in_text("sk 하이닉스와 삼전 비교해줘")
+
+        assert [match.code for match in matches] == ["000660", "005930"]
+        assert matches[0].matched == "sk 하이닉스"
+        assert matches[1].name == "삼성전자"
+
+    def test_ignores_ambiguous_and_embedded_short_names(self, resolver):
+        # "대상"은 일반 단어, "삼전"은 다른 단어 안에 있을 때 매칭하지 않음
+        assert resolver.find_in_text("투자 대상으로 어때?") == []
+        assert resolver.find_in_text("재삼전략 검토") == []
+        assert resolver.resolve("대상") == "001680"
+
+    @pytest.mark.asyncio
+    async def test_extractor_skips_llm_on_local_hit(self, resolver):
+        with patch("src.services.stock_name_resolver.stock_name_resolver", resolver), \
+                patch("src.utils.stock_name_extractor.get_claude_llm") as get_llm:
+            names = await extract_stock_names_from_query("엔솔이랑 네이버 전망 알려줘")
+
+        assert names == ["LG에너지솔루션", "NAVER"]
+        get_llm.assert_not_called()
@@ -0,0 +1,75 @@
+"""
+종목 검색 인덱스 단위 테스트 (DB 없이 가짜 종목 목록 사용)
+"""
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.services.stock_search_index import StockSearchIndex
+
+
+def _stock(code, name, market="KOSPI", market_cap=0, name_en=None):
+    return SimpleNamespace(
+        stock_code=code,
+        stock_name=name,
+        stock_name_en=name_en,
+        market=market,
+        sector=None,
+        market_cap=market_cap,
+        status="active",
+    )
+
+
+STOCKS = [
+    _stock("005930", "삼성전자", market_cap=400_000_000_000_000),
+    _stock("009150", "삼성전기", market_cap=10_000_000_000_000),
+    _stock("005935", "삼성전자우", market_cap=40_000_000_000_000),
+    _stock("000660", "SK하이닉스", market_cap=100_000_000_000_000),
+    _stock("091990", "셀트리온헬스케어", market="KOSDAQ", market_cap=9_000_000_000_000),
+    _stock("068270", "셀트리온", market_cap=30_000_000_000_000),
+]
+
+
+@pytest.fixture
+def index():
+    index = StockSearchIndex(repository=None)
+    index.load(STOCKS)
+    return index
+
+
+def _codes(results):
+    return [entry.code for entry in results[0]]
+
+
+class TestStockSearchIndex:
+    def test_prefix_matches_while_typing(self, index):
+        # 입력 중 상태("삼성젅")도 접두 일치, 시가총액 순 정렬
+        assert _codes(index.search("삼성젅")) == ["005930", "005935"]
+        assert _codes(index.search("삼성")) == ["005930", "005935", "009150"]
+
+    def test_infix_choseong_and_code(self, index):
+        assert _codes(index.search("하이닉")) == ["000660"]
+        assert _codes(index.search("ㅅㅅㅈㄱ")) == ["009150"]
+        assert _codes(index.search("0059")) == ["005930", "005935"]
+        assert _codes(index.search("005930")) == ["005930"]
+
+    def test_exact_match_and_market_filter(self, index):
+        results, total = index.search("셀트리온")
+        assert [entry.code for entry in results] == ["068270", "091990"]
+        assert total == 2
+        assert _codes(index.search("셀트리온", market="KOSDAQ")) == ["091990"]
+
+    def test_views_raise_rank(self, index):
+        for _ in range(1000):
+            index.record_view("009150")
+        assert _codes(index.search("삼성전"))[0] == "009150"
+
+    def test_search_is_fast(self, index):
+        rows = [_stock(f"{idx:06d}", f"테스트종목{idx}", market_cap=idx) for idx in range(3000)]
+        index.load(STOCKS + rows)
+
+        started = time.perf_counter()
+        for query in ("삼성", "테스트종목12", "ㅌㅅㅌ", "종목", "0012"):
+            index.search(query)
+        assert (time.perf_counter() - started) / 5 < 0.05
@@ -0,0 +1,96 @@
+"""
+UserProfileService 단위 테스트 (SQLite 인메모리 DB, 프로파일 캐시)
+"""
+import asyncio
+import threading
+import uuid
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.agents.memory_detector import ProfileUpdate, apply_profile_update
+from src.models.user_profile import UserProfile
+from src.services.user_profile_service import UserProfileService
+from src.utils.cache import TTLCache
+
+USER_ID = uuid.UUID("8c1f2e3d-4b5a-4c6d-9e8f-0a1b2c3d4e5f")
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    UserProfile.__table__.create(engine)
+    engine.selects = 0
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            engine.selects += 1
+
+    return engine
+
+
+@pytest.fixture
+def service(engine):
+    return UserProfileService(
+        sessionmaker(bind=engine, expire_on_commit=False),
+        cache=TTLCache("user_profiles_test", maxsize=16, ttl=60),
+    )
+
+
+class TestUserProfileService:
+    @pytest.mark.asyncio
+    async def test_profile_is_created_once_and_served_from_cache(self, service, engine):
+        profiles = await asyncio.gather(*(service.aget_user_profile(str(USER_ID)) for _ in range(5)))
+
+        assert {profile["preferred_depth"] for profile in profiles} == {"detailed"}
+        selects = engine.selects
+        assert selects >= 1
+
+        profile = await service.aget_user_profile(USER_ID)
+        profile["preferred_sectors"].append("반도체")  # 반환값 변경이 캐시에 새지 않음
+        assert (await service.aget_user_profile(USER_ID))["preferred_sectors"] == []
+        assert engine.selects == selects
+
+    @pytest.mark.asyncio
+    async def test_updates_refresh_cache_and_invalidate_forces_reload(self, service, engine):
+        await service.aget_user_profile(USER_ID)
+
+        update = ProfileUpdate(update_needed=True, field="preferred_depth", value="brief", reasoning="짧게 요청")
+        updated = await apply_profile_update(str(USER_ID), update, service)
+        assert updated["preferred_depth"] == "brief"
+
+        selects = engine.selects
+        assert (await service.aget_user_profile(USER_ID))["preferred_depth"] == "brief"
+        assert engine.selects == selects
+
+        service.invalidate_cache(USER_ID)
+        assert (await service.aget_user_profile(USER_ID))["preferred_depth"] == "brief"
+        assert engine.selects > selects
+
+    @pytest.mark.asyncio
+    async def test_inflight_load_does_not_overwrite_update(self, service):
+        await service.aget_user_profile(USER_ID)
+        service.invalidate_cache(USER_ID)
+
+        loaded, release = threading.Event(), threading.Event()
+        original_load = service._load
+
+        def _slow_load(user_uuid, db):
+            profile = original_load(user_uuid, db)  # 업데이트 전 값
+            loaded.set()
+            release.wait(5)
+            return profile
+
+        with patch.object(service, "_load", _slow_load):
+            pending = asyncio.create_task(service.aget_user_profile(USER_ID))
+            await asyncio.to_thread(loaded.wait, 5)
+            await service.aupdate_user_profile(USER_ID, {"preferred_depth": "brief"})
+            release.set()
+            stale = await pending
+
+        assert stale["preferred_depth"] == "detailed"
+        assert (await service.aget_user_profile(USER_ID))["preferred_depth"] == "brief"
@@ -0,0 +1,37 @@
+"""
+BlobStore 단위 테스트
+"""
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.utils.blob_store import BlobStore
+
+
+class TestBlobStore:
+    """핸들 역참조와 캐시 손실 후 재조회"""
+
+    @pytest.mark.asyncio
+    async def test_reload_with_same_content_is_cached(self):
+        store = BlobStore("test_blobs_same")
+        loader = AsyncMock(return_value=[1, 2, 3])
+        store.register_loader("prices", loader)
+        handle = store.put([1, 2, 3], kind="prices", ref={"stock_code": "005930"})
+        store._cache.clear()
+
+        assert await store.aresolve(handle) == [1, 2, 3]
+        assert await store.aresolve(handle) == [1, 2, 3]
+        loader.assert_awaited_once_with(stock_code="005930")
+
+    @pytest.mark.asyncio
+    async def test_changed_reload_is_not_cached_under_old_digest(self):
+        store = BlobStore("test_blobs_changed")
+        loader = AsyncMock(return_value=[1, 2, 4])
+        store.register_loader("prices", loader)
+        handle = store.put([1, 2, 3], kind="prices", ref={"stock_code": "005930"})
+        store._cache.clear()
+
+        assert await store.aresolve(handle) == [1, 2, 4]
+        assert store.resolve(handle) is None
+        await store.aresolve(handle)
+        assert loader.await_count == 2
@@ -0,0 +1,141 @@
+"""
+TTLCache 단위 테스트
+"""
+import asyncio
+
+import pytest
+
+from src.utils.cache import TTLCache, cache_stats
+
+
+class TestTTLCache:
+    """LRU/TTL/single-flight 동작 검증"""
+
+    def test_lru_eviction(self):
+        cache = TTLCache("test_lru", maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        cache = TTLCache("test_ttl", maxsize=10, ttl=60)
+        cache.set("a", 1, ttl=0)
+
+        assert cache.get("a") is None
+        assert cache.stats()["misses"] == 1
+
+    def test_invalidate_where(self):
+        cache = TTLCache("test_invalidate", maxsize=10, ttl=60)
+        cache.set(("005930", 30), "x")
+        cache.set(("005930", 60), "y")
+        cache.set(("000660", 30), "z")
+
+        removed = cache.invalidate_where(lambda key: key[0] == "005930")
+
+        assert removed == 2
+        assert len(cache) == 1
+        assert cache.get(("000660", 30)) == "z"
+
+    @pytest.mark.asyncio
+    async def test_single_flight_coalesces_concurrent_misses(self):
+        cache = TTLCache("test_single_flight", maxsize=10, ttl=60)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert cache.stats()["coalesced"] == 4
+
+        assert await cache.get_or_load("k", loader) == "value"
+        assert calls == 1
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_none_is_not_cached(self):
+        cache = TTLCache("test_none", maxsize=10, ttl=60)
+
+        async def loader():
+            return None
+
+        assert await cache.get_or_load("k", loader) is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_loader_error_propagates_to_waiters(self):
+        cache = TTLCache("test_error", maxsize=10, ttl=60)
+
+        async def loader():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            cache.get_or_load("k", loader),
+            cache.get_or_load("k", loader),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_loader_does_not_cancel_waiters(self):
+        cache = TTLCache("test_cancel", maxsize=10, ttl=60)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05 if calls == 1 else 0.01)
+            return "value"
+
+        leader = asyncio.create_task(asyncio.wait_for(cache.get_or_load("k", loader), timeout=0.01))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(cache.get_or_load("k", loader)) for _ in range(3)]
+
+        with pytest.raises(asyncio.TimeoutError):
+            await leader
+        assert await asyncio.gather(*followers) == ["value"] * 3
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_load_waits_for_in_flight_keys(self):
+        cache = TTLCache("test_batch", maxsize=10, ttl=60)
+        batches = []
+
+        async def single():
+            await asyncio.sleep(0.02)
+            return "a"
+
+        async def load_many(keys):
+            batches.append(keys)
+            await asyncio.sleep(0.01)
+            return {key: key.upper() for key in keys if key != "missing"}
+
+        cache.set("c", "C")
+        results = await asyncio.gather(
+            cache.get_or_load("a", single),
+            cache.get_or_load_many(["a", "b", "c", "missing"], load_many),
+            cache.get_or_load_many(["b", "d"], load_many),
+        )
+
+        assert results[1] == {"a": "a", "b": "B", "c": "C"}
+        assert results[2] == {"b": "B", "d": "D"}
+        assert batches == [["b", "missing"], ["d"]]
+        assert cache.stats()["coalesced"] == 2
+
+    def test_registry_exposes_stats(self):
+        TTLCache("test_registry", maxsize=1, ttl=1)
+        assert "test_registry" in cache_stats()
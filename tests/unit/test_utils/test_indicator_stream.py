@@ -0,0 +1,83 @@
+"""
+증분 지표 계산 단위 테스트 (벡터화 엔진 결과와 비교)
+"""
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.indicator_stream import IndicatorStream
+from src.utils.indicators import calculate_indicator_panel
+
+FIELDS = (
+    "ma5", "ma20", "ma60", "ma120", "rsi14", "macd", "macd_signal", "macd_histogram",
+    "bollinger_upper", "bollinger_middle", "bollinger_lower", "average_volume", "volume_ratio",
+)
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(7)
+    index = pd.bdate_range("2024-01-02", periods=260)
+    return pd.DataFrame(
+        {
+            "Close": 70000 + rng.normal(0, 800, len(index)).cumsum(),
+            "Volume": rng.integers(100_000, 1_000_000, len(index)).astype(float),
+        },
+        index=index,
+    )
+
+
+def _expected(df: pd.DataFrame) -> dict:
+    panel = calculate_indicator_panel(df[["Close"]], df[["Volume"]].rename(columns={"Volume": "Close"}))
+    return {name: frame["Close"] for name, frame in panel.items()}
+
+
+def _assert_matches(snapshot: dict, expected: dict, position: int) -> None:
+    for field in FIELDS:
+        value = expected[field].iloc[position]
+        if pd.isna(value):
+            assert snapshot[field] is None, field
+        elif field == "average_volume":
+            assert snapshot[field] == int(value)
+        else:
+            assert snapshot[field] == pytest.approx(value, rel=1e-9, abs=1e-6), field
+
+
+class TestIndicatorStream:
+    def test_matches_vectorized_engine_bar_by_bar(self, prices):
+        expected = _expected(prices)
+        stream = IndicatorStream()
+
+        for position, (close, volume) in enumerate(zip(prices["Close"], prices["Volume"])):
+            snapshot = stream.update(close, volume)
+            _assert_matches(snapshot, expected, position)
+
+    def test_state_round_trip_through_json(self, prices):
+        expected = _expected(prices)
+        stream = IndicatorStream.from_history(prices.iloc[:200])
+
+        restored = IndicatorStream.from_dict(json.loads(json.dumps(stream.to_dict())))
+        snapshot = restored.extend(prices.iloc[200:])
+
+        _assert_matches(snapshot, expected, len(prices) - 1)
+
+    def test_intraday_revision_replaces_last_bar(self, prices):
+        stream = IndicatorStream.from_history(prices.iloc[:-1])
+        last_close, last_volume = prices["Close"].iloc[-1], prices["Volume"].iloc[-1]
+
+        # 장중 현재가로 여러 번 갱신한 뒤 최종 종가로 확정
+        stream.update(last_close * 1.05, last_volume / 3)
+        stream.update(last_close * 0.97, last_volume / 2, new_bar=False)
+        snapshot = stream.update(last_close, last_volume, new_bar=False)
+
+        _assert_matches(snapshot, _expected(prices), len(prices) - 1)
+        assert stream.bars == len(prices)
+
+    def test_unknown_state_version_rejected(self):
+        state = IndicatorStream().to_dict()
+        state["version"] = 999
+
+        with pytest.raises(ValueError):
+            IndicatorStream.from_dict(state)
@@ -0,0 +1,95 @@
+"""
+벡터화 지표 엔진 단위 테스트 (단일 종목 함수와 결과 비교)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.indicators import (
+    calculate_bollinger_bands,
+    calculate_indicator_panel,
+    calculate_macd,
+    calculate_rsi,
+    indicator_panel_rows,
+)
+
+
+@pytest.fixture
+def price_panels():
+    rng = np.random.default_rng(42)
+    index = pd.bdate_range("2024-01-02", periods=200)
+    close = pd.DataFrame(
+        {
+            "005930": 70000 + rng.normal(0, 800, len(index)).cumsum(),
+            "000660": 120000 + rng.normal(0, 2000, len(index)).cumsum(),
+            "035420": 200000 + rng.normal(0, 3000, len(index)).cumsum(),
+        },
+        index=index,
+    )
+    # 상장 전 구간 (앞 30일 결측)
+    close.iloc[:30, 2] = np.nan
+    volume = pd.DataFrame(
+        rng.integers(100_000, 1_000_000, size=close.shape).astype(float),
+        index=index,
+        columns=close.columns,
+    )
+    return close, volume
+
+
+class TestIndicatorPanel:
+    def test_matches_single_series_functions(self, price_panels):
+        close, volume = price_panels
+        panel = calculate_indicator_panel(close, volume)
+
+        for code in close.columns:
+            series = close[code].dropna()
+            rsi = calculate_rsi(series)
+            macd = calculate_macd(series)
+            bb = calculate_bollinger_bands(series)
+
+            pd.testing.assert_series_equal(
+                panel["rsi14"][code].dropna(), rsi.dropna(), check_names=False, rtol=1e-8
+            )
+            pd.testing.assert_series_equal(
+                panel["macd"][code].dropna(), macd["macd"], check_names=False, rtol=1e-8
+            )
+            pd.testing.assert_series_equal(
+                panel["macd_signal"][code].dropna(), macd["signal"], check_names=False, rtol=1e-8
+            )
+            pd.testing.assert_series_equal(
+                panel["bollinger_upper"][code].dropna(), bb["upper"].dropna(), check_names=False, rtol=1e-8
+            )
+            pd.testing.assert_series_equal(
+                panel["ma120"][code].dropna(),
+                series.rolling(window=120).mean().dropna(),
+                check_names=False,
+                rtol=1e-8,
+            )
+
+    def test_volume_uses_rolling_window_average(self, price_panels):
+        close, volume = price_panels
+        panel = calculate_indicator_panel(close, volume, volume_window=20)
+
+        expected_avg = volume.rolling(window=20, min_periods=1).mean().where(close.notna())
+        pd.testing.assert_frame_equal(panel["average_volume"], expected_avg, rtol=1e-8)
+        pd.testing.assert_frame_equal(panel["volume_ratio"], volume.where(close.notna()) / expected_avg, rtol=1e-8)
+
+        latest = indicator_panel_rows(panel, "005930", last_n=1)[0]
+        assert latest["average_volume"] == int(volume["005930"].tail(20).mean())
+        assert latest["is_high_volume"] == ("Y" if volume["005930"].iloc[-1] / volume["005930"].tail(20).mean() > 1.5 else "N")
+
+    def test_rows_for_backfill(self, price_panels):
+        close, volume = price_panels
+        panel = calculate_indicator_panel(close, volume)
+
+        rows = indicator_panel_rows(panel, "035420")
+        assert len(rows) == close["035420"].notna().sum()
+
+        latest = indicator_panel_rows(panel, "005930", last_n=1)
+        assert len(latest) == 1
+        assert latest[0]["date"] == close.index[-1].date()
+        assert latest[0]["is_high_volume"] in {"Y", "N"}
+        assert isinstance(latest[0]["current_volume"], int)
+
+    def test_empty_panel(self):
+        assert calculate_indicator_panel(pd.DataFrame()) == {}
@@ -0,0 +1,109 @@
+"""
+LLM 응답 캐시 단위 테스트 (가짜 Chat 모델 + SQLite 저장소)
+"""
+import itertools
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.models.llm_cache import LLMResponseCacheEntry
+from src.repositories.llm_cache_repository import LLMCacheRepository
+from src.utils.llm_cache import LLMResponseCache, llm_cache_scope
+
+_cache_ids = itertools.count()
+
+
+def _answers():
+    for idx in itertools.count(1):
+        yield AIMessage(
+            content=f"answer-{idx}",
+            usage_metadata={"input_tokens": 90, "output_tokens": 10, "total_tokens": 100},
+        )
+
+
+def _model(cache):
+    return GenericFakeChatModel(messages=_answers(), cache=cache)
+
+
+def _cache(repository=None, **kwargs):
+    return LLMResponseCache(repository=repository, name=f"llm_response_test_{next(_cache_ids)}", **kwargs)
+
+
+@pytest.fixture
+def repository():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    LLMResponseCacheEntry.__table__.create(engine)
+    return LLMCacheRepository(sessionmaker(bind=engine, expire_on_commit=False))
+
+
+class TestLLMResponseCache:
+    @pytest.mark.asyncio
+    async def test_scoped_calls_are_served_from_cache(self):
+        cache = _cache()
+        llm = _model(cache)
+
+        with llm_cache_scope("market_analyzer"):
+            first = await llm.ainvoke("삼성전자 분석")
+            second = await llm.ainvoke("삼성전자\n\n   분석")
+
+        assert first.content == second.content == "answer-1"
+        stats = cache.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+        assert stats["saved_tokens"] == 100
+
+    @pytest.mark.asyncio
+    async def test_calls_outside_scope_are_never_cached(self, repository):
+        # 매매/라우팅처럼 scope로 감싸지 않은 호출은 temperature=0이어도 매번 LLM 호출
+        cache = _cache(repository, node_ttls={"macro_worker": 60})
+        llm = _model(cache)
+
+        assert (await llm.ainvoke("q")).content == "answer-1"
+        assert (await llm.ainvoke("q")).content == "answer-2"
+        stats = cache.stats()
+        assert stats["size"] == 0 and stats["writes"] == 0 and stats["misses"] == 0
+        assert repository.purge_expired() == 0
+
+        with llm_cache_scope("macro_worker"):
+            assert (await llm.ainvoke("q")).content == "answer-3"
+            assert (await llm.ainvoke("q")).content == "answer-3"
+        assert (await llm.ainvoke("q")).content == "answer-4"
+        assert cache.stats()["nodes"] == {"macro_worker": {"hits": 1, "misses": 1}}
+
+    @pytest.mark.asyncio
+    async def test_data_version_is_part_of_key(self):
+        cache = _cache()
+        llm = _model(cache)
+
+        with llm_cache_scope("macro_worker", data_version="2026-10-15"):
+            assert (await llm.ainvoke("q")).content == "answer-1"
+        with llm_cache_scope("macro_worker", data_version="2026-10-16"):
+            assert (await llm.ainvoke("q")).content == "answer-2"
+
+    @pytest.mark.asyncio
+    async def test_persistent_store_is_shared_across_processes(self, repository):
+        with llm_cache_scope("market_analyzer"):
+            await _model(_cache(repository)).ainvoke("q")
+
+            # 새 프로세스(빈 메모리)에서도 DB 엔트리로 응답
+            fresh = _cache(repository)
+            response = await _model(fresh).ainvoke("q")
+
+        assert response.content == "answer-1"
+        assert response.usage_metadata["total_tokens"] == 100
+        assert fresh.stats()["store_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_not_served(self, repository):
+        cache = _cache(repository, default_ttl=0.0)
+        llm = _model(cache)
+
+        with llm_cache_scope("intent_check"):
+            await llm.ainvoke("q")
+            assert (await llm.ainvoke("q")).content == "answer-2"
+        assert repository.purge_expired() == 1
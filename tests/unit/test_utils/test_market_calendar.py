@@ -0,0 +1,71 @@
+"""
+KRX 거래일 유틸리티 단위 테스트
+"""
+import logging
+from datetime import date, datetime
+
+from src.utils import market_calendar
+from src.utils.market_calendar import (
+    is_market_open,
+    is_trading_day,
+    last_closed_session,
+    latest_trading_day,
+    missing_trading_ranges,
+    next_market_open,
+    trading_days_between,
+)
+
+
+class TestMarketCalendar:
+    def test_weekend_and_holiday_are_closed(self):
+        assert not is_trading_day(date(2025, 10, 4))  # 토요일
+        assert not is_trading_day(date(2025, 10, 6))  # 추석
+        assert is_trading_day(date(2025, 10, 10))
+
+    def test_latest_trading_day_rolls_back_over_holidays(self):
+        # 2025-10-03(개천절) ~ 10-09(한글날) 연휴
+        assert latest_trading_day(datetime(2025, 10, 9, 12)) == date(2025, 10, 2)
+
+    def test_last_closed_session_before_and_after_close(self):
+        assert last_closed_session(datetime(2025, 10, 10, 10, 0)) == date(2025, 10, 2)
+        assert last_closed_session(datetime(2025, 10, 10, 16, 0)) == date(2025, 10, 10)
+
+    def test_market_open_and_next_open(self):
+        assert is_market_open(datetime(2025, 10, 10, 10, 0))
+        assert not is_market_open(datetime(2025, 10, 10, 15, 30))
+        assert not is_market_open(datetime(2025, 10, 6, 10, 0))  # 추석
+        assert next_market_open(datetime(2025, 10, 10, 8, 0)) == datetime(2025, 10, 10, 9, 0)
+        # 금요일 장 마감 후 → 다음 주 월요일
+        assert next_market_open(datetime(2025, 10, 10, 16, 0)) == datetime(2025, 10, 13, 9, 0)
+
+    def test_trading_days_between(self):
+        days = trading_days_between(date(2025, 9, 29), date(2025, 10, 10))
+        assert days == [
+            date(2025, 9, 29),
+            date(2025, 9, 30),
+            date(2025, 10, 1),
+            date(2025, 10, 2),
+            date(2025, 10, 10),
+        ]
+
+    def test_missing_trading_ranges_groups_contiguous_days(self):
+        existing = [date(2025, 9, 29), date(2025, 10, 2)]
+        ranges = missing_trading_ranges(existing, date(2025, 9, 29), date(2025, 10, 13))
+
+        assert ranges == [
+            (date(2025, 9, 30), date(2025, 10, 1)),
+            (date(2025, 10, 10), date(2025, 10, 13)),
+        ]
+
+    def test_no_missing_ranges_when_complete(self):
+        existing = trading_days_between(date(2025, 9, 1), date(2025, 9, 30))
+        assert missing_trading_ranges(existing, date(2025, 9, 1), date(2025, 9, 30)) == []
+
+    def test_year_outside_holiday_table_is_reported_once(self, caplog, monkeypatch):
+        monkeypatch.setattr(market_calendar, "_warned_years", set())
+        with caplog.at_level(logging.WARNING, logger=market_calendar.__name__):
+            assert is_trading_day(date(2099, 1, 2))
+            assert is_trading_day(date(2099, 1, 5))
+
+        assert len(caplog.records) == 1
+        assert "2099" in caplog.records[0].getMessage()